@@ -0,0 +1,120 @@
+//! Streams ticks through every incremental kernel and reports, per block of
+//! ticks, the step latency and the heap held by kernel state. Both should stay
+//! flat however long the stream runs.
+//!
+//! ```text
+//! cargo run --release -p ta-engine --example incremental_soak_bench [ticks]
+//! ```
+
+use std::alloc::{GlobalAlloc, Layout, System};
+use std::collections::BTreeMap;
+use std::hint::black_box;
+use std::sync::atomic::{AtomicIsize, Ordering};
+use std::time::Instant;
+
+use ta_engine::incremental::call_step::{
+    eval_call_step_inputs, initialize_kernel_state, KernelRuntimeState,
+};
+use ta_engine::incremental::contracts::IncrementalValue;
+use ta_engine::incremental::kernel_registry::KernelId;
+
+const DEFAULT_TICKS: u64 = 10_000_000;
+const REPORTS: u64 = 10;
+
+/// Tracks live heap bytes so kernel state growth shows up directly.
+struct CountingAlloc;
+
+static LIVE_BYTES: AtomicIsize = AtomicIsize::new(0);
+
+unsafe impl GlobalAlloc for CountingAlloc {
+    unsafe fn alloc(&self, layout: Layout) -> *mut u8 {
+        LIVE_BYTES.fetch_add(layout.size() as isize, Ordering::Relaxed);
+        System.alloc(layout)
+    }
+
+    unsafe fn dealloc(&self, ptr: *mut u8, layout: Layout) {
+        LIVE_BYTES.fetch_sub(layout.size() as isize, Ordering::Relaxed);
+        System.dealloc(ptr, layout)
+    }
+
+    unsafe fn realloc(&self, ptr: *mut u8, layout: Layout, new_size: usize) -> *mut u8 {
+        LIVE_BYTES.fetch_add(
+            new_size as isize - layout.size() as isize,
+            Ordering::Relaxed,
+        );
+        System.realloc(ptr, layout, new_size)
+    }
+}
+
+#[global_allocator]
+static ALLOC: CountingAlloc = CountingAlloc;
+
+fn main() {
+    let ticks = std::env::args()
+        .nth(1)
+        .and_then(|arg| arg.parse::<u64>().ok())
+        .unwrap_or(DEFAULT_TICKS);
+    let block = (ticks / REPORTS).max(1);
+
+    let mut states: Vec<(KernelId, KernelRuntimeState)> = KernelId::ALL
+        .iter()
+        .map(|id| (*id, initialize_kernel_state(*id, &BTreeMap::new())))
+        .collect();
+    let mut tick: BTreeMap<String, IncrementalValue> = ["open", "high", "low", "close", "volume"]
+        .into_iter()
+        .map(|field| (field.to_string(), IncrementalValue::Number(0.0)))
+        .collect();
+    let set = |tick: &mut BTreeMap<String, IncrementalValue>, field: &str, value: f64| {
+        if let Some(slot) = tick.get_mut(field) {
+            *slot = IncrementalValue::Number(value);
+        }
+    };
+
+    // Deterministic random walk so windows see both trends and reversals.
+    let mut seed = 0x2545_f491_4f6c_dd1d_u64;
+    let mut price = 100.0;
+    let mut inputs = vec![IncrementalValue::Null; 3];
+
+    println!("{} kernels, {ticks} ticks", states.len());
+    println!("{:>12} {:>12} {:>14}", "ticks", "ns/tick", "state bytes");
+    let baseline = LIVE_BYTES.load(Ordering::Relaxed);
+    let mut started = Instant::now();
+    for t in 1..=ticks {
+        seed ^= seed << 13;
+        seed ^= seed >> 7;
+        seed ^= seed << 17;
+        let open = price;
+        price += (seed % 2_001) as f64 / 1_000.0 - 1.0;
+        let spread = (seed % 97) as f64 / 100.0;
+        set(&mut tick, "open", open);
+        set(&mut tick, "high", open.max(price) + spread);
+        set(&mut tick, "low", open.min(price) - spread);
+        set(&mut tick, "close", price);
+        set(&mut tick, "volume", 1_000.0 + (seed % 500) as f64);
+        inputs[0] = IncrementalValue::Number(price);
+        inputs[1] = IncrementalValue::Number(open);
+        inputs[2] = IncrementalValue::Number(open - spread);
+
+        for (kernel_id, slot) in &mut states {
+            let state = std::mem::replace(
+                slot,
+                KernelRuntimeState::Generic {
+                    kernel_id: *kernel_id,
+                },
+            );
+            let (next, out) = eval_call_step_inputs(*kernel_id, state, &inputs, &tick);
+            *slot = next;
+            black_box(out);
+        }
+
+        if t % block == 0 {
+            let elapsed = started.elapsed();
+            println!(
+                "{t:>12} {:>12.1} {:>14}",
+                elapsed.as_nanos() as f64 / block as f64,
+                LIVE_BYTES.load(Ordering::Relaxed) - baseline
+            );
+            started = Instant::now();
+        }
+    }
+}
@@ -0,0 +1,76 @@
+//! Compares the block-based `rolling_min`/`rolling_max` with a full window
+//! rescan.
+//!
+//! ```text
+//! cargo run --release -p ta-engine --example rolling_extremes_bench
+//! ```
+
+use std::hint::black_box;
+use std::time::{Duration, Instant};
+
+use ta_engine::rolling;
+
+const ROWS: usize = 200_000;
+const PERIODS: [usize; 4] = [14, 50, 200, 1_000];
+
+fn rescan_max(values: &[f64], period: usize) -> Vec<f64> {
+    let mut out = vec![f64::NAN; values.len()];
+    for i in (period - 1)..values.len() {
+        let start = i + 1 - period;
+        let mut m = values[start];
+        for x in &values[start + 1..=i] {
+            if *x > m {
+                m = *x;
+            }
+        }
+        out[i] = m;
+    }
+    out
+}
+
+/// Best of a few runs, so allocation and cache warm-up do not dominate.
+fn time(mut f: impl FnMut() -> Vec<f64>) -> Duration {
+    (0..5)
+        .map(|_| {
+            let started = Instant::now();
+            black_box(f());
+            started.elapsed()
+        })
+        .min()
+        .unwrap_or_default()
+}
+
+fn main() {
+    // Deterministic random walk so windows see both trends and reversals.
+    let mut state = 0x2545_f491_4f6c_dd1d_u64;
+    let mut price = 100.0;
+    let values: Vec<f64> = (0..ROWS)
+        .map(|_| {
+            state ^= state << 13;
+            state ^= state >> 7;
+            state ^= state << 17;
+            price += (state % 2_001) as f64 / 1_000.0 - 1.0;
+            price
+        })
+        .collect();
+
+    println!("rolling_max over {ROWS} rows");
+    println!(
+        "{:>8} {:>12} {:>12} {:>9}",
+        "period", "rescan", "blocks", "speedup"
+    );
+    for period in PERIODS {
+        let rescan = time(|| rescan_max(&values, period));
+        let blocks = time(|| rolling::rolling_max(&values, period));
+        assert_eq!(
+            rescan_max(&values, period)[period - 1..],
+            rolling::rolling_max(&values, period)[period - 1..]
+        );
+        println!(
+            "{period:>8} {:>10.2}ms {:>10.2}ms {:>8.1}x",
+            rescan.as_secs_f64() * 1e3,
+            blocks.as_secs_f64() * 1e3,
+            rescan.as_secs_f64() / blocks.as_secs_f64()
+        );
+    }
+}
@@ -0,0 +1,99 @@
+//! Compares warm-restarting many symbol streams from binary snapshots against
+//! replaying their history.
+//!
+//! ```text
+//! cargo run --release -p ta-engine --example snapshot_restore_bench [streams] [bars]
+//! ```
+
+use std::collections::BTreeMap;
+use std::time::Instant;
+
+use ta_engine::incremental::backend::{IncrementalBackend, KernelStepRequest};
+use ta_engine::incremental::contracts::IncrementalValue;
+use ta_engine::incremental::kernel_registry::KernelId;
+use ta_engine::incremental::snapshot_codec::{decode_snapshot, encode_snapshot};
+
+const DEFAULT_STREAMS: usize = 5_000;
+const DEFAULT_BARS: usize = 500;
+
+fn main() {
+    let mut args = std::env::args().skip(1);
+    let streams = args
+        .next()
+        .and_then(|arg| arg.parse().ok())
+        .unwrap_or(DEFAULT_STREAMS);
+    let bars = args
+        .next()
+        .and_then(|arg| arg.parse().ok())
+        .unwrap_or(DEFAULT_BARS);
+
+    let request = |node_id: u32, kernel_id: KernelId, period: f64| KernelStepRequest {
+        node_id,
+        kernel_id,
+        input_field: "close".to_string(),
+        kwargs: BTreeMap::from([("period".to_string(), IncrementalValue::Number(period))]),
+    };
+    let requests = [
+        request(1, KernelId::Sma, 50.0),
+        request(2, KernelId::Ema, 20.0),
+        request(3, KernelId::Rsi, 14.0),
+        request(4, KernelId::Median, 30.0),
+        request(5, KernelId::Donchian, 20.0),
+    ];
+    let history: Vec<BTreeMap<String, IncrementalValue>> = (0..bars)
+        .map(|idx| {
+            let close = 100.0 + (idx as f64 * 0.05).sin() * 10.0;
+            ["open", "high", "low", "close", "volume"]
+                .into_iter()
+                .map(|field| (field.to_string(), IncrementalValue::Number(close)))
+                .collect()
+        })
+        .collect();
+    let warm = || {
+        let mut backend = IncrementalBackend::default();
+        backend.initialize();
+        for (idx, tick) in history.iter().enumerate() {
+            backend.step(idx as u64 + 1, &requests, tick);
+        }
+        backend
+    };
+
+    let started = Instant::now();
+    let mut backends: Vec<IncrementalBackend> = (0..streams).map(|_| warm()).collect();
+    let replay = started.elapsed();
+
+    let started = Instant::now();
+    let blobs: Vec<Vec<u8>> = backends
+        .iter_mut()
+        .map(|backend| encode_snapshot(&backend.snapshot()))
+        .collect();
+    let encode = started.elapsed();
+    let bytes: usize = blobs.iter().map(Vec::len).sum();
+
+    let started = Instant::now();
+    let restored: Vec<IncrementalBackend> = blobs
+        .iter()
+        .map(|blob| {
+            let mut backend = IncrementalBackend::default();
+            backend.initialize();
+            backend
+                .restore(decode_snapshot(blob).expect("snapshot decodes"))
+                .expect("snapshot restores");
+            backend
+        })
+        .collect();
+    let restore = started.elapsed();
+    assert_eq!(restored.len(), streams);
+
+    println!(
+        "{streams} streams x {bars} bars, {} kernels",
+        requests.len()
+    );
+    println!("replay history   {:>10.1} ms", replay.as_secs_f64() * 1e3);
+    println!(
+        "encode snapshots {:>10.1} ms  ({} bytes/stream)",
+        encode.as_secs_f64() * 1e3,
+        bytes / streams.max(1)
+    );
+    println!("decode + restore {:>10.1} ms", restore.as_secs_f64() * 1e3);
+}
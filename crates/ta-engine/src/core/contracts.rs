@@ -81,17 +81,23 @@ impl RustExecutionPayload {
         if self.partition.source.trim().is_empty() {
             return Err("partition.source must be non-empty".to_string());
         }
-        if self.graph.node_order.is_empty() {
+        self.graph.validate()
+    }
+}
+
+impl RustExecutionGraph {
+    pub fn validate(&self) -> Result<(), String> {
+        if self.node_order.is_empty() {
             return Err("graph.node_order must be non-empty".to_string());
         }
-        if !self.graph.nodes.contains_key(&self.graph.root_id) {
+        if !self.nodes.contains_key(&self.root_id) {
             return Err("graph.root_id must exist in graph.nodes".to_string());
         }
-        if !self.graph.node_order.contains(&self.graph.root_id) {
+        if !self.node_order.contains(&self.root_id) {
             return Err("graph.root_id must be present in graph.node_order".to_string());
         }
-        for node_id in self.graph.nodes.keys() {
-            if !self.graph.node_order.contains(node_id) {
+        for node_id in self.nodes.keys() {
+            if !self.node_order.contains(node_id) {
                 return Err(format!(
                     "graph.node_order missing node id present in graph.nodes: {node_id}"
                 ));
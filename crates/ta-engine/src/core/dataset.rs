@@ -1,6 +1,6 @@
 use std::collections::HashMap;
 use std::sync::atomic::{AtomicU64, Ordering};
-use std::sync::{Mutex, OnceLock};
+use std::sync::{Arc, OnceLock, RwLock, RwLockReadGuard, RwLockWriteGuard};
 
 pub type DatasetId = u64;
 
@@ -31,6 +31,10 @@ pub struct SeriesColumn {
 pub struct DatasetPartition {
     pub ohlcv: Option<OhlcvColumns>,
     pub series: HashMap<String, SeriesColumn>,
+    /// Bumped on every mutation. Values are drawn from a process-wide counter,
+    /// so a (dataset, partition, version) triple never repeats even when a
+    /// partition is dropped and recreated.
+    pub version: u64,
 }
 
 impl DatasetPartition {
@@ -38,14 +42,20 @@ impl DatasetPartition {
         Self {
             ohlcv: None,
             series: HashMap::new(),
+            version: 0,
         }
     }
+
+    fn touch(&mut self) {
+        self.version = NEXT_PARTITION_VERSION.fetch_add(1, Ordering::Relaxed);
+    }
 }
 
 #[derive(Debug, Clone, PartialEq)]
 pub struct DatasetRecord {
     pub id: DatasetId,
-    pub partitions: HashMap<DatasetPartitionKey, DatasetPartition>,
+    /// Partitions are shared with in-flight evaluations and copied on write.
+    pub partitions: HashMap<DatasetPartitionKey, Arc<DatasetPartition>>,
 }
 
 #[derive(Debug, Clone, PartialEq, Eq)]
@@ -71,6 +81,11 @@ pub enum DatasetRegistryError {
     EmptyField {
         field: &'static str,
     },
+    UnknownPartition {
+        symbol: String,
+        timeframe: String,
+        source: String,
+    },
 }
 
 impl std::fmt::Display for DatasetRegistryError {
@@ -89,6 +104,14 @@ impl std::fmt::Display for DatasetRegistryError {
                 write!(f, "timestamps must be non-decreasing for {field}")
             }
             Self::EmptyField { field } => write!(f, "empty field not allowed: {field}"),
+            Self::UnknownPartition {
+                symbol,
+                timeframe,
+                source,
+            } => write!(
+                f,
+                "unknown partition: symbol={symbol} timeframe={timeframe} source={source}"
+            ),
         }
     }
 }
@@ -96,15 +119,36 @@ impl std::fmt::Display for DatasetRegistryError {
 impl std::error::Error for DatasetRegistryError {}
 
 static NEXT_DATASET_ID: AtomicU64 = AtomicU64::new(1);
-static DATASET_REGISTRY: OnceLock<Mutex<HashMap<DatasetId, DatasetRecord>>> = OnceLock::new();
+static NEXT_PARTITION_VERSION: AtomicU64 = AtomicU64::new(1);
+
+/// Number of independently locked registry shards. Datasets are spread across
+/// shards by id, so reading or writing one dataset never waits on a writer of
+/// a dataset held in another shard.
+const REGISTRY_SHARDS: usize = 16;
+
+type RegistryShard = RwLock<HashMap<DatasetId, DatasetRecord>>;
 
-fn registry() -> &'static Mutex<HashMap<DatasetId, DatasetRecord>> {
-    DATASET_REGISTRY.get_or_init(|| Mutex::new(HashMap::new()))
+static DATASET_REGISTRY: OnceLock<[RegistryShard; REGISTRY_SHARDS]> = OnceLock::new();
+
+fn registry() -> &'static [RegistryShard; REGISTRY_SHARDS] {
+    DATASET_REGISTRY.get_or_init(|| std::array::from_fn(|_| RwLock::new(HashMap::new())))
+}
+
+fn shard(id: DatasetId) -> &'static RegistryShard {
+    &registry()[(id % REGISTRY_SHARDS as u64) as usize]
+}
+
+fn read_shard(id: DatasetId) -> RwLockReadGuard<'static, HashMap<DatasetId, DatasetRecord>> {
+    shard(id).read().expect("dataset registry lock poisoned")
+}
+
+fn write_shard(id: DatasetId) -> RwLockWriteGuard<'static, HashMap<DatasetId, DatasetRecord>> {
+    shard(id).write().expect("dataset registry lock poisoned")
 }
 
 pub fn create_dataset() -> DatasetId {
     let id = NEXT_DATASET_ID.fetch_add(1, Ordering::Relaxed);
-    let mut map = registry().lock().expect("dataset registry lock poisoned");
+    let mut map = write_shard(id);
     map.insert(
         id,
         DatasetRecord {
@@ -116,7 +160,7 @@ pub fn create_dataset() -> DatasetId {
 }
 
 pub fn drop_dataset(id: DatasetId) -> Result<(), DatasetRegistryError> {
-    let mut map = registry().lock().expect("dataset registry lock poisoned");
+    let mut map = write_shard(id);
     if map.remove(&id).is_some() {
         Ok(())
     } else {
@@ -125,17 +169,19 @@ pub fn drop_dataset(id: DatasetId) -> Result<(), DatasetRegistryError> {
 }
 
 pub fn dataset_exists(id: DatasetId) -> bool {
-    let map = registry().lock().expect("dataset registry lock poisoned");
+    let map = read_shard(id);
     map.contains_key(&id)
 }
 
 pub fn dataset_count() -> usize {
-    let map = registry().lock().expect("dataset registry lock poisoned");
-    map.len()
+    registry()
+        .iter()
+        .map(|shard| shard.read().expect("dataset registry lock poisoned").len())
+        .sum()
 }
 
 pub fn dataset_info(id: DatasetId) -> Result<DatasetInfo, DatasetRegistryError> {
-    let map = registry().lock().expect("dataset registry lock poisoned");
+    let map = read_shard(id);
     let record = map
         .get(&id)
         .ok_or(DatasetRegistryError::UnknownDatasetId(id))?;
@@ -173,32 +219,14 @@ pub fn append_ohlcv(
     close: &[f64],
     volume: &[f64],
 ) -> Result<usize, DatasetRegistryError> {
-    if key.source.trim().is_empty() {
-        return Err(DatasetRegistryError::EmptyField { field: "source" });
-    }
-    if key.symbol.trim().is_empty() {
-        return Err(DatasetRegistryError::EmptyField { field: "symbol" });
-    }
-    if key.timeframe.trim().is_empty() {
-        return Err(DatasetRegistryError::EmptyField { field: "timeframe" });
-    }
-
-    let expected = timestamps.len();
-    ensure_same_len("open", expected, open.len())?;
-    ensure_same_len("high", expected, high.len())?;
-    ensure_same_len("low", expected, low.len())?;
-    ensure_same_len("close", expected, close.len())?;
-    ensure_same_len("volume", expected, volume.len())?;
-    ensure_strictly_increasing_timestamps("timestamps", timestamps)?;
+    validate_partition_key(&key)?;
+    validate_ohlcv_columns(timestamps, open, high, low, close, volume)?;
 
-    let mut map = registry().lock().expect("dataset registry lock poisoned");
+    let mut map = write_shard(id);
     let record = map
         .get_mut(&id)
         .ok_or(DatasetRegistryError::UnknownDatasetId(id))?;
-    let partition = record
-        .partitions
-        .entry(key)
-        .or_insert_with(DatasetPartition::new);
+    let partition = partition_mut(record, key);
     let columns = partition.ohlcv.get_or_insert_with(|| OhlcvColumns {
         timestamps: Vec::new(),
         open: Vec::new(),
@@ -222,7 +250,42 @@ pub fn append_ohlcv(
     columns.low.extend_from_slice(low);
     columns.close.extend_from_slice(close);
     columns.volume.extend_from_slice(volume);
-    Ok(columns.timestamps.len())
+    let rows = columns.timestamps.len();
+    partition.touch();
+    Ok(rows)
+}
+
+/// Replace the OHLCV columns of a single partition, leaving every other
+/// partition of the dataset untouched.
+#[allow(clippy::too_many_arguments)]
+pub fn replace_ohlcv(
+    id: DatasetId,
+    key: DatasetPartitionKey,
+    timestamps: &[i64],
+    open: &[f64],
+    high: &[f64],
+    low: &[f64],
+    close: &[f64],
+    volume: &[f64],
+) -> Result<usize, DatasetRegistryError> {
+    validate_partition_key(&key)?;
+    validate_ohlcv_columns(timestamps, open, high, low, close, volume)?;
+
+    let mut map = write_shard(id);
+    let record = map
+        .get_mut(&id)
+        .ok_or(DatasetRegistryError::UnknownDatasetId(id))?;
+    let partition = partition_mut(record, key);
+    partition.ohlcv = Some(OhlcvColumns {
+        timestamps: timestamps.to_vec(),
+        open: open.to_vec(),
+        high: high.to_vec(),
+        low: low.to_vec(),
+        close: close.to_vec(),
+        volume: volume.to_vec(),
+    });
+    partition.touch();
+    Ok(timestamps.len())
 }
 
 pub fn append_series(
@@ -232,31 +295,14 @@ pub fn append_series(
     timestamps: &[i64],
     values: &[f64],
 ) -> Result<usize, DatasetRegistryError> {
-    if key.source.trim().is_empty() {
-        return Err(DatasetRegistryError::EmptyField { field: "source" });
-    }
-    if key.symbol.trim().is_empty() {
-        return Err(DatasetRegistryError::EmptyField { field: "symbol" });
-    }
-    if key.timeframe.trim().is_empty() {
-        return Err(DatasetRegistryError::EmptyField { field: "timeframe" });
-    }
-    if field.trim().is_empty() {
-        return Err(DatasetRegistryError::EmptyField { field: "field" });
-    }
-
-    let expected = timestamps.len();
-    ensure_same_len("values", expected, values.len())?;
-    ensure_strictly_increasing_timestamps("timestamps", timestamps)?;
+    validate_partition_key(&key)?;
+    validate_series_column(&field, timestamps, values)?;
 
-    let mut map = registry().lock().expect("dataset registry lock poisoned");
+    let mut map = write_shard(id);
     let record = map
         .get_mut(&id)
         .ok_or(DatasetRegistryError::UnknownDatasetId(id))?;
-    let partition = record
-        .partitions
-        .entry(key)
-        .or_insert_with(DatasetPartition::new);
+    let partition = partition_mut(record, key);
 
     let series = partition
         .series
@@ -276,16 +322,165 @@ pub fn append_series(
 
     series.timestamps.extend_from_slice(timestamps);
     series.values.extend_from_slice(values);
-    Ok(series.timestamps.len())
+    let rows = series.timestamps.len();
+    partition.touch();
+    Ok(rows)
+}
+
+/// Replace one series field of a single partition.
+pub fn replace_series(
+    id: DatasetId,
+    key: DatasetPartitionKey,
+    field: String,
+    timestamps: &[i64],
+    values: &[f64],
+) -> Result<usize, DatasetRegistryError> {
+    validate_partition_key(&key)?;
+    validate_series_column(&field, timestamps, values)?;
+
+    let mut map = write_shard(id);
+    let record = map
+        .get_mut(&id)
+        .ok_or(DatasetRegistryError::UnknownDatasetId(id))?;
+    let partition = partition_mut(record, key);
+    partition.series.insert(
+        field,
+        SeriesColumn {
+            timestamps: timestamps.to_vec(),
+            values: values.to_vec(),
+        },
+    );
+    partition.touch();
+    Ok(timestamps.len())
+}
+
+pub fn drop_partition(
+    id: DatasetId,
+    key: &DatasetPartitionKey,
+) -> Result<(), DatasetRegistryError> {
+    let mut map = write_shard(id);
+    let record = map
+        .get_mut(&id)
+        .ok_or(DatasetRegistryError::UnknownDatasetId(id))?;
+    record
+        .partitions
+        .remove(key)
+        .map(|_| ())
+        .ok_or_else(|| unknown_partition(key))
+}
+
+pub fn partition_version(
+    id: DatasetId,
+    key: &DatasetPartitionKey,
+) -> Result<u64, DatasetRegistryError> {
+    let map = read_shard(id);
+    let record = map
+        .get(&id)
+        .ok_or(DatasetRegistryError::UnknownDatasetId(id))?;
+    record
+        .partitions
+        .get(key)
+        .map(|partition| partition.version)
+        .ok_or_else(|| unknown_partition(key))
+}
+
+/// Shared handle to one partition. Columns can be read without holding the
+/// registry lock; later mutations copy the partition instead of changing it.
+pub fn get_partition(
+    id: DatasetId,
+    key: &DatasetPartitionKey,
+) -> Result<Arc<DatasetPartition>, DatasetRegistryError> {
+    let map = read_shard(id);
+    let record = map
+        .get(&id)
+        .ok_or(DatasetRegistryError::UnknownDatasetId(id))?;
+    record
+        .partitions
+        .get(key)
+        .cloned()
+        .ok_or_else(|| unknown_partition(key))
+}
+
+/// Keys of every partition in the dataset, sorted by symbol, timeframe and
+/// source.
+pub fn partition_keys(id: DatasetId) -> Result<Vec<DatasetPartitionKey>, DatasetRegistryError> {
+    let map = read_shard(id);
+    let record = map
+        .get(&id)
+        .ok_or(DatasetRegistryError::UnknownDatasetId(id))?;
+    let mut keys: Vec<DatasetPartitionKey> = record.partitions.keys().cloned().collect();
+    keys.sort_by(|a, b| {
+        (&a.symbol, &a.timeframe, &a.source).cmp(&(&b.symbol, &b.timeframe, &b.source))
+    });
+    Ok(keys)
 }
 
 pub fn get_dataset(id: DatasetId) -> Result<DatasetRecord, DatasetRegistryError> {
-    let map = registry().lock().expect("dataset registry lock poisoned");
+    let map = read_shard(id);
     map.get(&id)
         .cloned()
         .ok_or(DatasetRegistryError::UnknownDatasetId(id))
 }
 
+fn partition_mut(record: &mut DatasetRecord, key: DatasetPartitionKey) -> &mut DatasetPartition {
+    Arc::make_mut(
+        record
+            .partitions
+            .entry(key)
+            .or_insert_with(|| Arc::new(DatasetPartition::new())),
+    )
+}
+
+fn unknown_partition(key: &DatasetPartitionKey) -> DatasetRegistryError {
+    DatasetRegistryError::UnknownPartition {
+        symbol: key.symbol.clone(),
+        timeframe: key.timeframe.clone(),
+        source: key.source.clone(),
+    }
+}
+
+fn validate_partition_key(key: &DatasetPartitionKey) -> Result<(), DatasetRegistryError> {
+    if key.source.trim().is_empty() {
+        return Err(DatasetRegistryError::EmptyField { field: "source" });
+    }
+    if key.symbol.trim().is_empty() {
+        return Err(DatasetRegistryError::EmptyField { field: "symbol" });
+    }
+    if key.timeframe.trim().is_empty() {
+        return Err(DatasetRegistryError::EmptyField { field: "timeframe" });
+    }
+    Ok(())
+}
+
+fn validate_ohlcv_columns(
+    timestamps: &[i64],
+    open: &[f64],
+    high: &[f64],
+    low: &[f64],
+    close: &[f64],
+    volume: &[f64],
+) -> Result<(), DatasetRegistryError> {
+    let expected = timestamps.len();
+    ensure_same_len("open", expected, open.len())?;
+    ensure_same_len("high", expected, high.len())?;
+    ensure_same_len("low", expected, low.len())?;
+    ensure_same_len("close", expected, close.len())?;
+    ensure_same_len("volume", expected, volume.len())?;
+    ensure_strictly_increasing_timestamps("timestamps", timestamps)
+}
+
+fn validate_series_column(
+    field: &str,
+    timestamps: &[i64],
+    values: &[f64],
+) -> Result<(), DatasetRegistryError> {
+    if field.trim().is_empty() {
+        return Err(DatasetRegistryError::EmptyField { field: "field" });
+    }
+    ensure_same_len("values", timestamps.len(), values.len())?;
+    ensure_strictly_increasing_timestamps("timestamps", timestamps)
+}
+
 fn ensure_same_len(
     field: &'static str,
     expected: usize,
@@ -3,3 +3,4 @@ pub mod dataset;
 pub mod dataset_ops;
 pub mod events;
 pub mod metadata;
+pub mod series_ops;
@@ -0,0 +1,165 @@
+//! Element-wise kernels behind `Series` arithmetic and reductions.
+//!
+//! Values are float64 columns in which NaN marks a missing row. Binary
+//! operators follow the `Decimal` semantics of the Python series: `%` keeps
+//! the sign of the dividend and a zero divisor is an error rather than an
+//! infinity.
+
+use thiserror::Error;
+
+#[derive(Debug, Clone, Error, PartialEq, Eq)]
+pub enum SeriesOpsError {
+    #[error("series must have identical lengths")]
+    LengthMismatch,
+    #[error("division by zero")]
+    DivisionByZero,
+    #[error("unsupported series operator: {0}")]
+    UnsupportedOperator(String),
+    #[error("unsupported series reduction: {0}")]
+    UnsupportedReduction(String),
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum BinaryOp {
+    Add,
+    Sub,
+    Mul,
+    Div,
+    Mod,
+    Pow,
+}
+
+impl BinaryOp {
+    pub fn parse(op: &str) -> Result<Self, SeriesOpsError> {
+        match op {
+            "add" => Ok(Self::Add),
+            "sub" => Ok(Self::Sub),
+            "mul" => Ok(Self::Mul),
+            "div" => Ok(Self::Div),
+            "mod" => Ok(Self::Mod),
+            "pow" => Ok(Self::Pow),
+            other => Err(SeriesOpsError::UnsupportedOperator(other.to_string())),
+        }
+    }
+
+    #[inline]
+    fn apply(self, left: f64, right: f64) -> f64 {
+        match self {
+            Self::Add => left + right,
+            Self::Sub => left - right,
+            Self::Mul => left * right,
+            Self::Div => left / right,
+            Self::Mod => left % right,
+            Self::Pow => left.powf(right),
+        }
+    }
+
+    fn checks_divisor(self) -> bool {
+        matches!(self, Self::Div | Self::Mod)
+    }
+}
+
+pub fn binary(op: BinaryOp, left: &[f64], right: &[f64]) -> Result<Vec<f64>, SeriesOpsError> {
+    if left.len() != right.len() {
+        return Err(SeriesOpsError::LengthMismatch);
+    }
+    if op.checks_divisor() && right.contains(&0.0) {
+        return Err(SeriesOpsError::DivisionByZero);
+    }
+    Ok(left
+        .iter()
+        .zip(right)
+        .map(|(l, r)| op.apply(*l, *r))
+        .collect())
+}
+
+pub fn binary_scalar(op: BinaryOp, left: &[f64], right: f64) -> Result<Vec<f64>, SeriesOpsError> {
+    if op.checks_divisor() && right == 0.0 {
+        return Err(SeriesOpsError::DivisionByZero);
+    }
+    Ok(left.iter().map(|l| op.apply(*l, right)).collect())
+}
+
+pub fn negate(values: &[f64]) -> Vec<f64> {
+    values.iter().map(|v| -v).collect()
+}
+
+/// Shifts values by `periods` rows, padding with the first value for forward
+/// shifts and the last value for backward shifts.
+pub fn shift(values: &[f64], periods: i64) -> Vec<f64> {
+    let len = values.len();
+    if len == 0 || periods == 0 {
+        return values.to_vec();
+    }
+    let mut out = Vec::with_capacity(len);
+    let by = (periods.unsigned_abs() as usize).min(len);
+    if periods > 0 {
+        out.resize(by, values[0]);
+        out.extend_from_slice(&values[..len - by]);
+    } else {
+        out.extend_from_slice(&values[by..]);
+        out.resize(len, values[len - 1]);
+    }
+    out
+}
+
+/// Difference to the value `periods` rows back; the first `periods` rows are
+/// NaN.
+pub fn change(values: &[f64], periods: usize) -> Vec<f64> {
+    lagged(values, periods, |current, previous| current - previous)
+}
+
+/// Percentage change to the value `periods` rows back; NaN where the earlier
+/// value is zero.
+pub fn change_pct(values: &[f64], periods: usize) -> Vec<f64> {
+    lagged(values, periods, |current, previous| {
+        if previous == 0.0 {
+            f64::NAN
+        } else {
+            (current - previous) / previous * 100.0
+        }
+    })
+}
+
+fn lagged(values: &[f64], periods: usize, f: impl Fn(f64, f64) -> f64) -> Vec<f64> {
+    let len = values.len();
+    if len < periods + 1 {
+        return vec![f64::NAN; len];
+    }
+    let mut out = Vec::with_capacity(len);
+    out.resize(periods, f64::NAN);
+    out.extend(
+        values[periods..]
+            .iter()
+            .zip(values)
+            .map(|(current, previous)| f(*current, *previous)),
+    );
+    out
+}
+
+/// Rows of `values` where `keep` is set.
+pub fn filter(values: &[f64], keep: &[bool]) -> Result<Vec<f64>, SeriesOpsError> {
+    if values.len() != keep.len() {
+        return Err(SeriesOpsError::LengthMismatch);
+    }
+    Ok(values
+        .iter()
+        .zip(keep)
+        .filter_map(|(value, keep)| keep.then_some(*value))
+        .collect())
+}
+
+/// `sum` and `mean` fold every row; `max` and `min` skip NaN rows. Empty
+/// input, and `max`/`min` over only NaN rows, yield `None`, except `sum`
+/// which is `0.0`.
+pub fn reduce(values: &[f64], op: &str) -> Result<Option<f64>, SeriesOpsError> {
+    let present = || values.iter().copied().filter(|v| !v.is_nan());
+    Ok(match op {
+        "sum" => Some(values.iter().sum()),
+        "mean" if values.is_empty() => None,
+        "mean" => Some(values.iter().sum::<f64>() / values.len() as f64),
+        "max" => present().reduce(f64::max),
+        "min" => present().reduce(f64::min),
+        other => return Err(SeriesOpsError::UnsupportedReduction(other.to_string())),
+    })
+}
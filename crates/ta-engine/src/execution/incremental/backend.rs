@@ -1,14 +1,16 @@
-use std::collections::BTreeMap;
+use std::collections::{BTreeMap, BTreeSet};
 
-use super::call_step::{eval_call_step, initialize_kernel_state, KernelRuntimeState};
+use super::call_step::{eval_call_step_inputs, initialize_kernel_state, KernelRuntimeState};
+use super::columns::NodeColumn;
 use super::contracts::{IncrementalValue, RuntimeSnapshot};
 use super::graph_exec;
 use super::kernel_registry::KernelId;
 use super::payload_parse;
 use super::state::NodeRuntimeState;
 use super::state_codec;
+use super::step_graph::StepGraph;
 use super::store::RuntimeStateStore;
-use crate::contracts::RustExecutionPayload;
+use crate::contracts::{RustExecutionPartition, RustExecutionPayload};
 use crate::dataset::{self, DatasetId, DatasetPartitionKey};
 use thiserror::Error;
 
@@ -20,6 +22,13 @@ pub struct KernelStepRequest {
     pub kwargs: BTreeMap<String, IncrementalValue>,
 }
 
+/// Ticks laid out column-wise: one array per field, every array holding one
+/// value per tick.
+pub type TickColumns = BTreeMap<String, Vec<f64>>;
+
+/// Per-node outputs of a batch step, one value per tick in order.
+pub type BatchOutputs = BTreeMap<u32, Vec<IncrementalValue>>;
+
 #[derive(Debug, Clone)]
 pub struct ExecutePlanPayload {
     pub dataset_id: DatasetId,
@@ -27,16 +36,27 @@ pub struct ExecutePlanPayload {
     pub requests: Vec<KernelStepRequest>,
 }
 
+/// Kernel state is kept in native form while stepping and only encoded into
+/// the store when a snapshot is taken; nodes that have not stepped since the
+/// previous snapshot reuse their last encoding.
 #[derive(Debug, Clone, Default)]
 pub struct IncrementalBackend {
     store: RuntimeStateStore,
     call_states: BTreeMap<u32, KernelRuntimeState>,
+    graph: Option<StepGraph>,
+    /// Call nodes stepped since their state was last encoded.
+    dirty_calls: BTreeSet<u32>,
+    /// Whether the graph stepped since its state was last encoded.
+    graph_dirty: bool,
 }
 
 impl IncrementalBackend {
     pub fn initialize(&mut self) {
         self.store.initialize();
         self.call_states.clear();
+        self.graph = None;
+        self.dirty_calls.clear();
+        self.graph_dirty = false;
     }
 
     pub fn step(
@@ -49,36 +69,22 @@ impl IncrementalBackend {
         let mut outputs = BTreeMap::new();
 
         for req in requests {
-            let state = self
+            let slot = self
                 .call_states
-                .remove(&req.node_id)
-                .unwrap_or_else(|| initialize_kernel_state(req.kernel_id, &req.kwargs));
+                .entry(req.node_id)
+                .or_insert_with(|| initialize_kernel_state(req.kernel_id, &req.kwargs));
+            let state = std::mem::replace(
+                slot,
+                KernelRuntimeState::Generic {
+                    kernel_id: req.kernel_id,
+                },
+            );
 
-            let input = tick
-                .get(&req.input_field)
-                .cloned()
-                .unwrap_or(IncrementalValue::Null);
-
-            let (new_state, out) = eval_call_step(req.kernel_id, state, input, tick);
-            self.call_states.insert(req.node_id, new_state);
-            let state_blob = self
-                .call_states
-                .get(&req.node_id)
-                .map(state_codec::encode_kernel_state)
-                .unwrap_or_default();
-
-            let ticks_processed = self
-                .store
-                .get_node(req.node_id)
-                .map(|s| s.ticks_processed + 1)
-                .unwrap_or(1);
-
-            self.store.upsert_node(NodeRuntimeState {
-                node_id: req.node_id,
-                ticks_processed,
-                last_output: out.clone(),
-                state_blob,
-            });
+            let inputs = request_inputs(req, tick);
+            let (new_state, out) = eval_call_step_inputs(req.kernel_id, state, &inputs, tick);
+            *slot = new_state;
+            self.dirty_calls.insert(req.node_id);
+            self.store.record_step(req.node_id, out.clone());
 
             outputs.insert(req.node_id, out);
         }
@@ -86,12 +92,118 @@ impl IncrementalBackend {
         outputs
     }
 
-    pub fn snapshot(&self) -> RuntimeSnapshot {
+    /// Steps `requests` over every tick in `columns`, numbering events from
+    /// `first_event_index`. With `last_only`, only the outputs of the final
+    /// tick are kept.
+    pub fn step_batch(
+        &mut self,
+        first_event_index: u64,
+        requests: &[KernelStepRequest],
+        columns: &TickColumns,
+        last_only: bool,
+    ) -> Result<BatchOutputs, ExecutePlanError> {
+        step_columns(columns, last_only, |row, tick| {
+            self.step(first_event_index + row, requests, tick)
+        })
+    }
+
+    /// Advances the loaded step graph over every tick in `columns`, like
+    /// [`Self::step_batch`]. Errors are raised before any tick is stepped.
+    pub fn step_graph_batch(
+        &mut self,
+        first_event_index: u64,
+        columns: &TickColumns,
+        last_only: bool,
+    ) -> Result<BatchOutputs, ExecutePlanError> {
+        let graph = self
+            .graph
+            .as_mut()
+            .ok_or_else(|| ExecutePlanError::InvalidPayload("no step graph loaded".to_string()))?;
+        let store = &mut self.store;
+        let outputs = step_columns(columns, last_only, |row, tick| {
+            store.set_last_event_index(first_event_index + row);
+            graph.step(tick)
+        })?;
+        self.graph_dirty |= !columns.values().all(Vec::is_empty);
+        Ok(outputs)
+    }
+
+    /// Installs a compiled step graph for `step_graph`. Node state already in
+    /// the store (for example from `restore`) is carried over.
+    pub fn load_graph(&mut self, mut graph: StepGraph) {
+        self.flush_state();
+        graph.restore(&self.store.snapshot());
+        self.graph = Some(graph);
+    }
+
+    /// Advances the loaded step graph by one tick, returning every node value.
+    pub fn step_graph(
+        &mut self,
+        event_index: u64,
+        tick: &BTreeMap<String, IncrementalValue>,
+    ) -> Result<BTreeMap<u32, IncrementalValue>, ExecutePlanError> {
+        let graph = self
+            .graph
+            .as_mut()
+            .ok_or_else(|| ExecutePlanError::InvalidPayload("no step graph loaded".to_string()))?;
+        self.store.set_last_event_index(event_index);
+        let outputs = graph.step(tick);
+        self.graph_dirty = true;
+        Ok(outputs)
+    }
+
+    pub fn replay_graph(
+        &mut self,
+        events: &[BTreeMap<String, IncrementalValue>],
+    ) -> Result<Vec<BTreeMap<u32, IncrementalValue>>, ExecutePlanError> {
+        events
+            .iter()
+            .enumerate()
+            .map(|(idx, tick)| self.step_graph(idx as u64 + 1, tick))
+            .collect()
+    }
+
+    pub fn snapshot(&mut self) -> RuntimeSnapshot {
+        self.flush_state();
         self.store.snapshot()
     }
 
+    /// Approximate heap held by node state, measured on its encoded form.
+    /// State stepped since the last snapshot is encoded first.
+    pub fn state_bytes(&mut self) -> usize {
+        self.flush_state();
+        self.store.heap_bytes()
+    }
+
+    /// Encodes the state of every node that stepped since the last flush.
+    fn flush_state(&mut self) {
+        for node_id in std::mem::take(&mut self.dirty_calls) {
+            if let Some(state) = self.call_states.get(&node_id) {
+                self.store
+                    .set_state_blob(node_id, state_codec::encode_kernel_state(state));
+            }
+        }
+        if std::mem::take(&mut self.graph_dirty) {
+            if let Some(graph) = self.graph.as_ref() {
+                for (node_id, ticks_processed, last_output, state_blob) in graph.node_states() {
+                    self.store.upsert_node(NodeRuntimeState {
+                        node_id,
+                        ticks_processed,
+                        last_output: last_output.clone(),
+                        state_blob,
+                    });
+                }
+            }
+        }
+    }
+
     pub fn restore(&mut self, snapshot: RuntimeSnapshot) -> Result<(), &'static str> {
         self.store.restore(snapshot.clone())?;
+        if let Some(graph) = self.graph.as_mut() {
+            graph.restore(&snapshot);
+        }
+        self.dirty_calls.clear();
+        self.graph_dirty = false;
         self.call_states.clear();
         for (node_id, node) in snapshot.nodes {
             if let Some(state) = state_codec::decode_kernel_state(&node.state_blob) {
@@ -114,6 +226,73 @@ impl IncrementalBackend {
     }
 }
 
+/// Feeds each row of `columns` to `step` as a tick. The tick map is built
+/// once and its values overwritten in place, so rows cost no allocation
+/// beyond what `step` itself does.
+///
+/// The columns are validated before the first row and `step` cannot fail, so
+/// a batch is either consumed whole or rejected without touching any state.
+fn step_columns(
+    columns: &TickColumns,
+    last_only: bool,
+    mut step: impl FnMut(u64, &BTreeMap<String, IncrementalValue>) -> BTreeMap<u32, IncrementalValue>,
+) -> Result<BatchOutputs, ExecutePlanError> {
+    let mut lengths = columns.values().map(Vec::len);
+    let rows = lengths.next().unwrap_or(0);
+    if lengths.any(|len| len != rows) {
+        return Err(ExecutePlanError::InvalidPayload(
+            "tick columns must all have the same length".to_string(),
+        ));
+    }
+
+    let mut tick: BTreeMap<String, IncrementalValue> = columns
+        .keys()
+        .map(|field| (field.clone(), IncrementalValue::Null))
+        .collect();
+    let kept_rows = if last_only { rows.min(1) } else { rows };
+    let mut outputs = BatchOutputs::new();
+    for row in 0..rows {
+        // Both maps iterate in field order, so the zip pairs them up.
+        for (slot, values) in tick.values_mut().zip(columns.values()) {
+            *slot = IncrementalValue::Number(values[row]);
+        }
+        let values = step(row as u64, &tick);
+        if last_only && row + 1 < rows {
+            continue;
+        }
+        for (node_id, value) in values {
+            outputs
+                .entry(node_id)
+                .or_insert_with(|| Vec::with_capacity(kept_rows))
+                .push(value);
+        }
+    }
+    Ok(outputs)
+}
+
+/// Resolves the tick fields feeding a request: `input_field` first, then the
+/// `input_1`/`input_2` field names of multi-input kernels. Fields missing from
+/// the tick fall back to close.
+fn request_inputs(
+    req: &KernelStepRequest,
+    tick: &BTreeMap<String, IncrementalValue>,
+) -> Vec<IncrementalValue> {
+    let field_value = |field: &str| {
+        tick.get(field)
+            .or_else(|| tick.get("close"))
+            .cloned()
+            .unwrap_or(IncrementalValue::Null)
+    };
+    let mut inputs = vec![field_value(&req.input_field)];
+    for key in ["input_1", "input_2"] {
+        match req.kwargs.get(key) {
+            Some(IncrementalValue::Text(field)) => inputs.push(field_value(field)),
+            _ => break,
+        }
+    }
+    inputs
+}
+
 #[derive(Debug, Error, PartialEq, Eq)]
 pub enum ExecutePlanError {
     #[error(transparent)]
@@ -136,6 +315,8 @@ pub enum ExecutePlanError {
     InvalidPayload(String),
     #[error("unsupported kernel_id in payload: {0}")]
     UnsupportedKernelId(String),
+    #[error("unknown plan id: {0}")]
+    UnknownPlan(u64),
 }
 
 pub fn execute_plan(
@@ -217,6 +398,57 @@ pub fn parse_execute_plan_payload(
 
 pub fn execute_plan_graph_payload(
     payload: &RustExecutionPayload,
-) -> Result<BTreeMap<u32, Vec<IncrementalValue>>, ExecutePlanError> {
+) -> Result<BTreeMap<u32, NodeColumn<'static>>, ExecutePlanError> {
     graph_exec::execute_plan_graph_payload(payload)
 }
+
+pub fn execute_plan_graph_root(
+    payload: &RustExecutionPayload,
+) -> Result<NodeColumn<'static>, ExecutePlanError> {
+    graph_exec::execute_plan_graph_root(payload)
+}
+
+/// Columns produced by one graph evaluation, keyed by node id.
+pub type GraphOutputs = BTreeMap<u32, NodeColumn<'static>>;
+
+/// Knobs for graph execution.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct GraphExecOptions {
+    /// Return only the root column, releasing intermediate columns as soon as
+    /// their last consumer has run.
+    pub root_only: bool,
+    /// Worker threads: `1` (the default) evaluates on the calling thread,
+    /// `0` uses one worker per available core.
+    pub threads: usize,
+}
+
+impl Default for GraphExecOptions {
+    fn default() -> Self {
+        Self {
+            root_only: false,
+            threads: 1,
+        }
+    }
+}
+
+pub fn execute_plan_graph_with(
+    payload: &RustExecutionPayload,
+    options: &GraphExecOptions,
+) -> Result<GraphOutputs, ExecutePlanError> {
+    graph_exec::execute_plan_graph_with(payload, options)
+}
+
+pub fn execute_plan_graph_batch(
+    payload: &RustExecutionPayload,
+    partitions: &[RustExecutionPartition],
+    options: &GraphExecOptions,
+) -> Result<Vec<Result<GraphOutputs, ExecutePlanError>>, ExecutePlanError> {
+    graph_exec::execute_plan_graph_batch(payload, partitions, options)
+}
+
+pub fn matching_partitions(
+    dataset_id: DatasetId,
+    pattern: &RustExecutionPartition,
+) -> Result<Vec<RustExecutionPartition>, ExecutePlanError> {
+    graph_exec::matching_partitions(dataset_id, pattern)
+}
@@ -0,0 +1,304 @@
+//! Typed columnar node outputs for the batch graph executor.
+//!
+//! Numeric outputs are `f64` columns, borrowed straight from the dataset
+//! partition for source references; boolean outputs are packed bitmaps and
+//! literals or aggregates are a single broadcast value. Null rows are tracked
+//! in an optional validity bitmap, and numeric null rows always hold NaN so
+//! the raw values can feed indicator kernels without a copy.
+
+use std::borrow::Cow;
+
+use super::contracts::IncrementalValue;
+
+/// Packed bit vector used for boolean values and row validity.
+#[derive(Debug, Clone, PartialEq, Eq, Default)]
+pub struct Bitmap {
+    words: Vec<u64>,
+    len: usize,
+}
+
+impl Bitmap {
+    pub fn new(len: usize, value: bool) -> Self {
+        let fill = if value { u64::MAX } else { 0 };
+        let mut bitmap = Self {
+            words: vec![fill; len.div_ceil(64)],
+            len,
+        };
+        bitmap.clear_tail();
+        bitmap
+    }
+
+    pub fn from_fn(len: usize, mut f: impl FnMut(usize) -> bool) -> Self {
+        let mut words = vec![0_u64; len.div_ceil(64)];
+        for (idx, word) in words.iter_mut().enumerate() {
+            let start = idx * 64;
+            let end = (start + 64).min(len);
+            let mut bits = 0_u64;
+            for row in start..end {
+                bits |= (f(row) as u64) << (row - start);
+            }
+            *word = bits;
+        }
+        Self { words, len }
+    }
+
+    pub fn from_bools(values: &[bool]) -> Self {
+        Self::from_fn(values.len(), |row| values[row])
+    }
+
+    pub fn len(&self) -> usize {
+        self.len
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len == 0
+    }
+
+    #[inline]
+    pub fn get(&self, row: usize) -> bool {
+        (self.words[row / 64] >> (row % 64)) & 1 == 1
+    }
+
+    pub fn set(&mut self, row: usize, value: bool) {
+        let mask = 1_u64 << (row % 64);
+        if value {
+            self.words[row / 64] |= mask;
+        } else {
+            self.words[row / 64] &= !mask;
+        }
+    }
+
+    pub fn count_ones(&self) -> usize {
+        self.words.iter().map(|w| w.count_ones() as usize).sum()
+    }
+
+    pub fn all(&self) -> bool {
+        self.count_ones() == self.len
+    }
+
+    pub fn and(&self, other: &Bitmap) -> Bitmap {
+        Bitmap {
+            words: self
+                .words
+                .iter()
+                .zip(other.words.iter())
+                .map(|(a, b)| a & b)
+                .collect(),
+            len: self.len,
+        }
+    }
+
+    fn clear_tail(&mut self) {
+        let tail = self.len % 64;
+        if tail != 0 {
+            if let Some(last) = self.words.last_mut() {
+                *last &= (1_u64 << tail) - 1;
+            }
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+pub enum ColumnData<'a> {
+    Number(Cow<'a, [f64]>),
+    Bool(Bitmap),
+    /// One value broadcast over every row (literals and aggregates).
+    Scalar(IncrementalValue),
+}
+
+/// Output of one graph node over every row of the partition.
+#[derive(Debug, Clone, PartialEq)]
+pub struct NodeColumn<'a> {
+    len: usize,
+    data: ColumnData<'a>,
+    /// Row validity; `None` when no row is null.
+    validity: Option<Bitmap>,
+}
+
+impl<'a> NodeColumn<'a> {
+    pub fn numbers(values: impl Into<Cow<'a, [f64]>>) -> Self {
+        let values = values.into();
+        Self {
+            len: values.len(),
+            data: ColumnData::Number(values),
+            validity: None,
+        }
+    }
+
+    /// Numeric column whose null rows are given by `validity`; the values of
+    /// null rows are overwritten with NaN.
+    pub fn numbers_with_validity(mut values: Vec<f64>, validity: Bitmap) -> Self {
+        if validity.all() {
+            return Self::numbers(values);
+        }
+        for (row, value) in values.iter_mut().enumerate() {
+            if !validity.get(row) {
+                *value = f64::NAN;
+            }
+        }
+        Self {
+            len: values.len(),
+            data: ColumnData::Number(Cow::Owned(values)),
+            validity: Some(validity),
+        }
+    }
+
+    pub fn bools(values: Bitmap) -> Self {
+        Self {
+            len: values.len(),
+            data: ColumnData::Bool(values),
+            validity: None,
+        }
+    }
+
+    pub fn scalar(value: IncrementalValue, len: usize) -> Self {
+        Self {
+            len,
+            data: ColumnData::Scalar(value),
+            validity: None,
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.len
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len == 0
+    }
+
+    pub fn data(&self) -> &ColumnData<'a> {
+        &self.data
+    }
+
+    pub fn validity(&self) -> Option<&Bitmap> {
+        self.validity.as_ref()
+    }
+
+    #[inline]
+    pub fn is_null(&self, row: usize) -> bool {
+        match (&self.validity, &self.data) {
+            (Some(validity), _) if !validity.get(row) => true,
+            (_, ColumnData::Scalar(IncrementalValue::Null)) => true,
+            _ => false,
+        }
+    }
+
+    /// Row value in the boxed representation used at the API boundary.
+    pub fn value(&self, row: usize) -> IncrementalValue {
+        if self.is_null(row) {
+            return IncrementalValue::Null;
+        }
+        match &self.data {
+            ColumnData::Number(values) => IncrementalValue::Number(values[row]),
+            ColumnData::Bool(bits) => IncrementalValue::Bool(bits.get(row)),
+            ColumnData::Scalar(value) => value.clone(),
+        }
+    }
+
+    pub fn to_values(&self) -> Vec<IncrementalValue> {
+        (0..self.len).map(|row| self.value(row)).collect()
+    }
+
+    /// Numeric view with the semantics of `IncrementalValue::as_f64`. Numeric
+    /// columns are returned without copying.
+    pub fn as_f64(&self) -> Cow<'_, [f64]> {
+        match &self.data {
+            ColumnData::Number(values) => Cow::Borrowed(values.as_ref()),
+            _ => Cow::Owned((0..self.len).map(|row| self.f64_at(row)).collect()),
+        }
+    }
+
+    #[inline]
+    pub fn f64_at(&self, row: usize) -> f64 {
+        if self.is_null(row) {
+            return f64::NAN;
+        }
+        match &self.data {
+            ColumnData::Number(values) => values[row],
+            ColumnData::Bool(bits) => {
+                if bits.get(row) {
+                    1.0
+                } else {
+                    0.0
+                }
+            }
+            ColumnData::Scalar(value) => value.as_f64(),
+        }
+    }
+
+    #[inline]
+    pub fn truthy_at(&self, row: usize) -> bool {
+        if self.is_null(row) {
+            return false;
+        }
+        match &self.data {
+            ColumnData::Number(values) => values[row] != 0.0 && !values[row].is_nan(),
+            ColumnData::Bool(bits) => bits.get(row),
+            ColumnData::Scalar(value) => super::graph_exec::truthy(value),
+        }
+    }
+
+    /// Copies borrowed source values so the column outlives the partition.
+    pub fn into_owned(self) -> NodeColumn<'static> {
+        NodeColumn {
+            len: self.len,
+            data: match self.data {
+                ColumnData::Number(values) => ColumnData::Number(Cow::Owned(values.into_owned())),
+                ColumnData::Bool(bits) => ColumnData::Bool(bits),
+                ColumnData::Scalar(value) => ColumnData::Scalar(value),
+            },
+            validity: self.validity,
+        }
+    }
+
+    /// Same column borrowing this one's numeric values.
+    pub fn view(&self) -> NodeColumn<'_> {
+        NodeColumn {
+            len: self.len,
+            data: match &self.data {
+                ColumnData::Number(values) => ColumnData::Number(Cow::Borrowed(values.as_ref())),
+                ColumnData::Bool(bits) => ColumnData::Bool(bits.clone()),
+                ColumnData::Scalar(value) => ColumnData::Scalar(value.clone()),
+            },
+            validity: self.validity.clone(),
+        }
+    }
+
+    /// Approximate heap footprint of the column's buffers.
+    pub fn heap_bytes(&self) -> usize {
+        let data = match &self.data {
+            ColumnData::Number(values) => std::mem::size_of_val(values.as_ref()),
+            ColumnData::Bool(bits) => std::mem::size_of_val(bits.words.as_slice()),
+            ColumnData::Scalar(_) => 0,
+        };
+        let validity = self
+            .validity
+            .as_ref()
+            .map_or(0, |bits| std::mem::size_of_val(bits.words.as_slice()));
+        data + validity
+    }
+
+    /// Keeps the rows where `keep` is set and nulls the rest.
+    pub fn filter(&self, keep: &Bitmap) -> NodeColumn<'static> {
+        let validity = match &self.validity {
+            Some(validity) => validity.and(keep),
+            None => keep.clone(),
+        };
+        match &self.data {
+            ColumnData::Number(values) => {
+                NodeColumn::numbers_with_validity(values.to_vec(), validity)
+            }
+            ColumnData::Bool(bits) => NodeColumn {
+                len: self.len,
+                data: ColumnData::Bool(bits.clone()),
+                validity: Some(validity),
+            },
+            ColumnData::Scalar(value) => NodeColumn {
+                len: self.len,
+                data: ColumnData::Scalar(value.clone()),
+                validity: Some(validity),
+            },
+        }
+    }
+}
@@ -1,6 +1,6 @@
 use std::collections::BTreeMap;
 
-pub const INCREMENTAL_STATE_SCHEMA_VERSION: u16 = 1;
+pub const INCREMENTAL_STATE_SCHEMA_VERSION: u16 = 2;
 
 #[derive(Debug, Clone, PartialEq)]
 pub enum IncrementalValue {
@@ -8,6 +8,46 @@ pub enum IncrementalValue {
     Bool(bool),
     Text(String),
     Null,
+    /// Float array held in kernel state blobs (windows, histories).
+    Numbers(Vec<f64>),
+}
+
+impl IncrementalValue {
+    /// Numeric view used by kernels and operators: booleans map to 1/0,
+    /// unparsable text to 0, and null and arrays to NaN.
+    pub fn as_f64(&self) -> f64 {
+        match self {
+            IncrementalValue::Number(v) => *v,
+            IncrementalValue::Bool(v) => {
+                if *v {
+                    1.0
+                } else {
+                    0.0
+                }
+            }
+            IncrementalValue::Text(v) => v.parse::<f64>().unwrap_or(0.0),
+            IncrementalValue::Null | IncrementalValue::Numbers(_) => f64::NAN,
+        }
+    }
+
+    /// Bytes owned on the heap by this value.
+    pub fn heap_bytes(&self) -> usize {
+        match self {
+            IncrementalValue::Text(v) => v.capacity(),
+            IncrementalValue::Numbers(v) => v.capacity() * std::mem::size_of::<f64>(),
+            _ => 0,
+        }
+    }
+}
+
+/// Heap bytes of an encoded state blob, counting each map entry inline.
+pub fn state_blob_heap_bytes(state_blob: &BTreeMap<String, IncrementalValue>) -> usize {
+    state_blob
+        .iter()
+        .map(|(key, value)| {
+            std::mem::size_of::<(String, IncrementalValue)>() + key.capacity() + value.heap_bytes()
+        })
+        .sum()
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -45,6 +85,12 @@ pub struct NodeSnapshotState {
     pub state_blob: BTreeMap<String, IncrementalValue>,
 }
 
+impl NodeSnapshotState {
+    pub fn heap_bytes(&self) -> usize {
+        self.last_output.heap_bytes() + state_blob_heap_bytes(&self.state_blob)
+    }
+}
+
 impl RuntimeSnapshot {
     pub fn empty() -> Self {
         Self {
@@ -53,4 +99,12 @@ impl RuntimeSnapshot {
             nodes: BTreeMap::new(),
         }
     }
+
+    /// Approximate heap footprint, used for registry memory accounting.
+    pub fn heap_bytes(&self) -> usize {
+        self.nodes
+            .values()
+            .map(|node| std::mem::size_of::<(u32, NodeSnapshotState)>() + node.heap_bytes())
+            .sum()
+    }
 }
@@ -1,519 +1,1011 @@
-use std::collections::BTreeMap;
+use std::borrow::Cow;
+use std::collections::btree_map::Entry;
+use std::collections::hash_map::DefaultHasher;
+use std::collections::{BTreeMap, BTreeSet};
+use std::hash::{Hash, Hasher};
+use std::sync::Arc;
 
-use crate::contracts::RustExecutionPayload;
-use crate::dataset::{self, DatasetPartitionKey};
+use crate::contracts::{RustExecutionGraph, RustExecutionPartition, RustExecutionPayload};
+use crate::dataset::{self, DatasetPartition, DatasetPartitionKey, DatasetRegistryError};
+use crate::execution::parallel::par_map;
 
-use super::backend::ExecutePlanError;
+use super::backend::{ExecutePlanError, GraphExecOptions, GraphOutputs};
+use super::columns::{Bitmap, ColumnData, NodeColumn};
 use super::contracts::IncrementalValue;
+use super::result_cache::{NodeSignature, PartitionMemo};
 
+/// Evaluates every node of the payload graph over the whole partition.
 pub(crate) fn execute_plan_graph_payload(
     payload: &RustExecutionPayload,
-) -> Result<BTreeMap<u32, Vec<IncrementalValue>>, ExecutePlanError> {
+) -> Result<BTreeMap<u32, NodeColumn<'static>>, ExecutePlanError> {
+    execute_plan_graph_with(payload, &GraphExecOptions::default())
+}
+
+/// Evaluates the payload graph with explicit `options`; with
+/// `options.root_only` the map holds the root column alone.
+pub(crate) fn execute_plan_graph_with(
+    payload: &RustExecutionPayload,
+    options: &GraphExecOptions,
+) -> Result<GraphOutputs, ExecutePlanError> {
+    let plan = compile_payload(payload)?;
+    execute_compiled(&plan, payload.dataset_id, &payload.partition, options)
+}
+
+/// Evaluates the payload graph and returns the root column only, releasing
+/// intermediate columns as soon as their last consumer has run.
+pub(crate) fn execute_plan_graph_root(
+    payload: &RustExecutionPayload,
+) -> Result<NodeColumn<'static>, ExecutePlanError> {
+    let options = GraphExecOptions {
+        root_only: true,
+        ..GraphExecOptions::default()
+    };
+    let mut outputs = execute_plan_graph_with(payload, &options)?;
+    outputs.remove(&payload.graph.root_id).ok_or_else(|| {
+        ExecutePlanError::InvalidPayload(format!(
+            "missing output for root node {}",
+            payload.graph.root_id
+        ))
+    })
+}
+
+/// Evaluates the payload graph over each of `partitions` (the payload's own
+/// partition is ignored) on `options.threads` workers. Partitions are the
+/// unit of parallelism; a single partition is spread over its DAG levels
+/// instead. Results are returned in input order.
+pub(crate) fn execute_plan_graph_batch(
+    payload: &RustExecutionPayload,
+    partitions: &[RustExecutionPartition],
+    options: &GraphExecOptions,
+) -> Result<Vec<Result<GraphOutputs, ExecutePlanError>>, ExecutePlanError> {
+    let plan = compile_payload(payload)?;
+    Ok(execute_compiled_batch(
+        &plan,
+        payload.dataset_id,
+        partitions,
+        options,
+    ))
+}
+
+/// Evaluates a compiled graph over one partition of `dataset_id`.
+pub(crate) fn execute_compiled(
+    plan: &CompiledGraph,
+    dataset_id: u64,
+    target: &RustExecutionPartition,
+    options: &GraphExecOptions,
+) -> Result<GraphOutputs, ExecutePlanError> {
+    evaluate_partition(plan, dataset_id, target, options.root_only, options.threads)
+}
+
+/// Batch counterpart of [`execute_compiled`]; see [`execute_plan_graph_batch`].
+pub(crate) fn execute_compiled_batch(
+    plan: &CompiledGraph,
+    dataset_id: u64,
+    partitions: &[RustExecutionPartition],
+    options: &GraphExecOptions,
+) -> Vec<Result<GraphOutputs, ExecutePlanError>> {
+    if let [target] = partitions {
+        return vec![execute_compiled(plan, dataset_id, target, options)];
+    }
+    par_map(partitions, options.threads, |target| {
+        evaluate_partition(plan, dataset_id, target, options.root_only, 1)
+    })
+}
+
+/// Partitions of the payload dataset matching `pattern`, where `"*"` in any
+/// field matches every value.
+pub(crate) fn matching_partitions(
+    dataset_id: u64,
+    pattern: &RustExecutionPartition,
+) -> Result<Vec<RustExecutionPartition>, ExecutePlanError> {
+    let matches = |want: &str, have: &str| want == "*" || want == have;
+    Ok(dataset::partition_keys(dataset_id)?
+        .into_iter()
+        .filter(|key| {
+            matches(&pattern.symbol, &key.symbol)
+                && matches(&pattern.timeframe, &key.timeframe)
+                && matches(&pattern.source, &key.source)
+        })
+        .map(|key| RustExecutionPartition {
+            symbol: key.symbol,
+            timeframe: key.timeframe,
+            source: key.source,
+        })
+        .collect())
+}
+
+fn compile_payload(payload: &RustExecutionPayload) -> Result<CompiledGraph, ExecutePlanError> {
     payload
         .validate()
         .map_err(ExecutePlanError::InvalidPayload)?;
-    let record = dataset::get_dataset(payload.dataset_id)?;
+    CompiledGraph::compile(&payload.graph)
+}
+
+fn evaluate_partition(
+    plan: &CompiledGraph,
+    dataset_id: u64,
+    target: &RustExecutionPartition,
+    root_only: bool,
+    threads: usize,
+) -> Result<GraphOutputs, ExecutePlanError> {
+    let partition = load_partition(dataset_id, target)?;
+    let memo = PartitionMemo::load(dataset_id, partition.version, plan.memo_nodes());
+    let outputs = evaluate_graph(plan, target, &partition, memo.as_ref(), !root_only, threads)?;
+    Ok(outputs
+        .into_iter()
+        .filter(|(node_id, _)| !root_only || *node_id == plan.root_id)
+        .map(|(node_id, column)| (node_id, column.into_owned()))
+        .collect())
+}
+
+fn load_partition(
+    dataset_id: u64,
+    target: &RustExecutionPartition,
+) -> Result<Arc<DatasetPartition>, ExecutePlanError> {
     let partition_key = DatasetPartitionKey {
-        symbol: payload.partition.symbol.clone(),
-        timeframe: payload.partition.timeframe.clone(),
-        source: payload.partition.source.clone(),
+        symbol: target.symbol.clone(),
+        timeframe: target.timeframe.clone(),
+        source: target.source.clone(),
     };
-    let partition = record.partitions.get(&partition_key).ok_or_else(|| {
-        ExecutePlanError::PartitionNotFound {
+    dataset::get_partition(dataset_id, &partition_key).map_err(|err| match err {
+        DatasetRegistryError::UnknownPartition { .. } => ExecutePlanError::PartitionNotFound {
             symbol: partition_key.symbol.clone(),
             timeframe: partition_key.timeframe.clone(),
             data_source: partition_key.source.clone(),
-        }
-    })?;
-    let rows = partition
-        .ohlcv
-        .as_ref()
-        .map(|ohlcv| ohlcv.timestamps.len())
-        .or_else(|| partition.series.values().next().map(|s| s.timestamps.len()))
-        .ok_or_else(|| ExecutePlanError::MissingOhlcv {
-            symbol: partition_key.symbol.clone(),
-            timeframe: partition_key.timeframe.clone(),
-            data_source: partition_key.source.clone(),
-        })?;
-    let mut outputs: BTreeMap<u32, Vec<IncrementalValue>> = BTreeMap::new();
+        },
+        other => other.into(),
+    })
+}
 
-    for node_id in &payload.graph.node_order {
-        let meta = payload.graph.nodes.get(node_id).ok_or_else(|| {
-            ExecutePlanError::InvalidPayload(format!("missing node metadata for id {node_id}"))
-        })?;
-        let kind = meta.get("kind").ok_or_else(|| {
-            ExecutePlanError::InvalidPayload(format!("missing node kind for id {node_id}"))
-        })?;
-        let child_ids = payload
-            .graph
-            .edges
-            .get(node_id)
-            .cloned()
-            .unwrap_or_default();
-
-        let series = match kind.as_str() {
-            "source_ref" => {
-                let field = meta
-                    .get("field")
-                    .cloned()
-                    .unwrap_or_else(|| "close".to_string());
-                let source_name = meta.get("source").cloned().unwrap_or_default();
-                if let Some(series) = partition.series.get(&field) {
-                    series
-                        .values
-                        .iter()
-                        .copied()
-                        .map(IncrementalValue::Number)
-                        .collect()
-                } else if let Some(series) = partition.series.get(&source_name) {
-                    series
-                        .values
-                        .iter()
-                        .copied()
-                        .map(IncrementalValue::Number)
-                        .collect()
-                } else {
-                    match field.as_str() {
-                        "open" => partition
-                            .ohlcv
-                            .as_ref()
-                            .map(|ohlcv| {
-                                ohlcv
-                                    .open
-                                    .iter()
-                                    .copied()
-                                    .map(IncrementalValue::Number)
-                                    .collect()
-                            })
-                            .ok_or_else(|| ExecutePlanError::MissingOhlcv {
-                                symbol: partition_key.symbol.clone(),
-                                timeframe: partition_key.timeframe.clone(),
-                                data_source: partition_key.source.clone(),
-                            })?,
-                        "high" => partition
-                            .ohlcv
-                            .as_ref()
-                            .map(|ohlcv| {
-                                ohlcv
-                                    .high
-                                    .iter()
-                                    .copied()
-                                    .map(IncrementalValue::Number)
-                                    .collect()
-                            })
-                            .ok_or_else(|| ExecutePlanError::MissingOhlcv {
-                                symbol: partition_key.symbol.clone(),
-                                timeframe: partition_key.timeframe.clone(),
-                                data_source: partition_key.source.clone(),
-                            })?,
-                        "low" => partition
-                            .ohlcv
-                            .as_ref()
-                            .map(|ohlcv| {
-                                ohlcv
-                                    .low
-                                    .iter()
-                                    .copied()
-                                    .map(IncrementalValue::Number)
-                                    .collect()
-                            })
-                            .ok_or_else(|| ExecutePlanError::MissingOhlcv {
-                                symbol: partition_key.symbol.clone(),
-                                timeframe: partition_key.timeframe.clone(),
-                                data_source: partition_key.source.clone(),
-                            })?,
-                        "volume" => partition
-                            .ohlcv
-                            .as_ref()
-                            .map(|ohlcv| {
-                                ohlcv
-                                    .volume
-                                    .iter()
-                                    .copied()
-                                    .map(IncrementalValue::Number)
-                                    .collect()
-                            })
-                            .ok_or_else(|| ExecutePlanError::MissingOhlcv {
-                                symbol: partition_key.symbol.clone(),
-                                timeframe: partition_key.timeframe.clone(),
-                                data_source: partition_key.source.clone(),
-                            })?,
-                        _ => partition
-                            .ohlcv
-                            .as_ref()
-                            .map(|ohlcv| {
-                                ohlcv
-                                    .close
-                                    .iter()
-                                    .copied()
-                                    .map(IncrementalValue::Number)
-                                    .collect()
-                            })
-                            .ok_or_else(|| ExecutePlanError::MissingOhlcv {
-                                symbol: partition_key.symbol.clone(),
-                                timeframe: partition_key.timeframe.clone(),
-                                data_source: partition_key.source.clone(),
-                            })?,
-                    }
+/// Execution graph checked and resolved once: node kinds, literals and
+/// non-kernel parameters are typed, and the DAG levels, kernel groups and
+/// consumer counts are precomputed, so an evaluation only walks nodes and
+/// runs kernels. Call kernel parameters stay in the node metadata and are
+/// read when the kernel is dispatched. Every node carries a structural
+/// signature so call outputs can be shared through the result cache.
+#[derive(Debug)]
+pub struct CompiledGraph {
+    root_id: u32,
+    node_order: Vec<u32>,
+    nodes: BTreeMap<u32, CompiledNode>,
+    /// Units of work of each DAG level for parallel walks.
+    levels: Vec<Vec<Vec<u32>>>,
+    /// Number of consumers reading each node's column.
+    uses: BTreeMap<u32, usize>,
+}
+
+#[derive(Debug)]
+struct CompiledNode {
+    children: Vec<u32>,
+    op: NodeOp,
+    signature: NodeSignature,
+}
+
+#[derive(Debug)]
+enum NodeOp {
+    SourceRef { field: String, source: String },
+    Literal(IncrementalValue),
+    Call(CallOp),
+    TimeShift { steps: usize, operation: String },
+    BinaryOp(String),
+    UnaryOp(String),
+    Filter,
+    Aggregate(String),
+}
+
+#[derive(Debug)]
+struct CallOp {
+    name: String,
+    meta: BTreeMap<String, String>,
+    /// Field `select` reads from series-only partitions.
+    select_field: String,
+    /// Literal children read the partition's default column instead.
+    literal_children: Vec<bool>,
+    /// Index and member count of the planner `kernel_group`, if any.
+    group: Option<(usize, usize)>,
+}
+
+impl CompiledGraph {
+    pub fn compile(graph: &RustExecutionGraph) -> Result<Self, ExecutePlanError> {
+        graph.validate().map_err(ExecutePlanError::InvalidPayload)?;
+        let mut group_ids: BTreeMap<&str, usize> = BTreeMap::new();
+        let mut group_sizes: Vec<usize> = Vec::new();
+        for node_id in &graph.node_order {
+            if let Some(group) = graph
+                .nodes
+                .get(node_id)
+                .and_then(|meta| meta.get("kernel_group"))
+            {
+                let next = group_ids.len();
+                let index = *group_ids.entry(group.as_str()).or_insert(next);
+                if index == group_sizes.len() {
+                    group_sizes.push(0);
                 }
+                group_sizes[index] += 1;
             }
-            "literal" => {
-                let value_str = meta
-                    .get("value")
-                    .cloned()
-                    .unwrap_or_else(|| "0".to_string());
-                if value_str.eq_ignore_ascii_case("true") {
-                    vec![IncrementalValue::Bool(true); rows]
-                } else if value_str.eq_ignore_ascii_case("false") {
-                    vec![IncrementalValue::Bool(false); rows]
-                } else if let Ok(value) = value_str.parse::<f64>() {
-                    vec![IncrementalValue::Number(value); rows]
-                } else {
-                    vec![IncrementalValue::Text(value_str); rows]
-                }
+        }
+
+        let mut nodes: BTreeMap<u32, CompiledNode> = BTreeMap::new();
+        let mut uses: BTreeMap<u32, usize> = BTreeMap::new();
+        for node_id in &graph.node_order {
+            let children = graph.edges.get(node_id).cloned().unwrap_or_default();
+            for child_id in &children {
+                *uses.entry(*child_id).or_default() += 1;
             }
-            "call" => {
-                let name = meta
-                    .get("name")
-                    .cloned()
-                    .unwrap_or_else(|| "unknown".to_string());
-                if name == "select" && partition.ohlcv.is_none() {
-                    let field = meta
+            let meta = graph.nodes.get(node_id).ok_or_else(|| {
+                ExecutePlanError::InvalidPayload(format!("missing node metadata for id {node_id}"))
+            })?;
+            let kind = meta.get("kind").ok_or_else(|| {
+                ExecutePlanError::InvalidPayload(format!("missing node kind for id {node_id}"))
+            })?;
+            let text = |key: &str, default: &str| {
+                meta.get(key)
+                    .map(|s| s.as_str())
+                    .unwrap_or(default)
+                    .to_string()
+            };
+            let require = |count: usize, what: &str| {
+                if children.len() < count {
+                    let needs = if count == 1 {
+                        "one child"
+                    } else {
+                        "two children"
+                    };
+                    return Err(ExecutePlanError::InvalidPayload(format!(
+                        "{what} node {node_id} requires {needs}"
+                    )));
+                }
+                Ok(())
+            };
+            let op = match kind.as_str() {
+                "source_ref" => NodeOp::SourceRef {
+                    field: text("field", "close"),
+                    source: text("source", ""),
+                },
+                "literal" => NodeOp::Literal(literal_value(
+                    meta.get("value").map(|s| s.as_str()).unwrap_or("0"),
+                )),
+                "call" => NodeOp::Call(CallOp {
+                    name: text("name", "unknown"),
+                    select_field: meta
                         .get("kw_field")
                         .or_else(|| meta.get("field"))
                         .or_else(|| meta.get("arg_0"))
                         .map(|v| v.as_str())
-                        .unwrap_or("close");
-                    if let Some(series) = partition.series.get(field) {
-                        series
-                            .values
-                            .iter()
-                            .copied()
-                            .map(IncrementalValue::Number)
-                            .collect()
-                    } else {
-                        return Err(ExecutePlanError::InvalidPayload(format!(
-                            "select could not resolve source field '{field}'"
-                        )));
-                    }
-                } else {
-                    let child_series = child_ids
+                        .unwrap_or("close")
+                        .to_string(),
+                    literal_children: children
                         .iter()
-                        .map(|input_id| {
-                            let child_kind = payload
-                                .graph
+                        .map(|child_id| {
+                            graph
                                 .nodes
-                                .get(input_id)
+                                .get(child_id)
                                 .and_then(|n| n.get("kind"))
-                                .cloned()
-                                .unwrap_or_default();
-                            if child_kind == "literal" {
-                                Ok(partition
-                                    .ohlcv
-                                    .as_ref()
-                                    .map(|v| v.close.clone())
-                                    .or_else(|| {
-                                        partition.series.values().next().map(|s| s.values.clone())
-                                    })
-                                    .unwrap_or_default())
-                            } else {
-                                let input_values = outputs.get(input_id).ok_or_else(|| {
-                                    ExecutePlanError::InvalidPayload(format!(
-                                        "missing input output for node {input_id}"
-                                    ))
-                                })?;
-                                Ok(to_f64_vec(input_values))
-                            }
+                                .is_some_and(|kind| kind == "literal")
                         })
-                        .collect::<Result<Vec<Vec<f64>>, ExecutePlanError>>()?;
-                    dispatch_call_node(&name, meta, &child_series, partition.ohlcv.as_ref())?
+                        .collect(),
+                    group: meta.get("kernel_group").map(|group| {
+                        let index = group_ids[group.as_str()];
+                        (index, group_sizes[index])
+                    }),
+                    meta: meta.clone(),
+                }),
+                "time_shift" => {
+                    require(1, "time_shift")?;
+                    NodeOp::TimeShift {
+                        steps: parse_shift_steps(
+                            meta.get("shift").map(|s| s.as_str()).unwrap_or("1"),
+                        )
+                        .max(1),
+                        operation: text("operation", "change"),
+                    }
                 }
-            }
-            "time_shift" => {
-                if child_ids.is_empty() {
-                    return Err(ExecutePlanError::InvalidPayload(format!(
-                        "time_shift node {node_id} requires one child"
-                    )));
+                "binary_op" => {
+                    require(2, "binary")?;
+                    NodeOp::BinaryOp(text("operator", "eq"))
                 }
-                let base = outputs.get(&child_ids[0]).ok_or_else(|| {
-                    ExecutePlanError::InvalidPayload(format!(
-                        "missing time_shift child output for node {}",
-                        child_ids[0]
-                    ))
-                })?;
-                let steps =
-                    parse_shift_steps(meta.get("shift").map(|s| s.as_str()).unwrap_or("1")).max(1);
-                let operation = meta
-                    .get("operation")
-                    .map(|s| s.as_str())
-                    .unwrap_or("change");
-                apply_time_shift_op(base, steps, operation)
-            }
-            "binary_op" => {
-                if child_ids.len() < 2 {
+                "unary_op" => {
+                    require(1, "unary")?;
+                    NodeOp::UnaryOp(text("operator", "pos"))
+                }
+                "filter" => {
+                    require(2, "filter")?;
+                    NodeOp::Filter
+                }
+                "aggregate" => {
+                    require(1, "aggregate")?;
+                    NodeOp::Aggregate(text("operation", "sum"))
+                }
+                other => {
                     return Err(ExecutePlanError::InvalidPayload(format!(
-                        "binary node {node_id} requires two children"
-                    )));
+                        "unsupported graph node kind: {other}"
+                    )))
                 }
-                let left = outputs.get(&child_ids[0]).ok_or_else(|| {
-                    ExecutePlanError::InvalidPayload(format!(
-                        "missing left child output for node {}",
-                        child_ids[0]
-                    ))
-                })?;
-                let right = outputs.get(&child_ids[1]).ok_or_else(|| {
-                    ExecutePlanError::InvalidPayload(format!(
-                        "missing right child output for node {}",
-                        child_ids[1]
-                    ))
-                })?;
-                let op = meta
-                    .get("operator")
-                    .cloned()
-                    .unwrap_or_else(|| "eq".to_string());
-                left.iter()
-                    .zip(right.iter())
-                    .map(|(l, r)| match op.as_str() {
-                        "gt" => IncrementalValue::Bool(as_number(l) > as_number(r)),
-                        "gte" => IncrementalValue::Bool(as_number(l) >= as_number(r)),
-                        "lt" => IncrementalValue::Bool(as_number(l) < as_number(r)),
-                        "lte" => IncrementalValue::Bool(as_number(l) <= as_number(r)),
-                        "eq" => IncrementalValue::Bool(as_number(l) == as_number(r)),
-                        "neq" => IncrementalValue::Bool(as_number(l) != as_number(r)),
-                        "and" => IncrementalValue::Bool(truthy(l) && truthy(r)),
-                        "or" => IncrementalValue::Bool(truthy(l) || truthy(r)),
-                        "add" => IncrementalValue::Number(as_number(l) + as_number(r)),
-                        "sub" => IncrementalValue::Number(as_number(l) - as_number(r)),
-                        "mul" => IncrementalValue::Number(as_number(l) * as_number(r)),
-                        "mod" => IncrementalValue::Number(as_number(l) % as_number(r)),
-                        "pow" => IncrementalValue::Number(as_number(l).powf(as_number(r))),
-                        "div" => {
-                            let rv = as_number(r);
-                            if rv == 0.0 {
-                                IncrementalValue::Number(0.0)
-                            } else {
-                                IncrementalValue::Number(as_number(l) / rv)
-                            }
-                        }
-                        _ => IncrementalValue::Null,
-                    })
-                    .collect()
+            };
+            let child_signatures: Vec<NodeSignature> = children
+                .iter()
+                .map(|child_id| nodes.get(child_id).map_or(0, |child| child.signature))
+                .collect();
+            let signature = node_signature(meta, &child_signatures);
+            nodes.insert(
+                *node_id,
+                CompiledNode {
+                    children,
+                    op,
+                    signature,
+                },
+            );
+        }
+
+        let levels = dag_levels(graph)
+            .iter()
+            .map(|level| level_tasks(graph, level))
+            .collect();
+        Ok(Self {
+            root_id: graph.root_id,
+            node_order: graph.node_order.clone(),
+            nodes,
+            levels,
+            uses,
+        })
+    }
+
+    pub fn root_id(&self) -> u32 {
+        self.root_id
+    }
+
+    fn children(&self, node_id: u32) -> &[u32] {
+        self.nodes
+            .get(&node_id)
+            .map(|node| node.children.as_slice())
+            .unwrap_or_default()
+    }
+
+    /// Nodes whose outputs go through the result cache: kernel calls. Other
+    /// nodes borrow source columns or are cheap elementwise passes.
+    fn memo_nodes(&self) -> impl Iterator<Item = (u32, NodeSignature)> + '_ {
+        self.nodes
+            .iter()
+            .filter(|(_, node)| node.memoized())
+            .map(|(node_id, node)| (*node_id, node.signature))
+    }
+
+    /// Nodes the root depends on without looking below a cache hit.
+    fn needed_nodes(&self, memo: &PartitionMemo) -> BTreeSet<u32> {
+        let mut needed = BTreeSet::from([self.root_id]);
+        for node_id in self.node_order.iter().rev() {
+            if needed.contains(node_id) && !memo.is_hit(*node_id) {
+                needed.extend(self.children(*node_id));
             }
-            "unary_op" => {
-                if child_ids.is_empty() {
-                    return Err(ExecutePlanError::InvalidPayload(format!(
-                        "unary node {node_id} requires one child"
-                    )));
+        }
+        needed
+    }
+}
+
+impl CompiledNode {
+    fn memoized(&self) -> bool {
+        matches!(&self.op, NodeOp::Call(call) if call.name != "select")
+    }
+}
+
+/// 128-bit structural hash of a node's metadata and its children's
+/// signatures. Planner `kernel_group` labels only decide how kernel runs are
+/// shared, not what a node computes, so they are left out.
+fn node_signature(meta: &BTreeMap<String, String>, children: &[NodeSignature]) -> NodeSignature {
+    let half = |salt: u8| {
+        let mut hasher = DefaultHasher::new();
+        salt.hash(&mut hasher);
+        for (key, value) in meta {
+            if key != "kernel_group" {
+                key.hash(&mut hasher);
+                value.hash(&mut hasher);
+            }
+        }
+        children.hash(&mut hasher);
+        hasher.finish()
+    };
+    (u128::from(half(0)) << 64) | u128::from(half(1))
+}
+
+/// Walks the graph in planner order, or level by level on `threads` workers
+/// when `threads != 1` (`0` uses one worker per core): every node of a DAG
+/// level depends only on earlier levels, so its nodes run concurrently.
+/// Source columns are borrowed from `partition`; with `keep_all` unset, a
+/// node's column is dropped once every consumer has read it, so memory scales
+/// with the live frontier of the graph, and nodes only feeding cache hits in
+/// `memo` are skipped.
+fn evaluate_graph<'a>(
+    plan: &CompiledGraph,
+    target: &RustExecutionPartition,
+    partition: &'a DatasetPartition,
+    memo: Option<&'a PartitionMemo>,
+    keep_all: bool,
+    threads: usize,
+) -> Result<BTreeMap<u32, NodeColumn<'a>>, ExecutePlanError> {
+    let walk = GraphWalk::new(plan, target, partition, memo)?;
+    let needed = match memo {
+        Some(memo) if !keep_all && memo.has_hits() => Some(plan.needed_nodes(memo)),
+        _ => None,
+    };
+    let runs_node = |node_id: &u32| needed.as_ref().is_none_or(|n| n.contains(node_id));
+    let reads_children =
+        |node_id: u32| !memo.is_some_and(|memo: &PartitionMemo| memo.is_hit(node_id));
+    let mut remaining_uses = match &needed {
+        _ if keep_all => BTreeMap::new(),
+        None => plan.uses.clone(),
+        Some(needed) => {
+            let mut uses: BTreeMap<u32, usize> = BTreeMap::new();
+            for node_id in needed.iter().filter(|id| reads_children(**id)) {
+                for child_id in plan.children(*node_id) {
+                    *uses.entry(*child_id).or_default() += 1;
                 }
-                let input = outputs.get(&child_ids[0]).ok_or_else(|| {
-                    ExecutePlanError::InvalidPayload(format!(
-                        "missing unary child output for node {}",
-                        child_ids[0]
-                    ))
-                })?;
-                let op = meta
-                    .get("operator")
-                    .cloned()
-                    .unwrap_or_else(|| "pos".to_string());
-                input
-                    .iter()
-                    .map(|v| match op.as_str() {
-                        "not" => IncrementalValue::Bool(!truthy(v)),
-                        "neg" => IncrementalValue::Number(-as_number(v)),
-                        _ => IncrementalValue::Number(as_number(v)),
-                    })
-                    .collect()
             }
-            "filter" => {
-                if child_ids.len() < 2 {
-                    return Err(ExecutePlanError::InvalidPayload(format!(
-                        "filter node {node_id} requires two children"
-                    )));
+            uses
+        }
+    };
+    let mut outputs: BTreeMap<u32, NodeColumn<'a>> = BTreeMap::new();
+    let mut store = |outputs: &mut BTreeMap<u32, NodeColumn<'a>>, node_id: u32, column| {
+        if !keep_all && reads_children(node_id) {
+            for child_id in plan.children(node_id) {
+                if let Some(uses) = remaining_uses.get_mut(child_id) {
+                    *uses -= 1;
+                    if *uses == 0 && *child_id != plan.root_id {
+                        outputs.remove(child_id);
+                    }
                 }
-                let input = outputs.get(&child_ids[0]).ok_or_else(|| {
-                    ExecutePlanError::InvalidPayload(format!(
-                        "missing filter input for node {}",
-                        child_ids[0]
-                    ))
-                })?;
-                let condition = outputs.get(&child_ids[1]).ok_or_else(|| {
-                    ExecutePlanError::InvalidPayload(format!(
-                        "missing filter condition for node {}",
-                        child_ids[1]
-                    ))
-                })?;
-                input
-                    .iter()
-                    .zip(condition.iter())
-                    .map(|(value, cond)| {
-                        if truthy(cond) {
-                            value.clone()
-                        } else {
-                            IncrementalValue::Null
-                        }
-                    })
-                    .collect()
             }
-            "aggregate" => {
-                if child_ids.is_empty() {
-                    return Err(ExecutePlanError::InvalidPayload(format!(
-                        "aggregate node {node_id} requires one child"
-                    )));
+        }
+        outputs.insert(node_id, column);
+    };
+
+    if threads == 1 {
+        let mut runs = BTreeMap::new();
+        for node_id in plan.node_order.iter().filter(|id| runs_node(id)) {
+            let column = walk.eval_node(*node_id, &outputs, &mut runs)?;
+            store(&mut outputs, *node_id, column);
+        }
+        return Ok(outputs);
+    }
+    for tasks in &plan.levels {
+        let tasks: Vec<&Vec<u32>> = tasks
+            .iter()
+            .filter(|task| task.iter().any(&runs_node))
+            .collect();
+        let results = par_map(&tasks, threads, |task| {
+            let mut runs = BTreeMap::new();
+            task.iter()
+                .filter(|node_id| runs_node(node_id))
+                .map(|node_id| Ok((*node_id, walk.eval_node(*node_id, &outputs, &mut runs)?)))
+                .collect::<Result<Vec<_>, ExecutePlanError>>()
+        });
+        for result in results {
+            for (node_id, column) in result? {
+                store(&mut outputs, node_id, column);
+            }
+        }
+    }
+    Ok(outputs)
+}
+
+/// Groups `graph.node_order` by DAG depth (sources at level 0), keeping
+/// planner order within each level.
+fn dag_levels(graph: &RustExecutionGraph) -> Vec<Vec<u32>> {
+    let mut depth: BTreeMap<u32, usize> = BTreeMap::new();
+    let mut levels: Vec<Vec<u32>> = Vec::new();
+    for node_id in &graph.node_order {
+        let level = graph
+            .edges
+            .get(node_id)
+            .into_iter()
+            .flatten()
+            .filter_map(|child_id| depth.get(child_id))
+            .map(|child_level| child_level + 1)
+            .max()
+            .unwrap_or(0);
+        depth.insert(*node_id, level);
+        if levels.len() <= level {
+            levels.resize_with(level + 1, Vec::new);
+        }
+        levels[level].push(*node_id);
+    }
+    levels
+}
+
+/// Splits one DAG level into units of work: members of a planner
+/// `kernel_group` share a kernel run, so they stay together in one task.
+/// Group members read identical children and therefore share a level.
+fn level_tasks(graph: &RustExecutionGraph, level: &[u32]) -> Vec<Vec<u32>> {
+    let mut tasks: Vec<Vec<u32>> = Vec::new();
+    let mut group_task: BTreeMap<&str, usize> = BTreeMap::new();
+    for node_id in level {
+        let group = graph
+            .nodes
+            .get(node_id)
+            .and_then(|meta| meta.get("kernel_group"));
+        match group.and_then(|group| group_task.get(group.as_str())) {
+            Some(index) => tasks[*index].push(*node_id),
+            None => {
+                if let Some(group) = group {
+                    group_task.insert(group.as_str(), tasks.len());
                 }
-                let input = outputs.get(&child_ids[0]).ok_or_else(|| {
-                    ExecutePlanError::InvalidPayload(format!(
-                        "missing aggregate input for node {}",
-                        child_ids[0]
-                    ))
-                })?;
-                let operation = meta
-                    .get("operation")
-                    .cloned()
-                    .unwrap_or_else(|| "sum".to_string());
-                let non_null: Vec<&IncrementalValue> = input
-                    .iter()
-                    .filter(|v| !matches!(v, IncrementalValue::Null))
-                    .collect();
-                let aggregated = match operation.as_str() {
-                    "count" => IncrementalValue::Number(non_null.len() as f64),
-                    "sum" => IncrementalValue::Number(non_null.iter().map(|v| as_number(v)).sum()),
-                    "avg" => {
-                        if non_null.is_empty() {
-                            IncrementalValue::Null
-                        } else {
-                            let sum: f64 = non_null.iter().map(|v| as_number(v)).sum();
-                            IncrementalValue::Number(sum / non_null.len() as f64)
-                        }
-                    }
-                    "max" => {
-                        let max = non_null
-                            .iter()
-                            .map(|v| as_number(v))
-                            .fold(f64::NAN, f64::max);
-                        if max.is_nan() {
-                            IncrementalValue::Null
-                        } else {
-                            IncrementalValue::Number(max)
-                        }
+                tasks.push(vec![*node_id]);
+            }
+        }
+    }
+    tasks
+}
+
+/// Read-only state shared by every node evaluation of one graph walk.
+struct GraphWalk<'g, 'a> {
+    plan: &'g CompiledGraph,
+    target: &'g RustExecutionPartition,
+    partition: &'a DatasetPartition,
+    memo: Option<&'a PartitionMemo>,
+    rows: usize,
+    /// Call nodes read this column in place of literal arguments.
+    literal_input: &'a [f64],
+}
+
+impl<'g, 'a> GraphWalk<'g, 'a> {
+    fn new(
+        plan: &'g CompiledGraph,
+        target: &'g RustExecutionPartition,
+        partition: &'a DatasetPartition,
+        memo: Option<&'a PartitionMemo>,
+    ) -> Result<Self, ExecutePlanError> {
+        let mut walk = Self {
+            plan,
+            target,
+            partition,
+            memo,
+            rows: 0,
+            literal_input: &[],
+        };
+        walk.rows = partition
+            .ohlcv
+            .as_ref()
+            .map(|ohlcv| ohlcv.timestamps.len())
+            .or_else(|| partition.series.values().next().map(|s| s.timestamps.len()))
+            .ok_or_else(|| walk.missing_ohlcv())?;
+        walk.literal_input = partition
+            .ohlcv
+            .as_ref()
+            .map(|v| v.close.as_slice())
+            .or_else(|| {
+                partition
+                    .series
+                    .values()
+                    .next()
+                    .map(|s| s.values.as_slice())
+            })
+            .unwrap_or(&[]);
+        Ok(walk)
+    }
+
+    fn missing_ohlcv(&self) -> ExecutePlanError {
+        ExecutePlanError::MissingOhlcv {
+            symbol: self.target.symbol.clone(),
+            timeframe: self.target.timeframe.clone(),
+            data_source: self.target.source.clone(),
+        }
+    }
+
+    /// Evaluates one node from the columns of its children in `outputs`.
+    /// Sibling outputs of one multi-output kernel (e.g. `bb_upper` and
+    /// `bb_lower` over the same input) share a planner `kernel_group`; the
+    /// kernel runs once per group in `runs` and each member takes its slot.
+    /// Cached call outputs are borrowed from the memo and fresh ones stored.
+    fn eval_node(
+        &self,
+        node_id: u32,
+        outputs: &BTreeMap<u32, NodeColumn<'a>>,
+        runs: &mut BTreeMap<usize, SharedKernelRun>,
+    ) -> Result<NodeColumn<'a>, ExecutePlanError> {
+        let partition = self.partition;
+        let node = self.plan.nodes.get(&node_id).ok_or_else(|| {
+            ExecutePlanError::InvalidPayload(format!("missing node metadata for id {node_id}"))
+        })?;
+        if let Some(column) = self.memo.and_then(|memo| memo.hit(node_id)) {
+            return Ok(column.view());
+        }
+        let child_ids = node.children.as_slice();
+        let input = |pos: usize, what: &str| {
+            outputs.get(&child_ids[pos]).ok_or_else(|| {
+                ExecutePlanError::InvalidPayload(format!(
+                    "missing {what} for node {}",
+                    child_ids[pos]
+                ))
+            })
+        };
+
+        let column = match &node.op {
+            NodeOp::SourceRef { field, source } => {
+                let values: &'a [f64] = if let Some(series) = partition.series.get(field) {
+                    &series.values
+                } else if let Some(series) = partition.series.get(source) {
+                    &series.values
+                } else {
+                    let ohlcv = partition
+                        .ohlcv
+                        .as_ref()
+                        .ok_or_else(|| self.missing_ohlcv())?;
+                    match field.as_str() {
+                        "open" => &ohlcv.open,
+                        "high" => &ohlcv.high,
+                        "low" => &ohlcv.low,
+                        "volume" => &ohlcv.volume,
+                        _ => &ohlcv.close,
                     }
-                    "min" => {
-                        let min = non_null
-                            .iter()
-                            .map(|v| as_number(v))
-                            .fold(f64::NAN, f64::min);
-                        if min.is_nan() {
-                            IncrementalValue::Null
-                        } else {
-                            IncrementalValue::Number(min)
+                };
+                NodeColumn::numbers(values)
+            }
+            NodeOp::Literal(value) => NodeColumn::scalar(value.clone(), self.rows),
+            NodeOp::Call(call) => {
+                if call.name == "select" && partition.ohlcv.is_none() {
+                    match partition.series.get(&call.select_field) {
+                        Some(series) => NodeColumn::numbers(series.values.as_slice()),
+                        None => {
+                            return Err(ExecutePlanError::InvalidPayload(format!(
+                                "select could not resolve source field '{}'",
+                                call.select_field
+                            )))
                         }
                     }
-                    other => {
-                        return Err(ExecutePlanError::InvalidPayload(format!(
-                            "unsupported aggregate operation: {other}"
-                        )))
+                } else {
+                    let child_series = call
+                        .literal_children
+                        .iter()
+                        .enumerate()
+                        .map(|(pos, literal)| {
+                            if *literal {
+                                Ok(Cow::Borrowed(self.literal_input))
+                            } else {
+                                Ok(input(pos, "input output")?.as_f64())
+                            }
+                        })
+                        .collect::<Result<Vec<Cow<'_, [f64]>>, ExecutePlanError>>()?;
+                    let shared = match call.group {
+                        Some((group, size)) => shared_call_output(
+                            group,
+                            size,
+                            &call.name,
+                            &call.meta,
+                            &child_series,
+                            partition.ohlcv.as_ref(),
+                            runs,
+                        )?,
+                        None => None,
+                    };
+                    match shared {
+                        Some(values) => NodeColumn::numbers(values),
+                        None => dispatch_call_node(
+                            &call.name,
+                            &call.meta,
+                            &child_series,
+                            partition.ohlcv.as_ref(),
+                        )?,
                     }
-                };
-                vec![aggregated; rows]
+                }
+            }
+            NodeOp::TimeShift { steps, operation } => {
+                let base = input(0, "time_shift child output")?;
+                time_shift_column(base, *steps, operation)
+            }
+            NodeOp::BinaryOp(op) => {
+                let left = input(0, "left child output")?;
+                let right = input(1, "right child output")?;
+                binary_op_column(op, left, right)
             }
-            other => {
-                return Err(ExecutePlanError::InvalidPayload(format!(
-                    "unsupported graph node kind: {other}"
-                )))
+            NodeOp::UnaryOp(op) => {
+                let operand = input(0, "unary child output")?;
+                unary_op_column(op, operand)
+            }
+            NodeOp::Filter => {
+                let values = input(0, "filter input")?;
+                let condition = input(1, "filter condition")?;
+                let keep = Bitmap::from_fn(values.len().min(condition.len()), |row| {
+                    condition.truthy_at(row)
+                });
+                values.filter(&keep)
+            }
+            NodeOp::Aggregate(operation) => {
+                let values = input(0, "aggregate input")?;
+                NodeColumn::scalar(aggregate_column(values, operation)?, self.rows)
             }
         };
-        outputs.insert(*node_id, series);
+        if let Some(memo) = self.memo.filter(|_| node.memoized()) {
+            memo.store(node.signature, &column);
+        }
+        Ok(column)
     }
+}
 
-    Ok(outputs)
+/// Borrowed numeric view of a column for the elementwise operators: numeric
+/// columns and non-null broadcasts are read without per-row dispatch.
+enum Operand<'c> {
+    Slice(&'c [f64]),
+    Const(f64),
+    Column(&'c NodeColumn<'c>),
 }
 
-fn to_f64_vec(values: &[IncrementalValue]) -> Vec<f64> {
-    values.iter().map(as_number).collect()
+impl<'c> Operand<'c> {
+    fn of(column: &'c NodeColumn<'_>) -> Self {
+        match column.data() {
+            ColumnData::Number(values) => Operand::Slice(values),
+            ColumnData::Scalar(value) if column.validity().is_none() => {
+                Operand::Const(value.as_f64())
+            }
+            _ => Operand::Column(column),
+        }
+    }
+
+    #[inline]
+    fn at(&self, row: usize) -> f64 {
+        match self {
+            Operand::Slice(values) => values[row],
+            Operand::Const(value) => *value,
+            Operand::Column(column) => column.f64_at(row),
+        }
+    }
+}
+
+fn numeric_map(
+    len: usize,
+    left: &Operand<'_>,
+    right: &Operand<'_>,
+    f: impl Fn(f64, f64) -> f64,
+) -> Vec<f64> {
+    match (left, right) {
+        (Operand::Slice(l), Operand::Slice(r)) => l[..len]
+            .iter()
+            .zip(&r[..len])
+            .map(|(a, b)| f(*a, *b))
+            .collect(),
+        (Operand::Slice(l), Operand::Const(r)) => l[..len].iter().map(|a| f(*a, *r)).collect(),
+        _ => (0..len).map(|row| f(left.at(row), right.at(row))).collect(),
+    }
+}
+
+fn compare_map(
+    len: usize,
+    left: &Operand<'_>,
+    right: &Operand<'_>,
+    f: impl Fn(f64, f64) -> bool,
+) -> Bitmap {
+    Bitmap::from_fn(len, |row| f(left.at(row), right.at(row)))
+}
+
+/// Columnar form of `binary_op_value`; rows past the shorter operand are
+/// dropped, as when zipping the two series.
+fn binary_op_column(
+    op: &str,
+    left: &NodeColumn<'_>,
+    right: &NodeColumn<'_>,
+) -> NodeColumn<'static> {
+    let len = left.len().min(right.len());
+    let (l, r) = (Operand::of(left), Operand::of(right));
+    match op {
+        "gt" => NodeColumn::bools(compare_map(len, &l, &r, |a, b| a > b)),
+        "gte" => NodeColumn::bools(compare_map(len, &l, &r, |a, b| a >= b)),
+        "lt" => NodeColumn::bools(compare_map(len, &l, &r, |a, b| a < b)),
+        "lte" => NodeColumn::bools(compare_map(len, &l, &r, |a, b| a <= b)),
+        "eq" => NodeColumn::bools(compare_map(len, &l, &r, |a, b| a == b)),
+        "neq" => NodeColumn::bools(compare_map(len, &l, &r, |a, b| a != b)),
+        "and" => NodeColumn::bools(Bitmap::from_fn(len, |row| {
+            left.truthy_at(row) && right.truthy_at(row)
+        })),
+        "or" => NodeColumn::bools(Bitmap::from_fn(len, |row| {
+            left.truthy_at(row) || right.truthy_at(row)
+        })),
+        "add" => NodeColumn::numbers(numeric_map(len, &l, &r, |a, b| a + b)),
+        "sub" => NodeColumn::numbers(numeric_map(len, &l, &r, |a, b| a - b)),
+        "mul" => NodeColumn::numbers(numeric_map(len, &l, &r, |a, b| a * b)),
+        "mod" => NodeColumn::numbers(numeric_map(len, &l, &r, |a, b| a % b)),
+        "pow" => NodeColumn::numbers(numeric_map(len, &l, &r, f64::powf)),
+        "div" => NodeColumn::numbers(numeric_map(
+            len,
+            &l,
+            &r,
+            |a, b| {
+                if b == 0.0 {
+                    0.0
+                } else {
+                    a / b
+                }
+            },
+        )),
+        _ => NodeColumn::scalar(IncrementalValue::Null, len),
+    }
+}
+
+/// Columnar form of `unary_op_value`.
+fn unary_op_column(op: &str, operand: &NodeColumn<'_>) -> NodeColumn<'static> {
+    let len = operand.len();
+    match op {
+        "not" => NodeColumn::bools(Bitmap::from_fn(len, |row| !operand.truthy_at(row))),
+        "neg" => {
+            let values = Operand::of(operand);
+            NodeColumn::numbers((0..len).map(|row| -values.at(row)).collect::<Vec<f64>>())
+        }
+        _ => NodeColumn::numbers(operand.as_f64().into_owned()),
+    }
+}
+
+fn time_shift_column(base: &NodeColumn<'_>, steps: usize, operation: &str) -> NodeColumn<'static> {
+    let values = base.as_f64();
+    let mut out = vec![f64::NAN; values.len()];
+    let mut validity = Bitmap::new(values.len(), false);
+    for i in steps..values.len() {
+        if let Some(value) = time_shift_value(values[i], values[i - steps], operation) {
+            out[i] = value;
+            validity.set(i, true);
+        }
+    }
+    NodeColumn::numbers_with_validity(out, validity)
+}
+
+fn aggregate_column(
+    values: &NodeColumn<'_>,
+    operation: &str,
+) -> Result<IncrementalValue, ExecutePlanError> {
+    let non_null = || {
+        (0..values.len())
+            .filter(|row| !values.is_null(*row))
+            .map(|row| values.f64_at(row))
+    };
+    Ok(match operation {
+        "count" => IncrementalValue::Number(non_null().count() as f64),
+        "sum" => IncrementalValue::Number(non_null().sum()),
+        "avg" => {
+            let count = non_null().count();
+            if count == 0 {
+                IncrementalValue::Null
+            } else {
+                let sum: f64 = non_null().sum();
+                IncrementalValue::Number(sum / count as f64)
+            }
+        }
+        "max" => {
+            let max = non_null().fold(f64::NAN, f64::max);
+            if max.is_nan() {
+                IncrementalValue::Null
+            } else {
+                IncrementalValue::Number(max)
+            }
+        }
+        "min" => {
+            let min = non_null().fold(f64::NAN, f64::min);
+            if min.is_nan() {
+                IncrementalValue::Null
+            } else {
+                IncrementalValue::Number(min)
+            }
+        }
+        other => {
+            return Err(ExecutePlanError::InvalidPayload(format!(
+                "unsupported aggregate operation: {other}"
+            )))
+        }
+    })
 }
 
 fn as_number(value: &IncrementalValue) -> f64 {
-    match value {
-        IncrementalValue::Number(v) => *v,
-        IncrementalValue::Bool(v) => {
-            if *v {
-                1.0
+    value.as_f64()
+}
+
+/// Parses a literal node value the way literals are broadcast in the graph.
+pub(crate) fn literal_value(value: &str) -> IncrementalValue {
+    if value.eq_ignore_ascii_case("true") {
+        IncrementalValue::Bool(true)
+    } else if value.eq_ignore_ascii_case("false") {
+        IncrementalValue::Bool(false)
+    } else if let Ok(number) = value.parse::<f64>() {
+        IncrementalValue::Number(number)
+    } else {
+        IncrementalValue::Text(value.to_string())
+    }
+}
+
+pub(crate) fn binary_op_value(
+    op: &str,
+    l: &IncrementalValue,
+    r: &IncrementalValue,
+) -> IncrementalValue {
+    match op {
+        "gt" => IncrementalValue::Bool(as_number(l) > as_number(r)),
+        "gte" => IncrementalValue::Bool(as_number(l) >= as_number(r)),
+        "lt" => IncrementalValue::Bool(as_number(l) < as_number(r)),
+        "lte" => IncrementalValue::Bool(as_number(l) <= as_number(r)),
+        "eq" => IncrementalValue::Bool(as_number(l) == as_number(r)),
+        "neq" => IncrementalValue::Bool(as_number(l) != as_number(r)),
+        "and" => IncrementalValue::Bool(truthy(l) && truthy(r)),
+        "or" => IncrementalValue::Bool(truthy(l) || truthy(r)),
+        "add" => IncrementalValue::Number(as_number(l) + as_number(r)),
+        "sub" => IncrementalValue::Number(as_number(l) - as_number(r)),
+        "mul" => IncrementalValue::Number(as_number(l) * as_number(r)),
+        "mod" => IncrementalValue::Number(as_number(l) % as_number(r)),
+        "pow" => IncrementalValue::Number(as_number(l).powf(as_number(r))),
+        "div" => {
+            let rv = as_number(r);
+            if rv == 0.0 {
+                IncrementalValue::Number(0.0)
             } else {
-                0.0
+                IncrementalValue::Number(as_number(l) / rv)
             }
         }
-        IncrementalValue::Text(v) => v.parse::<f64>().unwrap_or(0.0),
-        IncrementalValue::Null => f64::NAN,
+        _ => IncrementalValue::Null,
+    }
+}
+
+pub(crate) fn unary_op_value(op: &str, value: &IncrementalValue) -> IncrementalValue {
+    match op {
+        "not" => IncrementalValue::Bool(!truthy(value)),
+        "neg" => IncrementalValue::Number(-as_number(value)),
+        _ => IncrementalValue::Number(as_number(value)),
+    }
+}
+
+pub(crate) fn filter_value(
+    value: &IncrementalValue,
+    condition: &IncrementalValue,
+) -> IncrementalValue {
+    if truthy(condition) {
+        value.clone()
+    } else {
+        IncrementalValue::Null
     }
 }
 
-fn truthy(value: &IncrementalValue) -> bool {
+pub(crate) fn truthy(value: &IncrementalValue) -> bool {
     match value {
         IncrementalValue::Null => false,
         IncrementalValue::Bool(v) => *v,
         IncrementalValue::Number(v) => *v != 0.0 && !v.is_nan(),
         IncrementalValue::Text(v) => !v.is_empty(),
+        IncrementalValue::Numbers(v) => !v.is_empty(),
     }
 }
 
-fn parse_shift_steps(shift: &str) -> usize {
+pub(crate) fn parse_shift_steps(shift: &str) -> usize {
     let digits: String = shift.chars().take_while(|c| c.is_ascii_digit()).collect();
     digits.parse::<usize>().unwrap_or(1)
 }
 
-fn apply_time_shift_op(
-    base: &[IncrementalValue],
-    steps: usize,
-    operation: &str,
-) -> Vec<IncrementalValue> {
-    let mut out = vec![IncrementalValue::Null; base.len()];
-    for i in steps..base.len() {
-        let cur = as_number(&base[i]);
-        let prev = as_number(&base[i - steps]);
-        out[i] = match operation {
-            "change_pct" => {
-                if prev == 0.0 || prev.is_nan() || cur.is_nan() {
-                    IncrementalValue::Null
-                } else {
-                    IncrementalValue::Number(((cur - prev) / prev) * 100.0)
-                }
-            }
-            _ => {
-                if prev.is_nan() || cur.is_nan() {
-                    IncrementalValue::Null
-                } else {
-                    IncrementalValue::Number(cur - prev)
-                }
-            }
-        };
+/// Value of a `time_shift` node given the current and shifted inputs; `None`
+/// when either side is missing.
+pub(crate) fn time_shift_value(cur: f64, prev: f64, operation: &str) -> Option<f64> {
+    if prev.is_nan() || cur.is_nan() {
+        return None;
+    }
+    match operation {
+        "change_pct" if prev == 0.0 => None,
+        "change_pct" => Some(((cur - prev) / prev) * 100.0),
+        _ => Some(cur - prev),
     }
-    out
 }
 
-fn dispatch_call_node(
+fn dispatch_call_node<'a>(
     name: &str,
     meta: &BTreeMap<String, String>,
-    child_series: &[Vec<f64>],
-    ohlcv: Option<&crate::dataset::OhlcvColumns>,
-) -> Result<Vec<IncrementalValue>, ExecutePlanError> {
+    child_series: &[Cow<'_, [f64]>],
+    ohlcv: Option<&'a crate::dataset::OhlcvColumns>,
+) -> Result<NodeColumn<'a>, ExecutePlanError> {
     let normalized = name.trim().to_ascii_lowercase();
     let name = normalized.as_str();
     let selected_output = meta.get("output").map(|v| v.as_str());
-    let default_close = ohlcv.map(|v| v.close.clone()).unwrap_or_default();
-    let close = child_series
-        .first()
-        .cloned()
-        .unwrap_or_else(|| default_close.clone());
-    let second = child_series
-        .get(1)
-        .cloned()
-        .unwrap_or_else(|| default_close.clone());
-    let third = child_series
-        .get(2)
-        .cloned()
-        .unwrap_or_else(|| default_close.clone());
-
-    let to_num = |values: Vec<f64>| values.into_iter().map(IncrementalValue::Number).collect();
-    let to_bool = |values: Vec<bool>| values.into_iter().map(IncrementalValue::Bool).collect();
+    let default_close: &[f64] = ohlcv.map(|v| v.close.as_slice()).unwrap_or_default();
+    let input = |pos: usize| child_series.get(pos).map_or(default_close, |s| s.as_ref());
+    let (close, second, third) = (input(0), input(1), input(2));
+
+    if let Some(outputs) = multi_output_kernel(name, meta, close, ohlcv)? {
+        let slot = output_slot(name, selected_output);
+        return Ok(NodeColumn::numbers(
+            outputs.into_iter().nth(slot).unwrap_or_default(),
+        ));
+    }
+
+    let to_num = |values: Vec<f64>| NodeColumn::numbers(values);
+    let to_bool = |values: Vec<bool>| NodeColumn::bools(Bitmap::from_bools(&values));
 
     let out = match name {
         "select" => {
@@ -529,89 +1021,61 @@ fn dispatch_call_node(
                         "select could not resolve source field '{field}'"
                     )));
                 }
-                return Ok(close
-                    .iter()
-                    .copied()
-                    .map(IncrementalValue::Number)
-                    .collect());
+                return Ok(NodeColumn::numbers(close.to_vec()));
             }
             match (field, ohlcv) {
-                ("open", Some(v)) => v
-                    .open
-                    .iter()
-                    .copied()
-                    .map(IncrementalValue::Number)
-                    .collect(),
-                ("high", Some(v)) => v
-                    .high
-                    .iter()
-                    .copied()
-                    .map(IncrementalValue::Number)
-                    .collect(),
-                ("low", Some(v)) => v
-                    .low
-                    .iter()
-                    .copied()
-                    .map(IncrementalValue::Number)
-                    .collect(),
-                ("volume", Some(v)) => v
-                    .volume
-                    .iter()
-                    .copied()
-                    .map(IncrementalValue::Number)
-                    .collect(),
-                ("close", Some(v)) | ("price", Some(v)) => v
-                    .close
-                    .iter()
-                    .copied()
-                    .map(IncrementalValue::Number)
-                    .collect(),
-                _ => close
-                    .iter()
-                    .copied()
-                    .map(IncrementalValue::Number)
-                    .collect(),
+                ("open", Some(v)) => NodeColumn::numbers(v.open.as_slice()),
+                ("high", Some(v)) => NodeColumn::numbers(v.high.as_slice()),
+                ("low", Some(v)) => NodeColumn::numbers(v.low.as_slice()),
+                ("volume", Some(v)) => NodeColumn::numbers(v.volume.as_slice()),
+                ("close", Some(v)) | ("price", Some(v)) => NodeColumn::numbers(v.close.as_slice()),
+                _ => NodeColumn::numbers(close.to_vec()),
             }
         }
         "sma" | "mean" | "rolling_mean" => {
             let period = get_usize(meta, "period", "arg_0", 20);
-            to_num(crate::rolling::rolling_mean(&close, period))
+            to_num(crate::rolling::rolling_mean(close, period))
         }
         "rolling_median" | "median" => {
             let period = get_usize(meta, "period", "arg_0", 20);
-            to_num(crate::rolling::rolling_median(&close, period))
+            to_num(crate::rolling::rolling_median(close, period))
+        }
+        "rolling_quantile" | "quantile" => {
+            let period = get_usize(meta, "period", "arg_0", 20);
+            let q = get_f64(meta, "q", "arg_1", 0.5);
+            to_num(crate::rolling::rolling_quantile(close, period, q))
         }
         "ema" | "rolling_ema" => {
             let period = get_usize(meta, "period", "arg_0", 20);
-            to_num(crate::moving_averages::ema(&close, period))
+            to_num(crate::moving_averages::ema(close, period))
         }
         "wma" | "rolling_wma" => {
             let period = get_usize(meta, "period", "arg_0", 14);
-            to_num(crate::moving_averages::wma(&close, period))
+            to_num(crate::moving_averages::wma(close, period))
         }
         "hma" => {
             let period = get_usize(meta, "period", "arg_0", 14);
-            to_num(crate::moving_averages::hma(&close, period))
+            to_num(crate::moving_averages::hma(close, period))
         }
         "rsi" => {
             let period = get_usize(meta, "period", "arg_0", 14);
-            to_num(crate::momentum::rsi(&close, period))
+            to_num(crate::momentum::rsi(close, period))
         }
         "roc" => {
             let period = get_usize(meta, "period", "arg_0", 12);
-            to_num(crate::momentum::roc(&close, period))
+            to_num(crate::momentum::roc(close, period))
         }
         "coppock" => {
             let wma_period = get_usize(meta, "wma_period", "arg_0", 10);
             let fast_roc = get_usize(meta, "fast_roc", "arg_1", 11);
             let slow_roc = get_usize(meta, "slow_roc", "arg_2", 14);
             to_num(crate::momentum::coppock(
-                &close, wma_period, fast_roc, slow_roc,
+                close, wma_period, fast_roc, slow_roc,
             ))
         }
         "cmo" => {
             let period = get_usize(meta, "period", "arg_0", 14);
-            to_num(crate::momentum::cmo(&close, period))
+            to_num(crate::momentum::cmo(close, period))
         }
         "mfi" => {
             let ohlcv = ohlcv.ok_or_else(|| {
@@ -626,28 +1090,6 @@ fn dispatch_call_node(
                 period,
             ))
         }
-        "vortex" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("vortex requires ohlcv data".to_string())
-            })?;
-            let period = get_usize(meta, "period", "arg_0", 14);
-            let (plus, minus) =
-                crate::momentum::vortex(&ohlcv.high, &ohlcv.low, &ohlcv.close, period);
-            match selected_output {
-                Some("minus") => to_num(minus),
-                _ => to_num(plus),
-            }
-        }
-        "bbands" | "bb_upper" | "bb_lower" => {
-            let period = get_usize(meta, "period", "arg_0", 20);
-            let std_dev = get_f64(meta, "std_dev", "arg_1", 2.0);
-            let (upper, _middle, lower) = crate::volatility::bbands(&close, period, std_dev);
-            match name {
-                "bb_upper" => to_num(upper),
-                "bb_lower" => to_num(lower),
-                _ => to_num(upper),
-            }
-        }
         "atr" => {
             let ohlcv = ohlcv.ok_or_else(|| {
                 ExecutePlanError::InvalidPayload("atr requires ohlcv data".to_string())
@@ -660,23 +1102,137 @@ fn dispatch_call_node(
                 period,
             ))
         }
-        "donchian" => {
+        "swing_high_at" => {
             let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("donchian requires ohlcv data".to_string())
+                ExecutePlanError::InvalidPayload("swing_high_at requires ohlcv data".to_string())
             })?;
+            let left = get_usize(meta, "left", "arg_1", 2);
+            let right = get_usize(meta, "right", "arg_2", 2);
+            let period = left + right + 1;
+            to_num(crate::rolling::rolling_max(&ohlcv.high, period))
+        }
+        "swing_low_at" => {
+            let ohlcv = ohlcv.ok_or_else(|| {
+                ExecutePlanError::InvalidPayload("swing_low_at requires ohlcv data".to_string())
+            })?;
+            let left = get_usize(meta, "left", "arg_1", 2);
+            let right = get_usize(meta, "right", "arg_2", 2);
+            let period = left + right + 1;
+            to_num(crate::rolling::rolling_min(&ohlcv.low, period))
+        }
+        "fib_level_down" | "fib_down" => {
+            let ohlcv = ohlcv.ok_or_else(|| {
+                ExecutePlanError::InvalidPayload("fib_level_down requires ohlcv data".to_string())
+            })?;
+            let level = get_f64(meta, "level", "arg_0", 0.618);
+            let left = get_usize(meta, "left", "arg_1", 2);
+            let right = get_usize(meta, "right", "arg_2", 2);
+            let period = left + right + 1;
+            let highs = crate::rolling::rolling_max(&ohlcv.high, period);
+            let lows = crate::rolling::rolling_min(&ohlcv.low, period);
+            to_num(
+                highs
+                    .iter()
+                    .zip(lows.iter())
+                    .map(|(h, l)| {
+                        if h.is_nan() || l.is_nan() {
+                            f64::NAN
+                        } else {
+                            h - ((h - l) * level)
+                        }
+                    })
+                    .collect(),
+            )
+        }
+        "fib_level_up" => {
+            let ohlcv = ohlcv.ok_or_else(|| {
+                ExecutePlanError::InvalidPayload("fib_level_up requires ohlcv data".to_string())
+            })?;
+            let level = get_f64(meta, "level", "arg_0", 0.618);
+            let left = get_usize(meta, "left", "arg_1", 2);
+            let right = get_usize(meta, "right", "arg_2", 2);
+            let period = left + right + 1;
+            let highs = crate::rolling::rolling_max(&ohlcv.high, period);
+            let lows = crate::rolling::rolling_min(&ohlcv.low, period);
+            to_num(
+                highs
+                    .iter()
+                    .zip(lows.iter())
+                    .map(|(h, l)| {
+                        if h.is_nan() || l.is_nan() {
+                            f64::NAN
+                        } else {
+                            l + ((h - l) * level)
+                        }
+                    })
+                    .collect(),
+            )
+        }
+        "crossup" => to_bool(crate::events::crossup(close, second)),
+        "crossdown" => to_bool(crate::events::crossdown(close, second)),
+        "cross" => to_bool(crate::events::cross(close, second)),
+        "rising" => to_bool(crate::events::rising(close)),
+        "falling" => to_bool(crate::events::falling(close)),
+        "rising_pct" => {
+            let pct = get_f64(meta, "pct", "arg_0", 5.0);
+            to_bool(crate::events::rising_pct(close, pct))
+        }
+        "falling_pct" => {
+            let pct = get_f64(meta, "pct", "arg_0", 5.0);
+            to_bool(crate::events::falling_pct(close, pct))
+        }
+        "in_channel" => to_bool(crate::events::in_channel(close, second, third)),
+        "out" => to_bool(crate::events::out_channel(close, second, third)),
+        "enter" => to_bool(crate::events::enter_channel(close, second, third)),
+        "exit" => to_bool(crate::events::exit_channel(close, second, third)),
+        other => {
+            return Err(ExecutePlanError::InvalidPayload(format!(
+                "unsupported call node in graph executor: {other}"
+            )))
+        }
+    };
+
+    Ok(out)
+}
+
+/// Runs the kernels that produce several output series and returns all of
+/// them in declaration order; `None` for single-output calls.
+fn multi_output_kernel(
+    name: &str,
+    meta: &BTreeMap<String, String>,
+    close: &[f64],
+    ohlcv: Option<&crate::dataset::OhlcvColumns>,
+) -> Result<Option<Vec<Vec<f64>>>, ExecutePlanError> {
+    let needs_ohlcv = |what: &str| {
+        ohlcv.ok_or_else(|| ExecutePlanError::InvalidPayload(format!("{what} requires ohlcv data")))
+    };
+    let outputs = match name {
+        "vortex" => {
+            let ohlcv = needs_ohlcv("vortex")?;
+            let period = get_usize(meta, "period", "arg_0", 14);
+            let (plus, minus) =
+                crate::momentum::vortex(&ohlcv.high, &ohlcv.low, &ohlcv.close, period);
+            vec![plus, minus]
+        }
+        "bbands" | "bb_upper" | "bb_lower" => {
+            let period = get_usize(meta, "period", "arg_0", 20);
+            let std_dev = get_f64(meta, "std_dev", "arg_1", 2.0);
+            let (upper, middle, lower) = crate::volatility::bbands(close, period, std_dev);
+            vec![upper, middle, lower]
+        }
+        "donchian" => {
+            let ohlcv = needs_ohlcv("donchian")?;
             let period = get_usize(meta, "period", "arg_0", 20);
-            let (upper, _middle, _lower) =
+            let (upper, middle, lower) =
                 crate::volatility::donchian(&ohlcv.high, &ohlcv.low, period);
-            to_num(upper)
+            vec![upper, middle, lower]
         }
         "keltner" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("keltner requires ohlcv data".to_string())
-            })?;
+            let ohlcv = needs_ohlcv("keltner")?;
             let ema_period = get_usize(meta, "ema_period", "arg_0", 20);
             let atr_period = get_usize(meta, "atr_period", "arg_1", 10);
             let multiplier = get_f64(meta, "multiplier", "arg_2", 2.0);
-            let (upper, _middle, _lower) = crate::volatility::keltner(
+            let (upper, middle, lower) = crate::volatility::keltner(
                 &ohlcv.high,
                 &ohlcv.low,
                 &ohlcv.close,
@@ -684,12 +1240,10 @@ fn dispatch_call_node(
                 atr_period,
                 multiplier,
             );
-            to_num(upper)
+            vec![upper, middle, lower]
         }
         "stochastic" | "stoch_k" | "stoch_d" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("stochastic requires ohlcv data".to_string())
-            })?;
+            let ohlcv = needs_ohlcv("stochastic")?;
             let k_period = get_usize(meta, "k_period", "arg_0", 14);
             let d_period = get_usize(meta, "d_period", "arg_1", 3);
             let smooth = get_usize(meta, "smooth", "arg_2", 1);
@@ -701,57 +1255,37 @@ fn dispatch_call_node(
                 d_period,
                 smooth,
             );
-            match name {
-                "stoch_d" => to_num(d),
-                _ => to_num(k),
-            }
+            vec![k, d]
         }
         "adx" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("adx requires ohlcv data".to_string())
-            })?;
+            let ohlcv = needs_ohlcv("adx")?;
             let period = get_usize(meta, "period", "arg_0", 14);
-            let (adx, _, _) = crate::trend::adx(&ohlcv.high, &ohlcv.low, &ohlcv.close, period);
-            to_num(adx)
+            let (adx, plus_di, minus_di) =
+                crate::trend::adx(&ohlcv.high, &ohlcv.low, &ohlcv.close, period);
+            vec![adx, plus_di, minus_di]
         }
         "macd" => {
             let fast = get_usize(meta, "fast_period", "arg_0", 12);
             let slow = get_usize(meta, "slow_period", "arg_1", 26);
             let signal = get_usize(meta, "signal_period", "arg_2", 9);
-            let (macd, signal_line, histogram) = crate::trend::macd(&close, fast, slow, signal);
-            match selected_output {
-                Some("signal") => to_num(signal_line),
-                Some("histogram") => to_num(histogram),
-                _ => to_num(macd),
-            }
+            let (macd, signal_line, histogram) = crate::trend::macd(close, fast, slow, signal);
+            vec![macd, signal_line, histogram]
         }
         "elder_ray" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("elder_ray requires ohlcv data".to_string())
-            })?;
+            let ohlcv = needs_ohlcv("elder_ray")?;
             let period = get_usize(meta, "period", "arg_0", 13);
             let (bull, bear) =
                 crate::trend::elder_ray(&ohlcv.high, &ohlcv.low, &ohlcv.close, period);
-            match selected_output {
-                Some("bear") => to_num(bear),
-                _ => to_num(bull),
-            }
+            vec![bull, bear]
         }
         "fisher" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("fisher requires ohlcv data".to_string())
-            })?;
+            let ohlcv = needs_ohlcv("fisher")?;
             let period = get_usize(meta, "period", "arg_0", 9);
             let (fisher, signal) = crate::trend::fisher(&ohlcv.high, &ohlcv.low, period);
-            match selected_output {
-                Some("signal") => to_num(signal),
-                _ => to_num(fisher),
-            }
+            vec![fisher, signal]
         }
         "ichimoku" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("ichimoku requires ohlcv data".to_string())
-            })?;
+            let ohlcv = needs_ohlcv("ichimoku")?;
             let tenkan_period = get_usize(meta, "tenkan_period", "arg_0", 9);
             let kijun_period = get_usize(meta, "kijun_period", "arg_1", 26);
             let span_b_period = get_usize(meta, "span_b_period", "arg_2", 52);
@@ -765,18 +1299,10 @@ fn dispatch_call_node(
                 span_b_period,
                 displacement,
             );
-            match selected_output {
-                Some("kijun_sen") => to_num(kijun),
-                Some("senkou_span_a") => to_num(span_a),
-                Some("senkou_span_b") => to_num(span_b),
-                Some("chikou_span") => to_num(chikou),
-                _ => to_num(tenkan),
-            }
+            vec![tenkan, kijun, span_a, span_b, chikou]
         }
         "psar" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("psar requires ohlcv data".to_string())
-            })?;
+            let ohlcv = needs_ohlcv("psar")?;
             let af_start = get_f64(meta, "af_start", "arg_0", 0.02);
             let af_increment = get_f64(meta, "af_increment", "arg_1", 0.02);
             let af_max = get_f64(meta, "af_max", "arg_2", 0.2);
@@ -788,115 +1314,106 @@ fn dispatch_call_node(
                 af_increment,
                 af_max,
             );
-            match selected_output {
-                Some("direction") => to_num(direction),
-                _ => to_num(sar),
-            }
+            vec![sar, direction]
         }
         "supertrend" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("supertrend requires ohlcv data".to_string())
-            })?;
+            let ohlcv = needs_ohlcv("supertrend")?;
             let period = get_usize(meta, "period", "arg_0", 10);
             let multiplier = get_f64(meta, "multiplier", "arg_1", 3.0);
             let (supertrend, direction) =
                 crate::trend::supertrend(&ohlcv.high, &ohlcv.low, &ohlcv.close, period, multiplier);
-            match selected_output {
-                Some("direction") => to_num(direction),
-                _ => to_num(supertrend),
-            }
-        }
-        "swing_high_at" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("swing_high_at requires ohlcv data".to_string())
-            })?;
-            let left = get_usize(meta, "left", "arg_1", 2);
-            let right = get_usize(meta, "right", "arg_2", 2);
-            let period = left + right + 1;
-            to_num(crate::rolling::rolling_max(&ohlcv.high, period))
-        }
-        "swing_low_at" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("swing_low_at requires ohlcv data".to_string())
-            })?;
-            let left = get_usize(meta, "left", "arg_1", 2);
-            let right = get_usize(meta, "right", "arg_2", 2);
-            let period = left + right + 1;
-            to_num(crate::rolling::rolling_min(&ohlcv.low, period))
-        }
-        "fib_level_down" | "fib_down" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("fib_level_down requires ohlcv data".to_string())
-            })?;
-            let level = get_f64(meta, "level", "arg_0", 0.618);
-            let left = get_usize(meta, "left", "arg_1", 2);
-            let right = get_usize(meta, "right", "arg_2", 2);
-            let period = left + right + 1;
-            let highs = crate::rolling::rolling_max(&ohlcv.high, period);
-            let lows = crate::rolling::rolling_min(&ohlcv.low, period);
-            to_num(
-                highs
-                    .iter()
-                    .zip(lows.iter())
-                    .map(|(h, l)| {
-                        if h.is_nan() || l.is_nan() {
-                            f64::NAN
-                        } else {
-                            h - ((h - l) * level)
-                        }
-                    })
-                    .collect(),
-            )
-        }
-        "fib_level_up" => {
-            let ohlcv = ohlcv.ok_or_else(|| {
-                ExecutePlanError::InvalidPayload("fib_level_up requires ohlcv data".to_string())
-            })?;
-            let level = get_f64(meta, "level", "arg_0", 0.618);
-            let left = get_usize(meta, "left", "arg_1", 2);
-            let right = get_usize(meta, "right", "arg_2", 2);
-            let period = left + right + 1;
-            let highs = crate::rolling::rolling_max(&ohlcv.high, period);
-            let lows = crate::rolling::rolling_min(&ohlcv.low, period);
-            to_num(
-                highs
-                    .iter()
-                    .zip(lows.iter())
-                    .map(|(h, l)| {
-                        if h.is_nan() || l.is_nan() {
-                            f64::NAN
-                        } else {
-                            l + ((h - l) * level)
-                        }
-                    })
-                    .collect(),
-            )
-        }
-        "crossup" => to_bool(crate::events::crossup(&close, &second)),
-        "crossdown" => to_bool(crate::events::crossdown(&close, &second)),
-        "cross" => to_bool(crate::events::cross(&close, &second)),
-        "rising" => to_bool(crate::events::rising(&close)),
-        "falling" => to_bool(crate::events::falling(&close)),
-        "rising_pct" => {
-            let pct = get_f64(meta, "pct", "arg_0", 5.0);
-            to_bool(crate::events::rising_pct(&close, pct))
-        }
-        "falling_pct" => {
-            let pct = get_f64(meta, "pct", "arg_0", 5.0);
-            to_bool(crate::events::falling_pct(&close, pct))
-        }
-        "in_channel" => to_bool(crate::events::in_channel(&close, &second, &third)),
-        "out" => to_bool(crate::events::out_channel(&close, &second, &third)),
-        "enter" => to_bool(crate::events::enter_channel(&close, &second, &third)),
-        "exit" => to_bool(crate::events::exit_channel(&close, &second, &third)),
-        other => {
-            return Err(ExecutePlanError::InvalidPayload(format!(
-                "unsupported call node in graph executor: {other}"
-            )))
+            vec![supertrend, direction]
         }
+        _ => return Ok(None),
     };
+    Ok(Some(outputs))
+}
 
-    Ok(out)
+/// Output names of a multi-output kernel, in the order `multi_output_kernel`
+/// returns them.
+fn kernel_output_names(name: &str) -> &'static [&'static str] {
+    match name {
+        "vortex" => &["plus", "minus"],
+        "bbands" | "donchian" | "keltner" => &["upper", "middle", "lower"],
+        "stochastic" => &["k", "d"],
+        "adx" => &["adx", "plus_di", "minus_di"],
+        "macd" => &["macd", "signal", "histogram"],
+        "elder_ray" => &["bull", "bear"],
+        "fisher" => &["fisher", "signal"],
+        "ichimoku" => &[
+            "tenkan_sen",
+            "kijun_sen",
+            "senkou_span_a",
+            "senkou_span_b",
+            "chikou_span",
+        ],
+        "psar" => &["sar", "direction"],
+        "supertrend" => &["supertrend", "direction"],
+        _ => &[],
+    }
+}
+
+/// Index of the output a call node reads from its kernel's output list. The
+/// single-band aliases select by name; everything else by `output` metadata,
+/// falling back to the primary output.
+fn output_slot(name: &str, selected_output: Option<&str>) -> usize {
+    match name {
+        "bb_upper" | "stoch_k" => 0,
+        "stoch_d" => 1,
+        "bb_lower" => 2,
+        _ => selected_output
+            .and_then(|output| kernel_output_names(name).iter().position(|n| *n == output))
+            .unwrap_or(0),
+    }
+}
+
+/// Outputs of one multi-output kernel run shared by the call nodes of a
+/// planner `kernel_group`, kept until the last member has read its slot.
+struct SharedKernelRun {
+    outputs: Vec<Vec<f64>>,
+    remaining: usize,
+}
+
+/// Serves a grouped call node from its group's shared kernel run, computing
+/// the kernel for the first member. Returns `None` when the call is not a
+/// multi-output kernel so the caller falls back to `dispatch_call_node`.
+fn shared_call_output(
+    group: usize,
+    group_size: usize,
+    name: &str,
+    meta: &BTreeMap<String, String>,
+    child_series: &[Cow<'_, [f64]>],
+    ohlcv: Option<&crate::dataset::OhlcvColumns>,
+    runs: &mut BTreeMap<usize, SharedKernelRun>,
+) -> Result<Option<Vec<f64>>, ExecutePlanError> {
+    let normalized = name.trim().to_ascii_lowercase();
+    let name = normalized.as_str();
+    if let Entry::Vacant(entry) = runs.entry(group) {
+        let default_close: &[f64] = ohlcv.map(|v| v.close.as_slice()).unwrap_or_default();
+        let close = child_series.first().map_or(default_close, |s| s.as_ref());
+        let Some(outputs) = multi_output_kernel(name, meta, close, ohlcv)? else {
+            return Ok(None);
+        };
+        entry.insert(SharedKernelRun {
+            outputs,
+            remaining: group_size.max(1),
+        });
+    }
+    let slot = output_slot(name, meta.get("output").map(|v| v.as_str()));
+    let Some(run) = runs.get_mut(&group) else {
+        return Ok(None);
+    };
+    run.remaining = run.remaining.saturating_sub(1);
+    if run.remaining > 0 {
+        return Ok(Some(run.outputs.get(slot).cloned().unwrap_or_default()));
+    }
+    let mut run = runs.remove(&group).expect("shared run was just read");
+    Ok(Some(
+        run.outputs
+            .get_mut(slot)
+            .map(std::mem::take)
+            .unwrap_or_default(),
+    ))
 }
 
 fn get_usize(meta: &BTreeMap<String, String>, kw: &str, arg: &str, default: usize) -> usize {
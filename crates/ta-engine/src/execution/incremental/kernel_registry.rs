@@ -2,32 +2,351 @@ use std::collections::BTreeMap;
 
 use super::contracts::IncrementalValue;
 
-#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
 pub enum KernelId {
+    Select,
+    Sma,
+    Median,
+    Quantile,
+    Ema,
+    Wma,
+    Hma,
     Rsi,
+    Roc,
+    Coppock,
+    Cmo,
+    Mfi,
+    Vortex,
+    Bbands,
+    BbUpper,
+    BbLower,
     Atr,
+    Donchian,
+    Keltner,
     Stochastic,
-    Macd,
-    Bbands,
+    StochK,
+    StochD,
     Adx,
+    Macd,
+    ElderRay,
+    Fisher,
+    Ichimoku,
+    Psar,
+    Supertrend,
+    SwingHighAt,
+    SwingLowAt,
+    FibLevelDown,
+    FibLevelUp,
+    Crossup,
+    Crossdown,
+    Cross,
+    Rising,
+    Falling,
+    RisingPct,
+    FallingPct,
+    InChannel,
+    Out,
+    Enter,
+    Exit,
     Vwap,
 }
 
+/// Parameter accepted by a step kernel, with the keyword name and positional
+/// argument key used by the graph executor and its default value.
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct KernelParam {
+    pub name: &'static str,
+    pub arg: &'static str,
+    pub default: f64,
+}
+
+const fn param(name: &'static str, arg: &'static str, default: f64) -> KernelParam {
+    KernelParam { name, arg, default }
+}
+
+const PERIOD_12: &[KernelParam] = &[param("period", "arg_0", 12.0)];
+const PERIOD_13: &[KernelParam] = &[param("period", "arg_0", 13.0)];
+const PERIOD_14: &[KernelParam] = &[param("period", "arg_0", 14.0)];
+const PERIOD_20: &[KernelParam] = &[param("period", "arg_0", 20.0)];
+const PERIOD_9: &[KernelParam] = &[param("period", "arg_0", 9.0)];
+const QUANTILE: &[KernelParam] = &[param("period", "arg_0", 20.0), param("q", "arg_1", 0.5)];
+const SWING: &[KernelParam] = &[param("left", "arg_1", 2.0), param("right", "arg_2", 2.0)];
+const FIB: &[KernelParam] = &[
+    param("level", "arg_0", 0.618),
+    param("left", "arg_1", 2.0),
+    param("right", "arg_2", 2.0),
+];
+const PCT: &[KernelParam] = &[param("pct", "arg_0", 5.0)];
+const STOCHASTIC: &[KernelParam] = &[
+    param("k_period", "arg_0", 14.0),
+    param("d_period", "arg_1", 3.0),
+    param("smooth", "arg_2", 1.0),
+];
+const BBANDS: &[KernelParam] = &[
+    param("period", "arg_0", 20.0),
+    param("std_dev", "arg_1", 2.0),
+];
+
+const COPPOCK: &[KernelParam] = &[
+    param("wma_period", "arg_0", 10.0),
+    param("fast_roc", "arg_1", 11.0),
+    param("slow_roc", "arg_2", 14.0),
+];
+const KELTNER: &[KernelParam] = &[
+    param("ema_period", "arg_0", 20.0),
+    param("atr_period", "arg_1", 10.0),
+    param("multiplier", "arg_2", 2.0),
+];
+const MACD: &[KernelParam] = &[
+    param("fast_period", "arg_0", 12.0),
+    param("slow_period", "arg_1", 26.0),
+    param("signal_period", "arg_2", 9.0),
+];
+const ICHIMOKU: &[KernelParam] = &[
+    param("tenkan_period", "arg_0", 9.0),
+    param("kijun_period", "arg_1", 26.0),
+    param("span_b_period", "arg_2", 52.0),
+    param("displacement", "arg_3", 26.0),
+];
+const PSAR: &[KernelParam] = &[
+    param("af_start", "arg_0", 0.02),
+    param("af_increment", "arg_1", 0.02),
+    param("af_max", "arg_2", 0.2),
+];
+const SUPERTREND: &[KernelParam] = &[
+    param("period", "arg_0", 10.0),
+    param("multiplier", "arg_1", 3.0),
+];
+
 impl KernelId {
+    pub const ALL: [KernelId; 45] = [
+        Self::Select,
+        Self::Sma,
+        Self::Median,
+        Self::Quantile,
+        Self::Ema,
+        Self::Wma,
+        Self::Hma,
+        Self::Rsi,
+        Self::Roc,
+        Self::Coppock,
+        Self::Cmo,
+        Self::Mfi,
+        Self::Vortex,
+        Self::Bbands,
+        Self::BbUpper,
+        Self::BbLower,
+        Self::Atr,
+        Self::Donchian,
+        Self::Keltner,
+        Self::Stochastic,
+        Self::StochK,
+        Self::StochD,
+        Self::Adx,
+        Self::Macd,
+        Self::ElderRay,
+        Self::Fisher,
+        Self::Ichimoku,
+        Self::Psar,
+        Self::Supertrend,
+        Self::SwingHighAt,
+        Self::SwingLowAt,
+        Self::FibLevelDown,
+        Self::FibLevelUp,
+        Self::Crossup,
+        Self::Crossdown,
+        Self::Cross,
+        Self::Rising,
+        Self::Falling,
+        Self::RisingPct,
+        Self::FallingPct,
+        Self::InChannel,
+        Self::Out,
+        Self::Enter,
+        Self::Exit,
+        Self::Vwap,
+    ];
+
+    /// Resolves a call name (including the aliases the graph executor accepts).
     pub fn from_name(name: &str) -> Option<Self> {
-        match name {
-            "rsi" => Some(Self::Rsi),
-            "atr" => Some(Self::Atr),
-            "stochastic" => Some(Self::Stochastic),
-            "macd" => Some(Self::Macd),
-            "bbands" => Some(Self::Bbands),
-            "adx" => Some(Self::Adx),
-            "vwap" => Some(Self::Vwap),
-            _ => None,
+        let normalized = name.trim().to_ascii_lowercase();
+        let id = match normalized.as_str() {
+            "select" => Self::Select,
+            "sma" | "mean" | "rolling_mean" => Self::Sma,
+            "rolling_median" | "median" => Self::Median,
+            "rolling_quantile" | "quantile" => Self::Quantile,
+            "ema" | "rolling_ema" => Self::Ema,
+            "wma" | "rolling_wma" => Self::Wma,
+            "hma" => Self::Hma,
+            "rsi" => Self::Rsi,
+            "roc" => Self::Roc,
+            "coppock" => Self::Coppock,
+            "cmo" => Self::Cmo,
+            "mfi" => Self::Mfi,
+            "vortex" => Self::Vortex,
+            "bbands" => Self::Bbands,
+            "bb_upper" => Self::BbUpper,
+            "bb_lower" => Self::BbLower,
+            "atr" => Self::Atr,
+            "donchian" => Self::Donchian,
+            "keltner" => Self::Keltner,
+            "stochastic" => Self::Stochastic,
+            "stoch_k" => Self::StochK,
+            "stoch_d" => Self::StochD,
+            "adx" => Self::Adx,
+            "macd" => Self::Macd,
+            "elder_ray" => Self::ElderRay,
+            "fisher" => Self::Fisher,
+            "ichimoku" => Self::Ichimoku,
+            "psar" => Self::Psar,
+            "supertrend" => Self::Supertrend,
+            "swing_high_at" => Self::SwingHighAt,
+            "swing_low_at" => Self::SwingLowAt,
+            "fib_level_down" | "fib_down" => Self::FibLevelDown,
+            "fib_level_up" => Self::FibLevelUp,
+            "crossup" => Self::Crossup,
+            "crossdown" => Self::Crossdown,
+            "cross" => Self::Cross,
+            "rising" => Self::Rising,
+            "falling" => Self::Falling,
+            "rising_pct" => Self::RisingPct,
+            "falling_pct" => Self::FallingPct,
+            "in_channel" => Self::InChannel,
+            "out" => Self::Out,
+            "enter" => Self::Enter,
+            "exit" => Self::Exit,
+            "vwap" => Self::Vwap,
+            _ => return None,
+        };
+        Some(id)
+    }
+
+    /// Canonical call name, stable across snapshot encodings.
+    pub fn name(self) -> &'static str {
+        match self {
+            Self::Select => "select",
+            Self::Sma => "sma",
+            Self::Median => "rolling_median",
+            Self::Quantile => "rolling_quantile",
+            Self::Ema => "ema",
+            Self::Wma => "wma",
+            Self::Hma => "hma",
+            Self::Rsi => "rsi",
+            Self::Roc => "roc",
+            Self::Coppock => "coppock",
+            Self::Cmo => "cmo",
+            Self::Mfi => "mfi",
+            Self::Vortex => "vortex",
+            Self::Bbands => "bbands",
+            Self::BbUpper => "bb_upper",
+            Self::BbLower => "bb_lower",
+            Self::Atr => "atr",
+            Self::Donchian => "donchian",
+            Self::Keltner => "keltner",
+            Self::Stochastic => "stochastic",
+            Self::StochK => "stoch_k",
+            Self::StochD => "stoch_d",
+            Self::Adx => "adx",
+            Self::Macd => "macd",
+            Self::ElderRay => "elder_ray",
+            Self::Fisher => "fisher",
+            Self::Ichimoku => "ichimoku",
+            Self::Psar => "psar",
+            Self::Supertrend => "supertrend",
+            Self::SwingHighAt => "swing_high_at",
+            Self::SwingLowAt => "swing_low_at",
+            Self::FibLevelDown => "fib_level_down",
+            Self::FibLevelUp => "fib_level_up",
+            Self::Crossup => "crossup",
+            Self::Crossdown => "crossdown",
+            Self::Cross => "cross",
+            Self::Rising => "rising",
+            Self::Falling => "falling",
+            Self::RisingPct => "rising_pct",
+            Self::FallingPct => "falling_pct",
+            Self::InChannel => "in_channel",
+            Self::Out => "out",
+            Self::Enter => "enter",
+            Self::Exit => "exit",
+            Self::Vwap => "vwap",
+        }
+    }
+
+    /// Parameters read by the kernel, mirroring the graph executor defaults.
+    pub fn params(self) -> &'static [KernelParam] {
+        match self {
+            Self::Sma | Self::Median | Self::Ema | Self::Donchian => PERIOD_20,
+            Self::Wma
+            | Self::Hma
+            | Self::Rsi
+            | Self::Cmo
+            | Self::Mfi
+            | Self::Vortex
+            | Self::Atr
+            | Self::Adx => PERIOD_14,
+            Self::Roc => PERIOD_12,
+            Self::ElderRay => PERIOD_13,
+            Self::Fisher => PERIOD_9,
+            Self::Quantile => QUANTILE,
+            Self::Coppock => COPPOCK,
+            Self::Bbands | Self::BbUpper | Self::BbLower => BBANDS,
+            Self::Keltner => KELTNER,
+            Self::Stochastic | Self::StochK | Self::StochD => STOCHASTIC,
+            Self::Macd => MACD,
+            Self::Ichimoku => ICHIMOKU,
+            Self::Psar => PSAR,
+            Self::Supertrend => SUPERTREND,
+            Self::SwingHighAt | Self::SwingLowAt => SWING,
+            Self::FibLevelDown | Self::FibLevelUp => FIB,
+            Self::RisingPct | Self::FallingPct => PCT,
+            Self::Select
+            | Self::Crossup
+            | Self::Crossdown
+            | Self::Cross
+            | Self::Rising
+            | Self::Falling
+            | Self::InChannel
+            | Self::Out
+            | Self::Enter
+            | Self::Exit
+            | Self::Vwap => &[],
+        }
+    }
+
+    /// Number of series inputs consumed by the kernel; OHLCV kernels read
+    /// their columns from the tick instead.
+    pub fn input_arity(self) -> usize {
+        match self {
+            Self::Crossup | Self::Crossdown | Self::Cross => 2,
+            Self::InChannel | Self::Out | Self::Enter | Self::Exit => 3,
+            Self::Select
+            | Self::Mfi
+            | Self::Vortex
+            | Self::Atr
+            | Self::Donchian
+            | Self::Keltner
+            | Self::Stochastic
+            | Self::StochK
+            | Self::StochD
+            | Self::Adx
+            | Self::ElderRay
+            | Self::Fisher
+            | Self::Ichimoku
+            | Self::Psar
+            | Self::Supertrend
+            | Self::SwingHighAt
+            | Self::SwingLowAt
+            | Self::FibLevelDown
+            | Self::FibLevelUp
+            | Self::Vwap => 0,
+            _ => 1,
         }
     }
 }
 
+/// Derives a kernel's scalar input from the tick where it is not the series
+/// input itself. Multi-field kernels read the tick's OHLCV fields directly
+/// through [`StepBar`](super::step_kernels::StepBar).
 pub fn coerce_incremental_input(
     kernel_id: KernelId,
     input_value: IncrementalValue,
@@ -38,35 +357,14 @@ pub fn coerce_incremental_input(
         KernelId::Atr => {
             let high = get_num(tick, "high").unwrap_or(0.0);
             let low = get_num(tick, "low").unwrap_or(0.0);
-            let close = get_num(tick, "close").unwrap_or(0.0);
 
             let mut tr = high - low;
             if let Some(prev) = prev_close {
                 tr = tr.max((high - prev).abs()).max((low - prev).abs());
             }
-            let _ = close;
             IncrementalValue::Number(tr)
         }
-        KernelId::Stochastic => {
-            let h = get_num(tick, "high").unwrap_or(0.0);
-            let l = get_num(tick, "low").unwrap_or(0.0);
-            let c = get_num(tick, "close").unwrap_or(0.0);
-            IncrementalValue::Text(format!("{h},{l},{c}"))
-        }
-        KernelId::Vwap => {
-            let h = get_num(tick, "high").unwrap_or(0.0);
-            let l = get_num(tick, "low").unwrap_or(0.0);
-            let c = get_num(tick, "close").unwrap_or(0.0);
-            let v = get_num(tick, "volume").unwrap_or(0.0);
-            IncrementalValue::Text(format!("{h},{l},{c},{v}"))
-        }
-        KernelId::Adx => {
-            let h = get_num(tick, "high").unwrap_or(0.0);
-            let l = get_num(tick, "low").unwrap_or(0.0);
-            let c = get_num(tick, "close").unwrap_or(0.0);
-            IncrementalValue::Text(format!("{h},{l},{c}"))
-        }
-        KernelId::Macd | KernelId::Bbands | KernelId::Rsi => input_value,
+        _ => input_value,
     }
 }
 
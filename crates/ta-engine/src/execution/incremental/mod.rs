@@ -1,9 +1,16 @@
 pub mod backend;
 pub mod call_step;
+pub mod columns;
 pub mod contracts;
 pub mod graph_exec;
 pub mod kernel_registry;
 pub mod payload_parse;
+pub mod plan_registry;
+pub mod result_cache;
+pub mod snapshot_codec;
+pub mod snapshot_store;
 pub mod state;
 pub mod state_codec;
+pub mod step_graph;
+pub mod step_kernels;
 pub mod store;
@@ -0,0 +1,99 @@
+//! Process-wide registry of compiled execution graphs addressed by handle.
+//!
+//! Registering validates and compiles a graph once; executing a registered
+//! plan then costs a handle lookup instead of re-parsing and re-checking the
+//! whole payload on every call.
+
+use std::collections::HashMap;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, OnceLock, RwLock};
+
+use crate::contracts::{RustExecutionGraph, RustExecutionPartition};
+use crate::dataset::DatasetId;
+
+use super::backend::{ExecutePlanError, GraphExecOptions, GraphOutputs};
+use super::graph_exec::{self, CompiledGraph};
+
+pub type PlanId = u64;
+
+static NEXT_PLAN_ID: AtomicU64 = AtomicU64::new(1);
+static PLAN_REGISTRY: OnceLock<RwLock<HashMap<PlanId, Arc<CompiledGraph>>>> = OnceLock::new();
+
+fn registry() -> &'static RwLock<HashMap<PlanId, Arc<CompiledGraph>>> {
+    PLAN_REGISTRY.get_or_init(|| RwLock::new(HashMap::new()))
+}
+
+/// Validates and compiles `graph`, returning a handle for [`execute_plan`].
+pub fn register_plan(graph: &RustExecutionGraph) -> Result<PlanId, ExecutePlanError> {
+    let compiled = Arc::new(CompiledGraph::compile(graph)?);
+    let id = NEXT_PLAN_ID.fetch_add(1, Ordering::Relaxed);
+    registry()
+        .write()
+        .expect("plan registry lock poisoned")
+        .insert(id, compiled);
+    Ok(id)
+}
+
+pub fn drop_plan(id: PlanId) -> Result<(), ExecutePlanError> {
+    registry()
+        .write()
+        .expect("plan registry lock poisoned")
+        .remove(&id)
+        .map(|_| ())
+        .ok_or(ExecutePlanError::UnknownPlan(id))
+}
+
+pub fn plan_exists(id: PlanId) -> bool {
+    registry()
+        .read()
+        .expect("plan registry lock poisoned")
+        .contains_key(&id)
+}
+
+pub fn plan_count() -> usize {
+    registry()
+        .read()
+        .expect("plan registry lock poisoned")
+        .len()
+}
+
+/// Root node id of a registered plan.
+pub fn plan_root_id(id: PlanId) -> Result<u32, ExecutePlanError> {
+    Ok(get_plan(id)?.root_id())
+}
+
+/// Evaluates a registered plan over one partition of `dataset_id`.
+pub fn execute_plan(
+    id: PlanId,
+    dataset_id: DatasetId,
+    partition: &RustExecutionPartition,
+    options: &GraphExecOptions,
+) -> Result<GraphOutputs, ExecutePlanError> {
+    let plan = get_plan(id)?;
+    graph_exec::execute_compiled(&plan, dataset_id, partition, options)
+}
+
+/// Evaluates a registered plan over each of `partitions`, as
+/// `execute_plan_graph_batch` does for a payload.
+pub fn execute_plan_batch(
+    id: PlanId,
+    dataset_id: DatasetId,
+    partitions: &[RustExecutionPartition],
+    options: &GraphExecOptions,
+) -> Result<Vec<Result<GraphOutputs, ExecutePlanError>>, ExecutePlanError> {
+    let plan = get_plan(id)?;
+    Ok(graph_exec::execute_compiled_batch(
+        &plan, dataset_id, partitions, options,
+    ))
+}
+
+/// The registry lock is held only for the lookup; evaluations of the same
+/// plan run concurrently on their own `Arc`.
+fn get_plan(id: PlanId) -> Result<Arc<CompiledGraph>, ExecutePlanError> {
+    registry()
+        .read()
+        .expect("plan registry lock poisoned")
+        .get(&id)
+        .cloned()
+        .ok_or(ExecutePlanError::UnknownPlan(id))
+}
@@ -0,0 +1,261 @@
+//! Process-wide memo of graph node outputs.
+//!
+//! A call node's column depends only on its structural signature and on the
+//! partition it reads, so outputs are keyed by (dataset, partition version,
+//! node signature) and shared by every plan containing the same
+//! subexpression. Partition versions are bumped on every mutation and never
+//! reused, so entries for stale data are never hit again; they age out under
+//! the byte budget in least-recently-used order.
+
+use std::collections::{BTreeMap, HashMap};
+use std::sync::{Arc, Mutex, MutexGuard, OnceLock};
+
+use crate::dataset::DatasetId;
+
+use super::columns::NodeColumn;
+
+/// Structural hash of a node and everything below it.
+pub type NodeSignature = u128;
+
+/// Budget used until [`set_result_cache_budget`] is called.
+pub const DEFAULT_RESULT_CACHE_BUDGET: usize = 64 << 20;
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+struct ResultKey {
+    dataset_id: DatasetId,
+    partition_version: u64,
+    signature: NodeSignature,
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Default)]
+pub struct ResultCacheStats {
+    pub hits: u64,
+    pub misses: u64,
+    pub evictions: u64,
+    pub entries: usize,
+    pub bytes: usize,
+    pub budget_bytes: usize,
+}
+
+struct CachedColumn {
+    column: Arc<NodeColumn<'static>>,
+    bytes: usize,
+    tick: u64,
+}
+
+struct ResultCache {
+    entries: HashMap<ResultKey, CachedColumn>,
+    /// Last-use tick of every entry, oldest first.
+    recency: BTreeMap<u64, ResultKey>,
+    tick: u64,
+    bytes: usize,
+    budget: usize,
+    hits: u64,
+    misses: u64,
+    evictions: u64,
+}
+
+impl ResultCache {
+    fn new(budget: usize) -> Self {
+        Self {
+            entries: HashMap::new(),
+            recency: BTreeMap::new(),
+            tick: 0,
+            bytes: 0,
+            budget,
+            hits: 0,
+            misses: 0,
+            evictions: 0,
+        }
+    }
+
+    fn next_tick(&mut self) -> u64 {
+        self.tick += 1;
+        self.tick
+    }
+
+    fn get(&mut self, key: &ResultKey) -> Option<Arc<NodeColumn<'static>>> {
+        let tick = self.next_tick();
+        let Some(entry) = self.entries.get_mut(key) else {
+            self.misses += 1;
+            return None;
+        };
+        self.recency.remove(&entry.tick);
+        self.recency.insert(tick, *key);
+        entry.tick = tick;
+        self.hits += 1;
+        Some(Arc::clone(&entry.column))
+    }
+
+    fn insert(&mut self, key: ResultKey, column: NodeColumn<'static>) {
+        let bytes = column.heap_bytes();
+        if bytes > self.budget {
+            return;
+        }
+        self.remove(&key);
+        let tick = self.next_tick();
+        self.recency.insert(tick, key);
+        self.entries.insert(
+            key,
+            CachedColumn {
+                column: Arc::new(column),
+                bytes,
+                tick,
+            },
+        );
+        self.bytes += bytes;
+        self.evict_to(self.budget);
+    }
+
+    fn remove(&mut self, key: &ResultKey) {
+        if let Some(entry) = self.entries.remove(key) {
+            self.recency.remove(&entry.tick);
+            self.bytes -= entry.bytes;
+        }
+    }
+
+    fn evict_to(&mut self, budget: usize) {
+        while self.bytes > budget {
+            let Some((_, key)) = self.recency.pop_first() else {
+                break;
+            };
+            if let Some(entry) = self.entries.remove(&key) {
+                self.bytes -= entry.bytes;
+                self.evictions += 1;
+            }
+        }
+    }
+}
+
+static RESULT_CACHE: OnceLock<Mutex<ResultCache>> = OnceLock::new();
+
+fn cache() -> MutexGuard<'static, ResultCache> {
+    RESULT_CACHE
+        .get_or_init(|| Mutex::new(ResultCache::new(DEFAULT_RESULT_CACHE_BUDGET)))
+        .lock()
+        .expect("result cache lock poisoned")
+}
+
+/// Caps the bytes held by cached node outputs, evicting least recently used
+/// entries to fit; `0` disables the cache.
+pub fn set_result_cache_budget(bytes: usize) {
+    let mut cache = cache();
+    cache.budget = bytes;
+    cache.evict_to(bytes);
+}
+
+/// Drops every cached node output; counters are kept.
+pub fn clear_result_cache() {
+    let mut cache = cache();
+    cache.entries.clear();
+    cache.recency.clear();
+    cache.bytes = 0;
+}
+
+pub fn result_cache_stats() -> ResultCacheStats {
+    let cache = cache();
+    ResultCacheStats {
+        hits: cache.hits,
+        misses: cache.misses,
+        evictions: cache.evictions,
+        entries: cache.entries.len(),
+        bytes: cache.bytes,
+        budget_bytes: cache.budget,
+    }
+}
+
+/// Cached outputs of one graph walk over one partition version. Hits are
+/// looked up before the walk starts and held here, so the walk borrows their
+/// values instead of copying them.
+pub(crate) struct PartitionMemo {
+    dataset_id: DatasetId,
+    partition_version: u64,
+    hits: BTreeMap<u32, Arc<NodeColumn<'static>>>,
+}
+
+impl PartitionMemo {
+    /// Looks up every `(node_id, signature)` in `nodes`; `None` when the
+    /// cache is disabled.
+    pub(crate) fn load(
+        dataset_id: DatasetId,
+        partition_version: u64,
+        nodes: impl IntoIterator<Item = (u32, NodeSignature)>,
+    ) -> Option<Self> {
+        let mut cache = cache();
+        if cache.budget == 0 {
+            return None;
+        }
+        let hits = nodes
+            .into_iter()
+            .filter_map(|(node_id, signature)| {
+                let key = ResultKey {
+                    dataset_id,
+                    partition_version,
+                    signature,
+                };
+                cache.get(&key).map(|column| (node_id, column))
+            })
+            .collect();
+        Some(Self {
+            dataset_id,
+            partition_version,
+            hits,
+        })
+    }
+
+    pub(crate) fn hit(&self, node_id: u32) -> Option<&NodeColumn<'static>> {
+        self.hits.get(&node_id).map(|column| column.as_ref())
+    }
+
+    pub(crate) fn is_hit(&self, node_id: u32) -> bool {
+        self.hits.contains_key(&node_id)
+    }
+
+    pub(crate) fn has_hits(&self) -> bool {
+        !self.hits.is_empty()
+    }
+
+    pub(crate) fn store(&self, signature: NodeSignature, column: &NodeColumn<'_>) {
+        let key = ResultKey {
+            dataset_id: self.dataset_id,
+            partition_version: self.partition_version,
+            signature,
+        };
+        cache().insert(key, column.clone().into_owned());
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn key(signature: NodeSignature) -> ResultKey {
+        ResultKey {
+            dataset_id: 1,
+            partition_version: 1,
+            signature,
+        }
+    }
+
+    #[test]
+    fn least_recently_used_entries_are_evicted_first() {
+        // Three 4-row columns (32 bytes each) under a 64-byte budget.
+        let mut cache = ResultCache::new(64);
+        cache.insert(key(1), NodeColumn::numbers(vec![1.0; 4]));
+        cache.insert(key(2), NodeColumn::numbers(vec![2.0; 4]));
+        assert!(cache.get(&key(1)).is_some());
+        cache.insert(key(3), NodeColumn::numbers(vec![3.0; 4]));
+
+        assert!(cache.get(&key(2)).is_none());
+        assert!(cache.get(&key(1)).is_some());
+        assert!(cache.get(&key(3)).is_some());
+        assert_eq!((cache.bytes, cache.evictions), (64, 1));
+
+        cache.insert(key(4), NodeColumn::numbers(vec![4.0; 16]));
+        assert!(
+            cache.get(&key(4)).is_none(),
+            "oversized columns are not cached"
+        );
+        assert_eq!(cache.entries.len(), 2);
+    }
+}
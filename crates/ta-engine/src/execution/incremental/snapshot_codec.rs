@@ -0,0 +1,322 @@
+//! Compact binary encoding of [`RuntimeSnapshot`] for export and warm restart.
+//!
+//! Layout (all integers little-endian, `varint` is unsigned LEB128):
+//!
+//! ```text
+//! magic        b"TAIS"
+//! version      u8                    SNAPSHOT_FORMAT_VERSION
+//! schema       varint                RuntimeSnapshot::schema_version
+//! last_event   varint
+//! keys         varint count, then per key: varint len + UTF-8 bytes
+//! nodes        varint count, then per node:
+//!                varint node_id, varint ticks_processed, value last_output,
+//!                varint entries, then per entry: varint key index + value
+//! checksum     u32                   CRC-32 (IEEE) of every preceding byte
+//! ```
+//!
+//! State blob keys repeat across nodes, so they are written once in the key
+//! table and referenced by index. Values are a one-byte tag followed by the
+//! payload; float arrays are raw `f64`s, so encoding and decoding never format
+//! or parse numbers.
+
+use std::fs::{self, File};
+use std::io::Write;
+use std::path::Path;
+
+use thiserror::Error;
+
+use super::contracts::{IncrementalValue, NodeSnapshotState, RuntimeSnapshot};
+
+const MAGIC: &[u8; 4] = b"TAIS";
+pub const SNAPSHOT_FORMAT_VERSION: u8 = 1;
+
+const TAG_NULL: u8 = 0;
+const TAG_FALSE: u8 = 1;
+const TAG_TRUE: u8 = 2;
+const TAG_NUMBER: u8 = 3;
+const TAG_TEXT: u8 = 4;
+const TAG_NUMBERS: u8 = 5;
+
+#[derive(Debug, Error)]
+pub enum SnapshotCodecError {
+    #[error("not an incremental snapshot")]
+    BadMagic,
+    #[error("unsupported snapshot format version {0}")]
+    UnsupportedVersion(u8),
+    #[error("snapshot checksum mismatch")]
+    ChecksumMismatch,
+    #[error("snapshot is truncated")]
+    Truncated,
+    #[error("malformed snapshot: {0}")]
+    Malformed(&'static str),
+    #[error(transparent)]
+    Io(#[from] std::io::Error),
+}
+
+pub fn encode_snapshot(snapshot: &RuntimeSnapshot) -> Vec<u8> {
+    let mut keys: Vec<&str> = snapshot
+        .nodes
+        .values()
+        .flat_map(|node| node.state_blob.keys().map(String::as_str))
+        .collect();
+    keys.sort_unstable();
+    keys.dedup();
+
+    let mut out = Vec::with_capacity(64);
+    out.extend_from_slice(MAGIC);
+    out.push(SNAPSHOT_FORMAT_VERSION);
+    put_varint(&mut out, u64::from(snapshot.schema_version));
+    put_varint(&mut out, snapshot.last_event_index);
+    put_varint(&mut out, keys.len() as u64);
+    for key in &keys {
+        put_bytes(&mut out, key.as_bytes());
+    }
+    put_varint(&mut out, snapshot.nodes.len() as u64);
+    for (node_id, node) in &snapshot.nodes {
+        put_varint(&mut out, u64::from(*node_id));
+        put_varint(&mut out, node.ticks_processed);
+        put_value(&mut out, &node.last_output);
+        put_varint(&mut out, node.state_blob.len() as u64);
+        for (key, value) in &node.state_blob {
+            // Keys are sorted, so the index is found by binary search.
+            let index = keys.binary_search(&key.as_str()).unwrap_or_default();
+            put_varint(&mut out, index as u64);
+            put_value(&mut out, value);
+        }
+    }
+    let checksum = crc32(&out);
+    out.extend_from_slice(&checksum.to_le_bytes());
+    out
+}
+
+pub fn decode_snapshot(bytes: &[u8]) -> Result<RuntimeSnapshot, SnapshotCodecError> {
+    if !bytes.starts_with(MAGIC) {
+        return Err(SnapshotCodecError::BadMagic);
+    }
+    if bytes.len() < MAGIC.len() + 1 + 4 {
+        return Err(SnapshotCodecError::Truncated);
+    }
+    let version = bytes[MAGIC.len()];
+    if version != SNAPSHOT_FORMAT_VERSION {
+        return Err(SnapshotCodecError::UnsupportedVersion(version));
+    }
+    let (body, checksum) = bytes.split_at(bytes.len() - 4);
+    if crc32(body).to_le_bytes() != checksum {
+        return Err(SnapshotCodecError::ChecksumMismatch);
+    }
+
+    let mut reader = Reader {
+        bytes: &body[MAGIC.len() + 1..],
+    };
+    let schema_version = u16::try_from(reader.varint()?)
+        .map_err(|_| SnapshotCodecError::Malformed("schema version out of range"))?;
+    let last_event_index = reader.varint()?;
+    let key_count = reader.len()?;
+    let mut keys = Vec::with_capacity(key_count);
+    for _ in 0..key_count {
+        keys.push(reader.text()?);
+    }
+    let node_count = reader.len()?;
+    let mut snapshot = RuntimeSnapshot {
+        schema_version,
+        last_event_index,
+        nodes: Default::default(),
+    };
+    for _ in 0..node_count {
+        let node_id = u32::try_from(reader.varint()?)
+            .map_err(|_| SnapshotCodecError::Malformed("node id out of range"))?;
+        let ticks_processed = reader.varint()?;
+        let last_output = reader.value()?;
+        let entries = reader.len()?;
+        let mut state_blob = std::collections::BTreeMap::new();
+        for _ in 0..entries {
+            let key = usize::try_from(reader.varint()?)
+                .ok()
+                .and_then(|index| keys.get(index))
+                .ok_or(SnapshotCodecError::Malformed(
+                    "state key index out of range",
+                ))?;
+            state_blob.insert(key.clone(), reader.value()?);
+        }
+        snapshot.nodes.insert(
+            node_id,
+            NodeSnapshotState {
+                ticks_processed,
+                last_output,
+                state_blob,
+            },
+        );
+    }
+    if !reader.bytes.is_empty() {
+        return Err(SnapshotCodecError::Malformed("trailing bytes"));
+    }
+    Ok(snapshot)
+}
+
+/// Writes the encoded snapshot to `path` durably: the bytes go to a sibling
+/// temporary file that is synced and then renamed over `path`, so a crash
+/// leaves either the previous file or the new one, never a partial write.
+pub fn save_snapshot(path: &Path, snapshot: &RuntimeSnapshot) -> Result<(), SnapshotCodecError> {
+    let mut tmp_name = path
+        .file_name()
+        .ok_or(SnapshotCodecError::Malformed(
+            "snapshot path has no file name",
+        ))?
+        .to_os_string();
+    tmp_name.push(".tmp");
+    let tmp_path = path.with_file_name(tmp_name);
+
+    let mut file = File::create(&tmp_path)?;
+    file.write_all(&encode_snapshot(snapshot))?;
+    file.sync_all()?;
+    drop(file);
+    fs::rename(&tmp_path, path)?;
+    // Persist the rename itself; directories cannot be opened on every
+    // platform, so this is best effort.
+    if let Some(dir) = path.parent().filter(|dir| !dir.as_os_str().is_empty()) {
+        if let Ok(dir) = File::open(dir) {
+            let _ = dir.sync_all();
+        }
+    }
+    Ok(())
+}
+
+pub fn load_snapshot(path: &Path) -> Result<RuntimeSnapshot, SnapshotCodecError> {
+    decode_snapshot(&fs::read(path)?)
+}
+
+fn put_varint(out: &mut Vec<u8>, mut value: u64) {
+    while value >= 0x80 {
+        out.push((value as u8) | 0x80);
+        value >>= 7;
+    }
+    out.push(value as u8);
+}
+
+fn put_bytes(out: &mut Vec<u8>, bytes: &[u8]) {
+    put_varint(out, bytes.len() as u64);
+    out.extend_from_slice(bytes);
+}
+
+fn put_value(out: &mut Vec<u8>, value: &IncrementalValue) {
+    match value {
+        IncrementalValue::Null => out.push(TAG_NULL),
+        IncrementalValue::Bool(false) => out.push(TAG_FALSE),
+        IncrementalValue::Bool(true) => out.push(TAG_TRUE),
+        IncrementalValue::Number(v) => {
+            out.push(TAG_NUMBER);
+            out.extend_from_slice(&v.to_le_bytes());
+        }
+        IncrementalValue::Text(s) => {
+            out.push(TAG_TEXT);
+            put_bytes(out, s.as_bytes());
+        }
+        IncrementalValue::Numbers(values) => {
+            out.push(TAG_NUMBERS);
+            put_varint(out, values.len() as u64);
+            out.reserve(values.len() * 8);
+            for v in values {
+                out.extend_from_slice(&v.to_le_bytes());
+            }
+        }
+    }
+}
+
+struct Reader<'a> {
+    bytes: &'a [u8],
+}
+
+impl<'a> Reader<'a> {
+    fn take(&mut self, len: usize) -> Result<&'a [u8], SnapshotCodecError> {
+        if len > self.bytes.len() {
+            return Err(SnapshotCodecError::Truncated);
+        }
+        let (head, rest) = self.bytes.split_at(len);
+        self.bytes = rest;
+        Ok(head)
+    }
+
+    fn byte(&mut self) -> Result<u8, SnapshotCodecError> {
+        Ok(self.take(1)?[0])
+    }
+
+    fn varint(&mut self) -> Result<u64, SnapshotCodecError> {
+        let mut value = 0u64;
+        for shift in (0..64).step_by(7) {
+            let byte = self.byte()?;
+            value |= u64::from(byte & 0x7f) << shift;
+            if byte & 0x80 == 0 {
+                return Ok(value);
+            }
+        }
+        Err(SnapshotCodecError::Malformed("varint overflows 64 bits"))
+    }
+
+    /// A length or element count. Every element takes at least one byte, so
+    /// counts beyond the remaining input are corrupt; checking them up front
+    /// keeps bad input from triggering huge allocations.
+    fn len(&mut self) -> Result<usize, SnapshotCodecError> {
+        let value = self.varint()?;
+        if value > self.bytes.len() as u64 {
+            return Err(SnapshotCodecError::Truncated);
+        }
+        Ok(value as usize)
+    }
+
+    fn text(&mut self) -> Result<String, SnapshotCodecError> {
+        let len = self.len()?;
+        String::from_utf8(self.take(len)?.to_vec())
+            .map_err(|_| SnapshotCodecError::Malformed("text is not UTF-8"))
+    }
+
+    fn f64(&mut self) -> Result<f64, SnapshotCodecError> {
+        let raw: [u8; 8] = self.take(8)?.try_into().expect("took 8 bytes");
+        Ok(f64::from_le_bytes(raw))
+    }
+
+    fn value(&mut self) -> Result<IncrementalValue, SnapshotCodecError> {
+        Ok(match self.byte()? {
+            TAG_NULL => IncrementalValue::Null,
+            TAG_FALSE => IncrementalValue::Bool(false),
+            TAG_TRUE => IncrementalValue::Bool(true),
+            TAG_NUMBER => IncrementalValue::Number(self.f64()?),
+            TAG_TEXT => IncrementalValue::Text(self.text()?),
+            TAG_NUMBERS => {
+                let count = self.len()?;
+                let raw = self.take(count.checked_mul(8).ok_or(SnapshotCodecError::Truncated)?)?;
+                IncrementalValue::Numbers(
+                    raw.chunks_exact(8)
+                        .map(|chunk| f64::from_le_bytes(chunk.try_into().expect("8-byte chunk")))
+                        .collect(),
+                )
+            }
+            _ => return Err(SnapshotCodecError::Malformed("unknown value tag")),
+        })
+    }
+}
+
+/// CRC-32 with the IEEE polynomial, as used by zip and PNG.
+fn crc32(bytes: &[u8]) -> u32 {
+    const TABLE: [u32; 256] = {
+        let mut table = [0u32; 256];
+        let mut i = 0;
+        while i < 256 {
+            let mut crc = i as u32;
+            let mut bit = 0;
+            while bit < 8 {
+                crc = if crc & 1 != 0 {
+                    (crc >> 1) ^ 0xedb8_8320
+                } else {
+                    crc >> 1
+                };
+                bit += 1;
+            }
+            table[i] = crc;
+            i += 1;
+        }
+        table
+    };
+    !bytes.iter().fold(!0u32, |crc, byte| {
+        TABLE[((crc ^ u32::from(*byte)) & 0xff) as usize] ^ (crc >> 8)
+    })
+}
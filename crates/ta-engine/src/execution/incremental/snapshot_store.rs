@@ -0,0 +1,173 @@
+//! Snapshots held by id on behalf of a binding layer.
+//!
+//! Bindings hand out snapshot ids to their host language and keep the
+//! snapshots here until the host drops them. The store tracks the bytes held
+//! and can be capped to a number of snapshots, evicting the least recently
+//! used ones; ids of evicted snapshots simply stop resolving.
+
+use std::collections::{BTreeMap, HashMap};
+
+use super::contracts::RuntimeSnapshot;
+
+pub type SnapshotId = u64;
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Default)]
+pub struct SnapshotStoreStats {
+    pub entries: usize,
+    pub bytes: usize,
+    pub capacity: Option<usize>,
+    pub evictions: u64,
+}
+
+#[derive(Debug)]
+struct StoredSnapshot {
+    snapshot: RuntimeSnapshot,
+    bytes: usize,
+    tick: u64,
+}
+
+#[derive(Debug, Default)]
+pub struct SnapshotStore {
+    entries: HashMap<SnapshotId, StoredSnapshot>,
+    /// Last-use tick of every entry, oldest first.
+    recency: BTreeMap<u64, SnapshotId>,
+    tick: u64,
+    bytes: usize,
+    capacity: Option<usize>,
+    evictions: u64,
+}
+
+impl SnapshotStore {
+    fn next_tick(&mut self) -> u64 {
+        self.tick += 1;
+        self.tick
+    }
+
+    /// Stores `snapshot` under `id`, replacing any previous entry, and evicts
+    /// least recently used snapshots beyond the capacity.
+    pub fn insert(&mut self, id: SnapshotId, snapshot: RuntimeSnapshot) {
+        self.remove(id);
+        let bytes = snapshot.heap_bytes();
+        let tick = self.next_tick();
+        self.recency.insert(tick, id);
+        self.entries.insert(
+            id,
+            StoredSnapshot {
+                snapshot,
+                bytes,
+                tick,
+            },
+        );
+        self.bytes += bytes;
+        self.evict_to_capacity();
+    }
+
+    /// Looks a snapshot up and marks it as recently used.
+    pub fn get(&mut self, id: SnapshotId) -> Option<&RuntimeSnapshot> {
+        let tick = self.next_tick();
+        let entry = self.entries.get_mut(&id)?;
+        self.recency.remove(&entry.tick);
+        self.recency.insert(tick, id);
+        entry.tick = tick;
+        Some(&entry.snapshot)
+    }
+
+    /// Drops a snapshot; `false` when `id` is unknown or was evicted.
+    pub fn remove(&mut self, id: SnapshotId) -> bool {
+        let Some(entry) = self.entries.remove(&id) else {
+            return false;
+        };
+        self.recency.remove(&entry.tick);
+        self.bytes -= entry.bytes;
+        true
+    }
+
+    /// Caps the number of stored snapshots (at least one is always kept);
+    /// `None` removes the cap.
+    pub fn set_capacity(&mut self, capacity: Option<usize>) {
+        self.capacity = capacity.map(|capacity| capacity.max(1));
+        self.evict_to_capacity();
+    }
+
+    pub fn stats(&self) -> SnapshotStoreStats {
+        SnapshotStoreStats {
+            entries: self.entries.len(),
+            bytes: self.bytes,
+            capacity: self.capacity,
+            evictions: self.evictions,
+        }
+    }
+
+    fn evict_to_capacity(&mut self) {
+        let Some(capacity) = self.capacity else {
+            return;
+        };
+        while self.entries.len() > capacity {
+            let Some((_, id)) = self.recency.pop_first() else {
+                break;
+            };
+            if let Some(entry) = self.entries.remove(&id) {
+                self.bytes -= entry.bytes;
+                self.evictions += 1;
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::incremental::contracts::{IncrementalValue, NodeSnapshotState};
+
+    fn snapshot(window: usize) -> RuntimeSnapshot {
+        let mut snapshot = RuntimeSnapshot::empty();
+        snapshot.nodes.insert(
+            1,
+            NodeSnapshotState {
+                ticks_processed: 1,
+                last_output: IncrementalValue::Number(1.0),
+                state_blob: BTreeMap::from([(
+                    "window".to_string(),
+                    IncrementalValue::Numbers(vec![0.0; window]),
+                )]),
+            },
+        );
+        snapshot
+    }
+
+    #[test]
+    fn bytes_follow_inserts_and_removals() {
+        let mut store = SnapshotStore::default();
+        store.insert(1, snapshot(10));
+        store.insert(2, snapshot(100));
+        let both = store.stats().bytes;
+        assert!(both >= 110 * 8);
+
+        assert!(store.remove(2));
+        assert!(!store.remove(2));
+        assert_eq!(store.stats().bytes, snapshot(10).heap_bytes());
+        assert!(store.remove(1));
+        assert_eq!(store.stats(), SnapshotStoreStats::default());
+    }
+
+    #[test]
+    fn capacity_evicts_least_recently_used_snapshots() {
+        let mut store = SnapshotStore::default();
+        store.set_capacity(Some(2));
+        store.insert(1, snapshot(4));
+        store.insert(2, snapshot(4));
+        assert!(store.get(1).is_some());
+        store.insert(3, snapshot(4));
+
+        assert!(store.get(2).is_none());
+        assert!(store.get(1).is_some());
+        assert!(store.get(3).is_some());
+        assert_eq!(store.stats().evictions, 1);
+
+        store.set_capacity(Some(0));
+        assert_eq!(store.stats().entries, 1, "the newest snapshot is kept");
+        assert!(store.get(3).is_some());
+        store.set_capacity(None);
+        assert_eq!(store.stats().capacity, None);
+    }
+}
@@ -1,6 +1,6 @@
 use std::collections::BTreeMap;
 
-use super::contracts::IncrementalValue;
+use super::contracts::{state_blob_heap_bytes, IncrementalValue};
 
 #[derive(Debug, Clone, PartialEq)]
 pub struct NodeRuntimeState {
@@ -9,3 +9,9 @@ pub struct NodeRuntimeState {
     pub last_output: IncrementalValue,
     pub state_blob: BTreeMap<String, IncrementalValue>,
 }
+
+impl NodeRuntimeState {
+    pub fn heap_bytes(&self) -> usize {
+        self.last_output.heap_bytes() + state_blob_heap_bytes(&self.state_blob)
+    }
+}
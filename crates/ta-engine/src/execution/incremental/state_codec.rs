@@ -3,148 +3,14 @@ use std::collections::BTreeMap;
 use super::call_step::KernelRuntimeState;
 use super::contracts::IncrementalValue;
 use super::kernel_registry::KernelId;
+use super::step_kernels::StepKernel;
 
 pub(crate) fn encode_kernel_state(
     state: &KernelRuntimeState,
 ) -> BTreeMap<String, IncrementalValue> {
     let mut blob = BTreeMap::new();
     match state {
-        KernelRuntimeState::Rsi {
-            period,
-            prev_close,
-            avg_gain,
-            avg_loss,
-            count,
-        } => {
-            blob.insert(
-                "kind".to_string(),
-                IncrementalValue::Text("rsi".to_string()),
-            );
-            blob.insert(
-                "period".to_string(),
-                IncrementalValue::Number(*period as f64),
-            );
-            blob.insert("count".to_string(), IncrementalValue::Number(*count as f64));
-            blob.insert(
-                "prev_close".to_string(),
-                prev_close.map_or(IncrementalValue::Null, IncrementalValue::Number),
-            );
-            blob.insert(
-                "avg_gain".to_string(),
-                avg_gain.map_or(IncrementalValue::Null, IncrementalValue::Number),
-            );
-            blob.insert(
-                "avg_loss".to_string(),
-                avg_loss.map_or(IncrementalValue::Null, IncrementalValue::Number),
-            );
-        }
-        KernelRuntimeState::Atr {
-            period,
-            prev_close,
-            rma_tr,
-            count,
-        } => {
-            blob.insert(
-                "kind".to_string(),
-                IncrementalValue::Text("atr".to_string()),
-            );
-            blob.insert(
-                "period".to_string(),
-                IncrementalValue::Number(*period as f64),
-            );
-            blob.insert("count".to_string(), IncrementalValue::Number(*count as f64));
-            blob.insert(
-                "prev_close".to_string(),
-                prev_close.map_or(IncrementalValue::Null, IncrementalValue::Number),
-            );
-            blob.insert(
-                "rma_tr".to_string(),
-                rma_tr.map_or(IncrementalValue::Null, IncrementalValue::Number),
-            );
-        }
-        KernelRuntimeState::Stochastic {
-            k_period,
-            highs,
-            lows,
-        } => {
-            blob.insert(
-                "kind".to_string(),
-                IncrementalValue::Text("stochastic".to_string()),
-            );
-            blob.insert(
-                "k_period".to_string(),
-                IncrementalValue::Number(*k_period as f64),
-            );
-            blob.insert(
-                "highs".to_string(),
-                IncrementalValue::Text(
-                    highs
-                        .iter()
-                        .map(|v| v.to_string())
-                        .collect::<Vec<_>>()
-                        .join(","),
-                ),
-            );
-            blob.insert(
-                "lows".to_string(),
-                IncrementalValue::Text(
-                    lows.iter()
-                        .map(|v| v.to_string())
-                        .collect::<Vec<_>>()
-                        .join(","),
-                ),
-            );
-        }
-        KernelRuntimeState::Vwap {
-            highs,
-            lows,
-            closes,
-            volumes,
-        } => {
-            blob.insert(
-                "kind".to_string(),
-                IncrementalValue::Text("vwap".to_string()),
-            );
-            blob.insert(
-                "highs".to_string(),
-                IncrementalValue::Text(
-                    highs
-                        .iter()
-                        .map(|v| v.to_string())
-                        .collect::<Vec<_>>()
-                        .join(","),
-                ),
-            );
-            blob.insert(
-                "lows".to_string(),
-                IncrementalValue::Text(
-                    lows.iter()
-                        .map(|v| v.to_string())
-                        .collect::<Vec<_>>()
-                        .join(","),
-                ),
-            );
-            blob.insert(
-                "closes".to_string(),
-                IncrementalValue::Text(
-                    closes
-                        .iter()
-                        .map(|v| v.to_string())
-                        .collect::<Vec<_>>()
-                        .join(","),
-                ),
-            );
-            blob.insert(
-                "volumes".to_string(),
-                IncrementalValue::Text(
-                    volumes
-                        .iter()
-                        .map(|v| v.to_string())
-                        .collect::<Vec<_>>()
-                        .join(","),
-                ),
-            );
-        }
+        KernelRuntimeState::Step(kernel) => kernel.encode(&mut blob),
         KernelRuntimeState::Generic { kernel_id: _ } => {
             blob.insert(
                 "kind".to_string(),
@@ -164,41 +30,19 @@ pub(crate) fn decode_kernel_state(
     };
 
     match kind {
-        "rsi" => Some(KernelRuntimeState::Rsi {
-            period: get_num(blob, "period").unwrap_or(14.0) as usize,
-            prev_close: get_num(blob, "prev_close"),
-            avg_gain: get_num(blob, "avg_gain"),
-            avg_loss: get_num(blob, "avg_loss"),
-            count: get_num(blob, "count").unwrap_or(0.0) as usize,
-        }),
-        "atr" => Some(KernelRuntimeState::Atr {
-            period: get_num(blob, "period").unwrap_or(14.0) as usize,
-            prev_close: get_num(blob, "prev_close"),
-            rma_tr: get_num(blob, "rma_tr"),
-            count: get_num(blob, "count").unwrap_or(0.0) as usize,
-        }),
-        "stochastic" => Some(KernelRuntimeState::Stochastic {
-            k_period: get_num(blob, "k_period").unwrap_or(14.0) as usize,
-            highs: get_csv_nums(blob, "highs"),
-            lows: get_csv_nums(blob, "lows"),
-        }),
-        "vwap" => Some(KernelRuntimeState::Vwap {
-            highs: get_csv_nums(blob, "highs"),
-            lows: get_csv_nums(blob, "lows"),
-            closes: get_csv_nums(blob, "closes"),
-            volumes: get_csv_nums(blob, "volumes"),
-        }),
+        // VWAP snapshots used to carry every bar seen so far.
+        "vwap" if blob.contains_key("highs") => Some(KernelRuntimeState::Step(Box::new(
+            StepKernel::vwap_from_history(
+                &get_csv_nums(blob, "highs"),
+                &get_csv_nums(blob, "lows"),
+                &get_csv_nums(blob, "closes"),
+                &get_csv_nums(blob, "volumes"),
+            ),
+        ))),
         "generic" => Some(KernelRuntimeState::Generic {
             kernel_id: KernelId::Rsi,
         }),
-        _ => None,
-    }
-}
-
-fn get_num(blob: &BTreeMap<String, IncrementalValue>, key: &str) -> Option<f64> {
-    match blob.get(key) {
-        Some(IncrementalValue::Number(v)) => Some(*v),
-        _ => None,
+        _ => StepKernel::decode(blob).map(|kernel| KernelRuntimeState::Step(Box::new(kernel))),
     }
 }
 
@@ -0,0 +1,494 @@
+//! Compiled step graph: advances a whole planner graph one tick at a time.
+//!
+//! Each node keeps the state it needs to produce the value the batch graph
+//! executor would emit for the newest bar of the series seen so far: call
+//! nodes hold a step kernel, `time_shift` nodes a ring buffer of the last
+//! `shift + 1` inputs and `aggregate` nodes a running accumulator. Operators,
+//! filters and literals are stateless and reuse the batch semantics directly,
+//! so a tick costs a constant amount of work per node regardless of history.
+
+use std::collections::{BTreeMap, VecDeque};
+
+use crate::contracts::RustExecutionGraph;
+
+use super::backend::ExecutePlanError;
+use super::call_step::{eval_call_step_inputs, initialize_kernel_state, KernelRuntimeState};
+use super::contracts::{IncrementalValue, RuntimeSnapshot};
+use super::graph_exec::{
+    binary_op_value, filter_value, literal_value, parse_shift_steps, time_shift_value,
+    unary_op_value,
+};
+use super::kernel_registry::KernelId;
+use super::state_codec;
+
+type Tick = BTreeMap<String, IncrementalValue>;
+type StateBlob = BTreeMap<String, IncrementalValue>;
+
+#[derive(Debug, Clone, PartialEq)]
+pub struct StepGraph {
+    root_id: u32,
+    nodes: Vec<StepNode>,
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct StepNode {
+    node_id: u32,
+    /// Positions of the child nodes in `StepGraph::nodes`.
+    children: Vec<usize>,
+    /// Children that are literals; call nodes read close in their place.
+    literal_children: Vec<bool>,
+    op: StepOp,
+    ticks_processed: u64,
+    last_output: IncrementalValue,
+}
+
+#[derive(Debug, Clone, PartialEq)]
+enum StepOp {
+    Source {
+        field: String,
+        source: String,
+    },
+    Literal(IncrementalValue),
+    Call {
+        kernel_id: KernelId,
+        kwargs: BTreeMap<String, IncrementalValue>,
+        state: KernelRuntimeState,
+    },
+    Binary(String),
+    Unary(String),
+    TimeShift {
+        steps: usize,
+        operation: String,
+        history: VecDeque<f64>,
+    },
+    Filter,
+    Aggregate(RunningAggregate),
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum AggregateOp {
+    Count,
+    Sum,
+    Avg,
+    Max,
+    Min,
+}
+
+impl AggregateOp {
+    fn from_name(name: &str) -> Option<Self> {
+        match name {
+            "count" => Some(Self::Count),
+            "sum" => Some(Self::Sum),
+            "avg" => Some(Self::Avg),
+            "max" => Some(Self::Max),
+            "min" => Some(Self::Min),
+            _ => None,
+        }
+    }
+}
+
+/// Running form of the batch `aggregate` node: the batch executor folds the
+/// non-null values of the whole series, so the newest bar of every prefix sees
+/// the fold over that prefix.
+#[derive(Debug, Clone, PartialEq)]
+struct RunningAggregate {
+    op: AggregateOp,
+    count: f64,
+    sum: f64,
+    max: f64,
+    min: f64,
+}
+
+impl RunningAggregate {
+    fn new(op: AggregateOp) -> Self {
+        Self {
+            op,
+            count: 0.0,
+            sum: 0.0,
+            max: f64::NAN,
+            min: f64::NAN,
+        }
+    }
+
+    fn step(&mut self, value: &IncrementalValue) -> IncrementalValue {
+        if !matches!(value, IncrementalValue::Null) {
+            let v = value.as_f64();
+            self.count += 1.0;
+            self.sum += v;
+            self.max = self.max.max(v);
+            self.min = self.min.min(v);
+        }
+        match self.op {
+            AggregateOp::Count => IncrementalValue::Number(self.count),
+            AggregateOp::Sum => IncrementalValue::Number(self.sum),
+            AggregateOp::Avg if self.count == 0.0 => IncrementalValue::Null,
+            AggregateOp::Avg => IncrementalValue::Number(self.sum / self.count),
+            AggregateOp::Max if self.max.is_nan() => IncrementalValue::Null,
+            AggregateOp::Max => IncrementalValue::Number(self.max),
+            AggregateOp::Min if self.min.is_nan() => IncrementalValue::Null,
+            AggregateOp::Min => IncrementalValue::Number(self.min),
+        }
+    }
+}
+
+impl StepGraph {
+    /// Compiles the planner graph for tick-by-tick execution. Fails for node
+    /// kinds, call names or aggregate operations without step semantics.
+    pub fn compile(graph: &RustExecutionGraph) -> Result<Self, ExecutePlanError> {
+        let positions: BTreeMap<u32, usize> = graph
+            .node_order
+            .iter()
+            .enumerate()
+            .map(|(idx, node_id)| (*node_id, idx))
+            .collect();
+        if !positions.contains_key(&graph.root_id) {
+            return Err(ExecutePlanError::InvalidPayload(
+                "graph.root_id must be present in graph.node_order".to_string(),
+            ));
+        }
+
+        let mut nodes: Vec<StepNode> = Vec::with_capacity(graph.node_order.len());
+        for (idx, node_id) in graph.node_order.iter().enumerate() {
+            let meta = graph.nodes.get(node_id).ok_or_else(|| {
+                ExecutePlanError::InvalidPayload(format!("missing node metadata for id {node_id}"))
+            })?;
+            let kind = meta.get("kind").ok_or_else(|| {
+                ExecutePlanError::InvalidPayload(format!("missing node kind for id {node_id}"))
+            })?;
+            let child_ids = graph.edges.get(node_id).cloned().unwrap_or_default();
+            let children = child_ids
+                .iter()
+                .map(|child_id| match positions.get(child_id) {
+                    Some(pos) if *pos < idx => Ok(*pos),
+                    _ => Err(ExecutePlanError::InvalidPayload(format!(
+                        "node {node_id} depends on {child_id} which is not ordered before it"
+                    ))),
+                })
+                .collect::<Result<Vec<usize>, ExecutePlanError>>()?;
+            let literal_children = children
+                .iter()
+                .map(|pos| matches!(nodes[*pos].op, StepOp::Literal(_)))
+                .collect();
+            let required = |count: usize, what: &str| {
+                if children.len() < count {
+                    Err(ExecutePlanError::InvalidPayload(format!(
+                        "{what} node {node_id} requires {count} child{}",
+                        if count == 1 { "" } else { "ren" }
+                    )))
+                } else {
+                    Ok(())
+                }
+            };
+
+            let op = match kind.as_str() {
+                "source_ref" => StepOp::Source {
+                    field: meta
+                        .get("field")
+                        .cloned()
+                        .unwrap_or_else(|| "close".to_string()),
+                    source: meta.get("source").cloned().unwrap_or_default(),
+                },
+                "literal" => StepOp::Literal(literal_value(
+                    meta.get("value").map(|s| s.as_str()).unwrap_or("0"),
+                )),
+                "call" => {
+                    let name = meta.get("name").map(|s| s.as_str()).unwrap_or("unknown");
+                    let kernel_id = KernelId::from_name(name)
+                        .ok_or_else(|| ExecutePlanError::UnsupportedKernelId(name.to_string()))?;
+                    let kwargs = call_kwargs(meta);
+                    let state = initialize_kernel_state(kernel_id, &kwargs);
+                    StepOp::Call {
+                        kernel_id,
+                        kwargs,
+                        state,
+                    }
+                }
+                "binary_op" => {
+                    required(2, "binary")?;
+                    StepOp::Binary(
+                        meta.get("operator")
+                            .cloned()
+                            .unwrap_or_else(|| "eq".to_string()),
+                    )
+                }
+                "unary_op" => {
+                    required(1, "unary")?;
+                    StepOp::Unary(
+                        meta.get("operator")
+                            .cloned()
+                            .unwrap_or_else(|| "pos".to_string()),
+                    )
+                }
+                "time_shift" => {
+                    required(1, "time_shift")?;
+                    let steps =
+                        parse_shift_steps(meta.get("shift").map(|s| s.as_str()).unwrap_or("1"))
+                            .max(1);
+                    StepOp::TimeShift {
+                        steps,
+                        operation: meta
+                            .get("operation")
+                            .cloned()
+                            .unwrap_or_else(|| "change".to_string()),
+                        history: VecDeque::with_capacity(steps + 1),
+                    }
+                }
+                "filter" => {
+                    required(2, "filter")?;
+                    StepOp::Filter
+                }
+                "aggregate" => {
+                    required(1, "aggregate")?;
+                    let operation = meta.get("operation").map(|s| s.as_str()).unwrap_or("sum");
+                    let op = AggregateOp::from_name(operation).ok_or_else(|| {
+                        ExecutePlanError::InvalidPayload(format!(
+                            "unsupported aggregate operation: {operation}"
+                        ))
+                    })?;
+                    StepOp::Aggregate(RunningAggregate::new(op))
+                }
+                other => {
+                    return Err(ExecutePlanError::InvalidPayload(format!(
+                        "unsupported graph node kind: {other}"
+                    )))
+                }
+            };
+            nodes.push(StepNode {
+                node_id: *node_id,
+                children,
+                literal_children,
+                op,
+                ticks_processed: 0,
+                last_output: IncrementalValue::Null,
+            });
+        }
+
+        Ok(Self {
+            root_id: graph.root_id,
+            nodes,
+        })
+    }
+
+    pub fn root_id(&self) -> u32 {
+        self.root_id
+    }
+
+    /// Advances every node by one tick in planner order and returns the value
+    /// of each node for that tick.
+    pub fn step(&mut self, tick: &Tick) -> BTreeMap<u32, IncrementalValue> {
+        let close = tick.get("close").cloned().unwrap_or(IncrementalValue::Null);
+        let mut values: Vec<IncrementalValue> = Vec::with_capacity(self.nodes.len());
+        for node in &mut self.nodes {
+            let child = |i: usize| &values[node.children[i]];
+            let value = match &mut node.op {
+                StepOp::Source { field, source } => tick
+                    .get(field.as_str())
+                    .or_else(|| tick.get(source.as_str()))
+                    .unwrap_or(&close)
+                    .clone(),
+                StepOp::Literal(value) => value.clone(),
+                StepOp::Call {
+                    kernel_id, state, ..
+                } => {
+                    let inputs: Vec<IncrementalValue> = node
+                        .children
+                        .iter()
+                        .zip(node.literal_children.iter())
+                        .map(|(pos, literal)| {
+                            if *literal {
+                                close.clone()
+                            } else {
+                                values[*pos].clone()
+                            }
+                        })
+                        .collect();
+                    let current = std::mem::replace(
+                        state,
+                        KernelRuntimeState::Generic {
+                            kernel_id: *kernel_id,
+                        },
+                    );
+                    let (next, out) = eval_call_step_inputs(*kernel_id, current, &inputs, tick);
+                    *state = next;
+                    // The batch executor emits NaN rather than null for numeric warmup.
+                    match out {
+                        IncrementalValue::Null => IncrementalValue::Number(f64::NAN),
+                        other => other,
+                    }
+                }
+                StepOp::Binary(op) => binary_op_value(op, child(0), child(1)),
+                StepOp::Unary(op) => unary_op_value(op, child(0)),
+                StepOp::TimeShift {
+                    steps,
+                    operation,
+                    history,
+                } => {
+                    if history.len() > *steps {
+                        history.pop_front();
+                    }
+                    history.push_back(child(0).as_f64());
+                    if history.len() > *steps {
+                        time_shift_value(history[*steps], history[0], operation)
+                            .map_or(IncrementalValue::Null, IncrementalValue::Number)
+                    } else {
+                        IncrementalValue::Null
+                    }
+                }
+                StepOp::Filter => filter_value(child(0), child(1)),
+                StepOp::Aggregate(aggregate) => aggregate.step(child(0)),
+            };
+            node.ticks_processed += 1;
+            node.last_output = value.clone();
+            values.push(value);
+        }
+        self.nodes
+            .iter()
+            .zip(values)
+            .map(|(node, value)| (node.node_id, value))
+            .collect()
+    }
+
+    /// Per-node runtime records in the shape stored by `RuntimeStateStore`.
+    pub(crate) fn node_states(
+        &self,
+    ) -> impl Iterator<Item = (u32, u64, &IncrementalValue, StateBlob)> {
+        self.nodes.iter().map(|node| {
+            (
+                node.node_id,
+                node.ticks_processed,
+                &node.last_output,
+                node.encode_state(),
+            )
+        })
+    }
+
+    /// Restores node state from a snapshot. Nodes absent from the snapshot
+    /// restart from their initial state.
+    pub fn restore(&mut self, snapshot: &RuntimeSnapshot) {
+        for node in &mut self.nodes {
+            node.reset();
+            if let Some(saved) = snapshot.nodes.get(&node.node_id) {
+                if node.decode_state(&saved.state_blob) {
+                    node.ticks_processed = saved.ticks_processed;
+                    node.last_output = saved.last_output.clone();
+                }
+            }
+        }
+    }
+}
+
+impl StepNode {
+    fn reset(&mut self) {
+        self.ticks_processed = 0;
+        self.last_output = IncrementalValue::Null;
+        match &mut self.op {
+            StepOp::Call {
+                kernel_id,
+                kwargs,
+                state,
+            } => *state = initialize_kernel_state(*kernel_id, kwargs),
+            StepOp::TimeShift { history, .. } => history.clear(),
+            StepOp::Aggregate(aggregate) => *aggregate = RunningAggregate::new(aggregate.op),
+            _ => {}
+        }
+    }
+
+    fn encode_state(&self) -> StateBlob {
+        let mut blob = StateBlob::new();
+        match &self.op {
+            StepOp::Call { state, .. } => blob = state_codec::encode_kernel_state(state),
+            StepOp::TimeShift { history, .. } => {
+                blob.insert(
+                    "kind".to_string(),
+                    IncrementalValue::Text("time_shift".to_string()),
+                );
+                blob.insert(
+                    "history".to_string(),
+                    IncrementalValue::Numbers(history.iter().copied().collect()),
+                );
+            }
+            StepOp::Aggregate(aggregate) => {
+                blob.insert(
+                    "kind".to_string(),
+                    IncrementalValue::Text("aggregate".to_string()),
+                );
+                for (key, value) in [
+                    ("count", aggregate.count),
+                    ("sum", aggregate.sum),
+                    ("max", aggregate.max),
+                    ("min", aggregate.min),
+                ] {
+                    blob.insert(key.to_string(), IncrementalValue::Number(value));
+                }
+            }
+            _ => {}
+        }
+        blob
+    }
+
+    /// Loads `blob` into the node state; returns whether the blob matched.
+    fn decode_state(&mut self, blob: &StateBlob) -> bool {
+        let kind = match blob.get("kind") {
+            Some(IncrementalValue::Text(kind)) => kind.as_str(),
+            _ => return !self.is_stateful(),
+        };
+        match (&mut self.op, kind) {
+            (StepOp::Call { state, .. }, _) => match state_codec::decode_kernel_state(blob) {
+                Some(decoded) => {
+                    *state = decoded;
+                    true
+                }
+                None => false,
+            },
+            (StepOp::TimeShift { history, .. }, "time_shift") => {
+                *history = match blob.get("history") {
+                    Some(IncrementalValue::Numbers(values)) => values.iter().copied().collect(),
+                    Some(IncrementalValue::Text(s)) if !s.is_empty() => {
+                        s.split(',').filter_map(|v| v.parse::<f64>().ok()).collect()
+                    }
+                    _ => VecDeque::new(),
+                };
+                true
+            }
+            (StepOp::Aggregate(aggregate), "aggregate") => {
+                let field = |key: &str| blob.get(key).map(IncrementalValue::as_f64);
+                match (field("count"), field("sum"), field("max"), field("min")) {
+                    (Some(count), Some(sum), Some(max), Some(min)) => {
+                        aggregate.count = count;
+                        aggregate.sum = sum;
+                        aggregate.max = max;
+                        aggregate.min = min;
+                        true
+                    }
+                    _ => false,
+                }
+            }
+            _ => false,
+        }
+    }
+
+    fn is_stateful(&self) -> bool {
+        matches!(
+            self.op,
+            StepOp::Call { .. } | StepOp::TimeShift { .. } | StepOp::Aggregate(_)
+        )
+    }
+}
+
+/// Kernel kwargs for a call node, matching how the batch executor resolves
+/// parameters: `kw_{name}` entries by name, positional `arg_{i}` entries and
+/// the selected `output`.
+fn call_kwargs(meta: &BTreeMap<String, String>) -> BTreeMap<String, IncrementalValue> {
+    let mut kwargs = BTreeMap::new();
+    for (key, value) in meta {
+        let name = if let Some(name) = key.strip_prefix("kw_") {
+            name
+        } else if key.starts_with("arg_") || key == "output" {
+            key.as_str()
+        } else {
+            continue;
+        };
+        kwargs.insert(name.to_string(), IncrementalValue::Text(value.clone()));
+    }
+    kwargs
+}
@@ -0,0 +1,1911 @@
+//! Bar-at-a-time kernels for the incremental runtime.
+//!
+//! Every kernel holds only the bounded state its batch counterpart needs
+//! (ring buffers for windows, monotonic deques for window extremes, running
+//! sums, recursive averages), so memory and per-bar cost stay flat however
+//! long a stream runs. The output produced for bar `t` is bit-identical to
+//! evaluating the batch indicator over bars `0..=t` and reading index `t`,
+//! including the warmup NaNs and the edge-case behaviour of the batch
+//! implementations.
+
+use std::collections::{BTreeMap, VecDeque};
+
+use super::contracts::IncrementalValue;
+use super::kernel_registry::KernelId;
+use crate::rolling::{RollingQuantile, RollingWma};
+
+pub type StateBlob = BTreeMap<String, IncrementalValue>;
+
+/// OHLCV fields of a tick; missing or non-numeric fields read as NaN.
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct StepBar {
+    pub open: f64,
+    pub high: f64,
+    pub low: f64,
+    pub close: f64,
+    pub volume: f64,
+}
+
+impl StepBar {
+    pub fn from_tick(tick: &BTreeMap<String, IncrementalValue>) -> Self {
+        let field = |key: &str| tick.get(key).map_or(f64::NAN, IncrementalValue::as_f64);
+        Self {
+            open: field("open"),
+            high: field("high"),
+            low: field("low"),
+            close: field("close"),
+            volume: field("volume"),
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+pub struct StepKernel {
+    kernel_id: KernelId,
+    selected: usize,
+    state: KernelState,
+}
+
+#[derive(Debug, Clone, PartialEq)]
+enum KernelState {
+    Select(Select),
+    Sma(RollingSum),
+    Window(ExtremaWindow),
+    Quantile(RollingQuantile),
+    Wma(RollingWma),
+    Ema(Ema),
+    Hma(Hma),
+    Rsi(Rsi),
+    Roc(Roc),
+    Coppock(Coppock),
+    Cmo(Cmo),
+    Mfi(Mfi),
+    Vortex(Vortex),
+    Bbands(Bbands),
+    Atr(Atr),
+    Keltner(Keltner),
+    Stochastic(Stochastic),
+    Adx(Adx),
+    Macd(Macd),
+    Fisher(Fisher),
+    Ichimoku(Box<Ichimoku>),
+    Psar(Psar),
+    Supertrend(Supertrend),
+    Extremum(Extremum),
+    Event(Event),
+    Vwap(Vwap),
+}
+
+impl StepKernel {
+    /// Builds a kernel from request kwargs. Parameters are read by keyword or
+    /// positional key with the graph executor defaults; `output` selects the
+    /// component of multi-output indicators.
+    pub fn new(kernel_id: KernelId, kwargs: &BTreeMap<String, IncrementalValue>) -> Self {
+        let usize_param = |name: &str| param_usize(kernel_id, kwargs, name);
+        let f64_param = |name: &str| param_f64(kernel_id, kwargs, name);
+        let state = match kernel_id {
+            KernelId::Select => KernelState::Select(Select {
+                field: match kwargs.get("field").or_else(|| kwargs.get("arg_0")) {
+                    Some(IncrementalValue::Text(field)) => field.clone(),
+                    _ => "close".to_string(),
+                },
+            }),
+            KernelId::Sma => KernelState::Sma(RollingSum::new(usize_param("period"))),
+            KernelId::Median => {
+                KernelState::Quantile(RollingQuantile::new(usize_param("period"), 0.5))
+            }
+            KernelId::Quantile => {
+                KernelState::Quantile(RollingQuantile::new(usize_param("period"), f64_param("q")))
+            }
+            KernelId::Wma => KernelState::Wma(RollingWma::new(usize_param("period"))),
+            KernelId::Donchian => KernelState::Window(ExtremaWindow::new(usize_param("period"))),
+            KernelId::Ema | KernelId::ElderRay => KernelState::Ema(Ema::new(usize_param("period"))),
+            KernelId::Hma => KernelState::Hma(Hma::new(usize_param("period"))),
+            KernelId::Rsi => KernelState::Rsi(Rsi::new(usize_param("period"))),
+            KernelId::Roc => KernelState::Roc(Roc::new(usize_param("period"))),
+            KernelId::Coppock => KernelState::Coppock(Coppock {
+                fast: Roc::new(usize_param("fast_roc")),
+                slow: Roc::new(usize_param("slow_roc")),
+                smooth: RollingWma::new(usize_param("wma_period")),
+            }),
+            KernelId::Cmo => KernelState::Cmo(Cmo::new(usize_param("period"))),
+            KernelId::Mfi => KernelState::Mfi(Mfi::new(usize_param("period"))),
+            KernelId::Vortex => KernelState::Vortex(Vortex::new(usize_param("period"))),
+            KernelId::Bbands | KernelId::BbUpper | KernelId::BbLower => {
+                KernelState::Bbands(Bbands::new(usize_param("period"), f64_param("std_dev")))
+            }
+            KernelId::Atr => KernelState::Atr(Atr::new(usize_param("period"))),
+            KernelId::Keltner => KernelState::Keltner(Keltner {
+                ema: Ema::new(usize_param("ema_period")),
+                atr: Atr::new(usize_param("atr_period")),
+                multiplier: f64_param("multiplier"),
+            }),
+            KernelId::Stochastic | KernelId::StochK | KernelId::StochD => {
+                KernelState::Stochastic(Stochastic::new(
+                    usize_param("k_period"),
+                    usize_param("d_period"),
+                    usize_param("smooth"),
+                ))
+            }
+            KernelId::Adx => KernelState::Adx(Adx::new(usize_param("period"))),
+            KernelId::Macd => KernelState::Macd(Macd {
+                fast: Ema::new(usize_param("fast_period")),
+                slow: Ema::new(usize_param("slow_period")),
+                signal: Ema::new(usize_param("signal_period")),
+            }),
+            KernelId::Fisher => KernelState::Fisher(Fisher::new(usize_param("period"))),
+            KernelId::Ichimoku => KernelState::Ichimoku(Box::new(Ichimoku::new(
+                usize_param("tenkan_period"),
+                usize_param("kijun_period"),
+                usize_param("span_b_period"),
+                usize_param("displacement"),
+            ))),
+            KernelId::Psar => KernelState::Psar(Psar::new(
+                f64_param("af_start"),
+                f64_param("af_increment"),
+                f64_param("af_max"),
+            )),
+            KernelId::Supertrend => KernelState::Supertrend(Supertrend::new(
+                usize_param("period"),
+                f64_param("multiplier"),
+            )),
+            KernelId::SwingHighAt
+            | KernelId::SwingLowAt
+            | KernelId::FibLevelDown
+            | KernelId::FibLevelUp => {
+                let period = usize_param("left") + usize_param("right") + 1;
+                let level = if matches!(kernel_id, KernelId::FibLevelDown | KernelId::FibLevelUp) {
+                    f64_param("level")
+                } else {
+                    0.0
+                };
+                KernelState::Extremum(Extremum {
+                    highs: ExtremaWindow::new(period),
+                    lows: ExtremaWindow::new(period),
+                    level,
+                })
+            }
+            KernelId::RisingPct => KernelState::Event(Event::new(1.0 + (f64_param("pct") / 100.0))),
+            KernelId::FallingPct => {
+                KernelState::Event(Event::new(1.0 - (f64_param("pct") / 100.0)))
+            }
+            KernelId::Crossup
+            | KernelId::Crossdown
+            | KernelId::Cross
+            | KernelId::Rising
+            | KernelId::Falling
+            | KernelId::InChannel
+            | KernelId::Out
+            | KernelId::Enter
+            | KernelId::Exit => KernelState::Event(Event::new(1.0)),
+            KernelId::Vwap => KernelState::Vwap(Vwap::default()),
+        };
+        let output = match kwargs.get("output") {
+            Some(IncrementalValue::Text(output)) => output.as_str(),
+            _ => "",
+        };
+        Self {
+            kernel_id,
+            selected: output_index(kernel_id, output),
+            state,
+        }
+    }
+
+    /// Rebuilds a VWAP kernel from the per-bar history kept by snapshots
+    /// written before VWAP held running sums.
+    pub(crate) fn vwap_from_history(
+        highs: &[f64],
+        lows: &[f64],
+        closes: &[f64],
+        volumes: &[f64],
+    ) -> Self {
+        let mut state = Vwap::default();
+        for (((high, low), close), volume) in highs.iter().zip(lows).zip(closes).zip(volumes) {
+            state.step(&StepBar {
+                open: f64::NAN,
+                high: *high,
+                low: *low,
+                close: *close,
+                volume: *volume,
+            });
+        }
+        Self {
+            kernel_id: KernelId::Vwap,
+            selected: 0,
+            state: KernelState::Vwap(state),
+        }
+    }
+
+    pub fn kernel_id(&self) -> KernelId {
+        self.kernel_id
+    }
+
+    /// Advances the kernel by one bar. `inputs` are the series inputs in call
+    /// order; absent inputs default to the tick close, as in the graph executor.
+    pub fn step(
+        &mut self,
+        inputs: &[IncrementalValue],
+        tick: &BTreeMap<String, IncrementalValue>,
+    ) -> IncrementalValue {
+        let bar = StepBar::from_tick(tick);
+        let input = |idx: usize| inputs.get(idx).map_or(bar.close, IncrementalValue::as_f64);
+        let x = input(0);
+        let selected = self.selected;
+        let value = match &mut self.state {
+            KernelState::Select(state) => state.step(x, &bar, tick),
+            KernelState::Sma(state) => state.step(x) / state.window.period as f64,
+            KernelState::Window(state) => {
+                state.push(bar.high);
+                state.max()
+            }
+            KernelState::Quantile(state) => state.push(x),
+            KernelState::Wma(state) => state.push(x),
+            KernelState::Ema(state) => {
+                let ema = state.step(if self.kernel_id == KernelId::ElderRay {
+                    bar.close
+                } else {
+                    x
+                });
+                match (self.kernel_id, selected) {
+                    (KernelId::ElderRay, _) if ema.is_nan() => f64::NAN,
+                    (KernelId::ElderRay, 1) => bar.low - ema,
+                    (KernelId::ElderRay, _) => bar.high - ema,
+                    _ => ema,
+                }
+            }
+            KernelState::Hma(state) => state.step(x),
+            KernelState::Rsi(state) => state.step(x),
+            KernelState::Roc(state) => state.step(x),
+            KernelState::Coppock(state) => state.step(x),
+            KernelState::Cmo(state) => state.step(x),
+            KernelState::Mfi(state) => state.step(&bar),
+            KernelState::Vortex(state) => state.step(&bar)[selected],
+            KernelState::Bbands(state) => state.step(x)[selected],
+            KernelState::Atr(state) => state.step(&bar),
+            KernelState::Keltner(state) => state.step(&bar),
+            KernelState::Stochastic(state) => state.step(&bar)[selected],
+            KernelState::Adx(state) => state.step(&bar),
+            KernelState::Macd(state) => state.step(x)[selected],
+            KernelState::Fisher(state) => state.step(&bar)[selected],
+            KernelState::Ichimoku(state) => state.step(&bar)[selected],
+            KernelState::Psar(state) => state.step(&bar)[selected],
+            KernelState::Supertrend(state) => state.step(&bar)[selected],
+            KernelState::Extremum(state) => state.step(self.kernel_id, &bar),
+            KernelState::Event(state) => {
+                return IncrementalValue::Bool(state.step(self.kernel_id, [x, input(1), input(2)]))
+            }
+            KernelState::Vwap(state) => state.step(&bar),
+        };
+        if value.is_nan() {
+            IncrementalValue::Null
+        } else {
+            IncrementalValue::Number(value)
+        }
+    }
+
+    pub fn encode(&self, blob: &mut StateBlob) {
+        blob.insert(
+            "kind".to_string(),
+            IncrementalValue::Text(self.kernel_id.name().to_string()),
+        );
+        self.selected.encode("selected", blob);
+        match &self.state {
+            KernelState::Select(state) => state.encode("s", blob),
+            KernelState::Sma(state) => state.encode("s", blob),
+            KernelState::Window(state) => state.encode("s", blob),
+            KernelState::Quantile(state) => state.encode("s", blob),
+            KernelState::Wma(state) => state.encode("s", blob),
+            KernelState::Ema(state) => state.encode("s", blob),
+            KernelState::Hma(state) => state.encode("s", blob),
+            KernelState::Rsi(state) => state.encode("s", blob),
+            KernelState::Roc(state) => state.encode("s", blob),
+            KernelState::Coppock(state) => state.encode("s", blob),
+            KernelState::Cmo(state) => state.encode("s", blob),
+            KernelState::Mfi(state) => state.encode("s", blob),
+            KernelState::Vortex(state) => state.encode("s", blob),
+            KernelState::Bbands(state) => state.encode("s", blob),
+            KernelState::Atr(state) => state.encode("s", blob),
+            KernelState::Keltner(state) => state.encode("s", blob),
+            KernelState::Stochastic(state) => state.encode("s", blob),
+            KernelState::Adx(state) => state.encode("s", blob),
+            KernelState::Macd(state) => state.encode("s", blob),
+            KernelState::Fisher(state) => state.encode("s", blob),
+            KernelState::Ichimoku(state) => state.encode("s", blob),
+            KernelState::Psar(state) => state.encode("s", blob),
+            KernelState::Supertrend(state) => state.encode("s", blob),
+            KernelState::Extremum(state) => state.encode("s", blob),
+            KernelState::Event(state) => state.encode("s", blob),
+            KernelState::Vwap(state) => state.encode("s", blob),
+        }
+    }
+
+    pub fn decode(blob: &StateBlob) -> Option<Self> {
+        let kernel_id = match blob.get("kind") {
+            Some(IncrementalValue::Text(kind)) => KernelId::from_name(kind)?,
+            _ => return None,
+        };
+        let state = match kernel_id {
+            KernelId::Select => KernelState::Select(Codec::decode("s", blob)?),
+            KernelId::Sma => KernelState::Sma(Codec::decode("s", blob)?),
+            KernelId::Median | KernelId::Quantile => {
+                KernelState::Quantile(Codec::decode("s", blob)?)
+            }
+            KernelId::Wma => KernelState::Wma(Codec::decode("s", blob)?),
+            KernelId::Donchian => KernelState::Window(Codec::decode("s", blob)?),
+            KernelId::Ema | KernelId::ElderRay => KernelState::Ema(Codec::decode("s", blob)?),
+            KernelId::Hma => KernelState::Hma(Codec::decode("s", blob)?),
+            KernelId::Rsi => KernelState::Rsi(Codec::decode("s", blob)?),
+            KernelId::Roc => KernelState::Roc(Codec::decode("s", blob)?),
+            KernelId::Coppock => KernelState::Coppock(Codec::decode("s", blob)?),
+            KernelId::Cmo => KernelState::Cmo(Codec::decode("s", blob)?),
+            KernelId::Mfi => KernelState::Mfi(Codec::decode("s", blob)?),
+            KernelId::Vortex => KernelState::Vortex(Codec::decode("s", blob)?),
+            KernelId::Bbands | KernelId::BbUpper | KernelId::BbLower => {
+                KernelState::Bbands(Codec::decode("s", blob)?)
+            }
+            KernelId::Atr => KernelState::Atr(Codec::decode("s", blob)?),
+            KernelId::Keltner => KernelState::Keltner(Codec::decode("s", blob)?),
+            KernelId::Stochastic | KernelId::StochK | KernelId::StochD => {
+                KernelState::Stochastic(Codec::decode("s", blob)?)
+            }
+            KernelId::Adx => KernelState::Adx(Codec::decode("s", blob)?),
+            KernelId::Macd => KernelState::Macd(Codec::decode("s", blob)?),
+            KernelId::Fisher => KernelState::Fisher(Codec::decode("s", blob)?),
+            KernelId::Ichimoku => KernelState::Ichimoku(Box::new(Codec::decode("s", blob)?)),
+            KernelId::Psar => KernelState::Psar(Codec::decode("s", blob)?),
+            KernelId::Supertrend => KernelState::Supertrend(Codec::decode("s", blob)?),
+            KernelId::SwingHighAt
+            | KernelId::SwingLowAt
+            | KernelId::FibLevelDown
+            | KernelId::FibLevelUp => KernelState::Extremum(Codec::decode("s", blob)?),
+            KernelId::Crossup
+            | KernelId::Crossdown
+            | KernelId::Cross
+            | KernelId::Rising
+            | KernelId::Falling
+            | KernelId::RisingPct
+            | KernelId::FallingPct
+            | KernelId::InChannel
+            | KernelId::Out
+            | KernelId::Enter
+            | KernelId::Exit => KernelState::Event(Codec::decode("s", blob)?),
+            KernelId::Vwap => KernelState::Vwap(Codec::decode("s", blob)?),
+        };
+        Some(Self {
+            kernel_id,
+            selected: Codec::decode("selected", blob)?,
+            state,
+        })
+    }
+}
+
+fn output_index(kernel_id: KernelId, output: &str) -> usize {
+    match (kernel_id, output) {
+        (KernelId::BbLower, _) | (KernelId::StochD, _) => 1,
+        (KernelId::Vortex, "minus") => 1,
+        (KernelId::Macd, "signal") => 1,
+        (KernelId::Macd, "histogram") => 2,
+        (KernelId::ElderRay, "bear") => 1,
+        (KernelId::Fisher, "signal") => 1,
+        (KernelId::Ichimoku, "kijun_sen") => 1,
+        (KernelId::Ichimoku, "senkou_span_a") => 2,
+        (KernelId::Ichimoku, "senkou_span_b") => 3,
+        (KernelId::Ichimoku, "chikou_span") => 4,
+        (KernelId::Psar, "direction") | (KernelId::Supertrend, "direction") => 1,
+        _ => 0,
+    }
+}
+
+fn param_value<'a>(
+    kwargs: &'a BTreeMap<String, IncrementalValue>,
+    kernel_id: KernelId,
+    name: &str,
+) -> (Option<&'a IncrementalValue>, f64) {
+    let spec = kernel_id.params().iter().find(|param| param.name == name);
+    let value = kwargs
+        .get(name)
+        .or_else(|| spec.and_then(|param| kwargs.get(param.arg)));
+    (value, spec.map_or(0.0, |param| param.default))
+}
+
+fn param_usize(
+    kernel_id: KernelId,
+    kwargs: &BTreeMap<String, IncrementalValue>,
+    name: &str,
+) -> usize {
+    let (value, default) = param_value(kwargs, kernel_id, name);
+    match value {
+        Some(IncrementalValue::Number(n)) if n.is_finite() && *n >= 0.0 && n.fract() == 0.0 => {
+            *n as usize
+        }
+        Some(IncrementalValue::Text(s)) => s.parse::<usize>().unwrap_or(default as usize),
+        _ => default as usize,
+    }
+}
+
+fn param_f64(kernel_id: KernelId, kwargs: &BTreeMap<String, IncrementalValue>, name: &str) -> f64 {
+    let (value, default) = param_value(kwargs, kernel_id, name);
+    match value {
+        Some(IncrementalValue::Number(n)) => *n,
+        Some(IncrementalValue::Text(s)) => s.parse::<f64>().unwrap_or(default),
+        _ => default,
+    }
+}
+
+// ---------------------------------------------------------------------------
+// State codec
+// ---------------------------------------------------------------------------
+
+trait Codec: Sized {
+    fn encode(&self, key: &str, blob: &mut StateBlob);
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self>;
+}
+
+impl Codec for f64 {
+    fn encode(&self, key: &str, blob: &mut StateBlob) {
+        blob.insert(key.to_string(), IncrementalValue::Number(*self));
+    }
+
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+        match blob.get(key) {
+            Some(IncrementalValue::Number(v)) => Some(*v),
+            _ => None,
+        }
+    }
+}
+
+impl Codec for usize {
+    fn encode(&self, key: &str, blob: &mut StateBlob) {
+        blob.insert(key.to_string(), IncrementalValue::Number(*self as f64));
+    }
+
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+        f64::decode(key, blob).map(|v| v as usize)
+    }
+}
+
+impl Codec for bool {
+    fn encode(&self, key: &str, blob: &mut StateBlob) {
+        blob.insert(key.to_string(), IncrementalValue::Bool(*self));
+    }
+
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+        match blob.get(key) {
+            Some(IncrementalValue::Bool(v)) => Some(*v),
+            _ => None,
+        }
+    }
+}
+
+impl Codec for String {
+    fn encode(&self, key: &str, blob: &mut StateBlob) {
+        blob.insert(key.to_string(), IncrementalValue::Text(self.clone()));
+    }
+
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+        match blob.get(key) {
+            Some(IncrementalValue::Text(v)) => Some(v.clone()),
+            _ => None,
+        }
+    }
+}
+
+impl Codec for Vec<f64> {
+    fn encode(&self, key: &str, blob: &mut StateBlob) {
+        blob.insert(key.to_string(), IncrementalValue::Numbers(self.clone()));
+    }
+
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+        decode_numbers(key, blob)
+    }
+}
+
+impl Codec for VecDeque<f64> {
+    fn encode(&self, key: &str, blob: &mut StateBlob) {
+        blob.insert(
+            key.to_string(),
+            IncrementalValue::Numbers(self.iter().copied().collect()),
+        );
+    }
+
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+        decode_numbers(key, blob).map(VecDeque::from)
+    }
+}
+
+impl Codec for [f64; 3] {
+    fn encode(&self, key: &str, blob: &mut StateBlob) {
+        blob.insert(key.to_string(), IncrementalValue::Numbers(self.to_vec()));
+    }
+
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+        decode_numbers(key, blob)?.try_into().ok()
+    }
+}
+
+impl<T: Codec> Codec for Option<T> {
+    fn encode(&self, key: &str, blob: &mut StateBlob) {
+        match self {
+            Some(value) => value.encode(key, blob),
+            None => {
+                blob.insert(key.to_string(), IncrementalValue::Null);
+            }
+        }
+    }
+
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+        match blob.get(key) {
+            Some(IncrementalValue::Null) => Some(None),
+            _ => T::decode(key, blob).map(Some),
+        }
+    }
+}
+
+/// Reads a float array; blobs written before arrays were stored natively hold
+/// comma-joined text.
+fn decode_numbers(key: &str, blob: &StateBlob) -> Option<Vec<f64>> {
+    match blob.get(key) {
+        Some(IncrementalValue::Numbers(values)) => Some(values.clone()),
+        Some(IncrementalValue::Text(s)) if s.is_empty() => Some(Vec::new()),
+        Some(IncrementalValue::Text(s)) => s.split(',').map(|v| v.parse::<f64>().ok()).collect(),
+        _ => None,
+    }
+}
+
+/// Implements [`Codec`] for a struct by encoding each listed field under
+/// `"{key}.{field}"`. Composite fields nest their own keys the same way.
+macro_rules! struct_codec {
+    ($ty:ident { $($field:ident),* $(,)? }) => {
+        impl Codec for $ty {
+            fn encode(&self, key: &str, blob: &mut StateBlob) {
+                $(self.$field.encode(&format!("{key}.{}", stringify!($field)), blob);)*
+            }
+
+            fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+                Some(Self {
+                    $($field: Codec::decode(&format!("{key}.{}", stringify!($field)), blob)?,)*
+                })
+            }
+        }
+    };
+}
+
+// ---------------------------------------------------------------------------
+// Building blocks
+// ---------------------------------------------------------------------------
+
+/// Fixed-length window over the most recent values.
+#[derive(Debug, Clone, PartialEq)]
+struct Window {
+    period: usize,
+    values: VecDeque<f64>,
+}
+struct_codec!(Window { period, values });
+
+impl Window {
+    fn new(period: usize) -> Self {
+        Self {
+            period,
+            values: VecDeque::with_capacity(period.saturating_add(1).min(4096)),
+        }
+    }
+
+    /// Pushes a value and returns the one that fell out of the window.
+    fn push(&mut self, value: f64) -> Option<f64> {
+        self.values.push_back(value);
+        if self.values.len() > self.period {
+            self.values.pop_front()
+        } else {
+            None
+        }
+    }
+
+    fn is_full(&self) -> bool {
+        self.period > 0 && self.values.len() == self.period
+    }
+}
+
+/// Window that answers its maximum and minimum in amortized O(1). Each side
+/// keeps a monotonic deque of the positions that can still become the
+/// extreme; a position is dropped once a strictly greater (smaller) value
+/// arrives after it. Ties therefore keep the earliest row, NaN rows are never
+/// candidates, and a window whose first row is NaN reads NaN, matching the
+/// batch `rolling_max`/`rolling_min`.
+#[derive(Debug, Clone)]
+struct ExtremaWindow {
+    window: Window,
+    /// Values pushed so far; deque entries are absolute positions.
+    pushed: u64,
+    maxima: VecDeque<u64>,
+    minima: VecDeque<u64>,
+}
+
+impl ExtremaWindow {
+    fn new(period: usize) -> Self {
+        Self::from_window(Window::new(period))
+    }
+
+    fn from_window(mut window: Window) -> Self {
+        let values = std::mem::take(&mut window.values);
+        let mut rebuilt = Self {
+            window,
+            pushed: 0,
+            maxima: VecDeque::new(),
+            minima: VecDeque::new(),
+        };
+        for value in values {
+            rebuilt.push(value);
+        }
+        rebuilt
+    }
+
+    fn period(&self) -> usize {
+        self.window.period
+    }
+
+    fn is_full(&self) -> bool {
+        self.window.is_full()
+    }
+
+    fn push(&mut self, value: f64) {
+        self.window.push(value);
+        let position = self.pushed;
+        self.pushed += 1;
+        let first = self.pushed - self.window.values.len() as u64;
+        let at = |p: u64| self.window.values[(p - first) as usize];
+        for candidates in [&mut self.maxima, &mut self.minima] {
+            while candidates.front().is_some_and(|p| *p < first) {
+                candidates.pop_front();
+            }
+        }
+        if value.is_nan() {
+            return;
+        }
+        while self.maxima.back().is_some_and(|p| value > at(*p)) {
+            self.maxima.pop_back();
+        }
+        self.maxima.push_back(position);
+        while self.minima.back().is_some_and(|p| value < at(*p)) {
+            self.minima.pop_back();
+        }
+        self.minima.push_back(position);
+    }
+
+    fn max(&self) -> f64 {
+        self.extreme(&self.maxima)
+    }
+
+    fn min(&self) -> f64 {
+        self.extreme(&self.minima)
+    }
+
+    fn extreme(&self, candidates: &VecDeque<u64>) -> f64 {
+        if !self.is_full() || self.window.values[0].is_nan() {
+            return f64::NAN;
+        }
+        let first = self.pushed - self.window.values.len() as u64;
+        candidates
+            .front()
+            .map_or(f64::NAN, |p| self.window.values[(p - first) as usize])
+    }
+}
+
+/// The deques are derived from the window, so only the window takes part in
+/// equality and encoding.
+impl PartialEq for ExtremaWindow {
+    fn eq(&self, other: &Self) -> bool {
+        self.window == other.window
+    }
+}
+
+impl Codec for ExtremaWindow {
+    fn encode(&self, key: &str, blob: &mut StateBlob) {
+        self.window.encode(key, blob);
+    }
+
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+        Window::decode(key, blob).map(Self::from_window)
+    }
+}
+
+/// Only the window values are stored; the heaps are rebuilt on decode.
+/// Median snapshots written before `q` was encoded decode with `q = 0.5`.
+impl Codec for RollingQuantile {
+    fn encode(&self, key: &str, blob: &mut StateBlob) {
+        self.period().encode(&format!("{key}.period"), blob);
+        self.quantile().encode(&format!("{key}.q"), blob);
+        self.values().encode(&format!("{key}.values"), blob);
+    }
+
+    fn decode(key: &str, blob: &StateBlob) -> Option<Self> {
+        let period = usize::decode(&format!("{key}.period"), blob)?;
+        let q = f64::decode(&format!("{key}.q"), blob).unwrap_or(0.5);
+        let values = VecDeque::<f64>::decode(&format!("{key}.values"), blob)?;
+        Some(Self::from_values(period, q, values))
+    }
+}
+
+struct_codec!(RollingWma {
+    period,
+    values,
+    nan_count,
+    sum,
+    weighted,
+    since_anchor
+});
+
+/// Running window sum with the add-then-evict order of `rolling_sum`.
+#[derive(Debug, Clone, PartialEq)]
+struct RollingSum {
+    window: Window,
+    sum: f64,
+}
+struct_codec!(RollingSum { window, sum });
+
+impl RollingSum {
+    fn new(period: usize) -> Self {
+        Self {
+            window: Window::new(period),
+            sum: 0.0,
+        }
+    }
+
+    fn step(&mut self, value: f64) -> f64 {
+        if self.window.period == 0 {
+            return f64::NAN;
+        }
+        self.sum += value;
+        if let Some(evicted) = self.window.push(value) {
+            self.sum -= evicted;
+        }
+        if self.window.is_full() {
+            self.sum
+        } else {
+            f64::NAN
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Ema {
+    period: usize,
+    prev: Option<f64>,
+}
+struct_codec!(Ema { period, prev });
+
+impl Ema {
+    fn new(period: usize) -> Self {
+        Self { period, prev: None }
+    }
+
+    fn step(&mut self, value: f64) -> f64 {
+        if self.period == 0 {
+            return f64::NAN;
+        }
+        let alpha = 2.0 / (self.period as f64 + 1.0);
+        let out = match self.prev {
+            None => value,
+            Some(prev) => alpha * value + (1.0 - alpha) * prev,
+        };
+        self.prev = Some(out);
+        out
+    }
+}
+
+/// Wilder running sum seeded with the plain sum of the first `period` values.
+#[derive(Debug, Clone, PartialEq)]
+struct WilderSum {
+    period: usize,
+    seed: Vec<f64>,
+    sum: Option<f64>,
+}
+struct_codec!(WilderSum { period, seed, sum });
+
+impl WilderSum {
+    fn new(period: usize) -> Self {
+        Self {
+            period,
+            seed: Vec::new(),
+            sum: None,
+        }
+    }
+
+    fn step(&mut self, value: f64) -> f64 {
+        match self.sum {
+            Some(sum) => {
+                let next = sum - (sum / self.period as f64) + value;
+                self.sum = Some(next);
+                next
+            }
+            None => {
+                self.seed.push(value);
+                if self.seed.len() < self.period {
+                    return f64::NAN;
+                }
+                let sum = self.seed.iter().sum::<f64>();
+                self.seed.clear();
+                self.sum = Some(sum);
+                sum
+            }
+        }
+    }
+}
+
+// ---------------------------------------------------------------------------
+// Indicator kernels
+// ---------------------------------------------------------------------------
+
+#[derive(Debug, Clone, PartialEq)]
+struct Select {
+    field: String,
+}
+struct_codec!(Select { field });
+
+impl Select {
+    fn step(&self, input: f64, bar: &StepBar, tick: &BTreeMap<String, IncrementalValue>) -> f64 {
+        match self.field.as_str() {
+            "open" => bar.open,
+            "high" => bar.high,
+            "low" => bar.low,
+            "volume" => bar.volume,
+            "close" | "price" => bar.close,
+            other => tick.get(other).map_or(input, IncrementalValue::as_f64),
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Hma {
+    period: usize,
+    half: RollingWma,
+    full: RollingWma,
+    smooth: RollingWma,
+}
+struct_codec!(Hma {
+    period,
+    half,
+    full,
+    smooth
+});
+
+impl Hma {
+    fn new(period: usize) -> Self {
+        Self {
+            period,
+            half: RollingWma::new((period / 2).max(1)),
+            full: RollingWma::new(period),
+            smooth: RollingWma::new(((period as f64).sqrt() as usize).max(1)),
+        }
+    }
+
+    fn step(&mut self, value: f64) -> f64 {
+        if self.period == 0 {
+            return f64::NAN;
+        }
+        let half = self.half.push(value);
+        let full = self.full.push(value);
+        self.smooth.push((2.0 * half) - full)
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Rsi {
+    period: usize,
+    prev: Option<f64>,
+    diffs: usize,
+    avg_gain: f64,
+    avg_loss: f64,
+}
+struct_codec!(Rsi {
+    period,
+    prev,
+    diffs,
+    avg_gain,
+    avg_loss
+});
+
+impl Rsi {
+    fn new(period: usize) -> Self {
+        Self {
+            period,
+            prev: None,
+            diffs: 0,
+            avg_gain: 0.0,
+            avg_loss: 0.0,
+        }
+    }
+
+    fn step(&mut self, value: f64) -> f64 {
+        let Some(prev) = self.prev.replace(value) else {
+            return f64::NAN;
+        };
+        if self.period == 0 {
+            return f64::NAN;
+        }
+        let diff = value - prev;
+        let p = self.period as f64;
+        self.diffs += 1;
+        if self.diffs <= self.period {
+            if diff > 0.0 {
+                self.avg_gain += diff;
+            } else {
+                self.avg_loss += -diff;
+            }
+            if self.diffs < self.period {
+                return f64::NAN;
+            }
+            self.avg_gain /= p;
+            self.avg_loss /= p;
+        } else {
+            let gain = if diff > 0.0 { diff } else { 0.0 };
+            let loss = if diff < 0.0 { -diff } else { 0.0 };
+            self.avg_gain = (self.avg_gain * (p - 1.0) + gain) / p;
+            self.avg_loss = (self.avg_loss * (p - 1.0) + loss) / p;
+        }
+        if self.avg_loss == 0.0 {
+            if self.avg_gain > 0.0 {
+                100.0
+            } else {
+                50.0
+            }
+        } else {
+            let rs = self.avg_gain / self.avg_loss;
+            100.0 - (100.0 / (1.0 + rs))
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Roc {
+    period: usize,
+    window: Window,
+}
+struct_codec!(Roc { period, window });
+
+impl Roc {
+    fn new(period: usize) -> Self {
+        Self {
+            period,
+            window: Window::new(period.saturating_add(1)),
+        }
+    }
+
+    fn step(&mut self, value: f64) -> f64 {
+        if self.period == 0 {
+            return f64::NAN;
+        }
+        self.window.push(value);
+        if !self.window.is_full() {
+            return f64::NAN;
+        }
+        let prev = self.window.values[0];
+        if prev == 0.0 || prev.is_nan() || value.is_nan() {
+            f64::NAN
+        } else {
+            ((value - prev) / prev) * 100.0
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Coppock {
+    fast: Roc,
+    slow: Roc,
+    smooth: RollingWma,
+}
+struct_codec!(Coppock { fast, slow, smooth });
+
+impl Coppock {
+    fn step(&mut self, value: f64) -> f64 {
+        if self.fast.period == 0 || self.slow.period == 0 {
+            return f64::NAN;
+        }
+        let fast = self.fast.step(value);
+        let slow = self.slow.step(value);
+        let sum = if !fast.is_nan() && !slow.is_nan() {
+            fast + slow
+        } else {
+            f64::NAN
+        };
+        self.smooth.push(sum)
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Cmo {
+    prev: Option<f64>,
+    gains: RollingSum,
+    losses: RollingSum,
+}
+struct_codec!(Cmo {
+    prev,
+    gains,
+    losses
+});
+
+impl Cmo {
+    fn new(period: usize) -> Self {
+        Self {
+            prev: None,
+            gains: RollingSum::new(period),
+            losses: RollingSum::new(period),
+        }
+    }
+
+    fn step(&mut self, value: f64) -> f64 {
+        let prev = self.prev.replace(value);
+        let (gain, loss) = match prev {
+            None => (0.0, 0.0),
+            Some(prev) => {
+                let diff = value - prev;
+                if diff > 0.0 {
+                    (diff, 0.0)
+                } else {
+                    (0.0, -diff)
+                }
+            }
+        };
+        let sg = self.gains.step(gain);
+        let sl = self.losses.step(loss);
+        if prev.is_none() || sg.is_nan() || sl.is_nan() {
+            return f64::NAN;
+        }
+        let denom = sg + sl;
+        if denom == 0.0 {
+            0.0
+        } else {
+            100.0 * (sg - sl) / denom
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Mfi {
+    prev_tp: Option<f64>,
+    pos: RollingSum,
+    neg: RollingSum,
+}
+struct_codec!(Mfi { prev_tp, pos, neg });
+
+impl Mfi {
+    fn new(period: usize) -> Self {
+        Self {
+            prev_tp: None,
+            pos: RollingSum::new(period),
+            neg: RollingSum::new(period),
+        }
+    }
+
+    fn step(&mut self, bar: &StepBar) -> f64 {
+        let tp = (bar.high + bar.low + bar.close) / 3.0;
+        let rmf = tp * bar.volume;
+        let (pos, neg) = match self.prev_tp.replace(tp) {
+            Some(prev) if tp > prev => (rmf, 0.0),
+            Some(prev) if tp < prev => (0.0, rmf),
+            _ => (0.0, 0.0),
+        };
+        let pos_sum = self.pos.step(pos);
+        let neg_sum = self.neg.step(neg);
+        if pos_sum.is_nan() || neg_sum.is_nan() {
+            return f64::NAN;
+        }
+        if neg_sum == 0.0 {
+            100.0
+        } else {
+            let mfr = pos_sum / neg_sum;
+            100.0 - (100.0 / (1.0 + mfr))
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Vortex {
+    prev: Option<[f64; 3]>,
+    tr: RollingSum,
+    plus: RollingSum,
+    minus: RollingSum,
+}
+struct_codec!(Vortex {
+    prev,
+    tr,
+    plus,
+    minus
+});
+
+impl Vortex {
+    fn new(period: usize) -> Self {
+        Self {
+            prev: None,
+            tr: RollingSum::new(period),
+            plus: RollingSum::new(period),
+            minus: RollingSum::new(period),
+        }
+    }
+
+    fn step(&mut self, bar: &StepBar) -> [f64; 2] {
+        let (tr, vm_plus, vm_minus) = match self.prev.replace([bar.high, bar.low, bar.close]) {
+            None => (f64::NAN, f64::NAN, f64::NAN),
+            Some([prev_high, prev_low, prev_close]) => {
+                let hl = bar.high - bar.low;
+                let hc = (bar.high - prev_close).abs();
+                let lc = (bar.low - prev_close).abs();
+                (
+                    hl.max(hc).max(lc),
+                    (bar.high - prev_low).abs(),
+                    (bar.low - prev_high).abs(),
+                )
+            }
+        };
+        let tr_sum = self.tr.step(tr);
+        let vp_sum = self.plus.step(vm_plus);
+        let vm_sum = self.minus.step(vm_minus);
+        if tr_sum.is_nan() || tr_sum == 0.0 || vp_sum.is_nan() || vm_sum.is_nan() {
+            return [f64::NAN, f64::NAN];
+        }
+        [vp_sum / tr_sum, vm_sum / tr_sum]
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Bbands {
+    std_dev: f64,
+    window: Window,
+    sum: f64,
+    sumsq: f64,
+}
+struct_codec!(Bbands {
+    std_dev,
+    window,
+    sum,
+    sumsq
+});
+
+impl Bbands {
+    fn new(period: usize, std_dev: f64) -> Self {
+        Self {
+            std_dev,
+            window: Window::new(period),
+            sum: 0.0,
+            sumsq: 0.0,
+        }
+    }
+
+    fn step(&mut self, value: f64) -> [f64; 2] {
+        if self.window.period == 0 {
+            return [f64::NAN, f64::NAN];
+        }
+        self.sum += value;
+        self.sumsq += value * value;
+        if let Some(evicted) = self.window.push(value) {
+            self.sum -= evicted;
+            self.sumsq -= evicted * evicted;
+        }
+        if !self.window.is_full() {
+            return [f64::NAN, f64::NAN];
+        }
+        let p = self.window.period as f64;
+        let mean = self.sum / p;
+        let mut var = (self.sumsq / p) - (mean * mean);
+        if var < 0.0 {
+            var = 0.0;
+        }
+        let std = var.sqrt();
+        if mean.is_nan() || std.is_nan() {
+            return [f64::NAN, f64::NAN];
+        }
+        [mean + (self.std_dev * std), mean - (self.std_dev * std)]
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Atr {
+    period: usize,
+    prev_close: Option<f64>,
+    seed: Vec<f64>,
+    atr: Option<f64>,
+}
+struct_codec!(Atr {
+    period,
+    prev_close,
+    seed,
+    atr
+});
+
+impl Atr {
+    fn new(period: usize) -> Self {
+        Self {
+            period,
+            prev_close: None,
+            seed: Vec::new(),
+            atr: None,
+        }
+    }
+
+    fn step(&mut self, bar: &StepBar) -> f64 {
+        let tr = match self.prev_close.replace(bar.close) {
+            None => bar.high - bar.low,
+            Some(prev_close) => {
+                let hl = bar.high - bar.low;
+                let hc = (bar.high - prev_close).abs();
+                let lc = (bar.low - prev_close).abs();
+                hl.max(hc).max(lc)
+            }
+        };
+        if self.period == 0 {
+            return f64::NAN;
+        }
+        let p = self.period as f64;
+        let atr = match self.atr {
+            Some(atr) => (atr * (p - 1.0) + tr) / p,
+            None => {
+                self.seed.push(tr);
+                if self.seed.len() < self.period {
+                    return f64::NAN;
+                }
+                let atr = self.seed.iter().sum::<f64>() / p;
+                self.seed.clear();
+                atr
+            }
+        };
+        self.atr = Some(atr);
+        atr
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Keltner {
+    ema: Ema,
+    atr: Atr,
+    multiplier: f64,
+}
+struct_codec!(Keltner {
+    ema,
+    atr,
+    multiplier
+});
+
+impl Keltner {
+    fn step(&mut self, bar: &StepBar) -> f64 {
+        let middle = self.ema.step(bar.close);
+        let atr = self.atr.step(bar);
+        if middle.is_nan() || atr.is_nan() {
+            return f64::NAN;
+        }
+        middle + atr * self.multiplier
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Stochastic {
+    highs: ExtremaWindow,
+    lows: ExtremaWindow,
+    smooth: RollingSum,
+    d_window: Window,
+}
+struct_codec!(Stochastic {
+    highs,
+    lows,
+    smooth,
+    d_window
+});
+
+impl Stochastic {
+    fn new(k_period: usize, d_period: usize, smooth: usize) -> Self {
+        Self {
+            highs: ExtremaWindow::new(k_period),
+            lows: ExtremaWindow::new(k_period),
+            smooth: RollingSum::new(smooth),
+            d_window: Window::new(d_period),
+        }
+    }
+
+    fn step(&mut self, bar: &StepBar) -> [f64; 2] {
+        if self.highs.period() == 0 || self.d_window.period == 0 {
+            return [f64::NAN, f64::NAN];
+        }
+        self.highs.push(bar.high);
+        self.lows.push(bar.low);
+        let mut k = f64::NAN;
+        if self.highs.is_full() {
+            let hh = self.highs.max();
+            let ll = self.lows.min();
+            let denom = hh - ll;
+            k = if denom == 0.0 {
+                50.0
+            } else {
+                100.0 * (bar.close - ll) / denom
+            };
+        }
+        if self.smooth.window.period > 1 {
+            k = self.smooth.step(k) / self.smooth.window.period as f64;
+        }
+        self.d_window.push(k);
+        let mut d = f64::NAN;
+        if self.d_window.is_full() {
+            let mut sum = 0.0;
+            let mut valid = true;
+            for value in &self.d_window.values {
+                if value.is_nan() {
+                    valid = false;
+                    break;
+                }
+                sum += *value;
+            }
+            if valid {
+                d = sum / self.d_window.period as f64;
+            }
+        }
+        [k, d]
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Adx {
+    period: usize,
+    prev: Option<[f64; 3]>,
+    tr: WilderSum,
+    plus_dm: WilderSum,
+    minus_dm: WilderSum,
+    dx_started: bool,
+    dx_seed: Vec<f64>,
+    adx: Option<f64>,
+}
+struct_codec!(Adx {
+    period,
+    prev,
+    tr,
+    plus_dm,
+    minus_dm,
+    dx_started,
+    dx_seed,
+    adx
+});
+
+impl Adx {
+    fn new(period: usize) -> Self {
+        Self {
+            period,
+            prev: None,
+            tr: WilderSum::new(period),
+            plus_dm: WilderSum::new(period),
+            minus_dm: WilderSum::new(period),
+            dx_started: false,
+            dx_seed: Vec::new(),
+            adx: None,
+        }
+    }
+
+    fn step(&mut self, bar: &StepBar) -> f64 {
+        if self.period == 0 {
+            return f64::NAN;
+        }
+        let prev = self.prev.replace([bar.high, bar.low, bar.close]);
+        let (plus_dm, minus_dm, tr) = match prev {
+            None => (0.0, 0.0, 0.0),
+            Some([prev_high, prev_low, prev_close]) => {
+                let up = bar.high - prev_high;
+                let down = prev_low - bar.low;
+                let hl = bar.high - bar.low;
+                let hc = (bar.high - prev_close).abs();
+                let lc = (bar.low - prev_close).abs();
+                (
+                    if up > down && up > 0.0 { up } else { 0.0 },
+                    if down > up && down > 0.0 { down } else { 0.0 },
+                    hl.max(hc).max(lc),
+                )
+            }
+        };
+        let tr_val = self.tr.step(tr);
+        let smooth_plus = self.plus_dm.step(plus_dm);
+        let smooth_minus = self.minus_dm.step(minus_dm);
+        let mut dx = f64::NAN;
+        if tr_val > 0.0 {
+            let pdi = 100.0 * smooth_plus / tr_val;
+            let mdi = 100.0 * smooth_minus / tr_val;
+            let sum = pdi + mdi;
+            dx = if sum > 0.0 {
+                100.0 * (pdi - mdi).abs() / sum
+            } else {
+                0.0
+            };
+        }
+        let adx = self.smooth_dx(dx);
+        if prev.is_none() {
+            // The batch kernel needs at least two bars before emitting anything.
+            return f64::NAN;
+        }
+        adx
+    }
+
+    fn smooth_dx(&mut self, dx: f64) -> f64 {
+        if !self.dx_started {
+            if dx.is_nan() {
+                return f64::NAN;
+            }
+            self.dx_started = true;
+        }
+        let p = self.period as f64;
+        let adx = match self.adx {
+            Some(prev) => (prev * (p - 1.0) + dx) / p,
+            None => {
+                self.dx_seed.push(dx);
+                if self.dx_seed.len() < self.period {
+                    return f64::NAN;
+                }
+                let sum = self.dx_seed.iter().sum::<f64>();
+                self.dx_seed.clear();
+                sum / p
+            }
+        };
+        self.adx = Some(adx);
+        adx
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Macd {
+    fast: Ema,
+    slow: Ema,
+    signal: Ema,
+}
+struct_codec!(Macd { fast, slow, signal });
+
+impl Macd {
+    fn step(&mut self, value: f64) -> [f64; 3] {
+        let fast = self.fast.step(value);
+        let slow = self.slow.step(value);
+        let line = if !fast.is_nan() && !slow.is_nan() {
+            fast - slow
+        } else {
+            f64::NAN
+        };
+        let signal = self.signal.step(line);
+        let histogram = if !line.is_nan() && !signal.is_nan() {
+            line - signal
+        } else {
+            f64::NAN
+        };
+        [line, signal, histogram]
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Fisher {
+    window: ExtremaWindow,
+    prev_value: f64,
+    prev_fisher: f64,
+    last: Option<f64>,
+}
+struct_codec!(Fisher {
+    window,
+    prev_value,
+    prev_fisher,
+    last
+});
+
+impl Fisher {
+    fn new(period: usize) -> Self {
+        Self {
+            window: ExtremaWindow::new(period),
+            prev_value: 0.0,
+            prev_fisher: 0.0,
+            last: None,
+        }
+    }
+
+    fn step(&mut self, bar: &StepBar) -> [f64; 2] {
+        if self.window.period() == 0 {
+            return [f64::NAN, f64::NAN];
+        }
+        let hl2 = (bar.high + bar.low) / 2.0;
+        self.window.push(hl2);
+        let h_max = self.window.max();
+        let l_min = self.window.min();
+        let mut fisher = f64::NAN;
+        if !h_max.is_nan() && !l_min.is_nan() {
+            let diff = h_max - l_min;
+            let x = if diff == 0.0 {
+                0.0
+            } else {
+                ((hl2 - l_min) / diff) - 0.5
+            };
+            let mut value = 0.66 * x + 0.67 * self.prev_value;
+            value = value.clamp(-0.999, 0.999);
+            fisher = 0.5 * ((1.0 + value) / (1.0 - value)).ln() + 0.5 * self.prev_fisher;
+            self.prev_value = value;
+            self.prev_fisher = fisher;
+        }
+        let signal = self.last.replace(fisher).unwrap_or(0.0);
+        [fisher, signal]
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Ichimoku {
+    tenkan_high: ExtremaWindow,
+    tenkan_low: ExtremaWindow,
+    kijun_high: ExtremaWindow,
+    kijun_low: ExtremaWindow,
+    span_b_high: ExtremaWindow,
+    span_b_low: ExtremaWindow,
+    displacement: usize,
+    pending_span_a: VecDeque<f64>,
+    recent_span_b: VecDeque<f64>,
+}
+struct_codec!(Ichimoku {
+    tenkan_high,
+    tenkan_low,
+    kijun_high,
+    kijun_low,
+    span_b_high,
+    span_b_low,
+    displacement,
+    pending_span_a,
+    recent_span_b
+});
+
+impl Ichimoku {
+    fn new(tenkan: usize, kijun: usize, span_b: usize, displacement: usize) -> Self {
+        Self {
+            tenkan_high: ExtremaWindow::new(tenkan),
+            tenkan_low: ExtremaWindow::new(tenkan),
+            kijun_high: ExtremaWindow::new(kijun),
+            kijun_low: ExtremaWindow::new(kijun),
+            span_b_high: ExtremaWindow::new(span_b),
+            span_b_low: ExtremaWindow::new(span_b),
+            displacement,
+            pending_span_a: VecDeque::new(),
+            recent_span_b: VecDeque::new(),
+        }
+    }
+
+    fn step(&mut self, bar: &StepBar) -> [f64; 5] {
+        if self.tenkan_high.period() == 0
+            || self.kijun_high.period() == 0
+            || self.span_b_high.period() == 0
+            || self.displacement == 0
+        {
+            return [f64::NAN; 5];
+        }
+        let midpoint = |high: &mut ExtremaWindow, low: &mut ExtremaWindow| {
+            high.push(bar.high);
+            low.push(bar.low);
+            let (h, l) = (high.max(), low.min());
+            if h.is_nan() || l.is_nan() {
+                f64::NAN
+            } else {
+                (h + l) / 2.0
+            }
+        };
+        let tenkan = midpoint(&mut self.tenkan_high, &mut self.tenkan_low);
+        let kijun = midpoint(&mut self.kijun_high, &mut self.kijun_low);
+        let raw_span_b = midpoint(&mut self.span_b_high, &mut self.span_b_low);
+
+        // Span A is the tenkan/kijun midpoint projected `displacement` bars ahead.
+        self.pending_span_a
+            .push_back(if tenkan.is_nan() || kijun.is_nan() {
+                f64::NAN
+            } else {
+                (tenkan + kijun) / 2.0
+            });
+        let span_a = if self.pending_span_a.len() > self.displacement {
+            self.pending_span_a.pop_front().unwrap_or(f64::NAN)
+        } else {
+            f64::NAN
+        };
+
+        // The batch kernel projects span B in place, so a valid value from
+        // `displacement` bars back overrides the freshly computed one.
+        let projected = if self.recent_span_b.len() == self.displacement {
+            self.recent_span_b.pop_front()
+        } else {
+            None
+        };
+        let span_b = match projected {
+            Some(value) if !value.is_nan() => value,
+            _ => raw_span_b,
+        };
+        self.recent_span_b.push_back(span_b);
+
+        [tenkan, kijun, span_a, span_b, f64::NAN]
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Psar {
+    af_start: f64,
+    af_increment: f64,
+    af_max: f64,
+    bars: usize,
+    first_close: f64,
+    is_long: bool,
+    af: f64,
+    ep: f64,
+    sar: f64,
+    prev_high: f64,
+    prev_low: f64,
+    prev2_high: f64,
+    prev2_low: f64,
+}
+struct_codec!(Psar {
+    af_start,
+    af_increment,
+    af_max,
+    bars,
+    first_close,
+    is_long,
+    af,
+    ep,
+    sar,
+    prev_high,
+    prev_low,
+    prev2_high,
+    prev2_low
+});
+
+impl Psar {
+    fn new(af_start: f64, af_increment: f64, af_max: f64) -> Self {
+        Self {
+            af_start,
+            af_increment,
+            af_max,
+            bars: 0,
+            first_close: f64::NAN,
+            is_long: true,
+            af: af_start,
+            ep: f64::NAN,
+            sar: f64::NAN,
+            prev_high: f64::NAN,
+            prev_low: f64::NAN,
+            prev2_high: f64::NAN,
+            prev2_low: f64::NAN,
+        }
+    }
+
+    fn step(&mut self, bar: &StepBar) -> [f64; 2] {
+        let i = self.bars;
+        self.bars += 1;
+        if i == 0 {
+            self.first_close = bar.close;
+            self.prev_high = bar.high;
+            self.prev_low = bar.low;
+            return [bar.low, 1.0];
+        }
+        if i == 1 {
+            self.is_long = bar.close >= self.first_close;
+            self.af = self.af_start;
+            self.ep = if self.is_long {
+                self.prev_high
+            } else {
+                self.prev_low
+            };
+            self.sar = if self.is_long {
+                self.prev_low
+            } else {
+                self.prev_high
+            };
+        }
+
+        let mut curr = self.sar + self.af * (self.ep - self.sar);
+        if self.is_long {
+            curr = curr.min(self.prev_low);
+            if i > 1 {
+                curr = curr.min(self.prev2_low);
+            }
+            if bar.low < curr {
+                self.is_long = false;
+                curr = self.ep;
+                self.ep = bar.low;
+                self.af = self.af_start;
+            } else if bar.high > self.ep {
+                self.ep = bar.high;
+                self.af = (self.af + self.af_increment).min(self.af_max);
+            }
+        } else {
+            curr = curr.max(self.prev_high);
+            if i > 1 {
+                curr = curr.max(self.prev2_high);
+            }
+            if bar.high > curr {
+                self.is_long = true;
+                curr = self.ep;
+                self.ep = bar.high;
+                self.af = self.af_start;
+            } else if bar.low < self.ep {
+                self.ep = bar.low;
+                self.af = (self.af + self.af_increment).min(self.af_max);
+            }
+        }
+        self.sar = curr;
+        self.prev2_high = self.prev_high;
+        self.prev2_low = self.prev_low;
+        self.prev_high = bar.high;
+        self.prev_low = bar.low;
+        [curr, if self.is_long { 1.0 } else { -1.0 }]
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+struct Supertrend {
+    atr: Atr,
+    multiplier: f64,
+    started: bool,
+    prev_close: Option<f64>,
+    prev_upper: f64,
+    prev_lower: f64,
+    prev_trend: f64,
+}
+struct_codec!(Supertrend {
+    atr,
+    multiplier,
+    started,
+    prev_close,
+    prev_upper,
+    prev_lower,
+    prev_trend
+});
+
+impl Supertrend {
+    fn new(period: usize, multiplier: f64) -> Self {
+        Self {
+            atr: Atr::new(period),
+            multiplier,
+            started: false,
+            prev_close: None,
+            prev_upper: f64::NAN,
+            prev_lower: f64::NAN,
+            prev_trend: f64::NAN,
+        }
+    }
+
+    fn step(&mut self, bar: &StepBar) -> [f64; 2] {
+        if self.atr.period == 0 {
+            return [f64::NAN, f64::NAN];
+        }
+        let atr = self.atr.step(bar);
+        let (basic_upper, basic_lower) = if atr.is_nan() {
+            (f64::NAN, f64::NAN)
+        } else {
+            let hl2 = (bar.high + bar.low) / 2.0;
+            (hl2 + self.multiplier * atr, hl2 - self.multiplier * atr)
+        };
+
+        let prev_close = self.prev_close.replace(bar.close);
+        let (upper, lower) = match prev_close {
+            Some(prev_close)
+                if !basic_upper.is_nan()
+                    && !basic_lower.is_nan()
+                    && !self.prev_upper.is_nan()
+                    && !self.prev_lower.is_nan() =>
+            {
+                (
+                    if basic_upper < self.prev_upper || prev_close > self.prev_upper {
+                        basic_upper
+                    } else {
+                        self.prev_upper
+                    },
+                    if basic_lower > self.prev_lower || prev_close < self.prev_lower {
+                        basic_lower
+                    } else {
+                        self.prev_lower
+                    },
+                )
+            }
+            _ => (basic_upper, basic_lower),
+        };
+
+        let (trend, direction) = if !self.started {
+            if !basic_upper.is_nan() && !upper.is_nan() {
+                self.started = true;
+                (upper, -1.0)
+            } else {
+                (f64::NAN, f64::NAN)
+            }
+        } else if basic_upper.is_nan() || upper.is_nan() || lower.is_nan() {
+            (f64::NAN, f64::NAN)
+        } else if self.prev_trend == self.prev_upper {
+            if bar.close <= upper {
+                (upper, -1.0)
+            } else {
+                (lower, 1.0)
+            }
+        } else if bar.close >= lower {
+            (lower, 1.0)
+        } else {
+            (upper, -1.0)
+        };
+
+        self.prev_upper = upper;
+        self.prev_lower = lower;
+        self.prev_trend = trend;
+        [trend, direction]
+    }
+}
+
+/// Rolling high/low extremes used by the swing and fibonacci level kernels.
+#[derive(Debug, Clone, PartialEq)]
+struct Extremum {
+    highs: ExtremaWindow,
+    lows: ExtremaWindow,
+    level: f64,
+}
+struct_codec!(Extremum { highs, lows, level });
+
+impl Extremum {
+    fn step(&mut self, kernel_id: KernelId, bar: &StepBar) -> f64 {
+        self.highs.push(bar.high);
+        self.lows.push(bar.low);
+        let (h, l) = (self.highs.max(), self.lows.min());
+        match kernel_id {
+            KernelId::SwingHighAt => h,
+            KernelId::SwingLowAt => l,
+            _ if h.is_nan() || l.is_nan() => f64::NAN,
+            KernelId::FibLevelUp => l + ((h - l) * self.level),
+            _ => h - ((h - l) * self.level),
+        }
+    }
+}
+
+/// Event kernels over up to three inputs, comparing against the previous bar.
+#[derive(Debug, Clone, PartialEq)]
+struct Event {
+    factor: f64,
+    prev: Option<[f64; 3]>,
+}
+struct_codec!(Event { factor, prev });
+
+impl Event {
+    fn new(factor: f64) -> Self {
+        Self { factor, prev: None }
+    }
+
+    fn step(&mut self, kernel_id: KernelId, current: [f64; 3]) -> bool {
+        let inside = |[p, upper, lower]: [f64; 3]| p >= lower && p <= upper;
+        let outside = |[p, upper, lower]: [f64; 3]| p > upper || p < lower;
+        let [a, b, _] = current;
+        let prev = self.prev.replace(current);
+        match kernel_id {
+            KernelId::InChannel => return inside(current),
+            KernelId::Out => return outside(current),
+            _ => {}
+        }
+        let Some(prev) = prev else {
+            return false;
+        };
+        let [pa, pb, _] = prev;
+        match kernel_id {
+            KernelId::Crossup => a > b && pa <= pb,
+            KernelId::Crossdown => a < b && pa >= pb,
+            KernelId::Cross => (a > b && pa <= pb) || (a < b && pa >= pb),
+            KernelId::Rising => a > pa,
+            KernelId::Falling => a < pa,
+            KernelId::RisingPct => a >= pa * self.factor,
+            KernelId::FallingPct => a <= pa * self.factor,
+            KernelId::Enter => inside(current) && outside(prev),
+            KernelId::Exit => outside(current) && inside(prev),
+            _ => false,
+        }
+    }
+}
+
+/// Cumulative volume-weighted typical price; falls back to the typical price
+/// while no volume has traded.
+#[derive(Debug, Clone, PartialEq, Default)]
+struct Vwap {
+    sum_pv: f64,
+    sum_volume: f64,
+}
+struct_codec!(Vwap { sum_pv, sum_volume });
+
+impl Vwap {
+    fn step(&mut self, bar: &StepBar) -> f64 {
+        let typical = (bar.high + bar.low + bar.close) / 3.0;
+        self.sum_pv += typical * bar.volume;
+        self.sum_volume += bar.volume;
+        if self.sum_volume > 0.0 {
+            self.sum_pv / self.sum_volume
+        } else {
+            typical
+        }
+    }
+}
@@ -1,6 +1,8 @@
 use std::collections::BTreeMap;
 
-use super::contracts::{NodeSnapshotState, RuntimeSnapshot, INCREMENTAL_STATE_SCHEMA_VERSION};
+use super::contracts::{
+    IncrementalValue, NodeSnapshotState, RuntimeSnapshot, INCREMENTAL_STATE_SCHEMA_VERSION,
+};
 use super::state::NodeRuntimeState;
 
 #[derive(Debug, Clone, Default)]
@@ -23,10 +25,40 @@ impl RuntimeStateStore {
         self.nodes.insert(node.node_id, node);
     }
 
+    /// Counts one step of `node_id` and records its output. The encoded state
+    /// is left as is; the owner refreshes it with [`Self::set_state_blob`]
+    /// before the store is snapshotted.
+    pub fn record_step(&mut self, node_id: u32, last_output: IncrementalValue) {
+        let node = self
+            .nodes
+            .entry(node_id)
+            .or_insert_with(|| NodeRuntimeState {
+                node_id,
+                ticks_processed: 0,
+                last_output: IncrementalValue::Null,
+                state_blob: BTreeMap::new(),
+            });
+        node.ticks_processed += 1;
+        node.last_output = last_output;
+    }
+
+    pub fn set_state_blob(&mut self, node_id: u32, state_blob: BTreeMap<String, IncrementalValue>) {
+        if let Some(node) = self.nodes.get_mut(&node_id) {
+            node.state_blob = state_blob;
+        }
+    }
+
     pub fn get_node(&self, node_id: u32) -> Option<&NodeRuntimeState> {
         self.nodes.get(&node_id)
     }
 
+    pub fn heap_bytes(&self) -> usize {
+        self.nodes
+            .values()
+            .map(|node| std::mem::size_of::<(u32, NodeRuntimeState)>() + node.heap_bytes())
+            .sum()
+    }
+
     pub fn snapshot(&self) -> RuntimeSnapshot {
         let mut nodes: BTreeMap<u32, NodeSnapshotState> = BTreeMap::new();
         for (node_id, state) in &self.nodes {
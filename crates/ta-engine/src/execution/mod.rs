@@ -1 +1,2 @@
 pub mod incremental;
+pub(crate) mod parallel;
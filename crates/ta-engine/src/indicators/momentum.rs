@@ -75,21 +75,13 @@ pub fn stochastic_kd(
         return (k, d);
     }
 
+    let highest = crate::rolling::rolling_max(high, k_period);
+    let lowest = crate::rolling::rolling_min(low, k_period);
     for i in 0..n {
         if i + 1 < k_period {
             continue;
         }
-        let start = i + 1 - k_period;
-        let mut hh = high[start];
-        let mut ll = low[start];
-        for j in (start + 1)..=i {
-            if high[j] > hh {
-                hh = high[j];
-            }
-            if low[j] < ll {
-                ll = low[j];
-            }
-        }
+        let (hh, ll) = (highest[i], lowest[i]);
         let denom = hh - ll;
         let k_val = if denom == 0.0 {
             50.0
@@ -141,25 +133,124 @@ pub fn cci(high: &[f64], low: &[f64], close: &[f64], period: usize) -> Vec<f64>
 
     let sma = crate::rolling::rolling_mean(&tp, period);
     let mut out = vec![f64::NAN; n];
+    let mean_deviation = rolling_mean_deviation(&tp, &sma, period);
 
-    for i in 0..n {
-        if i + 1 < period {
-            continue;
+    for i in (period - 1)..n {
+        if mean_deviation[i] == 0.0 {
+            out[i] = 0.0;
+        } else {
+            out[i] = (tp[i] - sma[i]) / (0.015 * mean_deviation[i]);
         }
+    }
 
-        let mut mean_deviation = 0.0;
-        let start = i + 1 - period;
-        let current_sma = sma[i];
+    out
+}
 
-        for value in tp.iter().take(i + 1).skip(start) {
-            mean_deviation += (*value - current_sma).abs();
-        }
-        mean_deviation /= period as f64;
+/// Deviations below this fraction of a chunk's magnitude are rescanned
+/// exactly by [`rolling_mean_deviation`].
+const NOISE_RATIO: f64 = 1e-7;
+
+/// Mean absolute deviation of each `period` window around `mean[i]`, in
+/// O(log period) amortized per row.
+///
+/// The deviation splits at the mean: `sum(x - m)` over values above it plus
+/// `sum(m - x)` over values below it. Window values are kept in a Fenwick tree
+/// of counts and sums indexed by rank. Rows are processed in chunks of a few
+/// windows, each with its own tree over the chunk's values centred on its
+/// first value, so float error from insert/remove cycles cannot accumulate
+/// beyond one chunk. That error is still relative to the chunk's magnitude, so
+/// a deviation within noise of it (flat or near-flat windows, where the tree
+/// can even come out negative) is recomputed with an exact window scan. Rows
+/// whose mean is not finite are left NaN, which keeps CCI NaN for them; a
+/// finite rolling mean implies every value in its window is finite.
+fn rolling_mean_deviation(values: &[f64], mean: &[f64], period: usize) -> Vec<f64> {
+    let n = values.len();
+    let mut out = vec![f64::NAN; n];
+    if period == 0 || n < period {
+        return out;
+    }
 
-        if mean_deviation == 0.0 {
-            out[i] = 0.0;
-        } else {
-            out[i] = (tp[i] - current_sma) / (0.015 * mean_deviation);
+    let chunk = period.max(256) * 4;
+    let mut sorted: Vec<f64> = Vec::with_capacity(chunk + period);
+    let mut counts: Vec<f64> = Vec::with_capacity(chunk + period + 1);
+    let mut sums: Vec<f64> = Vec::with_capacity(chunk + period + 1);
+
+    for chunk_start in (period - 1..n).step_by(chunk) {
+        let chunk_end = (chunk_start + chunk).min(n);
+        let lo = chunk_start + 1 - period;
+        let Some(origin) = values[lo..chunk_end]
+            .iter()
+            .copied()
+            .find(|x| x.is_finite())
+        else {
+            continue;
+        };
+
+        sorted.clear();
+        sorted.extend(
+            values[lo..chunk_end]
+                .iter()
+                .filter(|x| x.is_finite())
+                .map(|x| *x - origin),
+        );
+        sorted.sort_by(f64::total_cmp);
+        let noise = sorted[0].abs().max(sorted[sorted.len() - 1].abs()) * NOISE_RATIO;
+        counts.clear();
+        counts.resize(sorted.len() + 1, 0.0);
+        sums.clear();
+        sums.resize(sorted.len() + 1, 0.0);
+
+        let update = |counts: &mut [f64], sums: &mut [f64], x: f64, sign: f64| {
+            let mut pos = sorted.partition_point(|v| *v < x) + 1;
+            while pos < counts.len() {
+                counts[pos] += sign;
+                sums[pos] += sign * x;
+                pos += pos & pos.wrapping_neg();
+            }
+        };
+        let prefix = |counts: &[f64], sums: &[f64], mut pos: usize| {
+            let (mut count, mut sum) = (0.0, 0.0);
+            while pos > 0 {
+                count += counts[pos];
+                sum += sums[pos];
+                pos &= pos - 1;
+            }
+            (count, sum)
+        };
+
+        for x in &values[lo..chunk_start] {
+            if x.is_finite() {
+                update(&mut counts, &mut sums, *x - origin, 1.0);
+            }
+        }
+        for i in chunk_start..chunk_end {
+            if values[i].is_finite() {
+                update(&mut counts, &mut sums, values[i] - origin, 1.0);
+            }
+            if i >= lo + period && values[i - period].is_finite() {
+                update(&mut counts, &mut sums, values[i - period] - origin, -1.0);
+            }
+            if !mean[i].is_finite() {
+                continue;
+            }
+            let m = mean[i] - origin;
+            let (below_count, below_sum) =
+                prefix(&counts, &sums, sorted.partition_point(|v| *v < m));
+            let (upto_count, upto_sum) =
+                prefix(&counts, &sums, sorted.partition_point(|v| *v <= m));
+            let (total_count, total_sum) = prefix(&counts, &sums, sorted.len());
+            let above = (total_sum - upto_sum) - (total_count - upto_count) * m;
+            let below = below_count * m - below_sum;
+            let deviation = ((above + below) / period as f64).max(0.0);
+            out[i] = if deviation <= noise {
+                values[i + 1 - period..=i]
+                    .iter()
+                    .map(|x| (x - mean[i]).abs())
+                    .sum::<f64>()
+                    / period as f64
+            } else {
+                deviation
+            };
         }
     }
 
@@ -191,21 +282,13 @@ pub fn williams_r(high: &[f64], low: &[f64], close: &[f64], period: usize) -> Ve
         return out;
     }
 
+    let highest = crate::rolling::rolling_max(high, period);
+    let lowest = crate::rolling::rolling_min(low, period);
     for i in 0..n {
         if i + 1 < period {
             continue;
         }
-        let start = i + 1 - period;
-        let mut hh = high[start];
-        let mut ll = low[start];
-        for j in (start + 1)..=i {
-            if high[j] > hh {
-                hh = high[j];
-            }
-            if low[j] < ll {
-                ll = low[j];
-            }
-        }
+        let (hh, ll) = (highest[i], lowest[i]);
         let range = hh - ll;
         if range == 0.0 {
             out[i] = 0.0;
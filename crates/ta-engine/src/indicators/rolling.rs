@@ -1,3 +1,6 @@
+use std::cmp::{Ordering, Reverse};
+use std::collections::{BinaryHeap, HashMap, VecDeque};
+
 pub fn rolling_sum(values: &[f64], period: usize) -> Vec<f64> {
     let n = values.len();
     let mut out = vec![f64::NAN; n];
@@ -67,68 +70,292 @@ pub fn rolling_std(values: &[f64], period: usize) -> Vec<f64> {
 }
 
 pub fn rolling_min(values: &[f64], period: usize) -> Vec<f64> {
+    rolling_extreme(values, period, |candidate, kept| candidate < kept)
+}
+
+pub fn rolling_max(values: &[f64], period: usize) -> Vec<f64> {
+    rolling_extreme(values, period, |candidate, kept| candidate > kept)
+}
+
+/// Window extreme in O(1) per row with the van Herk/Gil-Werman scheme: rows
+/// are split into blocks of `period`, and every window is the combination of
+/// the previous block's suffix and the current block's prefix. The scans have
+/// no data-dependent loops, so the cost does not depend on the window length
+/// or on how often the extreme changes, and only one block of suffixes is
+/// kept.
+///
+/// `beats(candidate, kept)` is the strict ordering: equal values keep the
+/// earliest row and NaN rows are skipped. A window whose first row is NaN
+/// yields NaN, matching a left-to-right scan seeded with that row.
+fn rolling_extreme(values: &[f64], period: usize, beats: impl Fn(f64, f64) -> bool) -> Vec<f64> {
     let n = values.len();
     let mut out = vec![f64::NAN; n];
-    if period == 0 || n == 0 {
+    if period == 0 || n < period {
         return out;
     }
 
-    for i in 0..n {
-        if i + 1 >= period {
-            let start = i + 1 - period;
-            let mut m = values[start];
-            for x in &values[start + 1..=i] {
-                if *x < m {
-                    m = *x;
+    // `earlier` wins ties; NaN stands for "no value yet". The non-short-circuit
+    // `|` keeps the select branch-free.
+    let pick = |earlier: f64, later: f64| {
+        if earlier.is_nan() | beats(later, earlier) {
+            later
+        } else {
+            earlier
+        }
+    };
+
+    // `suffix[k]` is the extreme of rows `k..period` of the previous block.
+    let mut suffix = vec![f64::NAN; period];
+    for block_start in (0..n).step_by(period) {
+        let block_end = (block_start + period).min(n);
+        let mut acc = f64::NAN;
+        for i in block_start..block_end {
+            acc = pick(acc, values[i]);
+            // The window starts `offset` rows into the previous block, or
+            // covers exactly this block when `offset == period`.
+            let offset = i + 1 - block_start;
+            if offset == period {
+                if !values[block_start].is_nan() {
+                    out[i] = acc;
                 }
+            } else if block_start > 0 && !values[i + 1 - period].is_nan() {
+                out[i] = pick(suffix[offset], acc);
             }
-            out[i] = m;
+        }
+        let mut acc = f64::NAN;
+        for i in (block_start..block_end).rev() {
+            acc = pick(values[i], acc);
+            suffix[i - block_start] = acc;
         }
     }
 
     out
 }
 
-pub fn rolling_max(values: &[f64], period: usize) -> Vec<f64> {
-    let n = values.len();
-    let mut out = vec![f64::NAN; n];
-    if period == 0 || n == 0 {
-        return out;
+pub fn rolling_median(values: &[f64], period: usize) -> Vec<f64> {
+    rolling_quantile(values, period, 0.5)
+}
+
+/// Order statistic at quantile `q` of each full window; see [`RollingQuantile`]
+/// for the rank convention. O(log period) per row.
+pub fn rolling_quantile(values: &[f64], period: usize, q: f64) -> Vec<f64> {
+    let mut window = RollingQuantile::new(period, q);
+    values.iter().map(|&x| window.push(x)).collect()
+}
+
+/// Rank of quantile `q` in a sorted window of `period` values: the element at
+/// `floor(q * period)`, clamped to the last one, so `q = 0.5` is the upper
+/// median of even windows.
+fn quantile_rank(period: usize, q: f64) -> usize {
+    let rank = (q.clamp(0.0, 1.0) * period as f64).floor() as usize;
+    rank.min(period.saturating_sub(1))
+}
+
+/// `f64` ordered by `total_cmp`, so it can live in a `BinaryHeap`.
+#[derive(Debug, Clone, Copy)]
+struct Ranked(f64);
+
+impl PartialEq for Ranked {
+    fn eq(&self, other: &Self) -> bool {
+        self.cmp(other) == Ordering::Equal
     }
+}
 
-    for i in 0..n {
-        if i + 1 >= period {
-            let start = i + 1 - period;
-            let mut m = values[start];
-            for x in &values[start + 1..=i] {
-                if *x > m {
-                    m = *x;
-                }
+impl Eq for Ranked {}
+
+impl PartialOrd for Ranked {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl Ord for Ranked {
+    fn cmp(&self, other: &Self) -> Ordering {
+        self.0.total_cmp(&other.0)
+    }
+}
+
+/// Sliding-window order statistic in O(log period) per push.
+///
+/// The live values are split between a max-heap `low` holding the `rank + 1`
+/// smallest and a min-heap `high` holding the rest, so the answer is the top
+/// of `low`. Evicted values are deleted lazily: they are counted in `pending`
+/// and dropped once they surface at a heap top. Buried dead entries are
+/// bounded by rebuilding both heaps from the window once they outnumber the
+/// live ones.
+///
+/// A window containing NaN yields NaN, as does a window that is not yet full.
+#[derive(Debug, Clone)]
+pub struct RollingQuantile {
+    period: usize,
+    q: f64,
+    rank: usize,
+    window: VecDeque<f64>,
+    nan_count: usize,
+    low: BinaryHeap<Ranked>,
+    high: BinaryHeap<Reverse<Ranked>>,
+    low_live: usize,
+    high_live: usize,
+    pending: HashMap<u64, usize>,
+}
+
+impl RollingQuantile {
+    pub fn new(period: usize, q: f64) -> Self {
+        let capacity = period.saturating_add(1).min(4096);
+        Self {
+            period,
+            q,
+            rank: quantile_rank(period, q),
+            window: VecDeque::with_capacity(capacity),
+            nan_count: 0,
+            low: BinaryHeap::with_capacity(capacity),
+            high: BinaryHeap::with_capacity(capacity),
+            low_live: 0,
+            high_live: 0,
+            pending: HashMap::new(),
+        }
+    }
+
+    /// Rebuilds the window from its values, oldest first.
+    pub fn from_values(period: usize, q: f64, values: impl IntoIterator<Item = f64>) -> Self {
+        let mut out = Self::new(period, q);
+        for x in values {
+            out.push(x);
+        }
+        out
+    }
+
+    pub fn period(&self) -> usize {
+        self.period
+    }
+
+    pub fn quantile(&self) -> f64 {
+        self.q
+    }
+
+    /// Values currently in the window, oldest first.
+    pub fn values(&self) -> &VecDeque<f64> {
+        &self.window
+    }
+
+    /// Pushes a value, evicting the oldest once the window is full, and
+    /// returns the quantile of the resulting window.
+    pub fn push(&mut self, value: f64) -> f64 {
+        if self.period == 0 {
+            return f64::NAN;
+        }
+        self.window.push_back(value);
+        self.insert(value);
+        if self.window.len() > self.period {
+            if let Some(evicted) = self.window.pop_front() {
+                self.remove(evicted);
             }
-            out[i] = m;
         }
+        self.rebalance();
+        if self.low.len() + self.high.len() > 2 * self.period + 16 {
+            self.rebuild();
+        }
+        self.value()
     }
 
-    out
-}
+    /// Quantile of the current window, NaN until it is full.
+    pub fn value(&self) -> f64 {
+        if self.window.len() < self.period || self.nan_count > 0 {
+            return f64::NAN;
+        }
+        self.low.peek().map_or(f64::NAN, |top| top.0)
+    }
 
-pub fn rolling_median(values: &[f64], period: usize) -> Vec<f64> {
-    let n = values.len();
-    let mut out = vec![f64::NAN; n];
-    if period == 0 || n == 0 {
-        return out;
+    fn insert(&mut self, value: f64) {
+        if value.is_nan() {
+            self.nan_count += 1;
+        } else if self.low.peek().is_some_and(|top| Ranked(value) <= *top) {
+            self.low.push(Ranked(value));
+            self.low_live += 1;
+        } else {
+            self.high.push(Reverse(Ranked(value)));
+            self.high_live += 1;
+        }
     }
 
-    for i in 0..n {
-        if i + 1 >= period {
-            let start = i + 1 - period;
-            let mut window: Vec<f64> = values[start..=i].to_vec();
-            window.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-            out[i] = window[period / 2];
+    fn remove(&mut self, value: f64) {
+        if value.is_nan() {
+            self.nan_count -= 1;
+            return;
+        }
+        *self.pending.entry(value.to_bits()).or_insert(0) += 1;
+        // Tops are always live, and every live value in `high` ranks at or
+        // above the top of `low`, so the comparison finds the owning heap.
+        if self.low.peek().is_some_and(|top| Ranked(value) <= *top) {
+            self.low_live -= 1;
+            self.prune_low();
+        } else {
+            self.high_live -= 1;
+            self.prune_high();
         }
     }
 
-    out
+    fn rebalance(&mut self) {
+        let target = (self.rank + 1).min(self.low_live + self.high_live);
+        while self.low_live > target {
+            if let Some(top) = self.low.pop() {
+                self.high.push(Reverse(top));
+                self.low_live -= 1;
+                self.high_live += 1;
+                self.prune_low();
+            }
+        }
+        while self.low_live < target {
+            if let Some(Reverse(top)) = self.high.pop() {
+                self.low.push(top);
+                self.high_live -= 1;
+                self.low_live += 1;
+                self.prune_high();
+            }
+        }
+    }
+
+    fn take_pending(&mut self, value: f64) -> bool {
+        match self.pending.get_mut(&value.to_bits()) {
+            Some(count) => {
+                *count -= 1;
+                if *count == 0 {
+                    self.pending.remove(&value.to_bits());
+                }
+                true
+            }
+            None => false,
+        }
+    }
+
+    fn prune_low(&mut self) {
+        while let Some(&Ranked(top)) = self.low.peek() {
+            if !self.take_pending(top) {
+                break;
+            }
+            self.low.pop();
+        }
+    }
+
+    fn prune_high(&mut self) {
+        while let Some(&Reverse(Ranked(top))) = self.high.peek() {
+            if !self.take_pending(top) {
+                break;
+            }
+            self.high.pop();
+        }
+    }
+
+    fn rebuild(&mut self) {
+        let values = std::mem::take(&mut self.window);
+        *self = Self::from_values(self.period, self.q, values);
+    }
+}
+
+impl PartialEq for RollingQuantile {
+    fn eq(&self, other: &Self) -> bool {
+        self.period == other.period && self.q == other.q && self.window == other.window
+    }
 }
 
 pub fn ema(values: &[f64], period: usize) -> Vec<f64> {
@@ -166,27 +393,94 @@ pub fn rma(values: &[f64], period: usize) -> Vec<f64> {
 }
 
 pub fn wma(values: &[f64], period: usize) -> Vec<f64> {
-    let n = values.len();
-    let mut out = vec![f64::NAN; n];
-    if n == 0 || period == 0 {
-        return out;
+    let mut window = RollingWma::new(period);
+    values.iter().map(|&x| window.push(x)).collect()
+}
+
+/// Linearly weighted moving average (weights `1..=period`, newest heaviest)
+/// in O(1) per push.
+///
+/// With `S` the window sum and `W` the weighted sum, sliding the window by one
+/// value is `W' = W - S + period * x_new` and `S' = S - x_old + x_new`. The
+/// sums are recomputed from the window ("anchored") whenever the window fills
+/// or becomes NaN-free, and again every `period` pushes so rounding drift stays
+/// bounded. Anchored rows are bit-identical to a direct weighted sum.
+///
+/// Fields are crate-visible so the incremental kernels can snapshot the exact
+/// running state.
+#[derive(Debug, Clone, PartialEq)]
+pub struct RollingWma {
+    pub(crate) period: usize,
+    pub(crate) values: VecDeque<f64>,
+    pub(crate) nan_count: usize,
+    pub(crate) sum: f64,
+    pub(crate) weighted: f64,
+    /// Pushes since the sums were last anchored; `None` when they do not
+    /// describe the current window.
+    pub(crate) since_anchor: Option<usize>,
+}
+
+impl RollingWma {
+    pub fn new(period: usize) -> Self {
+        Self {
+            period,
+            values: VecDeque::with_capacity(period.saturating_add(1).min(4096)),
+            nan_count: 0,
+            sum: 0.0,
+            weighted: 0.0,
+            since_anchor: None,
+        }
     }
 
-    let denom = (period * (period + 1) / 2) as f64;
+    pub fn period(&self) -> usize {
+        self.period
+    }
 
-    for i in 0..n {
-        if i + 1 >= period {
-            let start = i + 1 - period;
-            let mut weighted_sum = 0.0;
-            for (idx, x) in values[start..=i].iter().enumerate() {
-                let w = (idx + 1) as f64;
-                weighted_sum += *x * w;
+    /// Pushes a value and returns the WMA of the resulting window, NaN until
+    /// the window is full or while it contains NaN.
+    pub fn push(&mut self, value: f64) -> f64 {
+        if self.period == 0 {
+            return f64::NAN;
+        }
+        self.values.push_back(value);
+        if value.is_nan() {
+            self.nan_count += 1;
+        }
+        let evicted = if self.values.len() > self.period {
+            self.values.pop_front()
+        } else {
+            None
+        };
+        if evicted.is_some_and(f64::is_nan) {
+            self.nan_count -= 1;
+        }
+        if self.values.len() < self.period || self.nan_count > 0 {
+            self.since_anchor = None;
+            return f64::NAN;
+        }
+
+        match (self.since_anchor, evicted) {
+            (Some(steps), Some(old)) if steps < self.period => {
+                self.weighted += self.period as f64 * value - self.sum;
+                self.sum += value - old;
+                self.since_anchor = Some(steps + 1);
             }
-            out[i] = weighted_sum / denom;
+            _ => self.anchor(),
         }
+        self.weighted / (self.period * (self.period + 1) / 2) as f64
     }
 
-    out
+    fn anchor(&mut self) {
+        let mut sum = 0.0;
+        let mut weighted = 0.0;
+        for (idx, x) in self.values.iter().enumerate() {
+            sum += *x;
+            weighted += *x * (idx + 1) as f64;
+        }
+        self.sum = sum;
+        self.weighted = weighted;
+        self.since_anchor = Some(0);
+    }
 }
 
 #[cfg(test)]
@@ -1,3 +1,5 @@
+use std::collections::VecDeque;
+
 use crate::moving_averages::ema;
 
 pub fn macd(
@@ -143,40 +145,34 @@ pub fn swing_points_raw(
         return (raw_high, raw_low);
     }
 
-    for i in left..(n - right) {
-        let current_high = high[i];
-        let current_low = low[i];
-
-        let mut is_high = true;
-        let mut count_high = 0;
-        for value in high.iter().take(i + right + 1).skip(i - left) {
-            if *value > current_high {
-                is_high = false;
-                break;
-            }
-            if *value == current_high {
-                count_high += 1;
-            }
+    // Bar `i` is compared against `left..=right` bars around it, so the window
+    // ending at `i + right` is the one centred on `i`.
+    let span = left + right + 1;
+    let mut highs = ExtremeRuns::default();
+    let mut lows = ExtremeRuns::default();
+    for end in 0..n {
+        if end >= span {
+            highs.evict(high[end - span]);
+            lows.evict(low[end - span]);
         }
-        if is_high && (allow_equal_extremes || count_high == 1) {
-            raw_high[i] = true;
-            have_high = true;
+        highs.push(high[end], |kept, x| kept < x);
+        lows.push(low[end], |kept, x| kept > x);
+        if end + 1 < span {
+            continue;
         }
+        let i = end - right;
 
+        if let Some(count) = highs.ties(high[i]) {
+            if allow_equal_extremes || count == 1 {
+                raw_high[i] = true;
+                have_high = true;
+            }
+        }
         if have_high {
-            let mut is_low = true;
-            let mut count_low = 0;
-            for value in low.iter().take(i + right + 1).skip(i - left) {
-                if *value < current_low {
-                    is_low = false;
-                    break;
+            if let Some(count) = lows.ties(low[i]) {
+                if allow_equal_extremes || count == 1 {
+                    raw_low[i] = true;
                 }
-                if *value == current_low {
-                    count_low += 1;
-                }
-            }
-            if is_low && (allow_equal_extremes || count_low == 1) {
-                raw_low[i] = true;
             }
         }
     }
@@ -482,3 +478,58 @@ pub fn supertrend(
 
     (st, direction)
 }
+
+/// Monotonic deque of `(value, count)` runs for a sliding window extreme.
+///
+/// Runs are kept in arrival order with strictly worsening values, so the front
+/// run is the window extreme and its count is how many window rows equal it.
+/// NaN rows never beat or tie anything and are not stored.
+#[derive(Default)]
+struct ExtremeRuns {
+    runs: VecDeque<(f64, usize)>,
+}
+
+impl ExtremeRuns {
+    /// Appends `value`, dropping runs it strictly beats.
+    fn push(&mut self, value: f64, beaten: impl Fn(f64, f64) -> bool) {
+        if value.is_nan() {
+            return;
+        }
+        while self
+            .runs
+            .back()
+            .is_some_and(|&(kept, _)| beaten(kept, value))
+        {
+            self.runs.pop_back();
+        }
+        match self.runs.back_mut() {
+            Some((kept, count)) if *kept == value => *count += 1,
+            _ => self.runs.push_back((value, 1)),
+        }
+    }
+
+    /// Removes the oldest window row. It is still stored only if nothing
+    /// later beat it, in which case it belongs to the front run.
+    fn evict(&mut self, value: f64) {
+        if let Some((front, count)) = self.runs.front_mut() {
+            if *front == value {
+                *count -= 1;
+                if *count == 0 {
+                    self.runs.pop_front();
+                }
+            }
+        }
+    }
+
+    /// For a row of the window: `Some(number of rows equal to it)` when no row
+    /// beats it, `None` otherwise. NaN is never beaten and equals nothing.
+    fn ties(&self, value: f64) -> Option<usize> {
+        if value.is_nan() {
+            return Some(0);
+        }
+        match self.runs.front() {
+            Some(&(front, count)) if front == value => Some(count),
+            _ => None,
+        }
+    }
+}
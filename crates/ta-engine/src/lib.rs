@@ -5,7 +5,7 @@ pub mod execution;
 pub mod indicators;
 pub mod runtime;
 
-pub use core::{contracts, dataset, dataset_ops, events, metadata};
+pub use core::{contracts, dataset, dataset_ops, events, metadata, series_ops};
 pub use execution::incremental;
 pub use indicators::{momentum, moving_averages, rolling, trend, volatility, volume};
 pub use runtime::{
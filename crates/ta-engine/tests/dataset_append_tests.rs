@@ -1,5 +1,6 @@
 use ta_engine::dataset::{
-    append_ohlcv, append_series, create_dataset, dataset_info, drop_dataset, DatasetPartitionKey,
+    append_ohlcv, append_series, create_dataset, dataset_info, drop_dataset, drop_partition,
+    get_dataset, partition_version, replace_ohlcv, replace_series, DatasetPartitionKey,
     DatasetRegistryError,
 };
 
@@ -112,3 +113,99 @@ fn append_supports_multi_partition_and_series() {
 
     drop_dataset(id).expect("drop should succeed");
 }
+
+#[test]
+fn partition_version_advances_on_append_and_replace() {
+    let id = create_dataset();
+    let k = key("BTCUSDT", "1m", "ohlcv");
+    append_ohlcv(
+        id,
+        k.clone(),
+        &[1, 2],
+        &[10.0, 11.0],
+        &[12.0, 13.0],
+        &[9.0, 10.0],
+        &[11.0, 12.0],
+        &[100.0, 200.0],
+    )
+    .expect("append should succeed");
+    let v1 = partition_version(id, &k).expect("version should exist");
+
+    append_ohlcv(
+        id,
+        k.clone(),
+        &[3],
+        &[12.0],
+        &[14.0],
+        &[11.0],
+        &[13.0],
+        &[300.0],
+    )
+    .expect("tail append should succeed");
+    let v2 = partition_version(id, &k).expect("version should exist");
+    assert!(v2 > v1);
+
+    let rows = replace_ohlcv(id, k.clone(), &[5], &[1.0], &[2.0], &[0.5], &[1.5], &[10.0])
+        .expect("replace should succeed");
+    assert_eq!(rows, 1);
+    let v3 = partition_version(id, &k).expect("version should exist");
+    assert!(v3 > v2);
+
+    let record = get_dataset(id).expect("dataset should exist");
+    let columns = record.partitions[&k].ohlcv.as_ref().expect("ohlcv present");
+    assert_eq!(columns.timestamps, vec![5]);
+    assert_eq!(columns.close, vec![1.5]);
+
+    drop_dataset(id).expect("drop should succeed");
+}
+
+#[test]
+fn replace_series_leaves_other_partitions_untouched() {
+    let id = create_dataset();
+    let btc = key("BTCUSDT", "1m", "funding");
+    let eth = key("ETHUSDT", "1m", "funding");
+    append_series(id, btc.clone(), "funding".to_string(), &[1, 2], &[0.1, 0.2])
+        .expect("append should succeed");
+    append_series(id, eth.clone(), "funding".to_string(), &[1, 2], &[0.3, 0.4])
+        .expect("append should succeed");
+    let eth_version = partition_version(id, &eth).expect("version should exist");
+
+    replace_series(id, btc.clone(), "funding".to_string(), &[7], &[0.7])
+        .expect("replace should succeed");
+
+    let record = get_dataset(id).expect("dataset should exist");
+    assert_eq!(record.partitions[&btc].series["funding"].values, vec![0.7]);
+    assert_eq!(
+        record.partitions[&eth].series["funding"].values,
+        vec![0.3, 0.4]
+    );
+    assert_eq!(partition_version(id, &eth), Ok(eth_version));
+
+    drop_dataset(id).expect("drop should succeed");
+}
+
+#[test]
+fn drop_partition_removes_only_target_key() {
+    let id = create_dataset();
+    let btc = key("BTCUSDT", "1m", "funding");
+    let eth = key("ETHUSDT", "1m", "funding");
+    append_series(id, btc.clone(), "funding".to_string(), &[1], &[0.1])
+        .expect("append should succeed");
+    append_series(id, eth.clone(), "funding".to_string(), &[1], &[0.3])
+        .expect("append should succeed");
+
+    drop_partition(id, &btc).expect("drop partition should succeed");
+    let info = dataset_info(id).expect("dataset info should exist");
+    assert_eq!(info.partition_count, 1);
+    assert_eq!(
+        partition_version(id, &btc),
+        Err(DatasetRegistryError::UnknownPartition {
+            symbol: "BTCUSDT".to_string(),
+            timeframe: "1m".to_string(),
+            source: "funding".to_string(),
+        })
+    );
+    assert!(drop_partition(id, &btc).is_err());
+
+    drop_dataset(id).expect("drop should succeed");
+}
@@ -1,5 +1,6 @@
 use ta_engine::dataset::{
-    create_dataset, dataset_exists, drop_dataset, get_dataset, DatasetRegistryError,
+    append_series, create_dataset, dataset_exists, drop_dataset, get_dataset, get_partition,
+    DatasetPartitionKey, DatasetRegistryError,
 };
 
 #[test]
@@ -38,3 +39,36 @@ fn dataset_ids_are_monotonic() {
     drop_dataset(first).expect("drop first should succeed");
     drop_dataset(second).expect("drop second should succeed");
 }
+
+#[test]
+fn datasets_can_be_written_and_read_from_many_threads() {
+    let key = DatasetPartitionKey {
+        symbol: "BTCUSDT".to_string(),
+        timeframe: "1m".to_string(),
+        source: "ohlcv".to_string(),
+    };
+    let ids: Vec<u64> = (0..8).map(|_| create_dataset()).collect();
+
+    std::thread::scope(|scope| {
+        for &id in &ids {
+            let key = key.clone();
+            scope.spawn(move || {
+                for row in 0..50_i64 {
+                    append_series(id, key.clone(), "x".to_string(), &[row], &[row as f64])
+                        .expect("append should succeed");
+                    let partition = get_partition(id, &key).expect("partition should exist");
+                    assert_eq!(partition.series["x"].values.len(), row as usize + 1);
+                }
+            });
+        }
+    });
+
+    for id in ids {
+        let partition = get_partition(id, &key).expect("partition should exist");
+        assert_eq!(
+            partition.series["x"].timestamps,
+            (0..50).collect::<Vec<i64>>()
+        );
+        drop_dataset(id).expect("drop should succeed");
+    }
+}
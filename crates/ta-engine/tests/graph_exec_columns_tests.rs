@@ -0,0 +1,407 @@
+use std::collections::BTreeMap;
+
+use ta_engine::contracts::{RustExecutionGraph, RustExecutionPartition, RustExecutionPayload};
+use ta_engine::dataset::{append_ohlcv, create_dataset, drop_dataset, DatasetPartitionKey};
+use ta_engine::incremental::backend::{
+    execute_plan_graph_batch, execute_plan_graph_payload, execute_plan_graph_root,
+    execute_plan_graph_with, matching_partitions, ExecutePlanError, GraphExecOptions,
+};
+use ta_engine::incremental::columns::{Bitmap, ColumnData, NodeColumn};
+use ta_engine::incremental::contracts::IncrementalValue;
+use ta_engine::incremental::plan_registry;
+use ta_engine::incremental::result_cache::result_cache_stats;
+
+fn node(kind: &str, meta: &[(&str, &str)]) -> BTreeMap<String, String> {
+    let mut out = BTreeMap::from([("kind".to_string(), kind.to_string())]);
+    for (k, v) in meta {
+        out.insert(k.to_string(), v.to_string());
+    }
+    out
+}
+
+/// `filter(close, close > 101)` next to `close.change(2)` and `count(...)`.
+fn typed_graph() -> RustExecutionGraph {
+    RustExecutionGraph {
+        root_id: 6,
+        node_order: vec![1, 2, 3, 4, 5, 6],
+        nodes: BTreeMap::from([
+            (
+                1,
+                node("source_ref", &[("field", "close"), ("source", "ohlcv")]),
+            ),
+            (2, node("literal", &[("value", "101")])),
+            (3, node("binary_op", &[("operator", "gt")])),
+            (4, node("filter", &[])),
+            (
+                5,
+                node("time_shift", &[("shift", "2"), ("operation", "change")]),
+            ),
+            (6, node("aggregate", &[("operation", "count")])),
+        ]),
+        edges: BTreeMap::from([(3, vec![1, 2]), (4, vec![1, 3]), (5, vec![4]), (6, vec![4])]),
+    }
+}
+
+fn payload_with_closes(closes: &[f64]) -> RustExecutionPayload {
+    let dataset_id = create_dataset();
+    let timestamps: Vec<i64> = (0..closes.len() as i64).collect();
+    append_ohlcv(
+        dataset_id,
+        DatasetPartitionKey {
+            symbol: "BTCUSDT".to_string(),
+            timeframe: "1m".to_string(),
+            source: "ohlcv".to_string(),
+        },
+        &timestamps,
+        closes,
+        closes,
+        closes,
+        closes,
+        closes,
+    )
+    .expect("append should succeed");
+    RustExecutionPayload {
+        dataset_id,
+        partition: RustExecutionPartition {
+            symbol: "BTCUSDT".to_string(),
+            timeframe: "1m".to_string(),
+            source: "ohlcv".to_string(),
+        },
+        graph: typed_graph(),
+        requests: Vec::new(),
+    }
+}
+
+#[test]
+fn graph_outputs_are_typed_columns() {
+    let payload = payload_with_closes(&[100.0, 102.0, 103.0, 99.0, 104.0]);
+    let out = execute_plan_graph_payload(&payload).expect("graph should execute");
+
+    assert!(matches!(out[&1].data(), ColumnData::Number(_)));
+    assert_eq!(
+        out[&2].data(),
+        &ColumnData::Scalar(IncrementalValue::Number(101.0))
+    );
+    assert_eq!(
+        out[&3].data(),
+        &ColumnData::Bool(Bitmap::from_bools(&[false, true, true, false, true]))
+    );
+    assert!(out[&3].validity().is_none());
+
+    let filtered = &out[&4];
+    assert_eq!(
+        filtered.to_values(),
+        vec![
+            IncrementalValue::Null,
+            IncrementalValue::Number(102.0),
+            IncrementalValue::Number(103.0),
+            IncrementalValue::Null,
+            IncrementalValue::Number(104.0),
+        ]
+    );
+    assert!(filtered.f64_at(0).is_nan());
+
+    let shifted = &out[&5];
+    assert_eq!(
+        shifted.to_values(),
+        vec![
+            IncrementalValue::Null,
+            IncrementalValue::Null,
+            IncrementalValue::Null,
+            IncrementalValue::Null,
+            IncrementalValue::Number(1.0),
+        ]
+    );
+    assert_eq!(
+        out[&6].data(),
+        &ColumnData::Scalar(IncrementalValue::Number(3.0))
+    );
+    assert_eq!(out[&6].len(), 5);
+
+    drop_dataset(payload.dataset_id).expect("drop should succeed");
+}
+
+#[test]
+fn root_only_execution_matches_full_graph() {
+    let payload = payload_with_closes(&[100.0, 102.0, 103.0, 99.0, 104.0]);
+    let full = execute_plan_graph_payload(&payload).expect("graph should execute");
+    let root = execute_plan_graph_root(&payload).expect("graph should execute");
+    assert_eq!(root, full[&payload.graph.root_id]);
+    drop_dataset(payload.dataset_id).expect("drop should succeed");
+}
+
+#[test]
+fn graph_execution_reports_missing_partition() {
+    let mut payload = payload_with_closes(&[100.0, 101.0]);
+    payload.partition.timeframe = "5m".to_string();
+    assert_eq!(
+        execute_plan_graph_root(&payload).unwrap_err(),
+        ExecutePlanError::PartitionNotFound {
+            symbol: "BTCUSDT".to_string(),
+            timeframe: "5m".to_string(),
+            data_source: "ohlcv".to_string(),
+        }
+    );
+    drop_dataset(payload.dataset_id).expect("drop should succeed");
+}
+
+#[test]
+fn bitmap_packs_values_across_words() {
+    let values: Vec<bool> = (0..130).map(|i| i % 3 == 0).collect();
+    let bits = Bitmap::from_bools(&values);
+    assert_eq!(bits.len(), 130);
+    assert_eq!(bits.count_ones(), values.iter().filter(|v| **v).count());
+    assert!((0..130).all(|i| bits.get(i) == values[i]));
+    assert!(Bitmap::new(70, true).all());
+
+    let column =
+        NodeColumn::numbers_with_validity(vec![1.0, 2.0], Bitmap::from_bools(&[true, false]));
+    assert!(column.is_null(1));
+    assert!(column.as_f64()[1].is_nan());
+}
+
+/// `bb_upper(5) - bb_lower(5)` next to `macd().signal` and `macd().histogram`,
+/// with each family optionally tagged as one planner kernel group.
+fn sibling_output_graph(grouped: bool) -> RustExecutionGraph {
+    let call = |name: &str, extra: &[(&str, &str)], group: &str| {
+        let mut meta = node("call", &[("name", name)]);
+        for (k, v) in extra {
+            meta.insert(k.to_string(), v.to_string());
+        }
+        if grouped {
+            meta.insert("kernel_group".to_string(), group.to_string());
+        }
+        meta
+    };
+    RustExecutionGraph {
+        root_id: 4,
+        node_order: vec![1, 2, 3, 4, 5, 6],
+        nodes: BTreeMap::from([
+            (1, node("literal", &[("value", "5")])),
+            (2, call("bb_upper", &[("arg_0", "5")], "bb")),
+            (3, call("bb_lower", &[("arg_0", "5")], "bb")),
+            (4, node("binary_op", &[("operator", "sub")])),
+            (5, call("macd", &[("output", "signal")], "macd")),
+            (6, call("macd", &[("output", "histogram")], "macd")),
+        ]),
+        edges: BTreeMap::from([(2, vec![1]), (3, vec![1]), (4, vec![2, 3])]),
+    }
+}
+
+#[test]
+fn grouped_sibling_outputs_match_separate_kernel_runs() {
+    let closes: Vec<f64> = (0..60)
+        .map(|i| 100.0 + (i as f64 * 0.7).sin() * 3.0)
+        .collect();
+    let mut payload = payload_with_closes(&closes);
+    payload.graph = sibling_output_graph(false);
+    let separate = execute_plan_graph_payload(&payload).expect("graph should execute");
+    payload.graph = sibling_output_graph(true);
+    let grouped = execute_plan_graph_payload(&payload).expect("graph should execute");
+    let bits = |column: &NodeColumn<'_>| -> Vec<u64> {
+        column.as_f64().iter().map(|v| v.to_bits()).collect()
+    };
+    assert_eq!(grouped.len(), separate.len());
+    for (node_id, column) in &separate {
+        assert_eq!(bits(&grouped[node_id]), bits(column), "node {node_id}");
+    }
+    let root = execute_plan_graph_root(&payload).expect("graph should execute");
+    assert_eq!(bits(&root), bits(&separate[&4]));
+
+    let (upper, _, lower) = ta_engine::volatility::bbands(&closes, 5, 2.0);
+    assert_eq!(grouped[&2].as_f64().as_ref()[10], upper[10]);
+    assert_eq!(grouped[&3].as_f64().as_ref()[10], lower[10]);
+    let (_, signal, histogram) = ta_engine::trend::macd(&closes, 12, 26, 9);
+    assert_eq!(grouped[&5].as_f64().as_ref()[59], signal[59]);
+    assert_eq!(grouped[&6].as_f64().as_ref()[59], histogram[59]);
+    drop_dataset(payload.dataset_id).expect("drop should succeed");
+}
+
+#[test]
+fn batch_execution_matches_per_partition_runs() {
+    let mut payload = payload_with_closes(&[100.0, 102.0, 103.0, 99.0, 104.0]);
+    for (symbol, closes) in [
+        ("ETHUSDT", [10.0, 9.0, 11.0, 12.0, 8.0]),
+        ("SOLUSDT", [1.0, 2.0, 3.0, 4.0, 5.0]),
+    ] {
+        append_ohlcv(
+            payload.dataset_id,
+            DatasetPartitionKey {
+                symbol: symbol.to_string(),
+                timeframe: "1m".to_string(),
+                source: "ohlcv".to_string(),
+            },
+            &[0, 1, 2, 3, 4],
+            &closes,
+            &closes,
+            &closes,
+            &closes,
+            &closes,
+        )
+        .expect("append should succeed");
+    }
+    let pattern = RustExecutionPartition {
+        symbol: "*".to_string(),
+        timeframe: "1m".to_string(),
+        source: "ohlcv".to_string(),
+    };
+    let mut partitions =
+        matching_partitions(payload.dataset_id, &pattern).expect("dataset should exist");
+    let symbols: Vec<&str> = partitions.iter().map(|p| p.symbol.as_str()).collect();
+    assert_eq!(symbols, ["BTCUSDT", "ETHUSDT", "SOLUSDT"]);
+
+    partitions.push(RustExecutionPartition {
+        symbol: "XRPUSDT".to_string(),
+        ..pattern.clone()
+    });
+    let options = GraphExecOptions {
+        root_only: true,
+        threads: 0,
+    };
+    let batch =
+        execute_plan_graph_batch(&payload, &partitions, &options).expect("payload is valid");
+    assert_eq!(batch.len(), 4);
+    for (target, outputs) in partitions.iter().zip(&batch) {
+        payload.partition = target.clone();
+        match execute_plan_graph_root(&payload) {
+            Ok(root) => {
+                let outputs = outputs.as_ref().expect("partition should execute");
+                assert_eq!(outputs.len(), 1);
+                assert_eq!(outputs[&payload.graph.root_id], root);
+            }
+            Err(err) => assert_eq!(outputs.as_ref().unwrap_err(), &err),
+        }
+    }
+    assert!(matches!(
+        batch[3],
+        Err(ExecutePlanError::PartitionNotFound { .. })
+    ));
+    drop_dataset(payload.dataset_id).expect("drop should succeed");
+}
+
+#[test]
+fn parallel_levels_match_sequential_walk() {
+    let closes: Vec<f64> = (0..80)
+        .map(|i| 100.0 + (i as f64 * 0.3).cos() * 4.0)
+        .collect();
+    let mut payload = payload_with_closes(&closes);
+    for graph in [typed_graph(), sibling_output_graph(true)] {
+        payload.graph = graph;
+        let sequential = execute_plan_graph_payload(&payload).expect("graph should execute");
+        for threads in [0, 2, 4] {
+            for root_only in [false, true] {
+                let options = GraphExecOptions { root_only, threads };
+                let parallel =
+                    execute_plan_graph_with(&payload, &options).expect("graph should execute");
+                if root_only {
+                    assert_eq!(parallel.len(), 1);
+                }
+                for (node_id, column) in &parallel {
+                    let expected = &sequential[node_id];
+                    let bits = |c: &NodeColumn<'_>| -> Vec<u64> {
+                        c.as_f64().iter().map(|v| v.to_bits()).collect()
+                    };
+                    assert_eq!(bits(column), bits(expected), "node {node_id}");
+                    assert_eq!(
+                        std::mem::discriminant(column.data()),
+                        std::mem::discriminant(expected.data())
+                    );
+                }
+            }
+        }
+    }
+    drop_dataset(payload.dataset_id).expect("drop should succeed");
+}
+
+#[test]
+fn registered_plan_matches_payload_execution() {
+    let payload = payload_with_closes(&[100.0, 102.0, 103.0, 99.0, 104.0]);
+    let plan_id = plan_registry::register_plan(&payload.graph).expect("graph should compile");
+    assert_eq!(
+        plan_registry::plan_root_id(plan_id),
+        Ok(payload.graph.root_id)
+    );
+
+    let options = GraphExecOptions::default();
+    let expected = execute_plan_graph_payload(&payload).expect("graph should execute");
+    for _ in 0..2 {
+        let out =
+            plan_registry::execute_plan(plan_id, payload.dataset_id, &payload.partition, &options)
+                .expect("plan should execute");
+        assert_eq!(out.len(), expected.len());
+        for (node_id, column) in &out {
+            let bits = |c: &NodeColumn<'_>| -> Vec<u64> {
+                c.as_f64().iter().map(|v| v.to_bits()).collect()
+            };
+            assert_eq!(bits(column), bits(&expected[node_id]), "node {node_id}");
+        }
+    }
+
+    plan_registry::drop_plan(plan_id).expect("drop should succeed");
+    assert_eq!(
+        plan_registry::execute_plan(plan_id, payload.dataset_id, &payload.partition, &options)
+            .unwrap_err(),
+        ExecutePlanError::UnknownPlan(plan_id)
+    );
+    drop_dataset(payload.dataset_id).expect("drop should succeed");
+}
+
+#[test]
+fn malformed_graphs_are_rejected_at_registration() {
+    let mut graph = typed_graph();
+    graph.edges.insert(3, vec![1]);
+    assert_eq!(
+        plan_registry::register_plan(&graph).unwrap_err(),
+        ExecutePlanError::InvalidPayload("binary node 3 requires two children".to_string())
+    );
+}
+
+#[test]
+fn shared_call_outputs_are_reused_across_plans_until_data_changes() {
+    let closes: Vec<f64> = (0..40)
+        .map(|i| 100.0 + (i as f64 * 0.5).sin() * 2.0)
+        .collect();
+    let mut payload = payload_with_closes(&closes);
+    payload.graph = sibling_output_graph(false);
+    execute_plan_graph_payload(&payload).expect("graph should execute");
+
+    // `bb_upper(5)` alone, under different node ids than in the first plan.
+    let upper_only = RustExecutionGraph {
+        root_id: 8,
+        node_order: vec![7, 8],
+        nodes: BTreeMap::from([
+            (7, node("literal", &[("value", "5")])),
+            (8, node("call", &[("name", "bb_upper"), ("arg_0", "5")])),
+        ]),
+        edges: BTreeMap::from([(8, vec![7])]),
+    };
+    payload.graph = upper_only;
+    let hits_before = result_cache_stats().hits;
+    let root = execute_plan_graph_root(&payload).expect("graph should execute");
+    assert!(result_cache_stats().hits > hits_before);
+    let (upper, _, _) = ta_engine::volatility::bbands(&closes, 5, 2.0);
+    assert_eq!(root.as_f64().as_ref()[39], upper[39]);
+
+    let mut extended = closes.clone();
+    extended.push(150.0);
+    append_ohlcv(
+        payload.dataset_id,
+        DatasetPartitionKey {
+            symbol: "BTCUSDT".to_string(),
+            timeframe: "1m".to_string(),
+            source: "ohlcv".to_string(),
+        },
+        &[40],
+        &[150.0],
+        &[150.0],
+        &[150.0],
+        &[150.0],
+        &[150.0],
+    )
+    .expect("append should succeed");
+    let root = execute_plan_graph_root(&payload).expect("graph should execute");
+    let (upper, _, _) = ta_engine::volatility::bbands(&extended, 5, 2.0);
+    assert_eq!(root.len(), 41);
+    assert_eq!(root.as_f64().as_ref()[40], upper[40]);
+    drop_dataset(payload.dataset_id).expect("drop should succeed");
+}
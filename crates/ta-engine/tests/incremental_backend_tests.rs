@@ -1,6 +1,6 @@
 use std::collections::BTreeMap;
 
-use ta_engine::incremental::backend::{IncrementalBackend, KernelStepRequest};
+use ta_engine::incremental::backend::{IncrementalBackend, KernelStepRequest, TickColumns};
 use ta_engine::incremental::contracts::IncrementalValue;
 use ta_engine::incremental::kernel_registry::KernelId;
 
@@ -39,3 +39,128 @@ fn backend_step_snapshot_restore_replay_is_deterministic_for_rsi() {
 
     assert_eq!(cont_a, cont_b);
 }
+
+#[test]
+fn snapshots_encode_state_stepped_since_the_previous_snapshot() {
+    let sma = |node_id: u32| KernelStepRequest {
+        node_id,
+        kernel_id: KernelId::Sma,
+        input_field: "close".to_string(),
+        kwargs: BTreeMap::from([("period".to_string(), IncrementalValue::Number(3.0))]),
+    };
+    let both = [sma(1), sma(2)];
+    let events: Vec<_> = [10.0, 11.0, 12.0, 11.0, 13.0, 14.0]
+        .into_iter()
+        .map(|close| BTreeMap::from([("close".to_string(), IncrementalValue::Number(close))]))
+        .collect();
+
+    let mut backend = IncrementalBackend::default();
+    backend.initialize();
+    for (idx, tick) in events[..3].iter().enumerate() {
+        backend.step(idx as u64 + 1, &both, tick);
+    }
+    let first = backend.snapshot();
+    for (idx, tick) in events.iter().enumerate().skip(3) {
+        backend.step(idx as u64 + 1, &both[..1], tick);
+    }
+    let second = backend.snapshot();
+
+    assert_ne!(first.nodes[&1].state_blob, second.nodes[&1].state_blob);
+    assert_eq!(second.nodes[&1].ticks_processed, 6);
+    // Node 2 has not stepped since the first snapshot.
+    assert_eq!(first.nodes[&2], second.nodes[&2]);
+
+    let mut resumed = IncrementalBackend::default();
+    resumed.initialize();
+    resumed
+        .restore(second)
+        .expect("valid snapshot should restore");
+    let next = BTreeMap::from([("close".to_string(), IncrementalValue::Number(15.0))]);
+    assert_eq!(
+        resumed.step(7, &both[..1], &next),
+        backend.step(7, &both[..1], &next)
+    );
+}
+
+#[test]
+fn state_bytes_track_kernel_windows_not_stream_length() {
+    let sma = |period: f64| KernelStepRequest {
+        node_id: 1,
+        kernel_id: KernelId::Sma,
+        input_field: "close".to_string(),
+        kwargs: BTreeMap::from([("period".to_string(), IncrementalValue::Number(period))]),
+    };
+    let run = |period: f64, ticks: usize| {
+        let mut backend = IncrementalBackend::default();
+        backend.initialize();
+        for idx in 0..ticks {
+            let tick =
+                BTreeMap::from([("close".to_string(), IncrementalValue::Number(idx as f64))]);
+            backend.step(idx as u64 + 1, &[sma(period)], &tick);
+        }
+        backend.state_bytes()
+    };
+
+    assert_eq!(run(10.0, 50), run(10.0, 500));
+    assert!(run(100.0, 500) >= run(10.0, 500) + 90 * std::mem::size_of::<f64>());
+    assert_eq!(run(10.0, 0), 0);
+}
+
+#[test]
+fn step_batch_matches_stepping_each_tick() {
+    let period = |p: f64| BTreeMap::from([("period".to_string(), IncrementalValue::Number(p))]);
+    let requests = [
+        KernelStepRequest {
+            node_id: 1,
+            kernel_id: KernelId::Rsi,
+            input_field: "close".to_string(),
+            kwargs: period(3.0),
+        },
+        KernelStepRequest {
+            node_id: 2,
+            kernel_id: KernelId::Atr,
+            input_field: "close".to_string(),
+            kwargs: period(4.0),
+        },
+    ];
+    let closes: Vec<f64> = (0..40)
+        .map(|i| 100.0 + (i as f64 * 0.4).sin() * 3.0)
+        .collect();
+    let columns: TickColumns = BTreeMap::from([
+        ("close".to_string(), closes.clone()),
+        ("high".to_string(), closes.iter().map(|c| c + 1.0).collect()),
+        ("low".to_string(), closes.iter().map(|c| c - 1.0).collect()),
+    ]);
+
+    let mut single = IncrementalBackend::default();
+    single.initialize();
+    let expected: Vec<_> = (0..closes.len())
+        .map(|row| {
+            let tick = columns
+                .iter()
+                .map(|(field, values)| (field.clone(), IncrementalValue::Number(values[row])))
+                .collect();
+            single.step(row as u64 + 1, &requests, &tick)
+        })
+        .collect();
+
+    let mut batched = IncrementalBackend::default();
+    batched.initialize();
+    let out = batched.step_batch(1, &requests, &columns, false).unwrap();
+    for (node_id, values) in &out {
+        let column: Vec<_> = expected.iter().map(|row| row[node_id].clone()).collect();
+        assert_eq!(values, &column, "node {node_id}");
+    }
+    assert_eq!(batched.snapshot(), single.snapshot());
+
+    let mut last = IncrementalBackend::default();
+    last.initialize();
+    let out = last.step_batch(1, &requests, &columns, true).unwrap();
+    assert_eq!(
+        out,
+        expected[closes.len() - 1]
+            .iter()
+            .map(|(node_id, value)| (*node_id, vec![value.clone()]))
+            .collect()
+    );
+}
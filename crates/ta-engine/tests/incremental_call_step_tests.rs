@@ -60,3 +60,64 @@ fn stochastic_call_step_emits_after_window() {
 
     assert!(matches!(last, IncrementalValue::Number(_)));
 }
+
+#[test]
+fn vwap_snapshots_with_bar_history_restore_as_running_sums() {
+    use ta_engine::incremental::backend::{IncrementalBackend, KernelStepRequest};
+    use ta_engine::incremental::contracts::{NodeSnapshotState, RuntimeSnapshot};
+    use ta_engine::volume;
+
+    let highs = [10.0, 11.0, 12.5, 12.0];
+    let lows = [9.0, 9.5, 11.0, 10.5];
+    let closes = [9.5, 10.5, 12.0, 11.0];
+    let volumes = [100.0, 250.0, 175.0, 300.0];
+    let csv = |values: &[f64]| {
+        IncrementalValue::Text(
+            values
+                .iter()
+                .map(|v| v.to_string())
+                .collect::<Vec<_>>()
+                .join(","),
+        )
+    };
+
+    let mut snapshot = RuntimeSnapshot::empty();
+    snapshot.last_event_index = 3;
+    snapshot.nodes.insert(
+        1,
+        NodeSnapshotState {
+            ticks_processed: 3,
+            last_output: IncrementalValue::Null,
+            state_blob: BTreeMap::from([
+                (
+                    "kind".to_string(),
+                    IncrementalValue::Text("vwap".to_string()),
+                ),
+                ("highs".to_string(), csv(&highs[..3])),
+                ("lows".to_string(), csv(&lows[..3])),
+                ("closes".to_string(), csv(&closes[..3])),
+                ("volumes".to_string(), csv(&volumes[..3])),
+            ]),
+        },
+    );
+    let mut backend = IncrementalBackend::default();
+    backend.initialize();
+    backend.restore(snapshot).unwrap();
+
+    let request = KernelStepRequest {
+        node_id: 1,
+        kernel_id: KernelId::Vwap,
+        input_field: "close".to_string(),
+        kwargs: BTreeMap::new(),
+    };
+    let tick = BTreeMap::from([
+        ("high".to_string(), IncrementalValue::Number(highs[3])),
+        ("low".to_string(), IncrementalValue::Number(lows[3])),
+        ("close".to_string(), IncrementalValue::Number(closes[3])),
+        ("volume".to_string(), IncrementalValue::Number(volumes[3])),
+    ]);
+    let out = backend.step(4, &[request], &tick);
+
+    let expected = volume::vwap(&highs, &lows, &closes, &volumes)[3];
+    assert_eq!(out[&1], IncrementalValue::Number(expected));
+}
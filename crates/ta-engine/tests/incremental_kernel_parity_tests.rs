@@ -0,0 +1,544 @@
+use std::collections::BTreeMap;
+
+use ta_engine::incremental::backend::{IncrementalBackend, KernelStepRequest};
+use ta_engine::incremental::call_step::{eval_call_step_inputs, initialize_kernel_state};
+use ta_engine::incremental::contracts::IncrementalValue;
+use ta_engine::incremental::kernel_registry::KernelId;
+
+struct Bars {
+    open: Vec<f64>,
+    high: Vec<f64>,
+    low: Vec<f64>,
+    close: Vec<f64>,
+    volume: Vec<f64>,
+}
+
+impl Bars {
+    fn prefix(&self, len: usize) -> Bars {
+        Bars {
+            open: self.open[..len].to_vec(),
+            high: self.high[..len].to_vec(),
+            low: self.low[..len].to_vec(),
+            close: self.close[..len].to_vec(),
+            volume: self.volume[..len].to_vec(),
+        }
+    }
+
+    fn tick(&self, idx: usize) -> BTreeMap<String, IncrementalValue> {
+        BTreeMap::from([
+            ("open".to_string(), IncrementalValue::Number(self.open[idx])),
+            ("high".to_string(), IncrementalValue::Number(self.high[idx])),
+            ("low".to_string(), IncrementalValue::Number(self.low[idx])),
+            (
+                "close".to_string(),
+                IncrementalValue::Number(self.close[idx]),
+            ),
+            (
+                "volume".to_string(),
+                IncrementalValue::Number(self.volume[idx]),
+            ),
+        ])
+    }
+}
+
+fn sample_bars(n: usize) -> Bars {
+    let mut seed: u64 = 0x2545_f491_4f6c_dd1d;
+    let mut next = || {
+        seed ^= seed << 13;
+        seed ^= seed >> 7;
+        seed ^= seed << 17;
+        (seed % 10_000) as f64 / 10_000.0
+    };
+    let mut bars = Bars {
+        open: Vec::new(),
+        high: Vec::new(),
+        low: Vec::new(),
+        close: Vec::new(),
+        volume: Vec::new(),
+    };
+    let mut price = 100.0;
+    for i in 0..n {
+        let open = price;
+        // A flat stretch exercises the zero-range and zero-diff branches.
+        let close = if (40..44).contains(&i) {
+            open
+        } else {
+            open + (next() - 0.5) * 4.0
+        };
+        let (high, low) = if (40..44).contains(&i) {
+            (open, open)
+        } else {
+            (open.max(close) + next(), open.min(close) - next())
+        };
+        bars.open.push(open);
+        bars.high.push(high);
+        bars.low.push(low);
+        bars.close.push(close);
+        bars.volume.push(1000.0 + next() * 500.0);
+        price = close;
+    }
+    bars
+}
+
+fn kwargs(pairs: &[(&str, IncrementalValue)]) -> BTreeMap<String, IncrementalValue> {
+    pairs
+        .iter()
+        .map(|(k, v)| (k.to_string(), v.clone()))
+        .collect()
+}
+
+fn num(v: f64) -> IncrementalValue {
+    IncrementalValue::Number(v)
+}
+
+fn text(v: &str) -> IncrementalValue {
+    IncrementalValue::Text(v.to_string())
+}
+
+fn step_all(
+    kernel_id: KernelId,
+    params: &BTreeMap<String, IncrementalValue>,
+    bars: &Bars,
+    inputs: impl Fn(&Bars, usize) -> Vec<IncrementalValue>,
+) -> Vec<IncrementalValue> {
+    let mut state = initialize_kernel_state(kernel_id, params);
+    let mut out = Vec::with_capacity(bars.close.len());
+    for idx in 0..bars.close.len() {
+        let (next, value) =
+            eval_call_step_inputs(kernel_id, state, &inputs(bars, idx), &bars.tick(idx));
+        state = next;
+        out.push(value);
+    }
+    out
+}
+
+fn assert_numeric_parity(
+    name: &str,
+    kernel_id: KernelId,
+    params: &[(&str, IncrementalValue)],
+    batch: impl Fn(&Bars) -> Vec<f64>,
+) {
+    assert_numeric_parity_on(&sample_bars(120), name, kernel_id, params, batch);
+}
+
+fn assert_numeric_parity_on(
+    bars: &Bars,
+    name: &str,
+    kernel_id: KernelId,
+    params: &[(&str, IncrementalValue)],
+    batch: impl Fn(&Bars) -> Vec<f64>,
+) {
+    let stepped = step_all(kernel_id, &kwargs(params), bars, |b, i| {
+        vec![num(b.close[i])]
+    });
+    for (t, value) in stepped.iter().enumerate() {
+        let expected = batch(&bars.prefix(t + 1))[t];
+        match value {
+            IncrementalValue::Null => assert!(
+                expected.is_nan(),
+                "{name}: bar {t} stepped null, batch {expected}"
+            ),
+            IncrementalValue::Number(v) => {
+                assert_eq!(
+                    v.to_bits(),
+                    expected.to_bits(),
+                    "{name}: bar {t} stepped {v}, batch {expected}"
+                );
+            }
+            other => panic!("{name}: unexpected output {other:?}"),
+        }
+    }
+}
+
+fn assert_event_parity(
+    name: &str,
+    kernel_id: KernelId,
+    params: &[(&str, IncrementalValue)],
+    inputs: impl Fn(&Bars, usize) -> Vec<f64>,
+    batch: impl Fn(&[Vec<f64>]) -> Vec<bool>,
+) {
+    let bars = sample_bars(120);
+    let series: Vec<Vec<f64>> = (0..bars.close.len()).map(|i| inputs(&bars, i)).collect();
+    let stepped = step_all(kernel_id, &kwargs(params), &bars, |b, i| {
+        inputs(b, i).into_iter().map(num).collect()
+    });
+    let columns: Vec<Vec<f64>> = (0..series[0].len())
+        .map(|c| series.iter().map(|row| row[c]).collect())
+        .collect();
+    let expected = batch(&columns);
+    for (t, value) in stepped.iter().enumerate() {
+        assert_eq!(
+            value,
+            &IncrementalValue::Bool(expected[t]),
+            "{name}: bar {t}"
+        );
+    }
+}
+
+#[test]
+fn kernel_ids_cover_graph_executor_call_names() {
+    for name in [
+        "select",
+        "mean",
+        "rolling_mean",
+        "median",
+        "quantile",
+        "rolling_ema",
+        "rolling_wma",
+        "fib_down",
+        "BB_UPPER",
+    ] {
+        assert!(KernelId::from_name(name).is_some(), "{name}");
+    }
+    for id in KernelId::ALL {
+        assert_eq!(KernelId::from_name(id.name()), Some(id));
+    }
+}
+
+#[test]
+fn moving_average_kernels_match_batch_prefixes() {
+    use ta_engine::{moving_averages, rolling};
+
+    assert_numeric_parity("sma", KernelId::Sma, &[("period", num(5.0))], |b| {
+        rolling::rolling_mean(&b.close, 5)
+    });
+    assert_numeric_parity("median", KernelId::Median, &[("period", num(4.0))], |b| {
+        rolling::rolling_median(&b.close, 4)
+    });
+    assert_numeric_parity(
+        "quantile",
+        KernelId::Quantile,
+        &[("period", num(6.0)), ("q", num(0.8))],
+        |b| rolling::rolling_quantile(&b.close, 6, 0.8),
+    );
+    assert_numeric_parity("ema", KernelId::Ema, &[("period", num(7.0))], |b| {
+        moving_averages::ema(&b.close, 7)
+    });
+    assert_numeric_parity("wma", KernelId::Wma, &[("period", num(6.0))], |b| {
+        moving_averages::wma(&b.close, 6)
+    });
+    assert_numeric_parity("hma", KernelId::Hma, &[("period", num(9.0))], |b| {
+        moving_averages::hma(&b.close, 9)
+    });
+    assert_numeric_parity(
+        "sma period 0",
+        KernelId::Sma,
+        &[("period", num(0.0))],
+        |b| rolling::rolling_mean(&b.close, 0),
+    );
+}
+
+#[test]
+fn momentum_kernels_match_batch_prefixes() {
+    use ta_engine::momentum;
+
+    assert_numeric_parity("rsi", KernelId::Rsi, &[("period", num(14.0))], |b| {
+        momentum::rsi(&b.close, 14)
+    });
+    assert_numeric_parity("roc", KernelId::Roc, &[("period", num(3.0))], |b| {
+        momentum::roc(&b.close, 3)
+    });
+    assert_numeric_parity("coppock", KernelId::Coppock, &[], |b| {
+        momentum::coppock(&b.close, 10, 11, 14)
+    });
+    assert_numeric_parity("cmo", KernelId::Cmo, &[("period", num(9.0))], |b| {
+        momentum::cmo(&b.close, 9)
+    });
+    assert_numeric_parity("mfi", KernelId::Mfi, &[("period", num(10.0))], |b| {
+        momentum::mfi(&b.high, &b.low, &b.close, &b.volume, 10)
+    });
+    assert_numeric_parity("vortex", KernelId::Vortex, &[("period", num(5.0))], |b| {
+        momentum::vortex(&b.high, &b.low, &b.close, 5).0
+    });
+    assert_numeric_parity(
+        "stoch_k",
+        KernelId::StochK,
+        &[("k_period", num(5.0)), ("smooth", num(3.0))],
+        |b| momentum::stochastic_kd(&b.high, &b.low, &b.close, 5, 3, 3).0,
+    );
+    assert_numeric_parity(
+        "stoch_d",
+        KernelId::StochD,
+        &[("k_period", num(5.0)), ("d_period", num(4.0))],
+        |b| momentum::stochastic_kd(&b.high, &b.low, &b.close, 5, 4, 1).1,
+    );
+}
+
+#[test]
+fn volatility_kernels_match_batch_prefixes() {
+    use ta_engine::volatility;
+
+    assert_numeric_parity(
+        "bb_upper",
+        KernelId::BbUpper,
+        &[("period", num(8.0))],
+        |b| volatility::bbands(&b.close, 8, 2.0).0,
+    );
+    assert_numeric_parity(
+        "bb_lower",
+        KernelId::BbLower,
+        &[("period", num(8.0)), ("std_dev", num(1.5))],
+        |b| volatility::bbands(&b.close, 8, 1.5).2,
+    );
+    assert_numeric_parity("atr", KernelId::Atr, &[("period", num(14.0))], |b| {
+        volatility::atr(&b.high, &b.low, &b.close, 14)
+    });
+    assert_numeric_parity(
+        "donchian",
+        KernelId::Donchian,
+        &[("period", num(10.0))],
+        |b| volatility::donchian(&b.high, &b.low, 10).0,
+    );
+    assert_numeric_parity("keltner", KernelId::Keltner, &[], |b| {
+        volatility::keltner(&b.high, &b.low, &b.close, 20, 10, 2.0).0
+    });
+}
+
+#[test]
+fn trend_kernels_match_batch_prefixes() {
+    use ta_engine::trend;
+
+    assert_numeric_parity("adx", KernelId::Adx, &[("period", num(7.0))], |b| {
+        trend::adx(&b.high, &b.low, &b.close, 7).0
+    });
+    for (output, idx) in [("macd", 0), ("signal", 1), ("histogram", 2)] {
+        assert_numeric_parity(output, KernelId::Macd, &[("output", text(output))], |b| {
+            let (line, signal, histogram) = trend::macd(&b.close, 12, 26, 9);
+            [line, signal, histogram][idx].clone()
+        });
+    }
+    assert_numeric_parity(
+        "elder bear",
+        KernelId::ElderRay,
+        &[("output", text("bear"))],
+        |b| trend::elder_ray(&b.high, &b.low, &b.close, 13).1,
+    );
+    for (output, idx) in [("fisher", 0), ("signal", 1)] {
+        assert_numeric_parity(output, KernelId::Fisher, &[("output", text(output))], |b| {
+            let (fisher, signal) = trend::fisher(&b.high, &b.low, 9);
+            [fisher, signal][idx].clone()
+        });
+    }
+    for (output, idx) in [
+        ("tenkan_sen", 0),
+        ("kijun_sen", 1),
+        ("senkou_span_a", 2),
+        ("senkou_span_b", 3),
+        ("chikou_span", 4),
+    ] {
+        assert_numeric_parity(
+            output,
+            KernelId::Ichimoku,
+            &[
+                ("tenkan_period", num(5.0)),
+                ("kijun_period", num(8.0)),
+                ("span_b_period", num(12.0)),
+                ("displacement", num(6.0)),
+                ("output", text(output)),
+            ],
+            |b| {
+                let out = trend::ichimoku(&b.high, &b.low, &b.close, 5, 8, 12, 6);
+                [out.0, out.1, out.2, out.3, out.4][idx].clone()
+            },
+        );
+    }
+    for (output, idx) in [("psar", 0), ("direction", 1)] {
+        assert_numeric_parity(output, KernelId::Psar, &[("output", text(output))], |b| {
+            let (sar, direction) = trend::psar(&b.high, &b.low, &b.close, 0.02, 0.02, 0.2);
+            [sar, direction][idx].clone()
+        });
+    }
+    for (output, idx) in [("supertrend", 0), ("direction", 1)] {
+        assert_numeric_parity(
+            output,
+            KernelId::Supertrend,
+            &[("period", num(7.0)), ("output", text(output))],
+            |b| {
+                let (st, direction) = trend::supertrend(&b.high, &b.low, &b.close, 7, 3.0);
+                [st, direction][idx].clone()
+            },
+        );
+    }
+}
+
+#[test]
+fn swing_and_fib_kernels_match_batch_prefixes() {
+    use ta_engine::rolling;
+
+    assert_numeric_parity("swing_high_at", KernelId::SwingHighAt, &[], |b| {
+        rolling::rolling_max(&b.high, 5)
+    });
+    assert_numeric_parity(
+        "swing_low_at",
+        KernelId::SwingLowAt,
+        &[("left", num(3.0)), ("right", num(1.0))],
+        |b| rolling::rolling_min(&b.low, 5),
+    );
+    assert_numeric_parity("fib_level_up", KernelId::FibLevelUp, &[], |b| {
+        let highs = rolling::rolling_max(&b.high, 5);
+        let lows = rolling::rolling_min(&b.low, 5);
+        highs
+            .iter()
+            .zip(lows.iter())
+            .map(|(h, l)| {
+                if h.is_nan() || l.is_nan() {
+                    f64::NAN
+                } else {
+                    l + ((h - l) * 0.618)
+                }
+            })
+            .collect()
+    });
+}
+
+#[test]
+fn window_extremes_skip_nan_rows_like_batch() {
+    use ta_engine::{rolling, volatility};
+
+    let mut bars = sample_bars(120);
+    for idx in [3, 17, 18, 19, 60, 61, 62, 63, 64, 65, 66, 90] {
+        bars.high[idx] = f64::NAN;
+        bars.low[idx] = f64::NAN;
+    }
+    assert_numeric_parity_on(
+        &bars,
+        "donchian",
+        KernelId::Donchian,
+        &[("period", num(4.0))],
+        |b| volatility::donchian(&b.high, &b.low, 4).0,
+    );
+    assert_numeric_parity_on(
+        &bars,
+        "swing_low_at",
+        KernelId::SwingLowAt,
+        &[("left", num(2.0)), ("right", num(2.0))],
+        |b| rolling::rolling_min(&b.low, 5),
+    );
+}
+
+#[test]
+fn vwap_kernel_matches_batch_prefixes() {
+    use ta_engine::volume;
+
+    assert_numeric_parity("vwap", KernelId::Vwap, &[], |b| {
+        volume::vwap(&b.high, &b.low, &b.close, &b.volume)
+    });
+    let mut bars = sample_bars(120);
+    bars.volume[..10].fill(0.0);
+    assert_numeric_parity_on(&bars, "vwap without volume", KernelId::Vwap, &[], |b| {
+        volume::vwap(&b.high, &b.low, &b.close, &b.volume)
+    });
+}
+
+#[test]
+fn kernel_state_stays_bounded_over_long_streams() {
+    let bars = sample_bars(2_000);
+    let requests: Vec<KernelStepRequest> = KernelId::ALL
+        .iter()
+        .enumerate()
+        .map(|(idx, kernel_id)| KernelStepRequest {
+            node_id: idx as u32,
+            kernel_id: *kernel_id,
+            input_field: "close".to_string(),
+            kwargs: BTreeMap::new(),
+        })
+        .collect();
+    // Numbers held in each node's encoded state.
+    let state_sizes = |backend: &mut IncrementalBackend| -> Vec<usize> {
+        backend
+            .snapshot()
+            .nodes
+            .values()
+            .map(|node| {
+                node.state_blob
+                    .values()
+                    .map(|value| match value {
+                        IncrementalValue::Numbers(values) => values.len(),
+                        IncrementalValue::Text(s) => s.split(',').count(),
+                        _ => 1,
+                    })
+                    .sum()
+            })
+            .collect()
+    };
+
+    let mut backend = IncrementalBackend::default();
+    backend.initialize();
+    for idx in 0..1_000 {
+        backend.step(idx as u64 + 1, &requests, &bars.tick(idx));
+    }
+    let warmed = state_sizes(&mut backend);
+    for idx in 1_000..2_000 {
+        backend.step(idx as u64 + 1, &requests, &bars.tick(idx));
+    }
+    assert_eq!(state_sizes(&mut backend), warmed);
+}
+
+#[test]
+fn event_kernels_match_batch() {
+    use ta_engine::events;
+
+    let pair = |b: &Bars, i: usize| vec![b.close[i], b.open[i]];
+    assert_event_parity("crossup", KernelId::Crossup, &[], pair, |c| {
+        events::crossup(&c[0], &c[1])
+    });
+    assert_event_parity("crossdown", KernelId::Crossdown, &[], pair, |c| {
+        events::crossdown(&c[0], &c[1])
+    });
+    assert_event_parity("cross", KernelId::Cross, &[], pair, |c| {
+        events::cross(&c[0], &c[1])
+    });
+    let single = |b: &Bars, i: usize| vec![b.close[i]];
+    assert_event_parity("rising", KernelId::Rising, &[], single, |c| {
+        events::rising(&c[0])
+    });
+    assert_event_parity(
+        "falling_pct",
+        KernelId::FallingPct,
+        &[("pct", num(0.5))],
+        single,
+        |c| events::falling_pct(&c[0], 0.5),
+    );
+    let channel = |b: &Bars, i: usize| vec![b.close[i], b.high[i] - 0.5, b.low[i] + 0.5];
+    assert_event_parity("in_channel", KernelId::InChannel, &[], channel, |c| {
+        events::in_channel(&c[0], &c[1], &c[2])
+    });
+    assert_event_parity("enter", KernelId::Enter, &[], channel, |c| {
+        events::enter_channel(&c[0], &c[1], &c[2])
+    });
+    assert_event_parity("exit", KernelId::Exit, &[], channel, |c| {
+        events::exit_channel(&c[0], &c[1], &c[2])
+    });
+}
+
+#[test]
+fn snapshot_restore_resumes_every_step_kernel() {
+    let bars = sample_bars(80);
+    let requests: Vec<KernelStepRequest> = KernelId::ALL
+        .iter()
+        .enumerate()
+        .map(|(idx, kernel_id)| KernelStepRequest {
+            node_id: idx as u32,
+            kernel_id: *kernel_id,
+            input_field: "close".to_string(),
+            kwargs: BTreeMap::from([("input_1".to_string(), text("open"))]),
+        })
+        .collect();
+    let events: Vec<_> = (0..bars.close.len()).map(|i| bars.tick(i)).collect();
+
+    let mut full = IncrementalBackend::default();
+    full.initialize();
+    let expected = full.replay(&requests, &events);
+
+    let mut first = IncrementalBackend::default();
+    first.initialize();
+    for (idx, tick) in events[..50].iter().enumerate() {
+        first.step(idx as u64 + 1, &requests, tick);
+    }
+    let mut resumed = IncrementalBackend::default();
+    resumed.restore(first.snapshot()).unwrap();
+    for (idx, tick) in events.iter().enumerate().skip(50) {
+        let out = resumed.step(idx as u64 + 1, &requests, tick);
+        assert_eq!(out, expected[idx], "bar {idx}");
+    }
+}
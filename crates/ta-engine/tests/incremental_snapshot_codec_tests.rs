@@ -0,0 +1,147 @@
+use std::collections::BTreeMap;
+
+use ta_engine::incremental::backend::{IncrementalBackend, KernelStepRequest};
+use ta_engine::incremental::contracts::{IncrementalValue, RuntimeSnapshot};
+use ta_engine::incremental::kernel_registry::KernelId;
+use ta_engine::incremental::snapshot_codec::{
+    decode_snapshot, encode_snapshot, load_snapshot, save_snapshot, SnapshotCodecError,
+    SNAPSHOT_FORMAT_VERSION,
+};
+
+fn requests() -> Vec<KernelStepRequest> {
+    let period = |p: f64| BTreeMap::from([("period".to_string(), IncrementalValue::Number(p))]);
+    vec![
+        KernelStepRequest {
+            node_id: 1,
+            kernel_id: KernelId::Sma,
+            input_field: "close".to_string(),
+            kwargs: period(5.0),
+        },
+        KernelStepRequest {
+            node_id: 2,
+            kernel_id: KernelId::Rsi,
+            input_field: "close".to_string(),
+            kwargs: period(3.0),
+        },
+        KernelStepRequest {
+            node_id: 3,
+            kernel_id: KernelId::Median,
+            input_field: "close".to_string(),
+            kwargs: period(4.0),
+        },
+    ]
+}
+
+fn events(count: usize) -> Vec<BTreeMap<String, IncrementalValue>> {
+    (0..count)
+        .map(|idx| {
+            let close = 100.0 + (idx as f64 * 0.7).sin() * 5.0 + idx as f64 * 0.1;
+            BTreeMap::from([("close".to_string(), IncrementalValue::Number(close))])
+        })
+        .collect()
+}
+
+fn warmed_snapshot() -> RuntimeSnapshot {
+    let mut backend = IncrementalBackend::default();
+    backend.initialize();
+    for (idx, tick) in events(20).iter().enumerate() {
+        backend.step(idx as u64 + 1, &requests(), tick);
+    }
+    backend.snapshot()
+}
+
+fn continue_from(snapshot: RuntimeSnapshot) -> Vec<BTreeMap<u32, IncrementalValue>> {
+    let mut backend = IncrementalBackend::default();
+    backend.initialize();
+    backend.restore(snapshot).expect("snapshot should restore");
+    backend.replay(&requests(), &events(30)[20..])
+}
+
+#[test]
+fn snapshots_roundtrip_through_the_binary_format() {
+    let snapshot = warmed_snapshot();
+    let bytes = encode_snapshot(&snapshot);
+    assert!(bytes.starts_with(b"TAIS"));
+    assert_eq!(bytes[4], SNAPSHOT_FORMAT_VERSION);
+
+    let decoded = decode_snapshot(&bytes).expect("encoded snapshot should decode");
+    assert_eq!(decoded, snapshot);
+    assert_eq!(continue_from(decoded), continue_from(snapshot));
+}
+
+#[test]
+fn corrupt_snapshots_are_rejected() {
+    let bytes = encode_snapshot(&warmed_snapshot());
+
+    let mut flipped = bytes.clone();
+    flipped[bytes.len() / 2] ^= 0x01;
+    assert!(matches!(
+        decode_snapshot(&flipped),
+        Err(SnapshotCodecError::ChecksumMismatch)
+    ));
+
+    let mut wrong_magic = bytes.clone();
+    wrong_magic[0] = b'X';
+    assert!(matches!(
+        decode_snapshot(&wrong_magic),
+        Err(SnapshotCodecError::BadMagic)
+    ));
+
+    let mut future = bytes.clone();
+    future[4] = SNAPSHOT_FORMAT_VERSION + 1;
+    assert!(matches!(
+        decode_snapshot(&future),
+        Err(SnapshotCodecError::UnsupportedVersion(v)) if v == SNAPSHOT_FORMAT_VERSION + 1
+    ));
+
+    assert!(matches!(
+        decode_snapshot(&bytes[..6]),
+        Err(SnapshotCodecError::Truncated)
+    ));
+    assert!(decode_snapshot(&bytes[..bytes.len() - 1]).is_err());
+}
+
+#[test]
+fn saved_snapshots_load_back_without_leaving_temporary_files() {
+    let dir = std::env::temp_dir().join(format!("ta-snapshot-codec-{}", std::process::id()));
+    std::fs::create_dir_all(&dir).expect("temp dir");
+    let path = dir.join("backend.snap");
+    let snapshot = warmed_snapshot();
+
+    save_snapshot(&path, &snapshot).expect("save");
+    // Saving again replaces the file in place.
+    save_snapshot(&path, &snapshot).expect("overwrite");
+    assert_eq!(load_snapshot(&path).expect("load"), snapshot);
+
+    let leftovers: Vec<_> = std::fs::read_dir(&dir)
+        .expect("read dir")
+        .map(|entry| entry.expect("entry").file_name())
+        .collect();
+    assert_eq!(leftovers, vec![std::ffi::OsString::from("backend.snap")]);
+
+    assert!(matches!(
+        load_snapshot(&dir.join("missing.snap")),
+        Err(SnapshotCodecError::Io(_))
+    ));
+    std::fs::remove_dir_all(&dir).expect("cleanup");
+}
+
+#[test]
+fn snapshots_with_comma_separated_windows_still_restore() {
+    let snapshot = warmed_snapshot();
+    let mut legacy = snapshot.clone();
+    let mut rewritten = 0;
+    for node in legacy.nodes.values_mut() {
+        for value in node.state_blob.values_mut() {
+            if let IncrementalValue::Numbers(values) = value {
+                let csv: Vec<String> = values.iter().map(f64::to_string).collect();
+                *value = IncrementalValue::Text(csv.join(","));
+                rewritten += 1;
+            }
+        }
+    }
+    assert!(rewritten > 0, "windowed kernels hold float arrays");
+
+    let decoded = decode_snapshot(&encode_snapshot(&legacy)).expect("legacy blobs decode");
+    assert_eq!(continue_from(decoded), continue_from(snapshot));
+}
@@ -0,0 +1,346 @@
+use std::collections::BTreeMap;
+
+use ta_engine::contracts::{RustExecutionGraph, RustExecutionPartition, RustExecutionPayload};
+use ta_engine::dataset::{append_ohlcv, create_dataset, drop_dataset, DatasetPartitionKey};
+use ta_engine::incremental::backend::{
+    execute_plan_graph_payload, ExecutePlanError, IncrementalBackend, TickColumns,
+};
+use ta_engine::incremental::contracts::IncrementalValue;
+use ta_engine::incremental::snapshot_codec::encode_snapshot;
+use ta_engine::incremental::step_graph::StepGraph;
+
+const BARS: usize = 90;
+
+struct Bars {
+    open: Vec<f64>,
+    high: Vec<f64>,
+    low: Vec<f64>,
+    close: Vec<f64>,
+    volume: Vec<f64>,
+}
+
+fn sample_bars(n: usize) -> Bars {
+    let mut seed: u64 = 0x9e37_79b9_7f4a_7c15;
+    let mut next = || {
+        seed ^= seed << 13;
+        seed ^= seed >> 7;
+        seed ^= seed << 17;
+        (seed % 10_000) as f64 / 10_000.0
+    };
+    let mut bars = Bars {
+        open: Vec::new(),
+        high: Vec::new(),
+        low: Vec::new(),
+        close: Vec::new(),
+        volume: Vec::new(),
+    };
+    let mut price = 100.0;
+    for _ in 0..n {
+        let open = price;
+        let close = open + (next() - 0.5) * 4.0;
+        bars.open.push(open);
+        bars.high.push(open.max(close) + next());
+        bars.low.push(open.min(close) - next());
+        bars.close.push(close);
+        bars.volume.push(1000.0 + next() * 500.0);
+        price = close;
+    }
+    bars
+}
+
+fn tick(bars: &Bars, idx: usize) -> BTreeMap<String, IncrementalValue> {
+    BTreeMap::from([
+        ("open".to_string(), IncrementalValue::Number(bars.open[idx])),
+        ("high".to_string(), IncrementalValue::Number(bars.high[idx])),
+        ("low".to_string(), IncrementalValue::Number(bars.low[idx])),
+        (
+            "close".to_string(),
+            IncrementalValue::Number(bars.close[idx]),
+        ),
+        (
+            "volume".to_string(),
+            IncrementalValue::Number(bars.volume[idx]),
+        ),
+    ])
+}
+
+fn node(kind: &str, meta: &[(&str, &str)]) -> BTreeMap<String, String> {
+    let mut out = BTreeMap::from([("kind".to_string(), kind.to_string())]);
+    for (k, v) in meta {
+        out.insert(k.to_string(), v.to_string());
+    }
+    out
+}
+
+/// `sma(close, 5)` / `ema(close, 9)` crossings gated by a three-bar change,
+/// with filters, aggregates and a literal-fed call exercising the rest of the
+/// graph executor's node kinds.
+fn signal_graph() -> RustExecutionGraph {
+    let nodes = BTreeMap::from([
+        (
+            1,
+            node("source_ref", &[("field", "close"), ("source", "ohlcv")]),
+        ),
+        (2, node("call", &[("name", "sma"), ("kw_period", "5")])),
+        (3, node("call", &[("name", "ema"), ("kw_period", "9")])),
+        (4, node("call", &[("name", "crossup")])),
+        (
+            5,
+            node("time_shift", &[("shift", "3"), ("operation", "change")]),
+        ),
+        (6, node("literal", &[("value", "0")])),
+        (7, node("binary_op", &[("operator", "gt")])),
+        (8, node("binary_op", &[("operator", "or")])),
+        (9, node("literal", &[("value", "14")])),
+        (10, node("call", &[("name", "rsi"), ("arg_0", "14")])),
+        (11, node("filter", &[])),
+        (12, node("aggregate", &[("operation", "avg")])),
+        (13, node("aggregate", &[("operation", "count")])),
+        (14, node("unary_op", &[("operator", "neg")])),
+        (15, node("binary_op", &[("operator", "div")])),
+        (
+            16,
+            node(
+                "time_shift",
+                &[("shift", "2h"), ("operation", "change_pct")],
+            ),
+        ),
+        (17, node("aggregate", &[("operation", "max")])),
+        (
+            18,
+            node("call", &[("name", "macd"), ("output", "histogram")]),
+        ),
+        (19, node("binary_op", &[("operator", "and")])),
+        (20, node("unary_op", &[("operator", "not")])),
+    ]);
+    let edges = BTreeMap::from([
+        (2, vec![1]),
+        (3, vec![1]),
+        (4, vec![2, 3]),
+        (5, vec![2]),
+        (7, vec![5, 6]),
+        (8, vec![4, 7]),
+        (10, vec![9]),
+        (11, vec![10, 8]),
+        (12, vec![11]),
+        (13, vec![11]),
+        (14, vec![12]),
+        (15, vec![14, 13]),
+        (16, vec![10]),
+        (17, vec![16]),
+        (18, vec![1]),
+        (19, vec![8, 18]),
+        (20, vec![19]),
+    ]);
+    RustExecutionGraph {
+        root_id: 20,
+        node_order: vec![
+            1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+        ],
+        nodes,
+        edges,
+    }
+}
+
+fn same_value(left: &IncrementalValue, right: &IncrementalValue) -> bool {
+    match (left, right) {
+        (IncrementalValue::Number(l), IncrementalValue::Number(r)) => {
+            l == r || (l.is_nan() && r.is_nan())
+        }
+        _ => left == right,
+    }
+}
+
+fn batch_prefix(
+    graph: &RustExecutionGraph,
+    bars: &Bars,
+    len: usize,
+) -> BTreeMap<u32, IncrementalValue> {
+    let dataset_id = create_dataset();
+    let timestamps: Vec<i64> = (0..len as i64).collect();
+    append_ohlcv(
+        dataset_id,
+        DatasetPartitionKey {
+            symbol: "BTCUSDT".to_string(),
+            timeframe: "1m".to_string(),
+            source: "ohlcv".to_string(),
+        },
+        &timestamps,
+        &bars.open[..len],
+        &bars.high[..len],
+        &bars.low[..len],
+        &bars.close[..len],
+        &bars.volume[..len],
+    )
+    .expect("append should succeed");
+    let payload = RustExecutionPayload {
+        dataset_id,
+        partition: RustExecutionPartition {
+            symbol: "BTCUSDT".to_string(),
+            timeframe: "1m".to_string(),
+            source: "ohlcv".to_string(),
+        },
+        graph: graph.clone(),
+        requests: Vec::new(),
+    };
+    let out = execute_plan_graph_payload(&payload).expect("batch graph should execute");
+    drop_dataset(dataset_id).expect("drop should succeed");
+    out.into_iter()
+        .map(|(node_id, series)| (node_id, series.value(len - 1)))
+        .collect()
+}
+
+#[test]
+fn step_graph_matches_batch_graph_prefixes() {
+    let graph = signal_graph();
+    let bars = sample_bars(BARS);
+    let mut backend = IncrementalBackend::default();
+    backend.initialize();
+    backend.load_graph(StepGraph::compile(&graph).expect("graph should compile"));
+
+    for t in 0..BARS {
+        let stepped = backend
+            .step_graph(t as u64 + 1, &tick(&bars, t))
+            .expect("step should succeed");
+        let expected = batch_prefix(&graph, &bars, t + 1);
+        assert_eq!(stepped.len(), expected.len());
+        for (node_id, value) in &expected {
+            assert!(
+                same_value(&stepped[node_id], value),
+                "node {node_id} bar {t}: stepped {:?}, batch {value:?}",
+                stepped[node_id]
+            );
+        }
+    }
+}
+
+#[test]
+fn step_graph_snapshot_restore_resumes() {
+    let graph = signal_graph();
+    let bars = sample_bars(BARS);
+    let events: Vec<_> = (0..BARS).map(|i| tick(&bars, i)).collect();
+
+    let mut full = IncrementalBackend::default();
+    full.initialize();
+    full.load_graph(StepGraph::compile(&graph).unwrap());
+    let expected = full.replay_graph(&events).unwrap();
+
+    let mut first = IncrementalBackend::default();
+    first.initialize();
+    first.load_graph(StepGraph::compile(&graph).unwrap());
+    for (idx, event) in events[..40].iter().enumerate() {
+        first.step_graph(idx as u64 + 1, event).unwrap();
+    }
+
+    let mut resumed = IncrementalBackend::default();
+    resumed.restore(first.snapshot()).unwrap();
+    resumed.load_graph(StepGraph::compile(&graph).unwrap());
+    for (idx, event) in events.iter().enumerate().skip(40) {
+        let out = resumed.step_graph(idx as u64 + 1, event).unwrap();
+        for (node_id, value) in &expected[idx] {
+            assert!(same_value(&out[node_id], value), "node {node_id} bar {idx}");
+        }
+    }
+}
+
+#[test]
+fn step_graph_rejects_unsupported_nodes() {
+    let mut graph = signal_graph();
+    graph
+        .nodes
+        .insert(12, node("aggregate", &[("operation", "median")]));
+    assert_eq!(
+        StepGraph::compile(&graph).unwrap_err(),
+        ExecutePlanError::InvalidPayload("unsupported aggregate operation: median".to_string())
+    );
+
+    let mut graph = signal_graph();
+    graph
+        .nodes
+        .insert(2, node("call", &[("name", "unknown_kernel")]));
+    assert_eq!(
+        StepGraph::compile(&graph).unwrap_err(),
+        ExecutePlanError::UnsupportedKernelId("unknown_kernel".to_string())
+    );
+
+    let mut backend = IncrementalBackend::default();
+    backend.initialize();
+    assert!(backend.step_graph(1, &BTreeMap::new()).is_err());
+}
+
+fn columns(bars: &Bars, rows: std::ops::Range<usize>) -> TickColumns {
+    BTreeMap::from([
+        ("open".to_string(), bars.open[rows.clone()].to_vec()),
+        ("high".to_string(), bars.high[rows.clone()].to_vec()),
+        ("low".to_string(), bars.low[rows.clone()].to_vec()),
+        ("close".to_string(), bars.close[rows.clone()].to_vec()),
+        ("volume".to_string(), bars.volume[rows].to_vec()),
+    ])
+}
+
+#[test]
+fn step_graph_batch_matches_tick_by_tick_stepping() {
+    let graph = signal_graph();
+    let bars = sample_bars(BARS);
+    let events: Vec<_> = (0..BARS).map(|i| tick(&bars, i)).collect();
+    let mut single = IncrementalBackend::default();
+    single.initialize();
+    single.load_graph(StepGraph::compile(&graph).unwrap());
+    let expected = single.replay_graph(&events).unwrap();
+
+    let mut batched = IncrementalBackend::default();
+    batched.initialize();
+    batched.load_graph(StepGraph::compile(&graph).unwrap());
+    let head = batched
+        .step_graph_batch(1, &columns(&bars, 0..50), false)
+        .expect("batch should step");
+    let tail = batched
+        .step_graph_batch(51, &columns(&bars, 50..BARS), true)
+        .expect("batch should step");
+
+    for (node_id, values) in &head {
+        assert_eq!(values.len(), 50);
+        for (idx, value) in values.iter().enumerate() {
+            assert!(
+                same_value(value, &expected[idx][node_id]),
+                "node {node_id} bar {idx}"
+            );
+        }
+    }
+    assert_eq!(tail.len(), expected[BARS - 1].len());
+    for (node_id, values) in &tail {
+        assert_eq!(values.len(), 1);
+        assert!(same_value(&values[0], &expected[BARS - 1][node_id]));
+    }
+    // Compared encoded, since NaN outputs never compare equal.
+    assert_eq!(
+        encode_snapshot(&batched.snapshot()),
+        encode_snapshot(&single.snapshot())
+    );
+}
+
+#[test]
+fn step_graph_batch_rejects_ragged_columns_and_missing_graph() {
+    let bars = sample_bars(10);
+    let mut backend = IncrementalBackend::default();
+    backend.initialize();
+    assert!(matches!(
+        backend.step_graph_batch(1, &columns(&bars, 0..10), false),
+        Err(ExecutePlanError::InvalidPayload(_))
+    ));
+
+    backend.load_graph(StepGraph::compile(&signal_graph()).unwrap());
+    let before = encode_snapshot(&backend.snapshot());
+    let mut ragged = columns(&bars, 0..10);
+    ragged.get_mut("close").unwrap().pop();
+    assert!(matches!(
+        backend.step_graph_batch(1, &ragged, false),
+        Err(ExecutePlanError::InvalidPayload(_))
+    ));
+    // A rejected batch steps none of its ticks.
+    assert_eq!(encode_snapshot(&backend.snapshot()), before);
+    assert!(backend
+        .step_graph_batch(1, &TickColumns::new(), false)
+        .unwrap()
+        .is_empty());
+}
@@ -24,3 +24,153 @@ fn rolling_min_max_basic() {
     assert_eq!(max_out[2], 4.0);
     assert_eq!(max_out[3], 4.0);
 }
+
+/// Full window rescan the deque implementation must reproduce bit for bit.
+fn scan_extreme(values: &[f64], period: usize, is_max: bool) -> Vec<f64> {
+    (0..values.len())
+        .map(|i| {
+            if i + 1 < period {
+                return f64::NAN;
+            }
+            let window = &values[i + 1 - period..=i];
+            window[1..].iter().fold(window[0], |m, &x| {
+                if (is_max && x > m) || (!is_max && x < m) {
+                    x
+                } else {
+                    m
+                }
+            })
+        })
+        .collect()
+}
+
+#[test]
+fn rolling_min_max_match_window_scan() {
+    let mut values: Vec<f64> = (0..400)
+        .map(|i| ((i * 37 % 101) as f64 - 50.0) / 4.0)
+        .collect();
+    for i in (0..values.len()).step_by(23) {
+        values[i] = f64::NAN;
+    }
+    values[5] = 0.0;
+    values[6] = -0.0;
+    values[7] = 0.0;
+
+    for period in [1, 2, 3, 7, 50, 399, 400, 401] {
+        for (out, is_max) in [
+            (rolling::rolling_max(&values, period), true),
+            (rolling::rolling_min(&values, period), false),
+        ] {
+            let expected = scan_extreme(&values, period, is_max);
+            assert_eq!(out.len(), expected.len());
+            for (got, want) in out.iter().zip(&expected) {
+                assert_eq!(got.to_bits(), want.to_bits(), "period {period}");
+            }
+        }
+    }
+}
+
+/// Sorted-window reference for the order-statistics kernel.
+fn sorted_quantile(values: &[f64], period: usize, q: f64) -> Vec<f64> {
+    let rank = ((q * period as f64).floor() as usize).min(period - 1);
+    (0..values.len())
+        .map(|i| {
+            if i + 1 < period {
+                return f64::NAN;
+            }
+            let mut window = values[i + 1 - period..=i].to_vec();
+            if window.iter().any(|x| x.is_nan()) {
+                return f64::NAN;
+            }
+            window.sort_by(f64::total_cmp);
+            window[rank]
+        })
+        .collect()
+}
+
+#[test]
+fn rolling_quantile_matches_sorted_window() {
+    // Few distinct values force duplicates across both heaps and a trending
+    // stretch buries evicted entries, exercising lazy deletion and rebuilds.
+    let mut values: Vec<f64> = (0..600)
+        .map(|i| {
+            if (200..320).contains(&i) {
+                i as f64
+            } else {
+                ((i * 37 % 11) as f64 - 5.0) / 2.0
+            }
+        })
+        .collect();
+    values[450] = f64::NAN;
+    values[451] = f64::NAN;
+
+    for period in [1, 2, 3, 4, 7, 50, 599, 600, 601] {
+        for q in [0.0, 0.1, 0.5, 0.75, 1.0] {
+            let out = rolling::rolling_quantile(&values, period, q);
+            let expected = sorted_quantile(&values, period, q);
+            assert_eq!(out.len(), expected.len());
+            for (i, (got, want)) in out.iter().zip(&expected).enumerate() {
+                assert_eq!(
+                    got.to_bits(),
+                    want.to_bits(),
+                    "period {period} q {q} row {i}"
+                );
+            }
+        }
+    }
+}
+
+#[test]
+fn rolling_median_is_upper_median() {
+    let out = rolling::rolling_median(&[4.0, 1.0, 3.0, 2.0, 5.0], 4);
+    assert!(out[2].is_nan());
+    assert_eq!(out[3], 3.0);
+    assert_eq!(out[4], 3.0);
+}
+
+/// Direct weighted sum over each window, the pre-running-sum definition.
+fn direct_wma(values: &[f64], period: usize) -> Vec<f64> {
+    let denom = (period * (period + 1) / 2) as f64;
+    (0..values.len())
+        .map(|i| {
+            if i + 1 < period {
+                return f64::NAN;
+            }
+            let weighted: f64 = values[i + 1 - period..=i]
+                .iter()
+                .enumerate()
+                .map(|(idx, x)| *x * (idx + 1) as f64)
+                .sum();
+            weighted / denom
+        })
+        .collect()
+}
+
+#[test]
+fn wma_running_sums_track_direct_weighted_sum() {
+    let mut values: Vec<f64> = (0..2_000)
+        .map(|i| 20_000.0 + ((i * 7919 % 613) as f64 - 306.0) * 0.37)
+        .collect();
+    // NaN rows must blank every window they touch and recover afterwards.
+    values[900] = f64::NAN;
+    values[1_300] = f64::NAN;
+
+    for period in [1, 2, 5, 14, 200, 1_999, 2_000, 2_001] {
+        let out = rolling::wma(&values, period);
+        let expected = direct_wma(&values, period);
+        for (i, (got, want)) in out.iter().zip(&expected).enumerate() {
+            if want.is_nan() {
+                assert!(got.is_nan(), "period {period} row {i}");
+            } else {
+                assert!(
+                    (got - want).abs() <= want.abs() * 1e-12,
+                    "period {period} row {i}: {got} vs {want}"
+                );
+            }
+        }
+        // The first full window is anchored, so it matches exactly.
+        if period <= values.len() {
+            assert_eq!(out[period - 1].to_bits(), expected[period - 1].to_bits());
+        }
+    }
+}
@@ -0,0 +1,101 @@
+use ta_engine::series_ops::{
+    binary, binary_scalar, change, change_pct, filter, negate, reduce, shift, BinaryOp,
+    SeriesOpsError,
+};
+
+#[test]
+fn binary_ops_are_elementwise() {
+    let left = [100.0, 200.0, -7.0];
+    let right = [50.0, 75.0, 2.0];
+
+    let add = binary(BinaryOp::parse("add").unwrap(), &left, &right).unwrap();
+    assert_eq!(add, vec![150.0, 275.0, -5.0]);
+    let sub = binary(BinaryOp::Sub, &left, &right).unwrap();
+    assert_eq!(sub, vec![50.0, 125.0, -9.0]);
+    let mul = binary(BinaryOp::Mul, &left, &right).unwrap();
+    assert_eq!(mul, vec![5000.0, 15000.0, -14.0]);
+    let div = binary(BinaryOp::Div, &left, &right).unwrap();
+    assert_eq!(div, vec![2.0, 200.0 / 75.0, -3.5]);
+    // Remainder keeps the sign of the dividend, as `Decimal` does.
+    let rem = binary(BinaryOp::Mod, &left, &right).unwrap();
+    assert_eq!(rem, vec![0.0, 50.0, -1.0]);
+    let pow = binary_scalar(BinaryOp::Pow, &left, 2.0).unwrap();
+    assert_eq!(pow, vec![10000.0, 40000.0, 49.0]);
+    assert_eq!(negate(&left), vec![-100.0, -200.0, 7.0]);
+}
+
+#[test]
+fn binary_ops_propagate_nan_and_reject_bad_input() {
+    let out = binary(BinaryOp::Add, &[f64::NAN, 1.0], &[1.0, 1.0]).unwrap();
+    assert!(out[0].is_nan());
+    assert_eq!(out[1], 2.0);
+
+    assert_eq!(
+        binary(BinaryOp::Add, &[1.0], &[1.0, 2.0]).unwrap_err(),
+        SeriesOpsError::LengthMismatch
+    );
+    assert_eq!(
+        binary(BinaryOp::Div, &[1.0, 2.0], &[1.0, 0.0]).unwrap_err(),
+        SeriesOpsError::DivisionByZero
+    );
+    assert_eq!(
+        binary_scalar(BinaryOp::Mod, &[1.0], 0.0).unwrap_err(),
+        SeriesOpsError::DivisionByZero
+    );
+    assert_eq!(
+        BinaryOp::parse("xor").unwrap_err(),
+        SeriesOpsError::UnsupportedOperator("xor".to_string())
+    );
+}
+
+#[test]
+fn shift_pads_with_edge_values() {
+    let values = [1.0, 2.0, 3.0, 4.0];
+    assert_eq!(shift(&values, 1), vec![1.0, 1.0, 2.0, 3.0]);
+    assert_eq!(shift(&values, -2), vec![3.0, 4.0, 4.0, 4.0]);
+    assert_eq!(shift(&values, 9), vec![1.0; 4]);
+    assert_eq!(shift(&values, -9), vec![4.0; 4]);
+    assert_eq!(shift(&values, 0), values.to_vec());
+    assert!(shift(&[], 3).is_empty());
+}
+
+#[test]
+fn change_and_change_pct_have_nan_prefix() {
+    let values = [100.0, 110.0, 0.0, 50.0];
+    let diff = change(&values, 1);
+    assert!(diff[0].is_nan());
+    assert_eq!(&diff[1..], &[10.0, -110.0, 50.0]);
+
+    let pct = change_pct(&values, 1);
+    assert!(pct[0].is_nan());
+    assert_eq!(pct[1], 10.0);
+    assert_eq!(pct[2], -100.0);
+    assert!(pct[3].is_nan());
+
+    assert!(change(&values, 4).iter().all(|v| v.is_nan()));
+}
+
+#[test]
+fn filter_and_reductions() {
+    let values = [3.0, f64::NAN, 5.0, 1.0];
+    assert_eq!(
+        filter(&values, &[true, false, true, false]).unwrap(),
+        vec![3.0, 5.0]
+    );
+    assert_eq!(
+        filter(&values, &[true]).unwrap_err(),
+        SeriesOpsError::LengthMismatch
+    );
+
+    assert_eq!(reduce(&values, "max").unwrap(), Some(5.0));
+    assert_eq!(reduce(&values, "min").unwrap(), Some(1.0));
+    assert_eq!(reduce(&[1.0, 2.0, 6.0], "sum").unwrap(), Some(9.0));
+    assert_eq!(reduce(&[1.0, 2.0, 6.0], "mean").unwrap(), Some(3.0));
+    assert_eq!(reduce(&[], "sum").unwrap(), Some(0.0));
+    assert_eq!(reduce(&[], "mean").unwrap(), None);
+    assert_eq!(reduce(&[f64::NAN], "max").unwrap(), None);
+    assert_eq!(
+        reduce(&values, "median").unwrap_err(),
+        SeriesOpsError::UnsupportedReduction("median".to_string())
+    );
+}
@@ -0,0 +1,179 @@
+use ta_engine::{momentum, rolling, trend};
+
+fn xorshift(seed: u64) -> impl FnMut() -> u64 {
+    let mut state = seed;
+    move || {
+        state ^= state << 13;
+        state ^= state >> 7;
+        state ^= state << 17;
+        state
+    }
+}
+
+/// Random walk quantized to a coarse grid so equal extremes are common, with
+/// scattered NaN rows and signed zeros.
+fn quantized_series(seed: u64, n: usize) -> Vec<f64> {
+    let mut next = xorshift(seed);
+    let mut level: i64 = 0;
+    (0..n)
+        .map(|_| {
+            let r = next();
+            level += (r % 5) as i64 - 2;
+            match r % 97 {
+                0 => f64::NAN,
+                1 => -0.0,
+                _ => level as f64 * 0.5,
+            }
+        })
+        .collect()
+}
+
+/// The per-bar window scan swing detection used before the deque version.
+fn scan_swing_points(
+    high: &[f64],
+    low: &[f64],
+    left: usize,
+    right: usize,
+    allow_equal_extremes: bool,
+) -> (Vec<bool>, Vec<bool>) {
+    let n = high.len();
+    let mut flags_high = vec![false; n];
+    let mut flags_low = vec![false; n];
+    if n <= left + right {
+        return (flags_high, flags_low);
+    }
+    let mut have_high = false;
+    for i in left..(n - right) {
+        let window = (i - left)..=(i + right);
+        let beaten = high[window.clone()].iter().any(|v| *v > high[i]);
+        let ties = high[window.clone()]
+            .iter()
+            .filter(|v| **v == high[i])
+            .count();
+        if !beaten && (allow_equal_extremes || ties == 1) {
+            flags_high[i + right] = true;
+            have_high = true;
+        }
+        if have_high {
+            let beaten = low[window.clone()].iter().any(|v| *v < low[i]);
+            let ties = low[window].iter().filter(|v| **v == low[i]).count();
+            if !beaten && (allow_equal_extremes || ties == 1) {
+                flags_low[i + right] = true;
+            }
+        }
+    }
+    (flags_high, flags_low)
+}
+
+#[test]
+fn swing_points_match_window_scan() {
+    for seed in 1..=40u64 {
+        let high = quantized_series(seed * 0x9e37_79b9, 300);
+        let low: Vec<f64> = high.iter().map(|h| h - 1.0).collect();
+        for (left, right) in [(0, 0), (1, 1), (2, 2), (3, 1), (0, 4), (5, 0), (10, 10)] {
+            for allow_equal in [false, true] {
+                assert_eq!(
+                    trend::swing_points_raw(&high, &low, left, right, allow_equal),
+                    scan_swing_points(&high, &low, left, right, allow_equal),
+                    "seed {seed} left {left} right {right} allow_equal {allow_equal}"
+                );
+            }
+        }
+    }
+}
+
+/// Direct window scan CCI used before the Fenwick mean deviation.
+fn scan_cci(high: &[f64], low: &[f64], close: &[f64], period: usize) -> Vec<f64> {
+    let tp: Vec<f64> = (0..close.len())
+        .map(|i| (high[i] + low[i] + close[i]) / 3.0)
+        .collect();
+    let sma = rolling::rolling_mean(&tp, period);
+    (0..tp.len())
+        .map(|i| {
+            if i + 1 < period {
+                return f64::NAN;
+            }
+            let deviation = tp[i + 1 - period..=i]
+                .iter()
+                .map(|v| (v - sma[i]).abs())
+                .sum::<f64>()
+                / period as f64;
+            if deviation == 0.0 {
+                0.0
+            } else {
+                (tp[i] - sma[i]) / (0.015 * deviation)
+            }
+        })
+        .collect()
+}
+
+fn unit(bits: u64) -> f64 {
+    (bits >> 11) as f64 / (1u64 << 53) as f64
+}
+
+/// High/low/close bars for the CCI parity test. `flat_runs` holds the price
+/// for stretches of identical bars inside the walk.
+fn cci_bars(seed: u64, n: usize, flat_runs: bool) -> (Vec<f64>, Vec<f64>, Vec<f64>) {
+    let mut next = xorshift(seed);
+    let mut price = 1_000.0;
+    let mut hold = 0;
+    let (mut high, mut low, mut close) = (Vec::new(), Vec::new(), Vec::new());
+    for _ in 0..n {
+        if hold > 0 {
+            hold -= 1;
+            high.push(price);
+            low.push(price);
+            close.push(price);
+            continue;
+        }
+        if flat_runs && next().is_multiple_of(10) {
+            hold = 5 + next() % 40;
+        }
+        price += unit(next()) * 20.0 - 10.0;
+        close.push(price);
+        high.push(price + unit(next()) * 5.0);
+        low.push(price - unit(next()) * 5.0);
+    }
+    (high, low, close)
+}
+
+#[test]
+fn cci_matches_window_scan() {
+    let mut cases = Vec::new();
+    for seed in 1..=10u64 {
+        cases.push(cci_bars(seed * 0x2545_f491, 3_000, false));
+        cases.push(cci_bars(seed * 0x9e37_79b9, 3_000, true));
+    }
+    // Repeated identical bars, and a staircase of constant stretches.
+    let flat = vec![898.992_043_795_620_7; 600];
+    cases.push((flat.clone(), flat.clone(), flat));
+    let stairs: Vec<f64> = (0..600).map(|i| 100.0 + (i / 50) as f64 * 0.1).collect();
+    cases.push((stairs.clone(), stairs.clone(), stairs));
+
+    for (case, (high, low, close)) in cases.iter().enumerate() {
+        for period in [1, 2, 14, 20, 100, 1_500] {
+            let got = momentum::cci(high, low, close, period);
+            let want = scan_cci(high, low, close, period);
+            for (i, (g, w)) in got.iter().zip(&want).enumerate() {
+                if w.is_nan() {
+                    assert!(g.is_nan(), "case {case} period {period} row {i}");
+                } else {
+                    assert!(
+                        (g - w).abs() <= 1e-6 * w.abs().max(1.0),
+                        "case {case} period {period} row {i}: {g} vs {w}"
+                    );
+                }
+            }
+        }
+    }
+}
+
+#[test]
+fn cci_stays_nan_after_nan_input() {
+    let mut close: Vec<f64> = (0..60).map(|i| 100.0 + (i % 7) as f64).collect();
+    close[30] = f64::NAN;
+    let out = momentum::cci(&close, &close, &close, 5);
+    assert!(out[..4].iter().all(|v| v.is_nan()));
+    assert!(out[4..30].iter().all(|v| v.is_finite()));
+    assert!(out[30..].iter().all(|v| v.is_nan()));
+}
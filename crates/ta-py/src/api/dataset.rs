@@ -2,6 +2,7 @@ use pyo3::prelude::*;
 use pyo3::types::PyDict;
 use ta_engine::dataset::{self, DatasetPartitionKey};
 
+use crate::buffers::F64Input;
 use crate::conversions::indicator_meta_to_pydict;
 use crate::errors::{map_dataset_error, map_dataset_ops_error};
 
@@ -23,54 +24,157 @@ pub(crate) fn dataset_drop(dataset_id: u64) -> PyResult<()> {
 #[pyfunction]
 #[allow(clippy::too_many_arguments)]
 pub(crate) fn dataset_append_ohlcv(
+    py: Python<'_>,
     dataset_id: u64,
     symbol: String,
     timeframe: String,
     source: String,
     timestamps: Vec<i64>,
-    open: Vec<f64>,
-    high: Vec<f64>,
-    low: Vec<f64>,
-    close: Vec<f64>,
-    volume: Vec<f64>,
+    open: F64Input,
+    high: F64Input,
+    low: F64Input,
+    close: F64Input,
+    volume: F64Input,
 ) -> PyResult<usize> {
-    dataset::append_ohlcv(
+    py.allow_threads(|| {
+        dataset::append_ohlcv(
+            dataset_id,
+            DatasetPartitionKey {
+                symbol,
+                timeframe,
+                source,
+            },
+            &timestamps,
+            &open,
+            &high,
+            &low,
+            &close,
+            &volume,
+        )
+    })
+    .map_err(map_dataset_error)
+}
+
+#[pyfunction]
+pub(crate) fn dataset_append_series(
+    py: Python<'_>,
+    dataset_id: u64,
+    symbol: String,
+    timeframe: String,
+    source: String,
+    field: String,
+    timestamps: Vec<i64>,
+    values: F64Input,
+) -> PyResult<usize> {
+    py.allow_threads(|| {
+        dataset::append_series(
+            dataset_id,
+            DatasetPartitionKey {
+                symbol,
+                timeframe,
+                source,
+            },
+            field,
+            &timestamps,
+            &values,
+        )
+    })
+    .map_err(map_dataset_error)
+}
+
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+pub(crate) fn dataset_replace_ohlcv(
+    py: Python<'_>,
+    dataset_id: u64,
+    symbol: String,
+    timeframe: String,
+    source: String,
+    timestamps: Vec<i64>,
+    open: F64Input,
+    high: F64Input,
+    low: F64Input,
+    close: F64Input,
+    volume: F64Input,
+) -> PyResult<usize> {
+    py.allow_threads(|| {
+        dataset::replace_ohlcv(
+            dataset_id,
+            DatasetPartitionKey {
+                symbol,
+                timeframe,
+                source,
+            },
+            &timestamps,
+            &open,
+            &high,
+            &low,
+            &close,
+            &volume,
+        )
+    })
+    .map_err(map_dataset_error)
+}
+
+#[pyfunction]
+pub(crate) fn dataset_replace_series(
+    py: Python<'_>,
+    dataset_id: u64,
+    symbol: String,
+    timeframe: String,
+    source: String,
+    field: String,
+    timestamps: Vec<i64>,
+    values: F64Input,
+) -> PyResult<usize> {
+    py.allow_threads(|| {
+        dataset::replace_series(
+            dataset_id,
+            DatasetPartitionKey {
+                symbol,
+                timeframe,
+                source,
+            },
+            field,
+            &timestamps,
+            &values,
+        )
+    })
+    .map_err(map_dataset_error)
+}
+
+#[pyfunction]
+pub(crate) fn dataset_drop_partition(
+    dataset_id: u64,
+    symbol: String,
+    timeframe: String,
+    source: String,
+) -> PyResult<()> {
+    dataset::drop_partition(
         dataset_id,
-        DatasetPartitionKey {
+        &DatasetPartitionKey {
             symbol,
             timeframe,
             source,
         },
-        &timestamps,
-        &open,
-        &high,
-        &low,
-        &close,
-        &volume,
     )
     .map_err(map_dataset_error)
 }
 
 #[pyfunction]
-pub(crate) fn dataset_append_series(
+pub(crate) fn dataset_partition_version(
     dataset_id: u64,
     symbol: String,
     timeframe: String,
     source: String,
-    field: String,
-    timestamps: Vec<i64>,
-    values: Vec<f64>,
-) -> PyResult<usize> {
-    dataset::append_series(
+) -> PyResult<u64> {
+    dataset::partition_version(
         dataset_id,
-        DatasetPartitionKey {
+        &DatasetPartitionKey {
             symbol,
             timeframe,
             source,
         },
-        field,
-        &timestamps,
-        &values,
     )
     .map_err(map_dataset_error)
 }
@@ -89,38 +193,43 @@ pub(crate) fn dataset_info(py: Python<'_>, dataset_id: u64) -> PyResult<PyObject
 
 #[pyfunction]
 pub(crate) fn series_downsample(
+    py: Python<'_>,
     timestamps: Vec<i64>,
-    values: Vec<f64>,
+    values: F64Input,
     factor: usize,
     agg: String,
 ) -> PyResult<(Vec<i64>, Vec<f64>)> {
-    ta_engine::dataset_ops::downsample(&timestamps, &values, factor, &agg)
+    py.allow_threads(|| ta_engine::dataset_ops::downsample(&timestamps, &values, factor, &agg))
         .map_err(map_dataset_ops_error)
 }
 
 #[pyfunction]
 pub(crate) fn series_upsample_ffill(
+    py: Python<'_>,
     timestamps: Vec<i64>,
-    values: Vec<f64>,
+    values: F64Input,
     factor: usize,
 ) -> PyResult<(Vec<i64>, Vec<f64>)> {
-    ta_engine::dataset_ops::upsample_ffill(&timestamps, &values, factor)
+    py.allow_threads(|| ta_engine::dataset_ops::upsample_ffill(&timestamps, &values, factor))
         .map_err(map_dataset_ops_error)
 }
 
 #[pyfunction]
 pub(crate) fn series_sync_timeframe(
+    py: Python<'_>,
     source_timestamps: Vec<i64>,
-    source_values: Vec<f64>,
+    source_values: F64Input,
     reference_timestamps: Vec<i64>,
     fill: String,
 ) -> PyResult<Vec<f64>> {
-    ta_engine::dataset_ops::sync_timeframe(
-        &source_timestamps,
-        &source_values,
-        &reference_timestamps,
-        &fill,
-    )
+    py.allow_threads(|| {
+        ta_engine::dataset_ops::sync_timeframe(
+            &source_timestamps,
+            &source_values,
+            &reference_timestamps,
+            &fill,
+        )
+    })
     .map_err(map_dataset_ops_error)
 }
 
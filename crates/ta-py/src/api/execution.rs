@@ -1,19 +1,26 @@
 use std::collections::BTreeMap;
+use std::path::PathBuf;
 
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
-use ta_engine::contracts::{RustExecutionGraph, RustExecutionPartition, RustExecutionPayload};
+use pyo3::types::{PyBytes, PyDict, PyList};
+use ta_engine::contracts::{RustExecutionPartition, RustExecutionPayload};
 use ta_engine::dataset::DatasetPartitionKey;
-use ta_engine::incremental::backend::{self, ExecutePlanPayload, IncrementalBackend};
+use ta_engine::incremental::backend::{
+    self, ExecutePlanError, ExecutePlanPayload, GraphExecOptions, IncrementalBackend, TickColumns,
+};
+use ta_engine::incremental::plan_registry;
+use ta_engine::incremental::result_cache;
+use ta_engine::incremental::snapshot_codec;
+use ta_engine::incremental::step_graph::StepGraph;
 
 use crate::conversions::{
-    extract_node_id, extract_scalar_string, incremental_map_to_pydict,
-    incremental_series_map_to_pydict, parse_contract_requests, parse_events, parse_requests,
-    parse_tick,
+    incremental_map_to_pydict, incremental_series_map_to_pydict, node_columns_to_pydict,
+    parse_contract_requests, parse_events, parse_graph, parse_requests, parse_tick,
 };
-use crate::errors::map_execute_plan_error;
+use crate::errors::{map_execute_plan_error, map_snapshot_codec_error};
 use crate::state::{
-    next_backend_id, next_snapshot_id, with_backends_mut, with_snapshots, with_snapshots_mut,
+    backend_stats, cloned_snapshot, insert_backend, insert_snapshot, next_backend_id,
+    remove_backend, snapshot_stats, with_backend, with_snapshots,
 };
 
 #[pyfunction]
@@ -21,10 +28,49 @@ pub(crate) fn incremental_initialize() -> PyResult<u64> {
     let mut backend = IncrementalBackend::default();
     backend.initialize();
     let id = next_backend_id();
-    with_backends_mut(|map| {
-        map.insert(id, backend);
-        id
-    })
+    insert_backend(id, backend)?;
+    Ok(id)
+}
+
+/// Releases a backend and its state; `False` when the id is unknown.
+#[pyfunction]
+pub(crate) fn incremental_drop(backend_id: u64) -> PyResult<bool> {
+    remove_backend(backend_id)
+}
+
+/// Releases a stored snapshot; `False` when the id is unknown or was evicted.
+#[pyfunction]
+pub(crate) fn snapshot_drop(snapshot_id: u64) -> PyResult<bool> {
+    with_snapshots(|store| store.remove(snapshot_id))
+}
+
+/// Caps the number of stored snapshots, evicting least recently used ones;
+/// `None` removes the cap.
+#[pyfunction]
+#[pyo3(signature = (capacity=None))]
+pub(crate) fn snapshot_set_capacity(capacity: Option<usize>) -> PyResult<()> {
+    if capacity == Some(0) {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "snapshot capacity must be positive",
+        ));
+    }
+    with_snapshots(|store| store.set_capacity(capacity))
+}
+
+/// Counts and bytes held by the backend, snapshot and plan registries.
+#[pyfunction]
+pub(crate) fn registry_stats(py: Python<'_>) -> PyResult<PyObject> {
+    let ((backends, backend_bytes), snapshots) =
+        py.allow_threads(|| Ok::<_, PyErr>((backend_stats()?, snapshot_stats()?)))?;
+    let out = PyDict::new(py);
+    out.set_item("backends", backends)?;
+    out.set_item("backend_bytes", backend_bytes)?;
+    out.set_item("snapshots", snapshots.entries)?;
+    out.set_item("snapshot_bytes", snapshots.bytes)?;
+    out.set_item("snapshot_capacity", snapshots.capacity)?;
+    out.set_item("snapshot_evictions", snapshots.evictions)?;
+    out.set_item("plans", plan_registry::plan_count())?;
+    Ok(out.into_any().unbind())
 }
 
 #[pyfunction]
@@ -38,29 +84,116 @@ pub(crate) fn incremental_step(
     let parsed_requests = parse_requests(requests)?;
     let parsed_tick = parse_tick(tick)?;
 
-    let out = with_backends_mut(|map| {
-        let backend = map.get_mut(&backend_id).ok_or_else(|| {
-            pyo3::exceptions::PyKeyError::new_err(format!("backend id {backend_id} not found"))
-        })?;
-        Ok::<_, PyErr>(backend.step(event_index, &parsed_requests, &parsed_tick))
-    })??;
+    let out = py.allow_threads(|| {
+        with_backend(backend_id, |backend| {
+            backend.step(event_index, &parsed_requests, &parsed_tick)
+        })
+    })?;
 
     incremental_map_to_pydict(py, &out)
 }
 
+/// Steps every tick in `columns` (field name to one float per tick) in one
+/// call, numbering events from `first_event_index`. With `requests` the call
+/// kernels are stepped; without, the backend's loaded step graph. Returns node
+/// id to the list of per-tick outputs, or to the final output with
+/// `last_only`.
 #[pyfunction]
-pub(crate) fn incremental_snapshot(backend_id: u64) -> PyResult<u64> {
-    let snapshot = with_backends_mut(|map| {
-        let backend = map.get_mut(&backend_id).ok_or_else(|| {
-            pyo3::exceptions::PyKeyError::new_err(format!("backend id {backend_id} not found"))
-        })?;
-        Ok::<_, PyErr>(backend.snapshot())
+#[pyo3(signature = (backend_id, columns, first_event_index, requests=None, last_only=false))]
+pub(crate) fn incremental_step_batch(
+    py: Python<'_>,
+    backend_id: u64,
+    columns: TickColumns,
+    first_event_index: u64,
+    requests: Option<&Bound<'_, PyList>>,
+    last_only: bool,
+) -> PyResult<PyObject> {
+    let parsed_requests = requests.map(parse_requests).transpose()?;
+
+    let out = py.allow_threads(|| {
+        with_backend(backend_id, |backend| {
+            match &parsed_requests {
+                Some(requests) => {
+                    backend.step_batch(first_event_index, requests, &columns, last_only)
+                }
+                None => backend.step_graph_batch(first_event_index, &columns, last_only),
+            }
+            .map_err(map_execute_plan_error)
+        })
     })??;
 
-    let snapshot_id = next_snapshot_id();
-    with_snapshots_mut(|snaps| {
-        snaps.insert(snapshot_id, snapshot);
-        snapshot_id
+    if last_only {
+        let last = out
+            .into_iter()
+            .filter_map(|(node_id, mut values)| values.pop().map(|value| (node_id, value)))
+            .collect();
+        return incremental_map_to_pydict(py, &last);
+    }
+    incremental_series_map_to_pydict(py, &out)
+}
+
+#[pyfunction]
+pub(crate) fn incremental_snapshot(py: Python<'_>, backend_id: u64) -> PyResult<u64> {
+    py.allow_threads(|| {
+        let snapshot = with_backend(backend_id, |backend| backend.snapshot())?;
+        insert_snapshot(snapshot)
+    })
+}
+
+/// Restores a backend from a stored snapshot and returns the snapshot's last
+/// event index, so the caller can resume numbering ticks after it.
+#[pyfunction]
+pub(crate) fn incremental_restore(
+    py: Python<'_>,
+    backend_id: u64,
+    snapshot_id: u64,
+) -> PyResult<u64> {
+    let snapshot = cloned_snapshot(snapshot_id)?;
+    py.allow_threads(|| {
+        let last_event_index = snapshot.last_event_index;
+        with_backend(backend_id, |backend| {
+            backend
+                .restore(snapshot)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
+        })??;
+        Ok(last_event_index)
+    })
+}
+
+/// Encodes a stored snapshot in the portable binary format.
+#[pyfunction]
+pub(crate) fn incremental_snapshot_export(py: Python<'_>, snapshot_id: u64) -> PyResult<PyObject> {
+    let snapshot = cloned_snapshot(snapshot_id)?;
+    let bytes = py.allow_threads(|| snapshot_codec::encode_snapshot(&snapshot));
+    Ok(PyBytes::new(py, &bytes).into_any().unbind())
+}
+
+/// Decodes a binary snapshot and stores it, returning its snapshot id.
+#[pyfunction]
+pub(crate) fn incremental_snapshot_import(py: Python<'_>, data: &[u8]) -> PyResult<u64> {
+    py.allow_threads(|| {
+        let snapshot = snapshot_codec::decode_snapshot(data).map_err(map_snapshot_codec_error)?;
+        insert_snapshot(snapshot)
+    })
+}
+
+#[pyfunction]
+pub(crate) fn incremental_snapshot_save(
+    py: Python<'_>,
+    snapshot_id: u64,
+    path: PathBuf,
+) -> PyResult<()> {
+    let snapshot = cloned_snapshot(snapshot_id)?;
+    py.allow_threads(|| {
+        snapshot_codec::save_snapshot(&path, &snapshot).map_err(map_snapshot_codec_error)
+    })
+}
+
+#[pyfunction]
+pub(crate) fn incremental_snapshot_load(py: Python<'_>, path: PathBuf) -> PyResult<u64> {
+    py.allow_threads(|| {
+        let snapshot = snapshot_codec::load_snapshot(&path).map_err(map_snapshot_codec_error)?;
+        insert_snapshot(snapshot)
     })
 }
 
@@ -72,24 +205,78 @@ pub(crate) fn incremental_replay(
     requests: &Bound<'_, PyList>,
     events: &Bound<'_, PyList>,
 ) -> PyResult<PyObject> {
-    let snapshot = with_snapshots(|snaps| {
-        snaps.get(&snapshot_id).cloned().ok_or_else(|| {
-            pyo3::exceptions::PyKeyError::new_err(format!("snapshot id {snapshot_id} not found"))
+    let snapshot = cloned_snapshot(snapshot_id)?;
+    let parsed_requests = parse_requests(requests)?;
+    let parsed_events = parse_events(events)?;
+
+    let replay_out = py.allow_threads(|| {
+        with_backend(backend_id, |backend| {
+            backend
+                .restore(snapshot)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+            Ok::<_, PyErr>(backend.replay(&parsed_requests, &parsed_events))
         })
     })??;
 
-    let parsed_requests = parse_requests(requests)?;
-    let parsed_events = parse_events(events)?;
+    let py_list = PyList::empty(py);
+    for step in replay_out {
+        py_list.append(incremental_map_to_pydict(py, &step)?)?;
+    }
+    Ok(py_list.into_any().unbind())
+}
 
-    let replay_out = with_backends_mut(|map| {
-        let backend = map.get_mut(&backend_id).ok_or_else(|| {
-            pyo3::exceptions::PyKeyError::new_err(format!("backend id {backend_id} not found"))
-        })?;
+#[pyfunction]
+pub(crate) fn incremental_load_graph(
+    py: Python<'_>,
+    backend_id: u64,
+    graph: &Bound<'_, PyDict>,
+) -> PyResult<()> {
+    let graph = parse_graph(graph)?;
+    py.allow_threads(|| {
+        let step_graph = StepGraph::compile(&graph).map_err(map_execute_plan_error)?;
+        with_backend(backend_id, |backend| backend.load_graph(step_graph))
+    })
+}
 
-        backend
-            .restore(snapshot)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
-        Ok::<_, PyErr>(backend.replay(&parsed_requests, &parsed_events))
+#[pyfunction]
+pub(crate) fn incremental_step_graph(
+    py: Python<'_>,
+    backend_id: u64,
+    tick: &Bound<'_, PyDict>,
+    event_index: u64,
+) -> PyResult<PyObject> {
+    let parsed_tick = parse_tick(tick)?;
+
+    let out = py.allow_threads(|| {
+        with_backend(backend_id, |backend| {
+            backend
+                .step_graph(event_index, &parsed_tick)
+                .map_err(map_execute_plan_error)
+        })
+    })??;
+
+    incremental_map_to_pydict(py, &out)
+}
+
+#[pyfunction]
+pub(crate) fn incremental_replay_graph(
+    py: Python<'_>,
+    backend_id: u64,
+    snapshot_id: u64,
+    events: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    let snapshot = cloned_snapshot(snapshot_id)?;
+    let parsed_events = parse_events(events)?;
+
+    let replay_out = py.allow_threads(|| {
+        with_backend(backend_id, |backend| {
+            backend
+                .restore(snapshot)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+            backend
+                .replay_graph(&parsed_events)
+                .map_err(map_execute_plan_error)
+        })
     })??;
 
     let py_list = PyList::empty(py);
@@ -118,7 +305,9 @@ pub(crate) fn execute_plan(
         },
         requests: parsed_requests,
     };
-    let out = backend::execute_plan_payload(&payload).map_err(map_execute_plan_error)?;
+    let out = py
+        .allow_threads(|| backend::execute_plan_payload(&payload))
+        .map_err(map_execute_plan_error)?;
     incremental_series_map_to_pydict(py, &out)
 }
 
@@ -127,6 +316,140 @@ pub(crate) fn execute_plan_payload(
     py: Python<'_>,
     payload: &Bound<'_, PyDict>,
 ) -> PyResult<PyObject> {
+    let (contract_payload, options) = parse_execution_payload(payload, 1)?;
+    let out = py
+        .allow_threads(|| backend::execute_plan_graph_with(&contract_payload, &options))
+        .map_err(map_execute_plan_error)?;
+    node_columns_to_pydict(py, out.iter().map(|(k, v)| (*k, v)))
+}
+
+/// Evaluates one plan payload over many partitions in a single call and
+/// returns `{(symbol, timeframe, source): {node_id: values}}`. `partitions`
+/// lists `(symbol, timeframe, source)` tuples; when omitted, every partition
+/// matching the payload partition is used, with `"*"` matching any value.
+/// Partitions run on `options.threads` workers, one per core by default.
+#[pyfunction]
+#[pyo3(signature = (payload, partitions=None))]
+pub(crate) fn execute_plan_batch(
+    py: Python<'_>,
+    payload: &Bound<'_, PyDict>,
+    partitions: Option<&Bound<'_, PyList>>,
+) -> PyResult<PyObject> {
+    let (contract_payload, options) = parse_execution_payload(payload, 0)?;
+    let targets = match partitions {
+        Some(items) => Some(
+            items
+                .iter()
+                .map(|item| {
+                    let (symbol, timeframe, source) = item.extract::<(String, String, String)>()?;
+                    Ok(RustExecutionPartition {
+                        symbol,
+                        timeframe,
+                        source,
+                    })
+                })
+                .collect::<PyResult<Vec<_>>>()?,
+        ),
+        None => None,
+    };
+    let (targets, results) = py
+        .allow_threads(|| {
+            let targets = match targets {
+                Some(targets) => targets,
+                None => backend::matching_partitions(
+                    contract_payload.dataset_id,
+                    &contract_payload.partition,
+                )?,
+            };
+            let results = backend::execute_plan_graph_batch(&contract_payload, &targets, &options)?;
+            Ok::<_, ExecutePlanError>((targets, results))
+        })
+        .map_err(map_execute_plan_error)?;
+    let out = PyDict::new(py);
+    for (target, result) in targets.iter().zip(results) {
+        let columns = result.map_err(map_execute_plan_error)?;
+        out.set_item(
+            (
+                target.symbol.as_str(),
+                target.timeframe.as_str(),
+                target.source.as_str(),
+            ),
+            node_columns_to_pydict(py, columns.iter().map(|(k, v)| (*k, v)))?,
+        )?;
+    }
+    Ok(out.into_any().unbind())
+}
+
+/// Validates and compiles an execution graph (the `graph` entry of an
+/// `execute_plan_payload` dict) once, returning a handle for `plan_execute`.
+#[pyfunction]
+pub(crate) fn plan_register(py: Python<'_>, graph: &Bound<'_, PyDict>) -> PyResult<u64> {
+    let graph = parse_graph(graph)?;
+    py.allow_threads(|| plan_registry::register_plan(&graph))
+        .map_err(map_execute_plan_error)
+}
+
+/// Evaluates a registered plan over the `(symbol, timeframe, source)`
+/// partition of a dataset and returns `{node_id: values}`.
+#[pyfunction]
+#[pyo3(signature = (plan_id, dataset_id, partition, root_only=false, threads=1))]
+pub(crate) fn plan_execute(
+    py: Python<'_>,
+    plan_id: u64,
+    dataset_id: u64,
+    partition: (String, String, String),
+    root_only: bool,
+    threads: usize,
+) -> PyResult<PyObject> {
+    let (symbol, timeframe, source) = partition;
+    let target = RustExecutionPartition {
+        symbol,
+        timeframe,
+        source,
+    };
+    let options = GraphExecOptions { root_only, threads };
+    let out = py
+        .allow_threads(|| plan_registry::execute_plan(plan_id, dataset_id, &target, &options))
+        .map_err(map_execute_plan_error)?;
+    node_columns_to_pydict(py, out.iter().map(|(k, v)| (*k, v)))
+}
+
+#[pyfunction]
+pub(crate) fn plan_drop(plan_id: u64) -> PyResult<()> {
+    plan_registry::drop_plan(plan_id).map_err(map_execute_plan_error)
+}
+
+/// Hit/miss counters and occupancy of the node result cache.
+#[pyfunction]
+pub(crate) fn result_cache_stats(py: Python<'_>) -> PyResult<PyObject> {
+    let stats = result_cache::result_cache_stats();
+    let out = PyDict::new(py);
+    out.set_item("hits", stats.hits)?;
+    out.set_item("misses", stats.misses)?;
+    out.set_item("evictions", stats.evictions)?;
+    out.set_item("entries", stats.entries)?;
+    out.set_item("bytes", stats.bytes)?;
+    out.set_item("budget_bytes", stats.budget_bytes)?;
+    Ok(out.into_any().unbind())
+}
+
+#[pyfunction]
+pub(crate) fn set_result_cache_budget(budget_bytes: usize) {
+    result_cache::set_result_cache_budget(budget_bytes);
+}
+
+#[pyfunction]
+pub(crate) fn clear_result_cache() {
+    result_cache::clear_result_cache();
+}
+
+/// Reads an `execute_plan_payload` dict. `options.outputs == "root"` skips
+/// materializing intermediate nodes and `options.threads` sets the worker
+/// count (`0` = one per core), defaulting to `default_threads`.
+fn parse_execution_payload(
+    payload: &Bound<'_, PyDict>,
+    default_threads: usize,
+) -> PyResult<(RustExecutionPayload, GraphExecOptions)> {
     let dataset_id: u64 = payload
         .get_item("dataset_id")?
         .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("missing dataset_id"))?
@@ -156,40 +479,6 @@ pub(crate) fn execute_plan_payload(
         .get_item("graph")?
         .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("missing graph"))?
         .downcast_into::<PyDict>()?;
-    let root_id: u32 = graph
-        .get_item("root_id")?
-        .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("missing graph.root_id"))?
-        .extract()?;
-    let node_order: Vec<u32> = graph
-        .get_item("node_order")?
-        .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("missing graph.node_order"))?
-        .extract()?;
-    let nodes_dict = graph
-        .get_item("nodes")?
-        .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("missing graph.nodes"))?
-        .downcast_into::<PyDict>()?;
-    let edges_dict = graph
-        .get_item("edges")?
-        .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("missing graph.edges"))?
-        .downcast_into::<PyDict>()?;
-
-    let mut nodes: BTreeMap<u32, BTreeMap<String, String>> = BTreeMap::new();
-    for (k, v) in nodes_dict.iter() {
-        let node_id = extract_node_id(&k)?;
-        let details = v.downcast::<PyDict>()?;
-        let mut map = BTreeMap::new();
-        for (dk, dv) in details.iter() {
-            map.insert(dk.extract::<String>()?, extract_scalar_string(&dv)?);
-        }
-        nodes.insert(node_id, map);
-    }
-
-    let mut edges = BTreeMap::new();
-    for (k, v) in edges_dict.iter() {
-        let node_id = extract_node_id(&k)?;
-        let child_ids: Vec<u32> = v.extract()?;
-        edges.insert(node_id, child_ids);
-    }
 
     let contract_payload = RustExecutionPayload {
         dataset_id,
@@ -198,15 +487,23 @@ pub(crate) fn execute_plan_payload(
             timeframe,
             source,
         },
-        graph: RustExecutionGraph {
-            root_id,
-            node_order,
-            nodes,
-            edges,
-        },
+        graph: parse_graph(&graph)?,
         requests: parse_contract_requests(&requests)?,
     };
-    let out =
-        backend::execute_plan_graph_payload(&contract_payload).map_err(map_execute_plan_error)?;
-    incremental_series_map_to_pydict(py, &out)
+    let mut options = GraphExecOptions {
+        root_only: false,
+        threads: default_threads,
+    };
+    if let Some(raw) = payload.get_item("options")? {
+        let raw = raw.downcast_into::<PyDict>()?;
+        if let Some(outputs) = raw.get_item("outputs")? {
+            options.root_only = outputs.extract::<String>()? == "root";
+        }
+        if let Some(threads) = raw.get_item("threads")? {
+            if !threads.is_none() {
+                options.threads = threads.extract()?;
+            }
+        }
+    }
+    Ok((contract_payload, options))
 }
@@ -1,3 +1,4 @@
 pub(crate) mod dataset;
 pub(crate) mod execution;
 pub(crate) mod indicators;
+pub(crate) mod series;
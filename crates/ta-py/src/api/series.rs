@@ -0,0 +1,79 @@
+use pyo3::prelude::*;
+use ta_engine::series_ops::{self, BinaryOp};
+
+use crate::buffers::{Columns, F64Input};
+use crate::errors::map_series_ops_error;
+
+#[pyfunction]
+pub(crate) fn series_binary(
+    py: Python<'_>,
+    op: &str,
+    left: F64Input,
+    right: F64Input,
+) -> PyResult<Columns<Vec<f64>>> {
+    let op = BinaryOp::parse(op).map_err(map_series_ops_error)?;
+    let out = py
+        .allow_threads(|| series_ops::binary(op, &left, &right))
+        .map_err(map_series_ops_error)?;
+    Ok(Columns::like(&left, out))
+}
+
+#[pyfunction]
+pub(crate) fn series_binary_scalar(
+    py: Python<'_>,
+    op: &str,
+    left: F64Input,
+    right: f64,
+) -> PyResult<Columns<Vec<f64>>> {
+    let op = BinaryOp::parse(op).map_err(map_series_ops_error)?;
+    let out = py
+        .allow_threads(|| series_ops::binary_scalar(op, &left, right))
+        .map_err(map_series_ops_error)?;
+    Ok(Columns::like(&left, out))
+}
+
+#[pyfunction]
+pub(crate) fn series_negate(py: Python<'_>, values: F64Input) -> Columns<Vec<f64>> {
+    Columns::compute(py, &values, || series_ops::negate(&values))
+}
+
+#[pyfunction]
+pub(crate) fn series_shift(py: Python<'_>, values: F64Input, periods: i64) -> Columns<Vec<f64>> {
+    Columns::compute(py, &values, || series_ops::shift(&values, periods))
+}
+
+#[pyfunction]
+pub(crate) fn series_change(py: Python<'_>, values: F64Input, periods: usize) -> Columns<Vec<f64>> {
+    Columns::compute(py, &values, || series_ops::change(&values, periods))
+}
+
+#[pyfunction]
+pub(crate) fn series_change_pct(
+    py: Python<'_>,
+    values: F64Input,
+    periods: usize,
+) -> Columns<Vec<f64>> {
+    Columns::compute(py, &values, || series_ops::change_pct(&values, periods))
+}
+
+/// `keep` is one byte per row, as stored by `AvailabilityMask`.
+#[pyfunction]
+pub(crate) fn series_filter(
+    py: Python<'_>,
+    values: F64Input,
+    keep: &[u8],
+) -> PyResult<Columns<Vec<f64>>> {
+    let out = py
+        .allow_threads(|| {
+            let keep: Vec<bool> = keep.iter().map(|flag| *flag != 0).collect();
+            series_ops::filter(&values, &keep)
+        })
+        .map_err(map_series_ops_error)?;
+    Ok(Columns::like(&values, out))
+}
+
+#[pyfunction]
+pub(crate) fn series_reduce(py: Python<'_>, values: F64Input, op: &str) -> PyResult<Option<f64>> {
+    py.allow_threads(|| series_ops::reduce(&values, op))
+        .map_err(map_series_ops_error)
+}
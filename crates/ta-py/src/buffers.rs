@@ -0,0 +1,296 @@
+//! Zero-copy column I/O for the indicator bindings.
+//!
+//! Inputs accept any float64 object exposing the buffer protocol
+//! (`array.array("d")`, `memoryview`, NumPy arrays, `BufferArray`) and borrow
+//! its memory while the kernel runs; plain sequences are still extracted into
+//! a `Vec<f64>`. Results for buffer inputs come back as `BufferArray`, which
+//! owns the Rust vector and exposes it through the buffer protocol, so
+//! `memoryview(out)` or `numpy.asarray(out)` read it in place. List inputs keep
+//! returning lists.
+//!
+//! Kernels run with the GIL released. A borrowed buffer stays exported for the
+//! whole call, so its exporter cannot resize or free it, but writing to the
+//! same array from another thread while the call runs gives unspecified
+//! results, as it does for NumPy's own GIL-free routines.
+
+use std::ffi::CStr;
+use std::ops::Deref;
+use std::os::raw::{c_int, c_void};
+
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyBufferError, PyIndexError};
+use pyo3::ffi;
+use pyo3::marker::Ungil;
+use pyo3::prelude::*;
+use pyo3::types::{PyList, PySlice, PyTuple};
+
+/// Float64 column argument, borrowed from a buffer when possible.
+pub(crate) struct F64Input {
+    source: InputSource,
+    buffered: bool,
+}
+
+enum InputSource {
+    Buffer(PyBuffer<f64>),
+    Owned(Vec<f64>),
+}
+
+impl F64Input {
+    /// Whether the caller passed a buffer rather than a sequence.
+    pub(crate) fn buffered(&self) -> bool {
+        self.buffered
+    }
+}
+
+impl<'py> FromPyObject<'py> for F64Input {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        if let Ok(buffer) = PyBuffer::<f64>::get(ob) {
+            let source = if buffer.dimensions() <= 1 && buffer.is_c_contiguous() {
+                InputSource::Buffer(buffer)
+            } else {
+                InputSource::Owned(buffer.to_vec(ob.py())?)
+            };
+            return Ok(Self {
+                source,
+                buffered: true,
+            });
+        }
+        Ok(Self {
+            source: InputSource::Owned(ob.extract()?),
+            buffered: false,
+        })
+    }
+}
+
+impl Deref for F64Input {
+    type Target = [f64];
+
+    fn deref(&self) -> &[f64] {
+        match &self.source {
+            InputSource::Buffer(buffer) if buffer.item_count() == 0 => &[],
+            // SAFETY: `PyBuffer::<f64>::get` checked the item size, format and
+            // alignment, the buffer is one-dimensional and C-contiguous, and the
+            // exporter keeps the memory alive until `buffer` is released.
+            InputSource::Buffer(buffer) => unsafe {
+                std::slice::from_raw_parts(buffer.buf_ptr() as *const f64, buffer.item_count())
+            },
+            InputSource::Owned(values) => values,
+        }
+    }
+}
+
+/// Binding result converted to lists or `BufferArray`s to match the input.
+pub(crate) struct Columns<T> {
+    value: T,
+    buffered: bool,
+}
+
+impl<T> Columns<T> {
+    pub(crate) fn like(input: &F64Input, value: T) -> Self {
+        Self {
+            value,
+            buffered: input.buffered(),
+        }
+    }
+
+    /// Runs `kernel` without holding the GIL and wraps its result like `input`.
+    pub(crate) fn compute(
+        py: Python<'_>,
+        input: &F64Input,
+        kernel: impl Ungil + FnOnce() -> T,
+    ) -> Self
+    where
+        T: Ungil,
+    {
+        Self::like(input, py.allow_threads(kernel))
+    }
+}
+
+pub(crate) trait IntoColumns {
+    fn into_columns(self, py: Python<'_>, buffered: bool) -> PyResult<Bound<'_, PyAny>>;
+}
+
+impl IntoColumns for Vec<f64> {
+    fn into_columns(self, py: Python<'_>, buffered: bool) -> PyResult<Bound<'_, PyAny>> {
+        if buffered {
+            Ok(Bound::new(py, BufferArray::new(ArrayData::F64(self)))?.into_any())
+        } else {
+            Ok(self.into_pyobject(py)?.into_any())
+        }
+    }
+}
+
+impl IntoColumns for Vec<bool> {
+    fn into_columns(self, py: Python<'_>, buffered: bool) -> PyResult<Bound<'_, PyAny>> {
+        if buffered {
+            Ok(Bound::new(py, BufferArray::new(ArrayData::Bool(self)))?.into_any())
+        } else {
+            Ok(self.into_pyobject(py)?.into_any())
+        }
+    }
+}
+
+macro_rules! tuple_into_columns {
+    ($($ty:ident $var:ident),+) => {
+        impl<$($ty: IntoColumns),+> IntoColumns for ($($ty,)+) {
+            fn into_columns(self, py: Python<'_>, buffered: bool) -> PyResult<Bound<'_, PyAny>> {
+                let ($($var,)+) = self;
+                let items = [$($var.into_columns(py, buffered)?),+];
+                Ok(PyTuple::new(py, items)?.into_any())
+            }
+        }
+    };
+}
+
+tuple_into_columns!(A a, B b);
+tuple_into_columns!(A a, B b, C c);
+tuple_into_columns!(A a, B b, C c, D d, E e);
+
+impl<'py, T: IntoColumns> IntoPyObject<'py> for Columns<T> {
+    type Target = PyAny;
+    type Output = Bound<'py, PyAny>;
+    type Error = PyErr;
+
+    fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
+        self.value.into_columns(py, self.buffered)
+    }
+}
+
+enum ArrayData {
+    F64(Vec<f64>),
+    Bool(Vec<bool>),
+}
+
+/// Read-only, one-dimensional column owned by Rust and exported through the
+/// buffer protocol (`format` `"d"` for floats, `"?"` for booleans).
+#[pyclass(module = "ta_py", frozen, sequence)]
+pub(crate) struct BufferArray {
+    data: ArrayData,
+    /// Shape and stride in the form `Py_buffer` points at; fixed at creation.
+    shape: [ffi::Py_ssize_t; 1],
+    strides: [ffi::Py_ssize_t; 1],
+}
+
+impl BufferArray {
+    fn new(data: ArrayData) -> Self {
+        let (len, itemsize) = match &data {
+            ArrayData::F64(values) => (values.len(), std::mem::size_of::<f64>()),
+            ArrayData::Bool(values) => (values.len(), std::mem::size_of::<bool>()),
+        };
+        Self {
+            data,
+            shape: [len as ffi::Py_ssize_t],
+            strides: [itemsize as ffi::Py_ssize_t],
+        }
+    }
+
+    fn len(&self) -> usize {
+        self.shape[0] as usize
+    }
+
+    fn format(&self) -> &'static CStr {
+        match self.data {
+            ArrayData::F64(_) => c"d",
+            ArrayData::Bool(_) => c"?",
+        }
+    }
+}
+
+#[pymethods]
+impl BufferArray {
+    fn __len__(&self) -> usize {
+        self.len()
+    }
+
+    fn __getitem__(&self, py: Python<'_>, index: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+        if let Ok(slice) = index.downcast::<PySlice>() {
+            let indices = slice.indices(self.len() as isize)?;
+            let rows = (0..indices.slicelength as isize)
+                .map(|i| (indices.start + i * indices.step) as usize);
+            return Ok(match &self.data {
+                ArrayData::F64(values) => PyList::new(py, rows.map(|row| values[row]))?,
+                ArrayData::Bool(values) => PyList::new(py, rows.map(|row| values[row]))?,
+            }
+            .into_any()
+            .unbind());
+        }
+        let index: isize = index.extract()?;
+        let len = self.len() as isize;
+        let row = if index < 0 { index + len } else { index };
+        if row < 0 || row >= len {
+            return Err(PyIndexError::new_err("BufferArray index out of range"));
+        }
+        let row = row as usize;
+        Ok(match &self.data {
+            ArrayData::F64(values) => values[row].into_pyobject(py)?.into_any().unbind(),
+            ArrayData::Bool(values) => values[row]
+                .into_pyobject(py)?
+                .to_owned()
+                .into_any()
+                .unbind(),
+        })
+    }
+
+    /// Buffer format character, as in `array.array.typecode`.
+    #[getter]
+    fn typecode(&self) -> &'static str {
+        match self.data {
+            ArrayData::F64(_) => "d",
+            ArrayData::Bool(_) => "?",
+        }
+    }
+
+    fn tolist(&self, py: Python<'_>) -> PyResult<PyObject> {
+        Ok(match &self.data {
+            ArrayData::F64(values) => PyList::new(py, values.iter().copied())?,
+            ArrayData::Bool(values) => PyList::new(py, values.iter().copied())?,
+        }
+        .into_any()
+        .unbind())
+    }
+
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("view is null"));
+        }
+        if (flags & ffi::PyBUF_WRITABLE) == ffi::PyBUF_WRITABLE {
+            return Err(PyBufferError::new_err("BufferArray is read-only"));
+        }
+        let array = slf.get();
+        let (buf, itemsize) = match &array.data {
+            ArrayData::F64(values) => (values.as_ptr() as *mut c_void, array.strides[0]),
+            ArrayData::Bool(values) => (values.as_ptr() as *mut c_void, array.strides[0]),
+        };
+        (*view).buf = buf;
+        (*view).len = array.shape[0] * itemsize;
+        (*view).readonly = 1;
+        (*view).itemsize = itemsize;
+        (*view).format = if (flags & ffi::PyBUF_FORMAT) == ffi::PyBUF_FORMAT {
+            array.format().as_ptr() as *mut _
+        } else {
+            std::ptr::null_mut()
+        };
+        (*view).ndim = 1;
+        (*view).shape = if (flags & ffi::PyBUF_ND) == ffi::PyBUF_ND {
+            array.shape.as_ptr() as *mut _
+        } else {
+            std::ptr::null_mut()
+        };
+        (*view).strides = if (flags & ffi::PyBUF_STRIDES) == ffi::PyBUF_STRIDES {
+            array.strides.as_ptr() as *mut _
+        } else {
+            std::ptr::null_mut()
+        };
+        (*view).suboffsets = std::ptr::null_mut();
+        (*view).internal = std::ptr::null_mut();
+        // The view keeps the array, and therefore the vector, alive.
+        (*view).obj = slf.into_any().into_ptr();
+        Ok(())
+    }
+
+    unsafe fn __releasebuffer__(&self, _view: *mut ffi::Py_buffer) {}
+}
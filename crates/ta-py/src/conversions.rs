@@ -2,8 +2,9 @@ use std::collections::BTreeMap;
 
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyDict, PyList};
-use ta_engine::contracts::RustExecutionRequest;
+use ta_engine::contracts::{RustExecutionGraph, RustExecutionRequest};
 use ta_engine::incremental::backend::KernelStepRequest;
+use ta_engine::incremental::columns::{ColumnData, NodeColumn};
 use ta_engine::incremental::contracts::IncrementalValue;
 use ta_engine::incremental::kernel_registry::KernelId;
 
@@ -105,6 +106,50 @@ pub(crate) fn parse_tick(tick: &Bound<'_, PyDict>) -> PyResult<BTreeMap<String,
     Ok(out)
 }
 
+pub(crate) fn parse_graph(graph: &Bound<'_, PyDict>) -> PyResult<RustExecutionGraph> {
+    let root_id: u32 = graph
+        .get_item("root_id")?
+        .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("missing graph.root_id"))?
+        .extract()?;
+    let node_order: Vec<u32> = graph
+        .get_item("node_order")?
+        .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("missing graph.node_order"))?
+        .extract()?;
+    let nodes_dict = graph
+        .get_item("nodes")?
+        .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("missing graph.nodes"))?
+        .downcast_into::<PyDict>()?;
+    let edges_dict = graph
+        .get_item("edges")?
+        .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("missing graph.edges"))?
+        .downcast_into::<PyDict>()?;
+
+    let mut nodes: BTreeMap<u32, BTreeMap<String, String>> = BTreeMap::new();
+    for (k, v) in nodes_dict.iter() {
+        let node_id = extract_node_id(&k)?;
+        let details = v.downcast::<PyDict>()?;
+        let mut map = BTreeMap::new();
+        for (dk, dv) in details.iter() {
+            map.insert(dk.extract::<String>()?, extract_scalar_string(&dv)?);
+        }
+        nodes.insert(node_id, map);
+    }
+
+    let mut edges = BTreeMap::new();
+    for (k, v) in edges_dict.iter() {
+        let node_id = extract_node_id(&k)?;
+        let child_ids: Vec<u32> = v.extract()?;
+        edges.insert(node_id, child_ids);
+    }
+
+    Ok(RustExecutionGraph {
+        root_id,
+        node_order,
+        nodes,
+        edges,
+    })
+}
+
 pub(crate) fn extract_node_id(value: &Bound<'_, PyAny>) -> PyResult<u32> {
     if let Ok(id) = value.extract::<u32>() {
         return Ok(id);
@@ -146,6 +191,7 @@ pub(crate) fn incremental_map_to_pydict(
             IncrementalValue::Bool(b) => d.set_item(k, b)?,
             IncrementalValue::Text(s) => d.set_item(k, s)?,
             IncrementalValue::Null => d.set_item(k, py.None())?,
+            IncrementalValue::Numbers(values) => d.set_item(k, values)?,
         }
     }
     Ok(d.into_any().unbind())
@@ -164,6 +210,7 @@ pub(crate) fn incremental_series_map_to_pydict(
                 IncrementalValue::Bool(b) => py_list.append(*b)?,
                 IncrementalValue::Text(s) => py_list.append(s)?,
                 IncrementalValue::Null => py_list.append(py.None())?,
+                IncrementalValue::Numbers(values) => py_list.append(values)?,
             }
         }
         d.set_item(k, py_list)?;
@@ -171,6 +218,42 @@ pub(crate) fn incremental_series_map_to_pydict(
     Ok(d.into_any().unbind())
 }
 
+/// Converts typed graph columns to Python lists without boxing every row into
+/// an `IncrementalValue` first.
+pub(crate) fn node_columns_to_pydict<'a>(
+    py: Python<'_>,
+    columns: impl IntoIterator<Item = (u32, &'a NodeColumn<'static>)>,
+) -> PyResult<PyObject> {
+    let d = PyDict::new(py);
+    for (k, column) in columns {
+        d.set_item(k, node_column_to_pylist(py, column)?)?;
+    }
+    Ok(d.into_any().unbind())
+}
+
+fn node_column_to_pylist<'py>(
+    py: Python<'py>,
+    column: &NodeColumn<'_>,
+) -> PyResult<Bound<'py, PyList>> {
+    let py_list = PyList::empty(py);
+    for row in 0..column.len() {
+        if column.is_null(row) {
+            py_list.append(py.None())?;
+            continue;
+        }
+        match column.data() {
+            ColumnData::Number(values) => py_list.append(values[row])?,
+            ColumnData::Bool(bits) => py_list.append(bits.get(row))?,
+            ColumnData::Scalar(IncrementalValue::Number(n)) => py_list.append(*n)?,
+            ColumnData::Scalar(IncrementalValue::Bool(b)) => py_list.append(*b)?,
+            ColumnData::Scalar(IncrementalValue::Text(s)) => py_list.append(s)?,
+            ColumnData::Scalar(IncrementalValue::Null) => py_list.append(py.None())?,
+            ColumnData::Scalar(IncrementalValue::Numbers(values)) => py_list.append(values)?,
+        }
+    }
+    Ok(py_list)
+}
+
 pub(crate) fn indicator_meta_to_pydict(
     py: Python<'_>,
     meta: &ta_engine::metadata::IndicatorMeta,
@@ -2,6 +2,8 @@ use pyo3::PyErr;
 use ta_engine::dataset::DatasetRegistryError;
 use ta_engine::dataset_ops::DatasetOpsError;
 use ta_engine::incremental::backend::ExecutePlanError;
+use ta_engine::incremental::snapshot_codec::SnapshotCodecError;
+use ta_engine::series_ops::SeriesOpsError;
 
 pub(crate) fn map_execute_plan_error(err: ExecutePlanError) -> PyErr {
     match err {
@@ -26,6 +28,16 @@ pub(crate) fn map_execute_plan_error(err: ExecutePlanError) -> PyErr {
         ExecutePlanError::UnsupportedKernelId(kernel_id) => {
             pyo3::exceptions::PyValueError::new_err(format!("unsupported kernel_id in payload: {kernel_id}"))
         }
+        ExecutePlanError::UnknownPlan(plan_id) => {
+            pyo3::exceptions::PyKeyError::new_err(format!("unknown plan id: {plan_id}"))
+        }
+    }
+}
+
+pub(crate) fn map_snapshot_codec_error(err: SnapshotCodecError) -> PyErr {
+    match err {
+        SnapshotCodecError::Io(inner) => inner.into(),
+        other => pyo3::exceptions::PyValueError::new_err(other.to_string()),
     }
 }
 
@@ -66,5 +78,29 @@ pub(crate) fn map_dataset_error(err: DatasetRegistryError) -> PyErr {
         DatasetRegistryError::EmptyField { field } => {
             pyo3::exceptions::PyValueError::new_err(format!("empty field not allowed: {field}"))
         }
+        DatasetRegistryError::UnknownPartition {
+            symbol,
+            timeframe,
+            source,
+        } => pyo3::exceptions::PyKeyError::new_err(format!(
+            "dataset partition not found for symbol={symbol} timeframe={timeframe} source={source}"
+        )),
+    }
+}
+
+pub(crate) fn map_series_ops_error(err: SeriesOpsError) -> PyErr {
+    match err {
+        SeriesOpsError::LengthMismatch => {
+            pyo3::exceptions::PyValueError::new_err("series must have identical lengths")
+        }
+        SeriesOpsError::DivisionByZero => {
+            pyo3::exceptions::PyZeroDivisionError::new_err("division by zero")
+        }
+        SeriesOpsError::UnsupportedOperator(op) => {
+            pyo3::exceptions::PyValueError::new_err(format!("unsupported series operator: {op}"))
+        }
+        SeriesOpsError::UnsupportedReduction(op) => {
+            pyo3::exceptions::PyValueError::new_err(format!("unsupported series reduction: {op}"))
+        }
     }
 }
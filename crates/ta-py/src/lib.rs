@@ -1,21 +1,38 @@
 use pyo3::prelude::*;
 
 mod api;
+mod buffers;
 mod conversions;
 mod errors;
 mod state;
 
 #[pymodule]
 fn ta_py(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<buffers::BufferArray>()?;
     m.add_function(wrap_pyfunction!(api::dataset::engine_version, m)?)?;
     m.add_function(wrap_pyfunction!(api::dataset::dataset_create, m)?)?;
     m.add_function(wrap_pyfunction!(api::dataset::dataset_drop, m)?)?;
     m.add_function(wrap_pyfunction!(api::dataset::dataset_append_ohlcv, m)?)?;
     m.add_function(wrap_pyfunction!(api::dataset::dataset_append_series, m)?)?;
+    m.add_function(wrap_pyfunction!(api::dataset::dataset_replace_ohlcv, m)?)?;
+    m.add_function(wrap_pyfunction!(api::dataset::dataset_replace_series, m)?)?;
+    m.add_function(wrap_pyfunction!(api::dataset::dataset_drop_partition, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        api::dataset::dataset_partition_version,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(api::dataset::dataset_info, m)?)?;
     m.add_function(wrap_pyfunction!(api::dataset::series_downsample, m)?)?;
     m.add_function(wrap_pyfunction!(api::dataset::series_upsample_ffill, m)?)?;
     m.add_function(wrap_pyfunction!(api::dataset::series_sync_timeframe, m)?)?;
+    m.add_function(wrap_pyfunction!(api::series::series_binary, m)?)?;
+    m.add_function(wrap_pyfunction!(api::series::series_binary_scalar, m)?)?;
+    m.add_function(wrap_pyfunction!(api::series::series_negate, m)?)?;
+    m.add_function(wrap_pyfunction!(api::series::series_shift, m)?)?;
+    m.add_function(wrap_pyfunction!(api::series::series_change, m)?)?;
+    m.add_function(wrap_pyfunction!(api::series::series_change_pct, m)?)?;
+    m.add_function(wrap_pyfunction!(api::series::series_filter, m)?)?;
+    m.add_function(wrap_pyfunction!(api::series::series_reduce, m)?)?;
     m.add_function(wrap_pyfunction!(api::dataset::indicator_catalog, m)?)?;
     m.add_function(wrap_pyfunction!(
         api::dataset::indicator_catalog_contract,
@@ -28,6 +45,8 @@ fn ta_py(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(api::indicators::rolling_std, m)?)?;
     m.add_function(wrap_pyfunction!(api::indicators::rolling_min, m)?)?;
     m.add_function(wrap_pyfunction!(api::indicators::rolling_max, m)?)?;
+    m.add_function(wrap_pyfunction!(api::indicators::rolling_median, m)?)?;
+    m.add_function(wrap_pyfunction!(api::indicators::rolling_quantile, m)?)?;
     m.add_function(wrap_pyfunction!(api::indicators::rolling_ema, m)?)?;
     m.add_function(wrap_pyfunction!(api::indicators::rolling_rma, m)?)?;
     m.add_function(wrap_pyfunction!(api::indicators::rolling_wma, m)?)?;
@@ -74,9 +93,47 @@ fn ta_py(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     m.add_function(wrap_pyfunction!(api::execution::incremental_initialize, m)?)?;
     m.add_function(wrap_pyfunction!(api::execution::incremental_step, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::incremental_step_batch, m)?)?;
     m.add_function(wrap_pyfunction!(api::execution::incremental_snapshot, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::incremental_drop, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::snapshot_drop, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::snapshot_set_capacity, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::registry_stats, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::incremental_restore, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        api::execution::incremental_snapshot_export,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        api::execution::incremental_snapshot_import,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        api::execution::incremental_snapshot_save,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(
+        api::execution::incremental_snapshot_load,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(api::execution::incremental_replay, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::incremental_load_graph, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::incremental_step_graph, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        api::execution::incremental_replay_graph,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(api::execution::execute_plan, m)?)?;
     m.add_function(wrap_pyfunction!(api::execution::execute_plan_payload, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::execute_plan_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::plan_register, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::plan_execute, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::plan_drop, m)?)?;
+    m.add_function(wrap_pyfunction!(api::execution::result_cache_stats, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        api::execution::set_result_cache_budget,
+        m
+    )?)?;
+    m.add_function(wrap_pyfunction!(api::execution::clear_result_cache, m)?)?;
     Ok(())
 }
@@ -1,51 +1,108 @@
 use std::collections::HashMap;
 use std::sync::atomic::{AtomicU64, Ordering};
-use std::sync::{Mutex, OnceLock};
+use std::sync::{Arc, Mutex, OnceLock, RwLock};
 
-use pyo3::exceptions::PyRuntimeError;
+use pyo3::exceptions::{PyKeyError, PyRuntimeError};
 use pyo3::prelude::PyResult;
 use ta_engine::incremental::backend::IncrementalBackend;
 use ta_engine::incremental::contracts::RuntimeSnapshot;
+use ta_engine::incremental::snapshot_store::{SnapshotStore, SnapshotStoreStats};
 
 static BACKEND_ID: AtomicU64 = AtomicU64::new(1);
 static SNAPSHOT_ID: AtomicU64 = AtomicU64::new(1);
-static BACKENDS: OnceLock<Mutex<HashMap<u64, IncrementalBackend>>> = OnceLock::new();
-static SNAPSHOTS: OnceLock<Mutex<HashMap<u64, RuntimeSnapshot>>> = OnceLock::new();
+/// Each backend sits behind its own lock, so stepping one backend never waits
+/// on another; the registry lock is only held to look a backend up.
+static BACKENDS: OnceLock<RwLock<HashMap<u64, Arc<Mutex<IncrementalBackend>>>>> = OnceLock::new();
+static SNAPSHOTS: OnceLock<Mutex<SnapshotStore>> = OnceLock::new();
 
 pub(crate) fn next_backend_id() -> u64 {
     BACKEND_ID.fetch_add(1, Ordering::SeqCst)
 }
 
-pub(crate) fn next_snapshot_id() -> u64 {
+fn next_snapshot_id() -> u64 {
     SNAPSHOT_ID.fetch_add(1, Ordering::SeqCst)
 }
 
-pub(crate) fn with_backends_mut<T>(
-    f: impl FnOnce(&mut HashMap<u64, IncrementalBackend>) -> T,
-) -> PyResult<T> {
-    let mut map = BACKENDS
-        .get_or_init(|| Mutex::new(HashMap::new()))
-        .lock()
-        .map_err(|_| PyRuntimeError::new_err("failed to lock backend registry"))?;
-    Ok(f(&mut map))
+fn backends() -> &'static RwLock<HashMap<u64, Arc<Mutex<IncrementalBackend>>>> {
+    BACKENDS.get_or_init(|| RwLock::new(HashMap::new()))
 }
 
-pub(crate) fn with_snapshots_mut<T>(
-    f: impl FnOnce(&mut HashMap<u64, RuntimeSnapshot>) -> T,
+fn snapshots() -> &'static Mutex<SnapshotStore> {
+    SNAPSHOTS.get_or_init(|| Mutex::new(SnapshotStore::default()))
+}
+
+pub(crate) fn insert_backend(id: u64, backend: IncrementalBackend) -> PyResult<()> {
+    backends()
+        .write()
+        .map_err(|_| PyRuntimeError::new_err("failed to lock backend registry"))?
+        .insert(id, Arc::new(Mutex::new(backend)));
+    Ok(())
+}
+
+/// Runs `f` with exclusive access to one backend.
+pub(crate) fn with_backend<T>(
+    backend_id: u64,
+    f: impl FnOnce(&mut IncrementalBackend) -> T,
 ) -> PyResult<T> {
-    let mut map = SNAPSHOTS
-        .get_or_init(|| Mutex::new(HashMap::new()))
+    let backend = backends()
+        .read()
+        .map_err(|_| PyRuntimeError::new_err("failed to lock backend registry"))?
+        .get(&backend_id)
+        .cloned()
+        .ok_or_else(|| PyKeyError::new_err(format!("backend id {backend_id} not found")))?;
+    let mut backend = backend
         .lock()
-        .map_err(|_| PyRuntimeError::new_err("failed to lock snapshot registry"))?;
-    Ok(f(&mut map))
+        .map_err(|_| PyRuntimeError::new_err(format!("failed to lock backend {backend_id}")))?;
+    Ok(f(&mut backend))
 }
 
-pub(crate) fn with_snapshots<T>(
-    f: impl FnOnce(&HashMap<u64, RuntimeSnapshot>) -> T,
-) -> PyResult<T> {
-    let map = SNAPSHOTS
-        .get_or_init(|| Mutex::new(HashMap::new()))
+/// Drops a backend; `false` when `backend_id` is unknown. Calls already
+/// holding the backend finish on their own reference.
+pub(crate) fn remove_backend(backend_id: u64) -> PyResult<bool> {
+    Ok(backends()
+        .write()
+        .map_err(|_| PyRuntimeError::new_err("failed to lock backend registry"))?
+        .remove(&backend_id)
+        .is_some())
+}
+
+/// Number of live backends and the bytes held by their node state. Each
+/// backend is locked in turn, never the whole registry at once.
+pub(crate) fn backend_stats() -> PyResult<(usize, usize)> {
+    let all: Vec<_> = backends()
+        .read()
+        .map_err(|_| PyRuntimeError::new_err("failed to lock backend registry"))?
+        .values()
+        .cloned()
+        .collect();
+    let mut bytes = 0;
+    for backend in &all {
+        let mut backend = backend
+            .lock()
+            .map_err(|_| PyRuntimeError::new_err("failed to lock backend"))?;
+        bytes += backend.state_bytes();
+    }
+    Ok((all.len(), bytes))
+}
+
+pub(crate) fn with_snapshots<T>(f: impl FnOnce(&mut SnapshotStore) -> T) -> PyResult<T> {
+    let mut store = snapshots()
         .lock()
         .map_err(|_| PyRuntimeError::new_err("failed to lock snapshot registry"))?;
-    Ok(f(&map))
+    Ok(f(&mut store))
+}
+
+pub(crate) fn insert_snapshot(snapshot: RuntimeSnapshot) -> PyResult<u64> {
+    let snapshot_id = next_snapshot_id();
+    with_snapshots(|store| store.insert(snapshot_id, snapshot))?;
+    Ok(snapshot_id)
+}
+
+pub(crate) fn cloned_snapshot(snapshot_id: u64) -> PyResult<RuntimeSnapshot> {
+    with_snapshots(|store| store.get(snapshot_id).cloned())?
+        .ok_or_else(|| PyKeyError::new_err(format!("snapshot id {snapshot_id} not found")))
+}
+
+pub(crate) fn snapshot_stats() -> PyResult<SnapshotStoreStats> {
+    with_snapshots(|store| store.stats())
 }
@@ -26,6 +26,8 @@ class IndicatorHandle:
         self.name = name
         self.params: dict[str, Any] = params
         self._registry = get_global_registry()
+        # Imports the indicator's category on first use
+        self._registry.get(name)
 
         if name not in self._registry._indicators:
             # Ensure indicators are loaded
@@ -291,7 +291,7 @@ class TASeries:
         # Ensure indicators are loaded
         _ensure_indicators_loaded()
 
-        if name in self._registry._indicators:
+        if self._registry.get(name) is not None and name in self._registry._indicators:
             indicator_func = self._registry._indicators[name]
 
             def indicator_wrapper(*args: Any, **kwargs: Any) -> Expression:
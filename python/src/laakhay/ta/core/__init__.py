@@ -9,6 +9,7 @@ from .context import (
 )
 from .dataset import Dataset, DatasetKey, DatasetMetadata, DatasetView, dataset
 from .ohlcv import OHLCV
+from .precision import PrecisionMode, get_precision, precision
 from .series import PriceSeries, QtySeries, Series, align_series
 from .timestamps import coerce_timestamp
 from .types import (
@@ -50,6 +51,9 @@ __all__ = [
     "coerce_rate",
     "coerce_timestamp",
     "align_series",
+    "precision",
+    "get_precision",
+    "PrecisionMode",
     "OHLCVContext",
     "TradeContext",
     "OrderBookContext",
@@ -0,0 +1,188 @@
+"""Compact columnar storage backing ``Series``.
+
+A compact series keeps its values in a contiguous float64 ``array``, its
+timestamps as int64 epoch milliseconds and its availability mask as one byte
+per row, about 17 bytes per point. The columns are read-only sequences that
+build ``Decimal`` values and UTC ``datetime`` objects only when an element is
+accessed, so they drop into code written against the tuple representation
+while the Rust kernels consume the raw buffers directly.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any, overload
+
+from .types import Price, Timestamp
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MS = timedelta(milliseconds=1)
+
+
+def as_f64_array(values: Any) -> array[float]:
+    """Return ``values`` as a float64 ``array``, copying only when needed.
+
+    Float64 buffers (``BufferArray``, ``memoryview``, NumPy arrays) are copied
+    with a single ``memcpy``; other iterables are converted element-wise.
+    """
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    if isinstance(values, Float64Values):
+        return values.buffer
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array("d", values)
+    out = array("d")
+    if view.format == "d" and view.ndim == 1 and view.c_contiguous:
+        out.frombytes(view)
+    else:
+        out.extend(view.tolist())
+    return out
+
+
+def timestamp_to_epoch_ms(ts: Timestamp) -> int:
+    """Exact epoch milliseconds for a UTC-aware (or naive UTC) datetime."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    return (ts - _EPOCH) // _ONE_MS
+
+
+def epoch_ms_to_timestamp(ms: int) -> Timestamp:
+    return _EPOCH + timedelta(milliseconds=ms)
+
+
+class _Column(Sequence[Any]):
+    """Shared sequence behaviour for the compact columns."""
+
+    __slots__ = ("_data",)
+
+    _data: Any
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, type(self)):
+            return self._data == other._data
+        if isinstance(other, Sequence) and not isinstance(other, str | bytes):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (self._data,))
+
+
+class Float64Values(_Column):
+    """Float64 values exposed as ``Price`` (``Decimal``) elements."""
+
+    __slots__ = ()
+
+    def __init__(self, values: Any) -> None:
+        self._data = as_f64_array(values)
+
+    @property
+    def buffer(self) -> array[float]:
+        """The underlying float64 array; do not mutate it."""
+        return self._data
+
+    @overload
+    def __getitem__(self, index: int) -> Price: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Float64Values: ...
+
+    def __getitem__(self, index: int | slice) -> Price | Float64Values:
+        if isinstance(index, slice):
+            return Float64Values(self._data[index])
+        return _to_price(self._data[index])
+
+    def __iter__(self) -> Iterator[Price]:
+        return map(_to_price, self._data)
+
+
+class EpochTimestamps(_Column):
+    """Int64 epoch milliseconds exposed as UTC ``datetime`` elements."""
+
+    __slots__ = ()
+
+    def __init__(self, millis: Iterable[int]) -> None:
+        self._data = millis if isinstance(millis, array) and millis.typecode == "q" else array("q", millis)
+
+    @classmethod
+    def from_timestamps(cls, timestamps: Iterable[Timestamp]) -> EpochTimestamps:
+        if isinstance(timestamps, EpochTimestamps):
+            return timestamps
+        return cls(timestamp_to_epoch_ms(ts) for ts in timestamps)
+
+    @property
+    def millis(self) -> array[int]:
+        """The underlying int64 epoch-millisecond array; do not mutate it."""
+        return self._data
+
+    def is_sorted(self) -> bool:
+        data = self._data
+        return all(data[i] <= data[i + 1] for i in range(len(data) - 1))
+
+    @overload
+    def __getitem__(self, index: int) -> Timestamp: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> EpochTimestamps: ...
+
+    def __getitem__(self, index: int | slice) -> Timestamp | EpochTimestamps:
+        if isinstance(index, slice):
+            return EpochTimestamps(self._data[index])
+        return epoch_ms_to_timestamp(self._data[index])
+
+    def __iter__(self) -> Iterator[Timestamp]:
+        return map(epoch_ms_to_timestamp, self._data)
+
+
+class AvailabilityMask(_Column):
+    """One byte per row availability flags exposed as ``bool`` elements."""
+
+    __slots__ = ()
+
+    def __init__(self, flags: Iterable[bool] | bytes) -> None:
+        self._data = flags if isinstance(flags, bytes) else bytes(bool(flag) for flag in flags)
+
+    @classmethod
+    def not_nan(cls, values: array[float]) -> AvailabilityMask:
+        """Rows whose value is not NaN."""
+        return cls(bytes(not math.isnan(v) for v in values))
+
+    def __and__(self, other: AvailabilityMask) -> AvailabilityMask:
+        """Row-wise AND over the whole byte string at once (flags are 0 or 1)."""
+        if not isinstance(other, AvailabilityMask):
+            return NotImplemented
+        size = len(self._data)
+        joined = int.from_bytes(self._data, "little") & int.from_bytes(other._data, "little")
+        return AvailabilityMask(joined.to_bytes(size, "little"))
+
+    @overload
+    def __getitem__(self, index: int) -> bool: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> AvailabilityMask: ...
+
+    def __getitem__(self, index: int | slice) -> bool | AvailabilityMask:
+        if isinstance(index, slice):
+            return AvailabilityMask(self._data[index])
+        return self._data[index] != 0
+
+    def __iter__(self) -> Iterator[bool]:
+        return (flag != 0 for flag in self._data)
+
+
+def _to_price(value: float) -> Price:
+    return Price("NaN") if math.isnan(value) else Price(str(value))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from array import array
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -40,8 +41,25 @@ def _to_epoch_millis(ts: Timestamp) -> int:
     return int(normalized.timestamp() * 1000)
 
 
-def _to_f64_list(values: tuple[Any, ...] | list[Any]) -> list[float]:
-    return [float(v) for v in values]
+def _appended_offset(previous: OHLCV | Series[Any], current: OHLCV | Series[Any]) -> int | None:
+    """Return ``len(previous)`` when ``current`` extends ``previous`` row-for-row, else ``None``."""
+    size = len(previous)
+    if current is previous:
+        return size
+    if len(current) < size or current.timestamps[:size] != previous.timestamps:
+        return None
+    if isinstance(previous, OHLCV) and isinstance(current, OHLCV):
+        columns = ("opens", "highs", "lows", "closes", "volumes")
+        if any(getattr(current, name)[:size] != getattr(previous, name) for name in columns):
+            return None
+        return size
+    if current.values[:size] != previous.values:
+        return None
+    return size
+
+
+def _to_f64_array(values: tuple[Any, ...] | list[Any]) -> array[float]:
+    return array("d", values)
 
 
 @dataclass(frozen=True)
@@ -136,10 +154,16 @@ class Dataset:
         series: OHLCV | Series[Any],
         source: str = "default",
     ) -> None:
-        """Add a series to the dataset."""
+        """Add a series to the dataset.
+
+        Re-adding a key whose stored series is a prefix of ``series`` only ships
+        the new tail rows to the Rust dataset; any other change replaces that
+        single partition. Other partitions are never touched.
+        """
         key = DatasetKey(symbol=symbol, timeframe=timeframe, source=source)
+        previous = self._series.get(key)
         self._series[key] = series
-        self._rebuild_rust_dataset()
+        self._sync_rust_partition(key, previous, series)
         self._context_cache.clear()
 
     def add(self, symbol: Symbol, timeframe: str, source: str, series: OHLCV | Series[Any]) -> None:
@@ -153,43 +177,67 @@ class Dataset:
     def rust_info(self) -> dict[str, int]:
         return dict(self._ta_py.dataset_info(self._rust_dataset_id))
 
-    def _append_to_rust(self, key: DatasetKey, series: OHLCV | Series[Any]) -> None:
-        timestamps = [_to_epoch_millis(ts) for ts in series.timestamps]
+    def partition_version(self, symbol: Symbol, timeframe: str, source: str = "default") -> int:
+        """Return the Rust-side version of a partition; it changes on every mutation."""
+        return int(self._ta_py.dataset_partition_version(self._rust_dataset_id, str(symbol), timeframe, source))
+
+    def _sync_rust_partition(
+        self,
+        key: DatasetKey,
+        previous: OHLCV | Series[Any] | None,
+        series: OHLCV | Series[Any],
+    ) -> None:
+        if previous is None:
+            self._write_to_rust(key, series, replace=False)
+            return
+        if isinstance(previous, OHLCV) != isinstance(series, OHLCV):
+            self._ta_py.dataset_drop_partition(self._rust_dataset_id, str(key.symbol), key.timeframe, key.source)
+            self._write_to_rust(key, series, replace=False)
+            return
+
+        start = _appended_offset(previous, series)
+        if start is None:
+            self._write_to_rust(key, series, replace=True)
+        elif start < len(series):
+            self._write_to_rust(key, series, replace=False, start=start)
+
+    def _write_to_rust(
+        self,
+        key: DatasetKey,
+        series: OHLCV | Series[Any],
+        *,
+        replace: bool,
+        start: int = 0,
+    ) -> None:
+        timestamps = [_to_epoch_millis(ts) for ts in series.timestamps[start:]]
         if isinstance(series, OHLCV):
-            self._ta_py.dataset_append_ohlcv(
+            write_ohlcv = self._ta_py.dataset_replace_ohlcv if replace else self._ta_py.dataset_append_ohlcv
+            write_ohlcv(
                 self._rust_dataset_id,
                 str(key.symbol),
                 key.timeframe,
                 key.source,
                 timestamps,
-                _to_f64_list(series.opens),
-                _to_f64_list(series.highs),
-                _to_f64_list(series.lows),
-                _to_f64_list(series.closes),
-                _to_f64_list(series.volumes),
+                _to_f64_array(series.opens[start:]),
+                _to_f64_array(series.highs[start:]),
+                _to_f64_array(series.lows[start:]),
+                _to_f64_array(series.closes[start:]),
+                _to_f64_array(series.volumes[start:]),
             )
             return
 
         field = key.source if key.source != SOURCE_DEFAULT else "value"
-        self._ta_py.dataset_append_series(
+        write_series = self._ta_py.dataset_replace_series if replace else self._ta_py.dataset_append_series
+        write_series(
             self._rust_dataset_id,
             str(key.symbol),
             key.timeframe,
             key.source,
             field,
             timestamps,
-            _to_f64_list(series.values),
+            _to_f64_array(series.values[start:]),
         )
 
-    def _rebuild_rust_dataset(self) -> None:
-        try:
-            self._ta_py.dataset_drop(self._rust_dataset_id)
-        except Exception:
-            pass
-        self._rust_dataset_id = int(self._ta_py.dataset_create())
-        for key in sorted(self._series.keys(), key=lambda k: (str(k.symbol), k.timeframe, k.source)):
-            self._append_to_rust(key, self._series[key])
-
     def __del__(self) -> None:
         dataset_id = getattr(self, "_rust_dataset_id", None)
         ta_py = getattr(self, "_ta_py", None)
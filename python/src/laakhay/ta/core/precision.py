@@ -0,0 +1,47 @@
+"""Numeric precision policy for ``Series`` arithmetic."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Literal, TypeAlias
+
+PrecisionMode: TypeAlias = Literal["auto", "float64", "decimal"]
+
+_MODES = ("auto", "float64", "decimal")
+
+
+class _Policy(threading.local):
+    def __init__(self) -> None:
+        self.mode: PrecisionMode = "auto"
+
+
+_policy = _Policy()
+
+
+def get_precision() -> PrecisionMode:
+    return _policy.mode
+
+
+@contextmanager
+def precision(mode: PrecisionMode) -> Iterator[None]:
+    """Temporarily select how ``Series`` operators compute values.
+
+    ``"auto"`` (the default) runs the Rust float64 kernels whenever an operand
+    is a compact series and keeps ``Decimal`` arithmetic for tuple-backed
+    series. ``"float64"`` uses the kernels for every numeric series, and
+    ``"decimal"`` forces exact per-element ``Decimal`` arithmetic.
+
+    Usage:
+        with precision("decimal"):
+            spread = left - right
+    """
+    if mode not in _MODES:
+        raise ValueError(f"Unsupported precision mode '{mode}'. Expected one of {_MODES}.")
+    prev = _policy.mode
+    try:
+        _policy.mode = mode
+        yield
+    finally:
+        _policy.mode = prev
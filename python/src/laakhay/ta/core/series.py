@@ -3,16 +3,52 @@
 from __future__ import annotations
 
 import decimal
-from collections.abc import Iterator
+from array import array
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import UTC
+from itertools import compress
 from typing import Any, Generic, Literal, TypeAlias, TypeVar
 
+from .columnar import AvailabilityMask, EpochTimestamps, Float64Values, as_f64_array
+from .precision import get_precision
 from .types import Price, Qty, Symbol, Timestamp
 
 T = TypeVar("T")
 
 
+def _load_ta_py() -> Any:
+    try:
+        import ta_py
+    except ImportError as exc:  # pragma: no cover - hard failure in runtime envs
+        raise RuntimeError("ta_py is required for float64 series arithmetic") from exc
+    return ta_py
+
+
+def _use_kernels(*operands: Any) -> bool:
+    """Whether the active precision mode routes ``operands`` to the Rust kernels."""
+    mode = get_precision()
+    if mode == "decimal":
+        return False
+    if mode == "float64":
+        return True
+    return any(isinstance(operand, Series) and operand.is_compact for operand in operands)
+
+
+def _f64_values(values: Sequence[Any]) -> array[float]:
+    """Float64 copy of ``values``, parsing non-numeric elements through ``Decimal``."""
+    try:
+        return as_f64_array(values)
+    except TypeError:
+        return array(
+            "d",
+            (
+                float(v) if isinstance(v, int | float | decimal.Decimal) else float(decimal.Decimal(str(v)))
+                for v in values
+            ),
+        )
+
+
 def _coerce_numeric_pair(v1: Any, v2: Any) -> tuple[Any, Any]:
     if isinstance(v1, decimal.Decimal) and isinstance(v2, float):
         return v1, decimal.Decimal(str(v2))
@@ -42,7 +78,10 @@ class Series(Generic[T]):
         if len(self.timestamps) != len(self.values):
             raise ValueError("Timestamps and values must have the same length")
 
-        if len(self.timestamps) > 1:
+        if isinstance(self.timestamps, EpochTimestamps):
+            if not self.timestamps.is_sorted():
+                raise ValueError("Timestamps must be sorted")
+        elif len(self.timestamps) > 1:
             if any(later < earlier for earlier, later in zip(self.timestamps, self.timestamps[1:], strict=False)):
                 raise ValueError("Timestamps must be sorted")
 
@@ -84,8 +123,107 @@ class Series(Generic[T]):
         """Iterate over (timestamp, value) pairs."""
         return zip(self.timestamps, self.values, strict=False)
 
+    def to_f64_array(self) -> array[float]:
+        """Values as a contiguous float64 buffer for the Rust kernels.
+
+        Compact series return their backing array without copying.
+        """
+        return as_f64_array(self.values)
+
+    @property
+    def is_compact(self) -> bool:
+        """Whether values are stored as a float64 column."""
+        return isinstance(self.values, Float64Values)
+
+    @classmethod
+    def from_f64(
+        cls,
+        values: Any,
+        *,
+        timestamps: Sequence[Timestamp],
+        symbol: Symbol,
+        timeframe: str,
+        availability_mask: Sequence[bool] | None = None,
+        mask_nan: bool = False,
+    ) -> Series[Any]:
+        """Build a compact series over float64 ``values``.
+
+        ``values`` may be any float64 buffer or iterable of floats. Timestamps
+        are stored as given, so compact timestamps of a source series are
+        shared. With ``mask_nan`` the availability mask marks NaN rows as
+        unavailable.
+        """
+        column = Float64Values(values)
+        mask: Sequence[bool] | None = availability_mask
+        if mask_nan:
+            mask = AvailabilityMask.not_nan(column.buffer)
+        elif mask is not None and not isinstance(mask, AvailabilityMask):
+            mask = AvailabilityMask(mask)
+        return cls(
+            timestamps=timestamps,  # type: ignore[arg-type]
+            values=column,  # type: ignore[arg-type]
+            symbol=symbol,
+            timeframe=timeframe,
+            availability_mask=mask,  # type: ignore[arg-type]
+        )
+
+    def compact(self) -> Series[Any]:
+        """Convert to float64 values, int64 epoch-ms timestamps and a byte mask.
+
+        Values read back as ``Decimal`` through ``str(float)``, and timestamps
+        are truncated to millisecond precision.
+        """
+        return Series.from_f64(
+            self.values,
+            timestamps=EpochTimestamps.from_timestamps(self.timestamps),
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            availability_mask=self.availability_mask,
+        )
+
+    def _kernel_binary(self, op: str, other: Series[Any] | Any, *, operation: str) -> Series[Any]:
+        """Apply ``op`` through the float64 kernels, returning a compact series."""
+        ta_py = _load_ta_py()
+        if isinstance(other, Series):
+            self._validate_series_alignment(other, operation=operation)
+            try:
+                values = ta_py.series_binary(op, self.to_f64_array(), other.to_f64_array())
+            except ZeroDivisionError:
+                raise ValueError(f"Cannot {operation} by zero in series") from None
+            mask = _and_masks(self.availability_mask, other.availability_mask)
+        else:
+            try:
+                scalar = float(other)  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                raise TypeError(f"Cannot {operation} series values with {type(other)}") from None
+            try:
+                values = ta_py.series_binary_scalar(op, self.to_f64_array(), scalar)
+            except ZeroDivisionError:
+                raise ValueError(f"Cannot {operation} by zero") from None
+            mask = self.availability_mask
+        return Series.from_f64(
+            values,
+            timestamps=self.timestamps,
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            availability_mask=mask,
+        )
+
+    def _kernel_extreme(self, op: str) -> Series[Any]:
+        """``max``/``min`` of a non-empty series over its non-NaN rows."""
+        value = _load_ta_py().series_reduce(self.to_f64_array(), op)
+        return Series.from_f64(
+            [float("nan") if value is None else value],
+            timestamps=(self.timestamps[0],),
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            mask_nan=True,
+        )
+
     def __add__(self, other: Series[T] | T) -> Series[T]:
         """Element-wise addition or scalar addition."""
+        if _use_kernels(self, other):
+            return self._kernel_binary("add", other, operation="add")
         if isinstance(other, Series):
             self._validate_series_alignment(other, operation="add")
             try:
@@ -126,6 +264,8 @@ class Series(Generic[T]):
 
     def __sub__(self, other: Series[T] | T) -> Series[T]:
         """Subtract scalar or element-wise subtract series."""
+        if _use_kernels(self, other):
+            return self._kernel_binary("sub", other, operation="subtract")
         if isinstance(other, Series):
             self._validate_series_alignment(other, operation="subtract")
             try:
@@ -167,6 +307,8 @@ class Series(Generic[T]):
 
     def __mul__(self, other: Series[T] | T) -> Series[T]:
         """Multiply series by scalar or element-wise multiply by series."""
+        if _use_kernels(self, other):
+            return self._kernel_binary("mul", other, operation="multiply")
         if isinstance(other, Series):
             self._validate_series_alignment(other, operation="multiply")
             try:
@@ -208,6 +350,8 @@ class Series(Generic[T]):
 
     def __truediv__(self, other: Series[T] | T) -> Series[T]:
         """Divide series by scalar or element-wise divide by series."""
+        if _use_kernels(self, other):
+            return self._kernel_binary("div", other, operation="divide")
         if isinstance(other, Series):
             self._validate_series_alignment(other, operation="divide")
             try:
@@ -253,6 +397,8 @@ class Series(Generic[T]):
 
     def __mod__(self, other: Series[T] | T) -> Series[T]:
         """Modulo operation between series or with scalar."""
+        if _use_kernels(self, other):
+            return self._kernel_binary("mod", other, operation="modulo")
         if isinstance(other, Series):
             self._validate_series_alignment(other, operation="modulo")
             try:
@@ -298,6 +444,8 @@ class Series(Generic[T]):
 
     def __pow__(self, other: Series[T] | T) -> Series[T]:
         """Power operation between series or with scalar exponent."""
+        if _use_kernels(self, other):
+            return self._kernel_binary("pow", other, operation="power")
         if isinstance(other, Series):
             self._validate_series_alignment(other, operation="power")
             try:
@@ -337,6 +485,14 @@ class Series(Generic[T]):
 
     def __neg__(self) -> Series[T]:
         """Unary negation of series."""
+        if _use_kernels(self):
+            return Series.from_f64(
+                _load_ta_py().series_negate(self.to_f64_array()),
+                timestamps=self.timestamps,
+                symbol=self.symbol,
+                timeframe=self.timeframe,
+                availability_mask=self.availability_mask,
+            )
         try:
             new_values_list = []
             for v in self.values:
@@ -407,6 +563,24 @@ class Series(Generic[T]):
             ValueError: If condition series is not aligned with this series.
         """
         self._validate_series_alignment(condition, operation="filter")
+        if _use_kernels(self):
+            keep = bytes(map(bool, condition.values))
+            if isinstance(self.timestamps, EpochTimestamps):
+                kept_timestamps: Sequence[Timestamp] = EpochTimestamps(
+                    array("q", compress(self.timestamps.millis, keep))
+                )
+            else:
+                kept_timestamps = tuple(compress(self.timestamps, keep))
+            return Series.from_f64(
+                _load_ta_py().series_filter(self.to_f64_array(), keep),
+                timestamps=kept_timestamps,
+                symbol=self.symbol,
+                timeframe=self.timeframe,
+                availability_mask=(
+                    None if self.availability_mask is None else tuple(compress(self.availability_mask, keep))
+                ),
+            )
+
         filtered_timestamps: list[Timestamp] = []
         filtered_values: list[T] = []
         filtered_mask: list[bool] | None = None if self.availability_mask is None else []
@@ -460,16 +634,9 @@ class Series(Generic[T]):
             Series with a single value representing the sum.
             For empty series, returns a series with a single value of 0.0.
         """
-        from decimal import Decimal
-
         # For now, sum the values directly
         # In the future, if values are structured objects, field can be used
-        if len(self.values) == 0:
-            total = 0.0
-        else:
-            total = sum(
-                float(Decimal(str(v))) if not isinstance(v, int | float | Decimal) else float(v) for v in self.values
-            )
+        total = _load_ta_py().series_reduce(_f64_values(self.values), "sum")
 
         # Always return a series with a single value
         # Use first timestamp if available, otherwise create a placeholder
@@ -497,8 +664,6 @@ class Series(Generic[T]):
         Returns:
             Series with a single value representing the average.
         """
-        from decimal import Decimal
-
         if len(self.values) == 0:
             return Series[float](
                 timestamps=(),
@@ -507,10 +672,7 @@ class Series(Generic[T]):
                 timeframe=self.timeframe,
             )
 
-        total = sum(
-            float(Decimal(str(v))) if not isinstance(v, int | float | Decimal) else float(v) for v in self.values
-        )
-        avg_value = total / len(self.values)
+        avg_value = _load_ta_py().series_reduce(_f64_values(self.values), "mean")
         return Series[float](
             timestamps=(self.timestamps[0],) if self.timestamps else (),
             values=(avg_value,),
@@ -535,6 +697,9 @@ class Series(Generic[T]):
                 timeframe=self.timeframe,
             )
 
+        if _use_kernels(self):
+            return self._kernel_extreme("max")
+
         max_value = max(self.values)
         return Series[T](
             timestamps=(self.timestamps[0],) if self.timestamps else (),
@@ -560,6 +725,9 @@ class Series(Generic[T]):
                 timeframe=self.timeframe,
             )
 
+        if _use_kernels(self):
+            return self._kernel_extreme("min")
+
         min_value = min(self.values)
         return Series[T](
             timestamps=(self.timestamps[0],) if self.timestamps else (),
@@ -596,6 +764,15 @@ class Series(Generic[T]):
                 availability_mask=self.availability_mask,
             )
 
+        if _use_kernels(self):
+            return Series.from_f64(
+                _load_ta_py().series_shift(self.to_f64_array(), periods),
+                timestamps=self.timestamps,
+                symbol=self.symbol,
+                timeframe=self.timeframe,
+                availability_mask=self.availability_mask,
+            )
+
         shifted_values: list[T] = list(self.values)
         if periods > 0:
             # Shift forward: move values to later timestamps
@@ -628,36 +805,9 @@ class Series(Generic[T]):
         Returns:
             Series with change values. First 'periods' values will be None/NaN.
         """
-        from decimal import Decimal
-
-        if len(self.values) < periods + 1:
-            return Series[float](
-                timestamps=self.timestamps,
-                values=tuple([float("nan")] * len(self.values)),
-                symbol=self.symbol,
-                timeframe=self.timeframe,
-            )
-
-        change_values: list[float] = []
-        for i in range(len(self.values)):
-            if i < periods:
-                change_values.append(float("nan"))
-            else:
-                current = (
-                    float(Decimal(str(self.values[i])))
-                    if not isinstance(self.values[i], int | float | Decimal)
-                    else float(self.values[i])
-                )
-                previous = (
-                    float(Decimal(str(self.values[i - periods])))
-                    if not isinstance(self.values[i - periods], int | float | Decimal)
-                    else float(self.values[i - periods])
-                )
-                change_values.append(current - previous)
-
         return Series[float](
             timestamps=self.timestamps,
-            values=tuple(change_values),
+            values=tuple(as_f64_array(_load_ta_py().series_change(_f64_values(self.values), periods))),
             symbol=self.symbol,
             timeframe=self.timeframe,
         )
@@ -671,39 +821,9 @@ class Series(Generic[T]):
         Returns:
             Series with percentage change values. First 'periods' values will be None/NaN.
         """
-        from decimal import Decimal
-
-        if len(self.values) < periods + 1:
-            return Series[float](
-                timestamps=self.timestamps,
-                values=tuple([float("nan")] * len(self.values)),
-                symbol=self.symbol,
-                timeframe=self.timeframe,
-            )
-
-        change_pct_values: list[float] = []
-        for i in range(len(self.values)):
-            if i < periods:
-                change_pct_values.append(float("nan"))
-            else:
-                current = (
-                    float(Decimal(str(self.values[i])))
-                    if not isinstance(self.values[i], int | float | Decimal)
-                    else float(self.values[i])
-                )
-                previous = (
-                    float(Decimal(str(self.values[i - periods])))
-                    if not isinstance(self.values[i - periods], int | float | Decimal)
-                    else float(self.values[i - periods])
-                )
-                if previous == 0:
-                    change_pct_values.append(float("nan"))
-                else:
-                    change_pct_values.append((current - previous) / previous * 100.0)
-
         return Series[float](
             timestamps=self.timestamps,
-            values=tuple(change_pct_values),
+            values=tuple(as_f64_array(_load_ta_py().series_change_pct(_f64_values(self.values), periods))),
             symbol=self.symbol,
             timeframe=self.timeframe,
         )
@@ -756,6 +876,8 @@ def _and_masks(a: tuple[bool, ...] | None, b: tuple[bool, ...] | None) -> tuple[
         return a
     if len(a) != len(b):
         raise ValueError("Cannot combine availability masks of different lengths")
+    if isinstance(a, AvailabilityMask) and isinstance(b, AvailabilityMask):
+        return a & b  # type: ignore[return-value]
     return tuple(x and y for x, y in zip(a, b, strict=False))
 
 
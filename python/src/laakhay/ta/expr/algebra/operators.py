@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from ...core import Series
-from ..execution.runner import evaluate_plan
+from ..execution.runner import evaluate_plan, evaluate_plan_many
 from ..ir.nodes import (
     BinaryOpNode,
     CallNode,
@@ -20,9 +20,9 @@ from ..planner.types import PlanResult, SignalRequirements
 class Expression:
     """Expression wrapper that enables operator overloading for Series objects."""
 
-    def __init__(self, node: CanonicalExpression):
+    def __init__(self, node: CanonicalExpression, plan: PlanResult | None = None):
         self._node = node
-        self._plan_cache: PlanResult | None = None
+        self._plan_cache: PlanResult | None = plan
 
     # ------------------------------------------------------------------
     # Arithmetic / logical operators
@@ -144,6 +144,11 @@ class Expression:
         plan = self._ensure_plan()
         return evaluate_plan(plan, data, return_all_outputs=return_all_outputs)
 
+    def run_many(self, data: Any, partitions: Any | None = None, timeframe: str | None = None) -> Any:
+        """Evaluate over many partitions of ``data`` (every symbol by default) in one backend call."""
+        plan = self._ensure_plan()
+        return evaluate_plan_many(plan, data, partitions, timeframe=timeframe)
+
     def requirements(self) -> SignalRequirements:
         return self._ensure_plan().requirements
 
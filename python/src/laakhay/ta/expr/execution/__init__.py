@@ -6,6 +6,7 @@ __all__ = [
     "resolve_execution_mode",
     "resolve_backend",
     "evaluate_plan",
+    "evaluate_plan_many",
     "Availability",
     "MissingInputPolicy",
     "ErrorPolicy",
@@ -33,10 +34,11 @@ def __getattr__(name: str):
             "resolve_backend": resolve_backend,
         }
         return exports[name]
-    if name == "evaluate_plan":
-        from .runner import evaluate_plan
+    if name in {"evaluate_plan", "evaluate_plan_many"}:
+        from .runner import evaluate_plan, evaluate_plan_many
 
-        return evaluate_plan
+        exports = {"evaluate_plan": evaluate_plan, "evaluate_plan_many": evaluate_plan_many}
+        return exports[name]
     if name in {
         "Availability",
         "MissingInputPolicy",
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import math
+import os
+import threading
+import weakref
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any
 
 import ta_py
@@ -8,23 +12,167 @@ import ta_py
 from ....core.dataset import Dataset
 from ....core.ohlcv import OHLCV
 from ....core.series import Series
+from ....registry.registry import on_registry_change
 from ...ir.nodes import CallNode
 from ...planner.manifest import build_rust_execution_payload
 from ...planner.types import PlanResult
 from .base import ExecutionBackend
 
+# Call names with a stateful Rust step kernel (see ``KernelId`` in ta-engine).
+INCREMENTAL_STEP_KERNELS = frozenset(
+    {
+        "select",
+        "sma",
+        "mean",
+        "rolling_mean",
+        "rolling_median",
+        "median",
+        "rolling_quantile",
+        "quantile",
+        "ema",
+        "rolling_ema",
+        "wma",
+        "rolling_wma",
+        "hma",
+        "rsi",
+        "roc",
+        "coppock",
+        "cmo",
+        "mfi",
+        "vortex",
+        "bbands",
+        "bb_upper",
+        "bb_lower",
+        "atr",
+        "donchian",
+        "keltner",
+        "stochastic",
+        "stoch_k",
+        "stoch_d",
+        "adx",
+        "macd",
+        "elder_ray",
+        "fisher",
+        "ichimoku",
+        "psar",
+        "supertrend",
+        "swing_high_at",
+        "swing_low_at",
+        "fib_level_down",
+        "fib_level_up",
+        "fib_down",
+        "crossup",
+        "crossdown",
+        "cross",
+        "rising",
+        "falling",
+        "rising_pct",
+        "falling_pct",
+        "in_channel",
+        "out",
+        "enter",
+        "exit",
+        "vwap",
+    }
+)
+
+# Rust plan handles by graph hash. A graph is validated and compiled into typed
+# Rust nodes on first evaluation; later evaluations only pass the handle.
+_PLAN_HANDLES: dict[str, int] = {}
+_PLAN_HANDLES_LOCK = threading.Lock()
+
+
+def _plan_handle(plan: PlanResult) -> int:
+    key = plan.graph_hash
+    with _PLAN_HANDLES_LOCK:
+        handle = _PLAN_HANDLES.get(key)
+    if handle is not None:
+        return handle
+    handle = ta_py.plan_register(plan.rust_graph)
+    with _PLAN_HANDLES_LOCK:
+        existing = _PLAN_HANDLES.setdefault(key, handle)
+    if existing != handle:
+        ta_py.plan_drop(handle)
+    return existing
+
+
+def _drop_plan_handles() -> None:
+    with _PLAN_HANDLES_LOCK:
+        handles = list(_PLAN_HANDLES.values())
+        _PLAN_HANDLES.clear()
+    for handle in handles:
+        try:
+            ta_py.plan_drop(handle)
+        except KeyError:
+            pass
+
+
+# Graph serialization depends on registered indicator metadata.
+on_registry_change(_drop_plan_handles)
+
+
+class IncrementalSnapshot:
+    """Handle to a snapshot held in the Rust snapshot registry.
+
+    The snapshot is released when the handle is garbage collected or
+    ``drop`` is called. With a snapshot capacity set (see
+    ``set_snapshot_capacity``), Rust may evict it earlier; using an evicted
+    snapshot raises ``KeyError``.
+    """
+
+    __slots__ = ("id", "_finalizer", "__weakref__")
+
+    def __init__(self, snapshot_id: int) -> None:
+        self.id = int(snapshot_id)
+        self._finalizer = weakref.finalize(self, ta_py.snapshot_drop, self.id)
+
+    def drop(self) -> None:
+        """Release the snapshot now instead of at garbage collection."""
+        self._finalizer()
+
+    def __repr__(self) -> str:
+        return f"IncrementalSnapshot(id={self.id})"
+
+
+def _snapshot_id(snapshot: IncrementalSnapshot | int) -> int:
+    return snapshot.id if isinstance(snapshot, IncrementalSnapshot) else int(snapshot)
+
 
 class IncrementalRustBackend(ExecutionBackend):
     """Rust-backed incremental backend bridge.
 
-    This backend intentionally handles incremental call-node kernels backed by
-    Rust lifecycle bindings first. Non-call graph semantics stay in the Python
-    incremental backend until parity migration is complete.
+    Batch evaluation registers each plan graph with Rust once and then runs
+    it by handle through ``plan_execute``. Pass ``threads=N`` (``0`` for one
+    per core) to evaluate independent branches of the graph in parallel with
+    the GIL released.
+
+    For tick-by-tick execution, plans accepted by ``can_step`` are compiled
+    into a Rust step graph that walks the planner order once per tick, so
+    operators, time shifts, filters, aggregates and events cost constant time
+    per bar. Other plans step through the flat call-kernel requests.
+
+    The Rust backend is released when this object is garbage collected or
+    re-initialized.
     """
 
     def __init__(self) -> None:
-        self._backend_id = ta_py.incremental_initialize()
+        self._finalizer: weakref.finalize | None = None
+        self._new_backend()
         self._requests: list[dict[str, Any]] = []
+        self._graph_loaded = False
+        self._event_index = 0
+
+    def _new_backend(self) -> None:
+        """Release the current Rust backend, if any, and allocate a fresh one."""
+        if self._finalizer is not None:
+            self._finalizer()
+        self._backend_id = ta_py.incremental_initialize()
+        self._finalizer = weakref.finalize(self, ta_py.incremental_drop, self._backend_id)
+
+    @property
+    def event_index(self) -> int:
+        """Number of ticks stepped since the last ``initialize``."""
+        return self._event_index
 
     def evaluate(
         self,
@@ -35,6 +183,7 @@ class IncrementalRustBackend(ExecutionBackend):
         **options: Any,
     ) -> Any:
         return_all_outputs = bool(options.get("return_all_outputs", False))
+        threads = options.get("threads")
         if not isinstance(dataset, Dataset):
             raise RuntimeError("IncrementalRustBackend requires Dataset input")
         if not self._can_execute_plan(plan):
@@ -45,8 +194,59 @@ class IncrementalRustBackend(ExecutionBackend):
             symbol=symbol,
             timeframe=timeframe,
             return_all_outputs=return_all_outputs,
+            threads=threads,
         )
 
+    def evaluate_many(
+        self,
+        plan: PlanResult,
+        dataset: Dataset,
+        partitions: Iterable[tuple[str, str] | tuple[str, str, str]] | None = None,
+        timeframe: str | None = None,
+        **options: Any,
+    ) -> dict[tuple[str, str, str], Series[Any]]:
+        """Evaluate one plan over many dataset partitions in a single Rust call.
+
+        ``partitions`` lists ``(symbol, timeframe)`` or ``(symbol, timeframe, source)``
+        keys; when omitted, every symbol in the dataset is evaluated, restricted
+        to ``timeframe`` when given. Partitions are spread across Rust worker
+        threads (one per core unless ``threads`` is passed) and the result maps
+        ``(symbol, timeframe, "default")`` to the root series of each partition,
+        like ``evaluate``.
+        """
+        if not isinstance(dataset, Dataset):
+            raise RuntimeError("IncrementalRustBackend requires Dataset input")
+        if not self._can_execute_plan(plan):
+            raise RuntimeError("plan contains unsupported nodes for rust graph execution backend")
+        _, _, source = self._resolve_partition(plan, dataset, None, None)
+        targets = None
+        if partitions is not None:
+            targets = [(str(key[0]), str(key[1]), str(key[2]) if len(key) > 2 else source) for key in partitions]
+        payload = build_rust_execution_payload(
+            plan,
+            dataset_id=dataset.rust_dataset_id,
+            symbol="*",
+            timeframe=timeframe or "*",
+            source=source,
+            requests=[],
+            root_only=True,
+            threads=options.get("threads"),
+        )
+        outputs = ta_py.execute_plan_batch(payload, targets)
+
+        root_id = int(plan.graph.root_id)
+        warmup = self.warmup_bars(plan)
+        results: dict[tuple[str, str, str], Series[Any]] = {}
+        for (part_symbol, part_timeframe, part_source), node_values in outputs.items():
+            root_values = node_values.get(root_id)
+            if root_values is None:
+                raise RuntimeError(f"execute_plan did not return output for root node {root_id}")
+            timestamps = _partition_timestamps(dataset, part_symbol, part_timeframe, part_source)
+            results[(part_symbol, part_timeframe, "default")] = _to_series(
+                root_values, timestamps, part_symbol, part_timeframe, warmup
+            )
+        return results
+
     def initialize(
         self,
         plan: PlanResult,
@@ -55,7 +255,18 @@ class IncrementalRustBackend(ExecutionBackend):
         timeframe: str | None = None,
         **options: Any,
     ) -> None:
+        self._new_backend()
         self._requests = self._build_requests(plan)
+        self._graph_loaded = self.can_step(plan)
+        if self._graph_loaded:
+            ta_py.incremental_load_graph(self._backend_id, plan.rust_graph)
+        self._event_index = 0
+        if not symbol or not timeframe:
+            return
+        ohlcv = history.series(symbol, timeframe, "ohlcv")
+        if not isinstance(ohlcv, OHLCV):
+            return
+        self.step_batch(plan, ohlcv_columns(ohlcv), last_only=True)
 
     def step(
         self,
@@ -65,51 +276,168 @@ class IncrementalRustBackend(ExecutionBackend):
         timeframe: str | None = None,
         **options: Any,
     ) -> dict[str, Any] | Any:
-        event_index = int(options.get("event_index", 0))
-        out = ta_py.incremental_step(self._backend_id, self._requests, tick, event_index)
+        event_index = int(options.get("event_index", self._event_index + 1))
+        self._event_index = event_index
+        if self._graph_loaded:
+            out = ta_py.incremental_step_graph(self._backend_id, tick, event_index)
+        else:
+            out = ta_py.incremental_step(self._backend_id, self._requests, tick, event_index)
         root_id = plan.graph.root_id
         return out.get(root_id)
 
+    def step_batch(
+        self,
+        plan: PlanResult,
+        columns: Mapping[str, Sequence[float]],
+        last_only: bool = False,
+    ) -> list[Any] | Any:
+        """Step every tick in ``columns`` with a single Rust call.
+
+        ``columns`` maps tick fields to equal-length float sequences, one entry
+        per tick (see ``ohlcv_columns``). Returns the root output of each tick,
+        or only the final one with ``last_only``. A batch the engine rejects
+        (for example ragged columns) steps none of its ticks, so the event
+        index only advances once the call succeeds.
+        """
+        columns = dict(columns)
+        rows = len(next(iter(columns.values()), ()))
+        first_event_index = self._event_index + 1
+        requests = None if self._graph_loaded else self._requests
+        out = ta_py.incremental_step_batch(self._backend_id, columns, first_event_index, requests, last_only=last_only)
+        self._event_index += rows
+        return out.get(plan.graph.root_id)
+
     def replay(
         self,
         plan: PlanResult,
-        snapshot: Any,
+        snapshot: IncrementalSnapshot | int,
         events: list[dict[str, Any]],
         symbol: str | None = None,
         timeframe: str | None = None,
         **options: Any,
     ) -> list[Any]:
-        rows = ta_py.incremental_replay(self._backend_id, snapshot, self._requests, events)
+        snapshot_id = _snapshot_id(snapshot)
+        if self._graph_loaded:
+            rows = ta_py.incremental_replay_graph(self._backend_id, snapshot_id, events)
+        else:
+            rows = ta_py.incremental_replay(self._backend_id, snapshot_id, self._requests, events)
         root_id = plan.graph.root_id
         return [row.get(root_id) for row in rows]
 
-    def snapshot(self, plan: PlanResult, **options: Any) -> Any:
-        return ta_py.incremental_snapshot(self._backend_id)
+    def snapshot(self, plan: PlanResult, **options: Any) -> IncrementalSnapshot:
+        return IncrementalSnapshot(ta_py.incremental_snapshot(self._backend_id))
+
+    def restore(self, plan: PlanResult, snapshot: IncrementalSnapshot | int, **options: Any) -> None:
+        """Resume ``plan`` from ``snapshot`` without replaying history.
+
+        ``snapshot`` comes from ``snapshot``, ``import_snapshot`` or
+        ``load_snapshot`` on a backend running the same plan; the next
+        ``step`` continues numbering after the snapshot's last tick.
+        """
+        self._new_backend()
+        self._requests = self._build_requests(plan)
+        self._graph_loaded = self.can_step(plan)
+        if self._graph_loaded:
+            ta_py.incremental_load_graph(self._backend_id, plan.rust_graph)
+        self._event_index = int(ta_py.incremental_restore(self._backend_id, _snapshot_id(snapshot)))
 
     def clear_cache(self) -> None:
-        self._backend_id = ta_py.incremental_initialize()
+        self._new_backend()
         self._requests = []
+        self._graph_loaded = False
+        self._event_index = 0
+
+    @staticmethod
+    def can_step(plan: PlanResult) -> bool:
+        """Whether every node of ``plan`` can be advanced tick-by-tick via ``step``."""
+        for graph_node in plan.graph.nodes.values():
+            node = graph_node.node
+            kind = type(node).__name__
+            if kind == "SourceRefNode":
+                if getattr(node, "field", None) not in _TICK_FIELDS:
+                    return False
+                if getattr(node, "source", None) not in {None, "ohlcv"}:
+                    return False
+                if any(getattr(node, attr, None) is not None for attr in ("symbol", "exchange", "timeframe")):
+                    return False
+                continue
+            if kind == "LiteralNode":
+                if not isinstance(getattr(node, "value", None), int | float | bool | str):
+                    return False
+                continue
+            if kind == "CallNode":
+                if not isinstance(node, CallNode) or node.name not in INCREMENTAL_STEP_KERNELS:
+                    return False
+                if node.name == "select" and _select_field(node) not in _TICK_FIELDS:
+                    return False
+                continue
+            if kind == "BinaryOpNode":
+                if getattr(node, "operator", None) not in _BINARY_OPERATORS:
+                    return False
+                continue
+            if kind == "UnaryOpNode":
+                if getattr(node, "operator", None) not in _UNARY_OPERATORS:
+                    return False
+                continue
+            if kind == "TimeShiftNode":
+                if getattr(node, "operation", None) not in _TIME_SHIFT_OPERATIONS:
+                    return False
+                continue
+            if kind == "FilterNode":
+                continue
+            if kind == "AggregateNode":
+                if getattr(node, "operation", None) not in _AGGREGATE_OPERATIONS:
+                    return False
+                continue
+            return False
+        return True
+
+    @staticmethod
+    def warmup_bars(plan: PlanResult) -> int:
+        """Leading bars masked as unavailable, shared by batch and step execution."""
+        if not plan.requirements.data_requirements:
+            return 0
+        warmup = max(int(req.min_lookback) for req in plan.requirements.data_requirements) - 1
+        return max(warmup, 0)
 
     @staticmethod
     def _build_requests(plan: PlanResult) -> list[dict[str, Any]]:
         requests: list[dict[str, Any]] = []
         for node_id in plan.node_order:
-            node = plan.graph.nodes[node_id].node
+            graph_node = plan.graph.nodes[node_id]
+            node = graph_node.node
             if not isinstance(node, CallNode):
                 continue
-            if node.name not in {"rsi", "atr", "stochastic", "vwap"}:
+            if node.name not in INCREMENTAL_STEP_KERNELS:
                 continue
 
+            # Inputs follow the graph executor: children in order, literals read close.
+            input_fields: list[str] = []
+            for child_id in graph_node.children:
+                child = plan.graph.nodes[child_id].node
+                if type(child).__name__ == "SourceRefNode" and getattr(child, "field", None):
+                    input_fields.append(str(child.field))
+                else:
+                    input_fields.append(_select_field(child) or "close")
+            input_field = input_fields[0] if input_fields else "close"
+
             kwargs: dict[str, Any] = {}
             for key, val in node.kwargs.items():
                 if hasattr(val, "value"):
-                    kwargs[key] = float(val.value)
+                    kwargs[key] = _kernel_param(val.value)
+            for index, arg in enumerate(node.args):
+                if type(arg).__name__ == "LiteralNode":
+                    kwargs[f"arg_{index}"] = _kernel_param(arg.value)
+            for index, field in enumerate(input_fields[1:3], start=1):
+                kwargs[f"input_{index}"] = field
+            if node.output:
+                kwargs["output"] = str(node.output)
 
             requests.append(
                 {
                     "node_id": int(node_id),
                     "kernel_id": node.name,
-                    "input_field": "close",
+                    "input_field": input_field,
                     "kwargs": kwargs,
                 }
             )
@@ -124,6 +452,8 @@ class IncrementalRustBackend(ExecutionBackend):
             "rolling_mean",
             "rolling_median",
             "median",
+            "rolling_quantile",
+            "quantile",
             "ema",
             "rolling_ema",
             "wma",
@@ -159,7 +489,6 @@ class IncrementalRustBackend(ExecutionBackend):
             "enter",
             "exit",
         }
-        allowed_binary = {"gt", "gte", "lt", "lte", "eq", "neq", "and", "or", "add", "sub", "mul", "div", "mod", "pow"}
         for graph_node in plan.graph.nodes.values():
             node = graph_node.node
             if type(node).__name__ == "SourceRefNode":
@@ -180,24 +509,24 @@ class IncrementalRustBackend(ExecutionBackend):
                 continue
             if type(node).__name__ == "BinaryOpNode":
                 op = getattr(node, "operator", None)
-                if op not in allowed_binary:
+                if op not in _BINARY_OPERATORS:
                     return False
                 continue
             if type(node).__name__ == "UnaryOpNode":
                 op = getattr(node, "operator", None)
-                if op not in {"not", "neg", "pos"}:
+                if op not in _UNARY_OPERATORS:
                     return False
                 continue
             if type(node).__name__ == "TimeShiftNode":
                 op = getattr(node, "operation", None)
-                if op not in {None, "change", "change_pct"}:
+                if op not in _TIME_SHIFT_OPERATIONS:
                     return False
                 continue
             if type(node).__name__ == "FilterNode":
                 continue
             if type(node).__name__ == "AggregateNode":
                 op = getattr(node, "operation", None)
-                if op not in {"count", "sum", "avg", "max", "min"}:
+                if op not in _AGGREGATE_OPERATIONS:
                     return False
                 continue
             return False
@@ -210,6 +539,7 @@ class IncrementalRustBackend(ExecutionBackend):
         symbol: str | None,
         timeframe: str | None,
         return_all_outputs: bool,
+        threads: int | None = None,
     ) -> Any:
         selected_symbol, selected_timeframe, selected_source = self._resolve_partition(
             plan,
@@ -217,66 +547,29 @@ class IncrementalRustBackend(ExecutionBackend):
             symbol,
             timeframe,
         )
-        payload = build_rust_execution_payload(
-            plan,
-            dataset_id=dataset.rust_dataset_id,
-            symbol=selected_symbol,
-            timeframe=selected_timeframe,
-            source=selected_source,
-            requests=[],
+        outputs = ta_py.plan_execute(
+            _plan_handle(plan),
+            dataset.rust_dataset_id,
+            (selected_symbol, selected_timeframe, selected_source),
+            root_only=not return_all_outputs,
+            threads=1 if threads is None else threads,
         )
-        outputs = ta_py.execute_plan_payload(payload)
 
         root_id = int(plan.graph.root_id)
         root_values = outputs.get(root_id)
         if root_values is None:
             raise RuntimeError(f"execute_plan did not return output for root node {root_id}")
 
-        series_obj = dataset.series(selected_symbol, selected_timeframe, selected_source)
-        if isinstance(series_obj, OHLCV):
-            timestamps = series_obj.timestamps
-        elif isinstance(series_obj, Series):
-            timestamps = series_obj.timestamps
-        else:
-            raise RuntimeError("execute_plan could not resolve timestamps for selected partition")
-
-        warmup = 0
-        if plan.requirements.data_requirements:
-            warmup = max(int(req.min_lookback) for req in plan.requirements.data_requirements) - 1
-            warmup = max(warmup, 0)
-
-        def _to_series(raw_values: list[Any]) -> Series[Any]:
-            normalized_values: list[Any] = []
-            for value in raw_values:
-                if isinstance(value, bool):
-                    normalized_values.append(value)
-                    continue
-                if isinstance(value, str):
-                    normalized_values.append(value)
-                    continue
-                if value is None:
-                    normalized_values.append(None)
-                    continue
-                number = float(value)
-                normalized_values.append(None if math.isnan(number) else number)
-            values = tuple(normalized_values)
-            availability_mask = [v is not None for v in values]
-            if warmup > 0:
-                for i in range(min(warmup, len(availability_mask))):
-                    availability_mask[i] = False
-            return Series[Any](
-                timestamps=timestamps,
-                values=values,
-                symbol=selected_symbol,
-                timeframe=selected_timeframe,
-                availability_mask=tuple(availability_mask),
-            )
-
-        series = _to_series(root_values)
+        warmup = self.warmup_bars(plan)
+        timestamps = _partition_timestamps(dataset, selected_symbol, selected_timeframe, selected_source)
+        series = _to_series(root_values, timestamps, selected_symbol, selected_timeframe, warmup)
         results = {(selected_symbol, selected_timeframe, "default"): series}
         if not return_all_outputs:
             return results
-        node_outputs = {int(node_id): _to_series(node_values) for node_id, node_values in outputs.items()}
+        node_outputs = {
+            int(node_id): _to_series(node_values, timestamps, selected_symbol, selected_timeframe, warmup)
+            for node_id, node_values in outputs.items()
+        }
         return results, node_outputs
 
     @staticmethod
@@ -338,3 +631,107 @@ class IncrementalRustBackend(ExecutionBackend):
             fields = ",".join(sorted(referenced_fields))
             raise RuntimeError(f"dataset does not contain required source field partitions: {fields}")
         raise RuntimeError("dataset must contain at least one partition for execute_plan")
+
+
+_TICK_FIELDS = frozenset({"open", "high", "low", "close", "volume"})
+_BINARY_OPERATORS = frozenset(
+    {"gt", "gte", "lt", "lte", "eq", "neq", "and", "or", "add", "sub", "mul", "div", "mod", "pow"}
+)
+_UNARY_OPERATORS = frozenset({"not", "neg", "pos"})
+_TIME_SHIFT_OPERATIONS = frozenset({None, "change", "change_pct"})
+_AGGREGATE_OPERATIONS = frozenset({"count", "sum", "avg", "max", "min"})
+
+
+def _partition_timestamps(dataset: Dataset, symbol: str, timeframe: str, source: str) -> tuple[Any, ...]:
+    series_obj = dataset.series(symbol, timeframe, source)
+    if isinstance(series_obj, OHLCV | Series):
+        return series_obj.timestamps
+    raise RuntimeError("execute_plan could not resolve timestamps for selected partition")
+
+
+def _to_series(raw_values: list[Any], timestamps: Any, symbol: str, timeframe: str, warmup: int) -> Series[Any]:
+    normalized_values: list[Any] = []
+    for value in raw_values:
+        if isinstance(value, bool):
+            normalized_values.append(value)
+            continue
+        if isinstance(value, str):
+            normalized_values.append(value)
+            continue
+        if value is None:
+            normalized_values.append(None)
+            continue
+        number = float(value)
+        normalized_values.append(None if math.isnan(number) else number)
+    values = tuple(normalized_values)
+    availability_mask = [v is not None for v in values]
+    if warmup > 0:
+        for i in range(min(warmup, len(availability_mask))):
+            availability_mask[i] = False
+    return Series[Any](
+        timestamps=timestamps,
+        values=values,
+        symbol=symbol,
+        timeframe=timeframe,
+        availability_mask=tuple(availability_mask),
+    )
+
+
+def _select_field(node: Any) -> str | None:
+    """Field read by a ``select`` call over the tick, or ``None`` for other nodes."""
+    if not isinstance(node, CallNode) or node.name != "select":
+        return None
+    field = node.kwargs.get("field")
+    value = getattr(field, "value", field)
+    return str(value) if value is not None else "close"
+
+
+def _kernel_param(value: Any) -> float | str:
+    if isinstance(value, str):
+        return value
+    return float(value)
+
+
+def ohlcv_columns(ohlcv: OHLCV) -> dict[str, list[float]]:
+    """Build the tick columns consumed by ``IncrementalRustBackend.step_batch``."""
+    return {
+        "open": [float(v) for v in ohlcv.opens],
+        "high": [float(v) for v in ohlcv.highs],
+        "low": [float(v) for v in ohlcv.lows],
+        "close": [float(v) for v in ohlcv.closes],
+        "volume": [float(v) for v in ohlcv.volumes],
+    }
+
+
+def ohlcv_tick(open_: Any, high: Any, low: Any, close: Any, volume: Any) -> dict[str, float]:
+    """Build the tick mapping consumed by ``ta_py.incremental_step``."""
+    return {
+        "open": float(open_),
+        "high": float(high),
+        "low": float(low),
+        "close": float(close),
+        "volume": float(volume),
+    }
+
+
+def export_snapshot(snapshot: IncrementalSnapshot | int) -> bytes:
+    """Encode a snapshot in the versioned, checksummed binary format."""
+    return ta_py.incremental_snapshot_export(_snapshot_id(snapshot))
+
+
+def import_snapshot(data: bytes) -> IncrementalSnapshot:
+    """Decode bytes from ``export_snapshot`` into a new snapshot.
+
+    Raises ``ValueError`` when the bytes are corrupt or from an unknown format version.
+    """
+    return IncrementalSnapshot(ta_py.incremental_snapshot_import(data))
+
+
+def save_snapshot(snapshot: IncrementalSnapshot | int, path: str | os.PathLike[str]) -> None:
+    """Write a snapshot to ``path`` atomically; a crash leaves the previous file intact."""
+    ta_py.incremental_snapshot_save(_snapshot_id(snapshot), os.fspath(path))
+
+
+def load_snapshot(path: str | os.PathLike[str]) -> IncrementalSnapshot:
+    """Read a snapshot written by ``save_snapshot``."""
+    return IncrementalSnapshot(ta_py.incremental_snapshot_load(os.fspath(path)))
@@ -19,11 +19,11 @@ class Engine:
     """Tiny evaluation engine.
 
     This initial version evaluates a single expression node against a
-    provided dataset. Future versions will add DAG scheduling and caching.
+    provided dataset. Indicator outputs shared between expressions are
+    memoized by the Rust backend (see ``expr.runtime.result_cache``).
     """
 
     def __init__(self) -> None:
-        self._cache: dict[int, Series[Any]] = {}
         self.backend = get_runtime_backend()
 
     def evaluate(self, expression: CanonicalExpression, dataset: Any) -> Any:
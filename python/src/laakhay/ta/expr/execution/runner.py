@@ -29,3 +29,24 @@ def evaluate_plan(
         raise TypeError(f"evaluate_plan requires Dataset input in rust-only runtime, got {type(data)}")
     exec_backend = resolve_backend(mode)
     return exec_backend.evaluate(plan, data, **options)
+
+
+def evaluate_plan_many(
+    plan: PlanResult,
+    data: Dataset,
+    partitions: Any | None = None,
+    *,
+    timeframe: str | None = None,
+    backend: Any | None = None,
+    mode: str | None = None,
+    **options: Any,
+) -> dict[tuple[str, str, str], Series[Any]]:
+    """Evaluate a plan over many dataset partitions with a single backend call.
+
+    `partitions` lists `(symbol, timeframe[, source])` keys; when omitted every
+    symbol in `data` is evaluated (restricted to `timeframe` when given).
+    """
+    if not isinstance(data, Dataset):
+        raise TypeError(f"evaluate_plan_many requires Dataset input, got {type(data)}")
+    exec_backend = backend if backend is not None else resolve_backend(mode)
+    return exec_backend.evaluate_many(plan, data, partitions, timeframe=timeframe, **options)
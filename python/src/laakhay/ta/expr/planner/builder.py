@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+from dataclasses import replace
 from typing import Any, Dict, Tuple
 
 from ..ir.nodes import (
@@ -20,6 +21,26 @@ from ..ir.nodes import (
 )
 from .types import Graph, GraphNode
 
+# Calls that read one output of a multi-output kernel, mapped to that kernel.
+_MULTI_OUTPUT_KERNELS: Dict[str, str] = {
+    "bbands": "bbands",
+    "bb_upper": "bbands",
+    "bb_lower": "bbands",
+    "stochastic": "stochastic",
+    "stoch_k": "stochastic",
+    "stoch_d": "stochastic",
+    "macd": "macd",
+    "adx": "adx",
+    "vortex": "vortex",
+    "donchian": "donchian",
+    "keltner": "keltner",
+    "elder_ray": "elder_ray",
+    "fisher": "fisher",
+    "ichimoku": "ichimoku",
+    "psar": "psar",
+    "supertrend": "supertrend",
+}
+
 
 def build_graph(root: CanonicalExpression) -> Graph:
     """Build a canonical graph representation for an expression node."""
@@ -88,6 +109,9 @@ def build_graph(root: CanonicalExpression) -> Graph:
             arg_sig = tuple(arg_sig_items)
 
             signature = ("CallNode", node.name, arg_sig, params_sig)
+            if node.output is not None:
+                # Different outputs of one indicator are different values.
+                signature += (node.output,)
             children = tuple(arg_children_ids + param_children_ids)
 
         elif isinstance(node, MemberAccessNode):
@@ -120,5 +144,31 @@ def build_graph(root: CanonicalExpression) -> Graph:
         return node_id, signature
 
     root_id, root_sig = visit(root)
+    _assign_kernel_groups(nodes)
     graph_hash = hashlib.sha1(repr(root_sig).encode("utf-8")).hexdigest()
     return Graph(root_id=root_id, nodes=nodes, hash=graph_hash)
+
+
+def _assign_kernel_groups(nodes: Dict[int, GraphNode]) -> None:
+    """Tag sibling calls that read outputs of the same kernel invocation.
+
+    ``bb_upper(20)`` and ``bb_lower(20)`` (or ``macd`` nodes selecting different
+    outputs) share a kernel run when their arguments match, so the executor
+    computes it once and hands each node its own output.
+    """
+    groups: Dict[Tuple[Any, ...], list[int]] = {}
+    for node_id, graph_node in nodes.items():
+        if not isinstance(graph_node.node, CallNode):
+            continue
+        kernel = _MULTI_OUTPUT_KERNELS.get(graph_node.node.name.lower())
+        if kernel is None:
+            continue
+        _, _, arg_sig, params_sig, *_ = graph_node.signature
+        groups.setdefault((kernel, arg_sig, params_sig), []).append(node_id)
+
+    for key, members in groups.items():
+        if len(members) < 2:
+            continue
+        group = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:16]
+        for node_id in members:
+            nodes[node_id] = replace(nodes[node_id], kernel_group=group)
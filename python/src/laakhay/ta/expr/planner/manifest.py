@@ -227,10 +227,19 @@ def build_rust_execution_payload(
     timeframe: str,
     source: str,
     requests: list[dict[str, Any]],
+    root_only: bool = False,
+    threads: int | None = None,
 ) -> dict[str, Any]:
-    """Build normalized DAG execution payload for Rust runtime."""
-    nodes = {str(node_id): _serialize_ir_node(graph_node.node) for node_id, graph_node in plan.graph.nodes.items()}
-    edges = {str(node_id): [int(c) for c in graph_node.children] for node_id, graph_node in plan.graph.nodes.items()}
+    """Build normalized DAG execution payload for Rust runtime.
+
+    With ``root_only`` the runtime returns only the root node's output and
+    frees intermediate node columns as soon as they are consumed. ``threads``
+    opts into parallel evaluation of independent graph branches (``0`` uses
+    one worker per core); by default the graph runs on the calling thread.
+    """
+    options: dict[str, Any] = {"outputs": "root"} if root_only else {}
+    if threads is not None:
+        options["threads"] = int(threads)
     return {
         "dataset_id": int(dataset_id),
         "partition": {
@@ -238,12 +247,7 @@ def build_rust_execution_payload(
             "timeframe": timeframe,
             "source": source,
         },
-        "graph": {
-            "root_id": int(plan.graph.root_id),
-            "node_order": [int(n) for n in plan.node_order],
-            "nodes": nodes,
-            "edges": edges,
-        },
+        "graph": plan.rust_graph,
         "requests": requests,
         "alignment": {
             "how": plan.alignment.how,
@@ -251,7 +255,22 @@ def build_rust_execution_payload(
             "left_fill_value": plan.alignment.left_fill_value,
             "right_fill_value": plan.alignment.right_fill_value,
         },
-        "options": {},
+        "options": options,
+    }
+
+
+def build_rust_execution_graph(plan: PlanResult) -> dict[str, Any]:
+    """Build the normalized DAG shared by batch execution and the Rust step graph."""
+    nodes = {str(node_id): _serialize_ir_node(graph_node.node) for node_id, graph_node in plan.graph.nodes.items()}
+    for node_id, graph_node in plan.graph.nodes.items():
+        if graph_node.kernel_group is not None:
+            nodes[str(node_id)]["kernel_group"] = graph_node.kernel_group
+    edges = {str(node_id): [int(c) for c in graph_node.children] for node_id, graph_node in plan.graph.nodes.items()}
+    return {
+        "root_id": int(plan.graph.root_id),
+        "node_order": [int(n) for n in plan.node_order],
+        "nodes": nodes,
+        "edges": edges,
     }
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 from ..ir.nodes import CanonicalExpression
@@ -17,6 +18,8 @@ class GraphNode:
     children: tuple[int, ...]
     signature: tuple[Any, ...]
     hash: str
+    # Shared by sibling calls that read different outputs of one kernel run.
+    kernel_group: str | None = None
 
 
 @dataclass(frozen=True)
@@ -69,6 +72,13 @@ class PlanResult:
     def graph_hash(self) -> str:
         return self.graph.hash
 
+    @cached_property
+    def rust_graph(self) -> dict[str, Any]:
+        """Rust execution DAG for this plan, serialized once and shared; treat as read-only."""
+        from .manifest import build_rust_execution_graph
+
+        return build_rust_execution_graph(self)
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize PlanResult to a dictionary for backend/frontend consumption."""
         return {
@@ -2,7 +2,10 @@
 
 from .analyze import AnalysisResult, analyze
 from .emission import IndicatorEmission, IndicatorInputBinding, IndicatorRenderHints
+from .plan_cache import CompiledPlan, PlanCacheInfo, clear_plan_cache, compile_plan, plan_cache_info
 from .preview import PreviewResult, preview
+from .result_cache import ResultCacheInfo, clear_result_cache, result_cache_info, set_result_cache_budget
+from .rust_registry import RegistryStats, registry_stats, set_snapshot_capacity
 from .stream import AvailabilityTransition, Stream, StreamUpdate
 from .validate import ExprValidationError, ValidationResult, validate
 
@@ -20,4 +23,16 @@ __all__ = [
     "AvailabilityTransition",
     "analyze",
     "AnalysisResult",
+    "compile_plan",
+    "CompiledPlan",
+    "PlanCacheInfo",
+    "plan_cache_info",
+    "clear_plan_cache",
+    "ResultCacheInfo",
+    "result_cache_info",
+    "set_result_cache_budget",
+    "clear_result_cache",
+    "RegistryStats",
+    "registry_stats",
+    "set_snapshot_capacity",
 ]
@@ -0,0 +1,145 @@
+"""Process-wide cache of compiled expression plans.
+
+Parsing, planning and serializing the Rust graph for an expression string is
+pure work given the text, the active alignment policy and the registered
+indicators. Services that evaluate the same strategy strings repeatedly can
+go through :func:`compile_plan` to pay that cost once per distinct string.
+The cache is cleared whenever the indicator registry changes.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from ...registry.registry import on_registry_change
+from ..algebra import Expression
+from ..dsl import compute_trim, extract_indicator_nodes, parse_expression_text
+from ..ir.nodes import CallNode
+from ..planner.planner import get_alignment_policy, plan_expression
+from ..planner.types import PlanResult
+
+_QUOTED = re.compile(r"""('[^']*'|"[^"]*")""")
+
+
+@dataclass(frozen=True)
+class CompiledPlan:
+    """Parsed, planned expression ready for evaluation.
+
+    Instances are shared between callers and must not be mutated.
+    """
+
+    text: str
+    expression: Expression
+    plan: PlanResult
+    rust_graph: dict[str, Any]
+    indicators: tuple[CallNode, ...]
+    trim: int
+
+
+@dataclass(frozen=True)
+class PlanCacheInfo:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class PlanCache:
+    """Thread-safe LRU map from (normalized text, alignment policy) to a compiled plan."""
+
+    def __init__(self, maxsize: int = 512) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[Any, ...], CompiledPlan] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_compile(self, text: str) -> CompiledPlan:
+        normalized = normalize_expression_text(text)
+        key = (normalized, get_alignment_policy().cache_key())
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return compiled
+            self._misses += 1
+
+        # Compile outside the lock; a concurrent miss on the same text only
+        # costs a duplicate compile.
+        compiled = _compile(normalized)
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> PlanCacheInfo:
+        with self._lock:
+            return PlanCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                maxsize=self._maxsize,
+            )
+
+
+def normalize_expression_text(text: str) -> str:
+    """Collapse runs of whitespace outside quoted literals."""
+    parts = _QUOTED.split(text)
+    return "".join(part if index % 2 else " ".join(part.split()) for index, part in enumerate(parts)).strip()
+
+
+def _compile(text: str) -> CompiledPlan:
+    node = parse_expression_text(text)
+    indicators = extract_indicator_nodes(node)
+    plan = plan_expression(node)
+    return CompiledPlan(
+        text=text,
+        expression=Expression(node, plan),
+        plan=plan,
+        rust_graph=plan.rust_graph,
+        indicators=tuple(indicators),
+        trim=compute_trim(indicators),
+    )
+
+
+_PLAN_CACHE = PlanCache()
+on_registry_change(_PLAN_CACHE.clear)
+
+
+def compile_plan(text: str) -> CompiledPlan:
+    """Parse, plan and serialize ``text``, reusing a cached result when available."""
+    return _PLAN_CACHE.get_or_compile(text)
+
+
+def plan_cache_info() -> PlanCacheInfo:
+    """Hit/miss counters and occupancy of the process-wide plan cache."""
+    return _PLAN_CACHE.info()
+
+
+def clear_plan_cache() -> None:
+    """Drop every cached plan; counters are kept."""
+    _PLAN_CACHE.clear()
+
+
+__all__ = [
+    "CompiledPlan",
+    "PlanCache",
+    "PlanCacheInfo",
+    "clear_plan_cache",
+    "compile_plan",
+    "normalize_expression_text",
+    "plan_cache_info",
+]
@@ -14,10 +14,10 @@ from ..dsl import (
     compile_expression,
     compute_trim,
     extract_indicator_nodes,
-    parse_expression_text,
 )
 from ..ir.nodes import CallNode
 from .emission import IndicatorEmission, build_indicator_emissions
+from .plan_cache import compile_plan
 
 
 @dataclass
@@ -77,15 +77,17 @@ def preview(
         ValueError: If neither bars nor dataset provided, or if bars provided without symbol/timeframe.
         StrategyError: If expression parsing or compilation fails.
     """
-    # Parse expression if string
+    # Expression text goes through the process-wide plan cache, so repeated
+    # previews of the same string skip parsing, planning and serialization.
     if isinstance(expression, str):
-        strategy_expr = parse_expression_text(expression)
+        compiled = compile_plan(expression)
+        compiled_expr = compiled.expression
+        indicator_nodes = list(compiled.indicators)
+        trim = compiled.trim
     else:
-        strategy_expr = expression
-
-    # Extract indicators and compute trim
-    indicator_nodes = extract_indicator_nodes(strategy_expr)
-    trim = compute_trim(indicator_nodes)
+        compiled_expr = compile_expression(expression)
+        indicator_nodes = extract_indicator_nodes(expression)
+        trim = compute_trim(indicator_nodes)
 
     # Normalize dataset input
     if dataset is None:
@@ -100,9 +102,6 @@ def preview(
     if trim > 0 and symbol and timeframe:
         dataset = trim_dataset(dataset, symbol=symbol, timeframe=timeframe, trim=trim)
 
-    # Compile expression
-    compiled_expr = compile_expression(strategy_expr)
-
     # Evaluate expression
     eval_result = compiled_expr.run(dataset, return_all_outputs=True)
     if isinstance(eval_result, tuple) and len(eval_result) == 2:
@@ -150,16 +149,6 @@ def preview(
     # Extract triggers (boolean True values)
     triggers = _extract_triggers(series)
 
-    # Get requirements if available
-    try:
-        from ..planner import plan_expression
-
-        plan = plan_expression(compiled_expr._node)
-        requirements = plan.requirements
-    except Exception:
-        plan = None
-        requirements = None
-
     return PreviewResult(
         series=series,
         triggers=triggers,
@@ -167,7 +156,7 @@ def preview(
         trim=trim,
         indicator_series=indicator_series,
         indicator_emissions=indicator_emissions,
-        requirements=requirements,
+        requirements=plan.requirements,
         plan=plan,
     )
 
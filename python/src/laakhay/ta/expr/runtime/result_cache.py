@@ -0,0 +1,53 @@
+"""Controls for the Rust-side cache of graph node outputs.
+
+Indicator calls evaluated by the Rust backend are memoized by dataset
+partition version and structural node signature, so strategies sharing a
+subexpression such as ``sma(close, 200)`` compute it once per data version.
+Entries for older versions are never hit again and are evicted least
+recently used first once the byte budget is exceeded.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import ta_py
+
+# Matches DEFAULT_RESULT_CACHE_BUDGET in ta-engine.
+DEFAULT_BUDGET_BYTES = 64 << 20
+
+
+@dataclass(frozen=True)
+class ResultCacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    budget_bytes: int
+
+
+def result_cache_info() -> ResultCacheInfo:
+    """Hit/miss counters and occupancy of the node result cache."""
+    return ResultCacheInfo(**ta_py.result_cache_stats())
+
+
+def set_result_cache_budget(budget_bytes: int) -> None:
+    """Cap the bytes held by cached node outputs; ``0`` disables the cache."""
+    if budget_bytes < 0:
+        raise ValueError("budget_bytes must be non-negative")
+    ta_py.set_result_cache_budget(budget_bytes)
+
+
+def clear_result_cache() -> None:
+    """Drop every cached node output; counters are kept."""
+    ta_py.clear_result_cache()
+
+
+__all__ = [
+    "DEFAULT_BUDGET_BYTES",
+    "ResultCacheInfo",
+    "clear_result_cache",
+    "result_cache_info",
+    "set_result_cache_budget",
+]
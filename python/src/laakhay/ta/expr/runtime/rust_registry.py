@@ -0,0 +1,43 @@
+"""Occupancy of the Rust-side backend, snapshot and plan registries.
+
+Incremental backends and snapshots live in Rust registries addressed by id.
+``IncrementalRustBackend`` and ``IncrementalSnapshot`` release their entries
+when garbage collected; these helpers report what is still held and can cap
+the number of snapshots kept, evicting least recently used ones first.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import ta_py
+
+
+@dataclass(frozen=True)
+class RegistryStats:
+    backends: int
+    backend_bytes: int
+    snapshots: int
+    snapshot_bytes: int
+    snapshot_capacity: int | None
+    snapshot_evictions: int
+    plans: int
+
+
+def registry_stats() -> RegistryStats:
+    """Counts and approximate bytes held by the Rust registries."""
+    return RegistryStats(**ta_py.registry_stats())
+
+
+def set_snapshot_capacity(capacity: int | None) -> None:
+    """Keep at most ``capacity`` snapshots; ``None`` (the default) keeps every snapshot."""
+    if capacity is not None and capacity <= 0:
+        raise ValueError("capacity must be positive")
+    ta_py.snapshot_set_capacity(capacity)
+
+
+__all__ = [
+    "RegistryStats",
+    "registry_stats",
+    "set_snapshot_capacity",
+]
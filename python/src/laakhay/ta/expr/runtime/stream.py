@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple
@@ -9,8 +10,10 @@ from typing import Any, Dict, List, Tuple
 from ...core.bar import Bar
 from ...core.dataset import Dataset
 from ...core.ohlcv import OHLCV
+from ...core.series import Series
 from ..algebra import Expression
 from ..execution.backend import resolve_backend
+from ..execution.backends.incremental_rust import IncrementalRustBackend, ohlcv_tick
 from ..execution.runner import evaluate_plan
 
 
@@ -34,32 +37,61 @@ class StreamUpdate:
 
 def _append_bar(ohlcv: OHLCV | None, bar: Bar, *, symbol: str, timeframe: str) -> OHLCV:
     """Append a bar to an OHLCV container, returning a new instance."""
+    return _append_bars(ohlcv, [bar], symbol=symbol, timeframe=timeframe)
+
+
+def _append_bars(ohlcv: OHLCV | None, bars: list[Bar], *, symbol: str, timeframe: str) -> OHLCV:
+    """Append several bars to an OHLCV container in a single copy."""
     if ohlcv is None or ohlcv.is_empty:
         return OHLCV(
-            timestamps=(bar.ts,),
-            opens=(bar.open,),
-            highs=(bar.high,),
-            lows=(bar.low,),
-            closes=(bar.close,),
-            volumes=(bar.volume,),
-            is_closed=(bar.is_closed,),
+            timestamps=tuple(bar.ts for bar in bars),
+            opens=tuple(bar.open for bar in bars),
+            highs=tuple(bar.high for bar in bars),
+            lows=tuple(bar.low for bar in bars),
+            closes=tuple(bar.close for bar in bars),
+            volumes=tuple(bar.volume for bar in bars),
+            is_closed=tuple(bar.is_closed for bar in bars),
             symbol=symbol,
             timeframe=timeframe,
         )
 
     return OHLCV(
-        timestamps=ohlcv.timestamps + (bar.ts,),
-        opens=ohlcv.opens + (bar.open,),
-        highs=ohlcv.highs + (bar.high,),
-        lows=ohlcv.lows + (bar.low,),
-        closes=ohlcv.closes + (bar.close,),
-        volumes=ohlcv.volumes + (bar.volume,),
-        is_closed=ohlcv.is_closed + (bar.is_closed,),
+        timestamps=ohlcv.timestamps + tuple(bar.ts for bar in bars),
+        opens=ohlcv.opens + tuple(bar.open for bar in bars),
+        highs=ohlcv.highs + tuple(bar.high for bar in bars),
+        lows=ohlcv.lows + tuple(bar.low for bar in bars),
+        closes=ohlcv.closes + tuple(bar.close for bar in bars),
+        volumes=ohlcv.volumes + tuple(bar.volume for bar in bars),
+        is_closed=ohlcv.is_closed + tuple(bar.is_closed for bar in bars),
         symbol=ohlcv.symbol,
         timeframe=ohlcv.timeframe,
     )
 
 
+def _step_series(raw: Any, timestamp: Any, symbol: str, timeframe: str, *, warm: bool) -> Series[Any]:
+    """One-bar series for a stepped output, typed like full evaluation.
+
+    Numbers go through ``Series.from_f64`` so they read back as ``Decimal``;
+    booleans and text are kept as they are.
+    """
+    if isinstance(raw, bool | str):
+        return Series[Any](
+            timestamps=(timestamp,),
+            values=(raw,),
+            symbol=symbol,
+            timeframe=timeframe,
+            availability_mask=(warm,),
+        )
+    number = math.nan if raw is None else float(raw)
+    return Series.from_f64(
+        (number,),
+        timestamps=(timestamp,),
+        symbol=symbol,
+        timeframe=timeframe,
+        availability_mask=(warm and not math.isnan(number),),
+    )
+
+
 def _ensure_bar(bar: Bar | Mapping[str, Any]) -> Bar:
     if isinstance(bar, Bar):
         return bar
@@ -67,20 +99,36 @@ def _ensure_bar(bar: Bar | Mapping[str, Any]) -> Bar:
 
 
 class Stream:
-    """Lightweight helper that tracks expressions over a mutating dataset."""
-
-    def __init__(self, dataset: Dataset | None = None):
+    """Lightweight helper that tracks expressions over a mutating dataset.
+
+    With ``incremental=True`` every registered plan that the Rust step graph
+    covers (indicators, operators, time shifts, filters, aggregates and
+    crossing events over OHLCV fields) is compiled once per symbol/timeframe
+    into its own incremental backend and advanced one bar at a time, so the
+    cost of ``update_ohlcv`` depends on graph size rather than history length.
+    Outputs for those expressions hold only the bars produced by the update,
+    with the same value types as full evaluation (``Decimal`` numbers);
+    transitions are identical to full re-evaluation. Other plans fall back to
+    full evaluation. Appended bars are buffered and written to the
+    dataset when it is next read through ``dataset`` or a full evaluation runs.
+    """
+
+    def __init__(self, dataset: Dataset | None = None, *, incremental: bool = False):
         self._dataset = dataset or Dataset()
         self._expressions: dict[str, Expression] = {}
         self._callbacks: dict[str, list[Callable[[AvailabilityTransition], None]]] = {}
 
         self._backend = resolve_backend()
+        self._incremental = incremental
+        self._steppers: dict[tuple[str, str, str], IncrementalRustBackend] = {}
+        self._pending_bars: dict[tuple[str, str], list[Bar]] = {}
 
         self._last_masks: dict[str, dict[Tuple[str, ...], bool]] = {}
         self._last_lengths: dict[str, dict[Tuple[str, ...], int]] = {}
 
     @property
     def dataset(self) -> Dataset:
+        self._flush_pending_bars()
         return self._dataset
 
     def register(
@@ -92,6 +140,7 @@ class Stream:
     ) -> None:
         """Register an expression to be tracked by the stream."""
         self._expressions[name] = expression
+        self._drop_steppers(name=name)
         if on_transition is not None:
             self._callbacks.setdefault(name, []).append(on_transition)
         self._last_masks.setdefault(name, {})
@@ -117,6 +166,9 @@ class Stream:
         if existing is not None and not isinstance(existing, OHLCV):
             raise TypeError(f"Existing series for {symbol} {timeframe} is not OHLCV; got {type(existing).__name__}")
 
+        if self._incremental:
+            return self._step_bar(symbol, timeframe, bar_obj)
+
         updated = _append_bar(existing, bar_obj, symbol=symbol, timeframe=timeframe)
         self._dataset.add_series(symbol, timeframe, updated, source="ohlcv")
         return self.evaluate()
@@ -129,11 +181,13 @@ class Stream:
         series,
     ) -> StreamUpdate:
         """Replace or add a derived series."""
-        self._dataset.add_series(symbol, timeframe, series, source)
+        self.dataset.add_series(symbol, timeframe, series, source)
+        self._drop_steppers(symbol=symbol, timeframe=timeframe)
         return self.evaluate()
 
     def evaluate(self) -> StreamUpdate:
         """Evaluate all registered expressions and return outputs + transitions."""
+        dataset = self.dataset
         # Reset backend cache so streaming updates reflect latest dataset state.
         self._backend.clear_cache()
         outputs: dict[str, Any] = {}
@@ -141,19 +195,86 @@ class Stream:
 
         for name, expr in self._expressions.items():
             plan = expr._ensure_plan()
-            result = evaluate_plan(plan, self._dataset, backend=self._backend)
+            result = evaluate_plan(plan, dataset, backend=self._backend)
             outputs[name] = result
             transitions.extend(self._collect_transitions(name, result))
 
+        return self._emit(outputs, transitions)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _emit(self, outputs: dict[str, Any], transitions: list[AvailabilityTransition]) -> StreamUpdate:
         for transition in transitions:
             for callback in self._callbacks.get(transition.expression, []):
                 callback(transition)
 
         return StreamUpdate(outputs=outputs, transitions=transitions)
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
+    def _step_bar(self, symbol: str, timeframe: str, bar: Bar) -> StreamUpdate:
+        plans = {name: expr._ensure_plan() for name, expr in self._expressions.items()}
+        # Warm any new steppers against history that excludes the incoming bar.
+        for name, plan in plans.items():
+            if IncrementalRustBackend.can_step(plan) and (name, symbol, timeframe) not in self._steppers:
+                stepper = IncrementalRustBackend()
+                stepper.initialize(plan, self.dataset, symbol=symbol, timeframe=timeframe)
+                self._steppers[(name, symbol, timeframe)] = stepper
+
+        self._pending_bars.setdefault((symbol, timeframe), []).append(bar)
+        tick = ohlcv_tick(bar.open, bar.high, bar.low, bar.close, bar.volume)
+        outputs: dict[str, Any] = {}
+        transitions: list[AvailabilityTransition] = []
+        fallback = False
+
+        for name, plan in plans.items():
+            stepper = self._steppers.get((name, symbol, timeframe))
+            if stepper is None:
+                fallback = True
+                continue
+            raw = stepper.step(plan, tick)
+            warm = stepper.event_index > IncrementalRustBackend.warmup_bars(plan)
+            result = {(symbol, timeframe, "default"): _step_series(raw, bar.ts, symbol, timeframe, warm=warm)}
+            outputs[name] = result
+            transitions.extend(self._collect_transitions(name, result))
+
+        if fallback:
+            dataset = self.dataset
+            self._backend.clear_cache()
+            for name, plan in plans.items():
+                if name in outputs:
+                    continue
+                result = evaluate_plan(plan, dataset, backend=self._backend)
+                outputs[name] = result
+                transitions.extend(self._collect_transitions(name, result))
+
+        return self._emit(outputs, transitions)
+
+    def _flush_pending_bars(self) -> None:
+        if not self._pending_bars:
+            return
+        pending, self._pending_bars = self._pending_bars, {}
+        for (symbol, timeframe), bars in pending.items():
+            existing = self._dataset.series(symbol, timeframe, source="ohlcv")
+            if existing is not None and not isinstance(existing, OHLCV):
+                raise TypeError(f"Existing series for {symbol} {timeframe} is not OHLCV; got {type(existing).__name__}")
+            updated = _append_bars(existing, bars, symbol=symbol, timeframe=timeframe)
+            self._dataset.add_series(symbol, timeframe, updated, source="ohlcv")
+
+    def _drop_steppers(
+        self,
+        *,
+        name: str | None = None,
+        symbol: str | None = None,
+        timeframe: str | None = None,
+    ) -> None:
+        for key in list(self._steppers):
+            key_name, key_symbol, key_timeframe = key
+            if name is not None and key_name != name:
+                continue
+            if symbol is not None and (key_symbol, key_timeframe) != (symbol, timeframe):
+                continue
+            del self._steppers[key]
 
     def _collect_transitions(self, name: str, result: Any) -> list[AvailabilityTransition]:
         transitions: list[AvailabilityTransition] = []
@@ -1,6 +1,8 @@
 """Indicator registry and implementation imports.
 
-Internal module: imports here trigger registration of all indicators and primitives.
+Internal module: importing it registers the primitives and declares every
+indicator with the registry. Each category package (trend, momentum, ...) is
+imported, and its indicators registered, on first lookup or attribute access.
 For public API use laakhay.ta (e.g., ta.sma(20), indicator("sma", period=20)).
 
 Exports are intended for:
@@ -8,6 +10,9 @@ Exports are intended for:
 - Advanced users constructing expressions programmatically (Expression, Literal)
 """
 
+from importlib import import_module
+from typing import Any
+
 # Import core dependencies once
 # Ensure namespace-level indicators (e.g., select) are registered
 from ..api.namespace import _select_indicator  # noqa: F401
@@ -40,43 +45,96 @@ from ..primitives.rolling_ops import (
 )
 from ..primitives.select import select
 from ..registry.models import SeriesContext
-from ..registry.registry import register
+from ..registry.registry import get_global_registry, register
 
-# Import event patterns
-from .events import (
-    cross,
-    crossdown,
-    crossup,
-    enter,
-    exit,
-    falling,
-    falling_pct,
-    in_channel,
-    out,
-    rising,
-    rising_pct,
-)
-from .momentum.adx import adx
-from .momentum.cci import cci
-from .momentum.roc import roc
-from .momentum.rsi import rsi
-from .momentum.stochastic import stochastic
-from .momentum.williams_r import williams_r
-from .pattern.fib import fib_anchor_high, fib_anchor_low, fib_level_down, fib_level_up, fib_retracement
-from .pattern.swing import swing_high_at, swing_highs, swing_low_at, swing_lows, swing_points
-from .trend.bbands import bbands
-from .trend.ema import ema
-from .trend.ichimoku import ichimoku
-from .trend.macd import macd
+# Registered names and aliases of each indicator category. A category
+# package is imported, registering all of its indicators, on the first lookup
+# of one of them (see Registry.declare_lazy); keep in sync with the specs.
+INDICATOR_CATEGORIES: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "events": (
+        (
+            "crossup",
+            "crossdown",
+            "cross",
+            "in_channel",
+            "out",
+            "enter",
+            "exit",
+            "rising",
+            "falling",
+            "rising_pct",
+            "falling_pct",
+        ),
+        ("in",),
+    ),
+    "momentum": (
+        (
+            "adx",
+            "ao",
+            "cci",
+            "cmo",
+            "coppock",
+            "mfi",
+            "roc",
+            "rsi",
+            "stochastic",
+            "stoch_k",
+            "stoch_d",
+            "vortex",
+            "williams_r",
+        ),
+        ("stoch",),
+    ),
+    "pattern": (
+        (
+            "swing_points",
+            "swing_highs",
+            "swing_lows",
+            "swing_high_at",
+            "swing_low_at",
+            "fib_retracement",
+            "fib_anchor_high",
+            "fib_anchor_low",
+            "fib_level_down",
+            "fib_level_up",
+        ),
+        ("fib_high_anchor", "fib_low_anchor", "fib_down_level", "fib_down", "fib_up_level", "fib_up"),
+    ),
+    "trend": (
+        (
+            "sma",
+            "ema",
+            "wma",
+            "hma",
+            "macd",
+            "bbands",
+            "bb_upper",
+            "bb_lower",
+            "supertrend",
+            "ichimoku",
+            "psar",
+            "elder_ray",
+            "fisher",
+        ),
+        ("bb",),
+    ),
+    "volatility": (("atr", "donchian", "keltner"), ()),
+    "volume": (("obv", "vwap", "cmf", "klinger"), ()),
+}
+
+for _category, (_names, _aliases) in INDICATOR_CATEGORIES.items():
+    get_global_registry().declare_lazy(f"{__name__}.{_category}", _names, _aliases)
+
+
+def __getattr__(name: str) -> Any:
+    """Indicator functions, importing their category package on first access."""
+    if name in INDICATOR_CATEGORIES:
+        return import_module(f".{name}", __name__)
+    for category, (names, _) in INDICATOR_CATEGORIES.items():
+        if name in names:
+            return getattr(import_module(f".{category}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Import all indicators
-from .trend.sma import sma
-from .trend.supertrend import supertrend
-from .volatility.atr import atr
-from .volatility.keltner import keltner
-from .volume.cmf import cmf
-from .volume.obv import obv
-from .volume.vwap import vwap
 
 __all__ = [
     # Core types
@@ -5,8 +5,20 @@ from ..core import Series as CoreSeries
 from ..core.types import Price
 
 
-def results_to_series(results: list[float], ctx_series: CoreSeries[Any], value_class: type = Price) -> CoreSeries[Any]:
-    """Converts a list of floats (with optional NaNs) from Rust to a CoreSeries."""
+def results_to_series(results: Any, ctx_series: CoreSeries[Any], value_class: type = Price) -> CoreSeries[Any]:
+    """Converts float64 results (with optional NaNs) from Rust to a CoreSeries.
+
+    Decimal results are stored as a compact float64 column; NaN rows are
+    marked unavailable.
+    """
+    if value_class is Price:
+        return CoreSeries.from_f64(
+            results,
+            timestamps=ctx_series.timestamps,
+            symbol=ctx_series.symbol,
+            timeframe=ctx_series.timeframe,
+            mask_nan=True,
+        )
     mask = tuple(not math.isnan(v) for v in results)
     values = tuple(value_class("NaN") if math.isnan(v) else value_class(str(v)) for v in results)
 
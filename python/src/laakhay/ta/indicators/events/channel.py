@@ -109,9 +109,9 @@ def in_channel(
     price_aligned, upper_aligned, lower_aligned = aligned
 
     out = ta_py.in_channel(
-        [float(v) for v in price_aligned.values],
-        [float(v) for v in upper_aligned.values],
-        [float(v) for v in lower_aligned.values],
+        price_aligned.to_f64_array(),
+        upper_aligned.to_f64_array(),
+        lower_aligned.to_f64_array(),
     )
     return _bool_values_to_series(out, price_aligned)
 
@@ -175,9 +175,9 @@ def out(
     price_aligned, upper_aligned, lower_aligned = aligned
 
     out_vals = ta_py.out_channel(
-        [float(v) for v in price_aligned.values],
-        [float(v) for v in upper_aligned.values],
-        [float(v) for v in lower_aligned.values],
+        price_aligned.to_f64_array(),
+        upper_aligned.to_f64_array(),
+        lower_aligned.to_f64_array(),
     )
     return _bool_values_to_series(out_vals, price_aligned)
 
@@ -255,9 +255,9 @@ def enter(
     price_aligned, upper_aligned, lower_aligned = aligned
 
     out_vals = ta_py.enter_channel(
-        [float(v) for v in price_aligned.values],
-        [float(v) for v in upper_aligned.values],
-        [float(v) for v in lower_aligned.values],
+        price_aligned.to_f64_array(),
+        upper_aligned.to_f64_array(),
+        lower_aligned.to_f64_array(),
     )
     return _bool_values_to_series(out_vals, price_aligned)
 
@@ -334,8 +334,8 @@ def exit(
     price_aligned, upper_aligned, lower_aligned = aligned
 
     out_vals = ta_py.exit_channel(
-        [float(v) for v in price_aligned.values],
-        [float(v) for v in upper_aligned.values],
-        [float(v) for v in lower_aligned.values],
+        price_aligned.to_f64_array(),
+        upper_aligned.to_f64_array(),
+        lower_aligned.to_f64_array(),
     )
     return _bool_values_to_series(out_vals, price_aligned)
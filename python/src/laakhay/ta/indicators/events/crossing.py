@@ -100,8 +100,8 @@ def crossup(
         )
 
     out = ta_py.crossup(
-        [float(v) for v in a_aligned.values],
-        [float(v) for v in b_aligned.values],
+        a_aligned.to_f64_array(),
+        b_aligned.to_f64_array(),
     )
     return _bool_values_to_series(out, a_aligned)
 
@@ -170,8 +170,8 @@ def crossdown(
         )
 
     out = ta_py.crossdown(
-        [float(v) for v in a_aligned.values],
-        [float(v) for v in b_aligned.values],
+        a_aligned.to_f64_array(),
+        b_aligned.to_f64_array(),
     )
     return _bool_values_to_series(out, a_aligned)
 
@@ -222,7 +222,7 @@ def cross(
     except ValueError:
         return Series[bool](timestamps=(), values=(), symbol=a_series.symbol, timeframe=a_series.timeframe)
     out = ta_py.cross(
-        [float(v) for v in a_aligned.values],
-        [float(v) for v in b_aligned.values],
+        a_aligned.to_f64_array(),
+        b_aligned.to_f64_array(),
     )
     return _bool_values_to_series(out, a_aligned)
@@ -80,7 +80,7 @@ def rising(
             timeframe=a_series.timeframe,
         )
 
-    out = ta_py.rising([float(v) for v in a_series.values])
+    out = ta_py.rising(a_series.to_f64_array())
     return _bool_values_to_series(out, a_series)
 
 
@@ -132,7 +132,7 @@ def falling(
             timeframe=a_series.timeframe,
         )
 
-    out = ta_py.falling([float(v) for v in a_series.values])
+    out = ta_py.falling(a_series.to_f64_array())
     return _bool_values_to_series(out, a_series)
 
 
@@ -189,7 +189,7 @@ def rising_pct(
             timeframe=a_series.timeframe,
         )
 
-    out = ta_py.rising_pct([float(v) for v in a_series.values], float(pct))
+    out = ta_py.rising_pct(a_series.to_f64_array(), float(pct))
     return _bool_values_to_series(out, a_series)
 
 
@@ -243,5 +243,5 @@ def falling_pct(
             timeframe=a_series.timeframe,
         )
 
-    out = ta_py.falling_pct([float(v) for v in a_series.values], float(pct))
+    out = ta_py.falling_pct(a_series.to_f64_array(), float(pct))
     return _bool_values_to_series(out, a_series)
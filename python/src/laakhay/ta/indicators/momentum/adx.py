@@ -53,9 +53,9 @@ def adx(ctx: SeriesContext, period: int = 14) -> tuple[Series[Price], Series[Pri
     from .._utils import results_to_series
 
     adx_val, pdi_val, mdi_val = ta_py.adx(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
-        [float(v) for v in ctx.close.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
+        ctx.close.to_f64_array(),
         period,
     )
 
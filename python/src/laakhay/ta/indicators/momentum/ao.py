@@ -43,8 +43,8 @@ def ao(ctx: SeriesContext, fast_period: int = 5, slow_period: int = 34) -> Serie
     if fast_period <= 0 or slow_period <= 0:
         raise ValueError("Periods must be positive")
     out = ta_py.ao(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
         fast_period,
         slow_period,
     )
@@ -40,9 +40,9 @@ def cci(ctx: SeriesContext, period: int = 20) -> Series[Price]:
     if period <= 0:
         raise ValueError("CCI period must be positive")
 
-    h = [float(v) for v in ctx.high.values]
-    l = [float(v) for v in ctx.low.values]
-    c = [float(v) for v in ctx.close.values]
+    h = ctx.high.to_f64_array()
+    l = ctx.low.to_f64_array()
+    c = ctx.close.to_f64_array()
 
     out_vals = ta_py.cci(h, l, c, period)
 
@@ -39,5 +39,5 @@ def cmo(ctx: SeriesContext, period: int = 14) -> Series[Price]:
     """
     if period <= 0:
         raise ValueError("CMO period must be positive")
-    out = ta_py.cmo([float(v) for v in ctx.close.values], period)
+    out = ta_py.cmo(ctx.close.to_f64_array(), period)
     return results_to_series(out, ctx.close, value_class=Price)
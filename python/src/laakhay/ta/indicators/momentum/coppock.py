@@ -50,7 +50,7 @@ def coppock(
         raise ValueError("Coppock periods must be positive")
 
     out = ta_py.coppock(
-        [float(v) for v in ctx.close.values],
+        ctx.close.to_f64_array(),
         wma_period,
         fast_roc,
         slow_roc,
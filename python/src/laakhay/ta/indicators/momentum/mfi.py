@@ -39,10 +39,10 @@ def mfi(ctx: SeriesContext, period: int = 14) -> Series[Price]:
         raise ValueError("MFI period must be positive")
 
     out_vals = ta_py.mfi(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
-        [float(v) for v in ctx.close.values],
-        [float(v) for v in ctx.volume.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
+        ctx.close.to_f64_array(),
+        ctx.volume.to_f64_array(),
         period,
     )
     return results_to_series(out_vals, ctx.close, value_class=Price)
@@ -40,5 +40,5 @@ def roc(ctx: SeriesContext, period: int = 12) -> Series[Price]:
     if period <= 0:
         raise ValueError("ROC period must be positive")
 
-    out = ta_py.roc([float(v) for v in ctx.close.values], period)
+    out = ta_py.roc(ctx.close.to_f64_array(), period)
     return results_to_series(out, ctx.close, value_class=Price)
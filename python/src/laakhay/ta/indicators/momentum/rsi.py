@@ -87,5 +87,5 @@ def rsi(ctx: SeriesContext, period: int = 14) -> Series[Price]:
 
     from .._utils import results_to_series
 
-    out = ta_py.rsi([float(v) for v in close_series.values], period)
+    out = ta_py.rsi(close_series.to_f64_array(), period)
     return results_to_series(out, close_series, value_class=Price)
@@ -67,9 +67,9 @@ def stochastic(
     high = ctx.high
     low = ctx.low
     k_out, d_out = ta_py.stochastic_kd(
-        [float(v) for v in high.values],
-        [float(v) for v in low.values],
-        [float(v) for v in close.values],
+        high.to_f64_array(),
+        low.to_f64_array(),
+        close.to_f64_array(),
         k_period,
         d_period,
         smooth,
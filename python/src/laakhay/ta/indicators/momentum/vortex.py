@@ -52,9 +52,9 @@ def vortex(ctx: SeriesContext, period: int = 14) -> tuple[Series[Price], Series[
         return empty, empty
 
     plus_vals, minus_vals = ta_py.vortex(
-        [float(v) for v in h.values],
-        [float(v) for v in l.values],
-        [float(v) for v in c.values],
+        h.to_f64_array(),
+        l.to_f64_array(),
+        c.to_f64_array(),
         period,
     )
     return (
@@ -41,9 +41,9 @@ def williams_r(ctx: SeriesContext, period: int = 14) -> Series[Price]:
         raise ValueError("Williams %R period must be positive")
 
     out = ta_py.williams_r(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
-        [float(v) for v in ctx.close.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
+        ctx.close.to_f64_array(),
         period,
     )
     return results_to_series(out, ctx.close, value_class=Price)
@@ -69,8 +69,8 @@ def _compute_swings(
         empty_pivots: tuple[_ConfirmedPivot, ...] = tuple()
         return _SwingSeries(empty_flags, empty_flags, empty_flags, empty_pivots, empty_pivots)
 
-    hi_vals = [float(v) for v in high.values]
-    lo_vals = [float(v) for v in low.values]
+    hi_vals = high.to_f64_array()
+    lo_vals = low.to_f64_array()
 
     # Call Rust kernel
     res_high, res_low = ta_py.swing_points_raw(hi_vals, lo_vals, left, right, allow_equal_extremes)
@@ -56,32 +56,28 @@ def bbands(
     - upper_band = middle_band + (std_dev * standard_deviation)
     - lower_band = middle_band - (std_dev * standard_deviation)
     """
+    return _bands(ctx, period, std_dev, (0, 1, 2))  # type: ignore[return-value]
+
+
+def _bands(ctx: SeriesContext, period: int, std_dev: float, picks: tuple[int, ...]) -> tuple[Series[Price], ...]:
+    """Run the bbands kernel once and convert only the bands at ``picks``."""
     if period <= 0 or std_dev <= 0:
         raise ValueError("Bollinger Bands period and std_dev must be positive")
 
     close = ctx.close
     if close is None:
-        return (
-            close.__class__(timestamps=(), values=(), symbol=None, timeframe=None),
-            close.__class__(timestamps=(), values=(), symbol=None, timeframe=None),
-            close.__class__(timestamps=(), values=(), symbol=None, timeframe=None),
-        )
+        return tuple(close.__class__(timestamps=(), values=(), symbol=None, timeframe=None) for _ in picks)
 
     if len(close) == 0:
         empty = close.__class__(timestamps=(), values=(), symbol=close.symbol, timeframe=close.timeframe)
-        return empty, empty, empty
+        return tuple(empty for _ in picks)
 
     import ta_py
 
     from .._utils import results_to_series
 
-    upper, middle, lower = ta_py.bbands([float(v) for v in close.values], period, std_dev)
-
-    upper_series = results_to_series(upper, close, value_class=Price)
-    mid_series = results_to_series(middle, close, value_class=Price)
-    lower_series = results_to_series(lower, close, value_class=Price)
-
-    return upper_series, mid_series, lower_series
+    bands = ta_py.bbands(close.to_f64_array(), period, std_dev)
+    return tuple(results_to_series(bands[pick], close, value_class=Price) for pick in picks)
 
 
 BB_UPPER_SPEC = IndicatorSpec(
@@ -106,7 +102,7 @@ def bb_upper(
     """
     Convenience wrapper that returns only the upper Bollinger Band.
     """
-    upper_band, _, _ = bbands(ctx, period=period, std_dev=std_dev)
+    (upper_band,) = _bands(ctx, period, std_dev, (0,))
     return upper_band
 
 
@@ -132,5 +128,5 @@ def bb_lower(
     """
     Convenience wrapper that returns only the lower Bollinger Band.
     """
-    _, _, lower_band = bbands(ctx, period=period, std_dev=std_dev)
+    (lower_band,) = _bands(ctx, period, std_dev, (2,))
     return lower_band
@@ -46,9 +46,9 @@ def elder_ray(ctx: SeriesContext, period: int = 13) -> tuple[Series[Price], Seri
         raise ValueError("Elder Ray period must be positive")
 
     bull_vals, bear_vals = ta_py.elder_ray(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
-        [float(v) for v in ctx.close.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
+        ctx.close.to_f64_array(),
         period,
     )
     return (
@@ -42,8 +42,8 @@ def fisher(ctx: SeriesContext, period: int = 9) -> tuple[Series[Price], Series[P
         raise ValueError("Fisher period must be positive")
 
     fisher_vals, signal_vals = ta_py.fisher(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
         period,
     )
     return (
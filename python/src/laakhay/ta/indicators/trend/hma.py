@@ -35,5 +35,5 @@ def hma(ctx: SeriesContext, period: int = 14) -> Series[Price]:
     """Hull Moving Average (HMA) implementation."""
     if period <= 0:
         raise ValueError("HMA period must be positive")
-    result = ta_py.hma([float(v) for v in ctx.close.values], period)
+    result = ta_py.hma(ctx.close.to_f64_array(), period)
     return results_to_series(result, ctx.close, value_class=Price)
@@ -58,9 +58,9 @@ def ichimoku(
         raise ValueError("Ichimoku periods and displacement must be positive")
 
     tenkan, kijun, span_a, span_b, chikou = ta_py.ichimoku(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
-        [float(v) for v in ctx.close.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
+        ctx.close.to_f64_array(),
         tenkan_period,
         kijun_period,
         span_b_period,
@@ -66,7 +66,7 @@ def macd(
     from .._utils import results_to_series
 
     macd_val, signal_val, hist_val = ta_py.macd(
-        [float(v) for v in close.values],
+        close.to_f64_array(),
         fast_period,
         slow_period,
         signal_period,
@@ -56,9 +56,9 @@ def psar(
         return empty, empty
 
     sar_vals, dir_vals = ta_py.psar(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
-        [float(v) for v in ctx.close.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
+        ctx.close.to_f64_array(),
         af_start,
         af_increment,
         af_max,
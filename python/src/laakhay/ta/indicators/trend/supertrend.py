@@ -54,9 +54,9 @@ def supertrend(ctx: SeriesContext, period: int = 10, multiplier: float = 3.0) ->
         return empty, empty
 
     st_vals, dir_vals = ta_py.supertrend(
-        [float(v) for v in h.values],
-        [float(v) for v in l.values],
-        [float(v) for v in c.values],
+        h.to_f64_array(),
+        l.to_f64_array(),
+        c.to_f64_array(),
         period,
         multiplier,
     )
@@ -53,9 +53,9 @@ def atr(ctx: SeriesContext, period: int = 14) -> Series[Price]:
     from .._utils import results_to_series
 
     out = ta_py.atr(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
-        [float(v) for v in ctx.close.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
+        ctx.close.to_f64_array(),
         period,
     )
     return results_to_series(out, ctx.close, value_class=Price)
@@ -43,8 +43,8 @@ def donchian(ctx: SeriesContext, period: int = 20) -> tuple[Series[Price], Serie
         raise ValueError("Donchian period must be positive")
 
     upper_vals, lower_vals, middle_vals = ta_py.donchian(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
         period,
     )
     return (
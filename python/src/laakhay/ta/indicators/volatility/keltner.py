@@ -53,9 +53,9 @@ def keltner(
         raise ValueError("Keltner periods must be positive")
 
     upper_vals, middle_vals, lower_vals = ta_py.keltner(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
-        [float(v) for v in ctx.close.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
+        ctx.close.to_f64_array(),
         ema_period,
         atr_period,
         multiplier,
@@ -46,10 +46,10 @@ def cmf(ctx: SeriesContext, period: int = 20) -> Series[Price]:
 
     h, l, c, v = ctx.high, ctx.low, ctx.close, ctx.volume
     out = ta_py.cmf(
-        [float(x) for x in h.values],
-        [float(x) for x in l.values],
-        [float(x) for x in c.values],
-        [float(x) for x in v.values],
+        h.to_f64_array(),
+        l.to_f64_array(),
+        c.to_f64_array(),
+        v.to_f64_array(),
         period,
     )
     return CoreSeries[Price](
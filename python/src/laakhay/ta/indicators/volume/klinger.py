@@ -58,10 +58,10 @@ def klinger(
         return empty, empty
 
     klinger_vals, signal_vals = ta_py.klinger(
-        [float(x) for x in h.values],
-        [float(x) for x in l.values],
-        [float(x) for x in c.values],
-        [float(x) for x in v.values],
+        h.to_f64_array(),
+        l.to_f64_array(),
+        c.to_f64_array(),
+        v.to_f64_array(),
         fast_period,
         slow_period,
         signal_period,
@@ -47,5 +47,5 @@ def obv(ctx: SeriesContext) -> Series[Qty]:
         return close.__class__(timestamps=(), values=(), symbol=close.symbol, timeframe=close.timeframe)
     from .._utils import results_to_series
 
-    out = ta_py.obv([float(v) for v in close.values], [float(v) for v in volume.values])
+    out = ta_py.obv(close.to_f64_array(), volume.to_f64_array())
     return results_to_series(out, close, value_class=Qty)
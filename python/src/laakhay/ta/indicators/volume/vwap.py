@@ -48,9 +48,9 @@ def vwap(ctx: SeriesContext) -> Series[Price]:
     from .._utils import results_to_series
 
     out = ta_py.vwap(
-        [float(v) for v in ctx.high.values],
-        [float(v) for v in ctx.low.values],
-        [float(v) for v in ctx.close.values],
-        [float(v) for v in ctx.volume.values],
+        ctx.high.to_f64_array(),
+        ctx.low.to_f64_array(),
+        ctx.close.to_f64_array(),
+        ctx.volume.to_f64_array(),
     )
     return results_to_series(out, ctx.close, value_class=Price)
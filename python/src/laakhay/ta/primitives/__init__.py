@@ -25,6 +25,7 @@ from .rolling_ops import (
     rolling_mean,
     rolling_median,
     rolling_min,
+    rolling_quantile,
     rolling_rma,
     rolling_std,
     rolling_sum,
@@ -54,6 +55,7 @@ __all__ = [
     "rolling_mean",
     "rolling_median",
     "rolling_min",
+    "rolling_quantile",
     "rolling_rma",
     "rolling_std",
     "rolling_sum",
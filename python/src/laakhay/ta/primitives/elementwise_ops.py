@@ -353,10 +353,10 @@ def downsample(
             return result
         result_tf = target_timeframe or c.timeframe
         ts_epoch = _series_to_epoch_millis(c)
-        out_ts_epoch, o_vals_raw = ta_py.series_downsample(ts_epoch, [float(x) for x in o.values], factor, "first")
-        _, h_vals_raw = ta_py.series_downsample(ts_epoch, [float(x) for x in h.values], factor, "max")
-        _, l_vals_raw = ta_py.series_downsample(ts_epoch, [float(x) for x in l.values], factor, "min")
-        _, c_vals_raw = ta_py.series_downsample(ts_epoch, [float(x) for x in c.values], factor, "last")
+        out_ts_epoch, o_vals_raw = ta_py.series_downsample(ts_epoch, o.to_f64_array(), factor, "first")
+        _, h_vals_raw = ta_py.series_downsample(ts_epoch, h.to_f64_array(), factor, "max")
+        _, l_vals_raw = ta_py.series_downsample(ts_epoch, l.to_f64_array(), factor, "min")
+        _, c_vals_raw = ta_py.series_downsample(ts_epoch, c.to_f64_array(), factor, "last")
         new_ts = _epoch_millis_to_timestamps(out_ts_epoch)
         o_vals = _f64_to_decimals(o_vals_raw)
         h_vals = _f64_to_decimals(h_vals_raw)
@@ -364,7 +364,7 @@ def downsample(
         c_vals = _f64_to_decimals(c_vals_raw)
         v_vals = None
         if v is not None:
-            _, v_vals_raw = ta_py.series_downsample(ts_epoch, [float(x) for x in v.values], factor, "sum")
+            _, v_vals_raw = ta_py.series_downsample(ts_epoch, v.to_f64_array(), factor, "sum")
             v_vals = _f64_to_decimals(v_vals_raw)
         o_ser = _build_like(o, new_ts, o_vals)
         h_ser = _build_like(h, new_ts, h_vals)
@@ -419,7 +419,7 @@ def downsample(
         return _empty_like(src)
     out_ts_epoch, out_vals_raw = ta_py.series_downsample(
         _series_to_epoch_millis(src),
-        [float(v) for v in src.values],
+        src.to_f64_array(),
         factor,
         agg,
     )
@@ -458,7 +458,7 @@ def upsample(ctx: SeriesContext, *, factor: int = 2, method: str = "ffill") -> S
         return _empty_like(src)
     out_ts_epoch, out_vals_raw = ta_py.series_upsample_ffill(
         _series_to_epoch_millis(src),
-        [float(v) for v in src.values],
+        src.to_f64_array(),
         factor,
     )
     res = _build_like(src, _epoch_millis_to_timestamps(out_ts_epoch), _f64_to_decimals(out_vals_raw))
@@ -489,7 +489,7 @@ def sync_timeframe(ctx: SeriesContext, reference: Series[Price], *, fill: str =
         return _empty_like(src)
     out_vals_raw = ta_py.series_sync_timeframe(
         _series_to_epoch_millis(src),
-        [float(v) for v in src.values],
+        src.to_f64_array(),
         _series_to_epoch_millis(reference),
         fill,
     )
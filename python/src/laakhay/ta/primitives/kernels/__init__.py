@@ -31,6 +31,7 @@ from .rolling import (
     RollingMaxKernel,
     RollingMedianKernel,
     RollingMinKernel,
+    RollingQuantileKernel,
 )
 from .rsi import RSIKernel, RSIState
 from .supertrend import SupertrendKernel, SupertrendState
@@ -58,6 +59,7 @@ __all__ = [
     "RollingMaxKernel",
     "RollingMedianKernel",
     "RollingMinKernel",
+    "RollingQuantileKernel",
     "RSIKernel",
     "RSIState",
     "SupertrendKernel",
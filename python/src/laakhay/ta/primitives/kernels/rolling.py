@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import deque
 from dataclasses import dataclass
 from decimal import Decimal
@@ -126,29 +127,52 @@ class RollingArgminKernel(Kernel[_MonotonicWindowState]):
 
 
 @dataclass(frozen=True)
-class RollingMedianState:
+class RollingQuantileState:
     window: tuple[Decimal, ...]
+    ordered: tuple[Decimal, ...]
 
 
-class RollingMedianKernel(Kernel[RollingMedianState]):
-    def initialize(self, history: list[Decimal], period: int, **kwargs: Any) -> RollingMedianState:
+RollingMedianState = RollingQuantileState
+
+
+class RollingQuantileKernel(Kernel[RollingQuantileState]):
+    """Element at ``floor(q * len(window))`` of the sorted window.
+
+    The window is kept sorted alongside arrival order, so a step is a binary
+    search and an insert/remove instead of a full sort.
+    """
+
+    def initialize(self, history: list[Decimal], period: int, **kwargs: Any) -> RollingQuantileState:
         win = tuple(history[-(period - 1) :] if period > 1 else history)
-        return RollingMedianState(window=win)
+        return RollingQuantileState(window=win, ordered=tuple(sorted(win)))
 
     def step(
         self,
-        state: RollingMedianState,
+        state: RollingQuantileState,
         x_t: Decimal,
         period: int,
+        q: float = 0.5,
         **kwargs: Any,
-    ) -> tuple[RollingMedianState, Decimal]:
+    ) -> tuple[RollingQuantileState, Decimal]:
         new_win = list(state.window)
+        ordered = list(state.ordered)
         new_win.append(x_t)
+        insort(ordered, x_t)
         if len(new_win) > period:
-            new_win.pop(0)
-        sorted_window = sorted(new_win)
-        med = sorted_window[len(sorted_window) // 2]
-        return RollingMedianState(window=tuple(new_win)), med
+            del ordered[bisect_left(ordered, new_win.pop(0))]
+        rank = min(int(q * len(ordered)), len(ordered) - 1)
+        return RollingQuantileState(window=tuple(new_win), ordered=tuple(ordered)), ordered[rank]
+
+
+class RollingMedianKernel(RollingQuantileKernel):
+    def step(
+        self,
+        state: RollingQuantileState,
+        x_t: Decimal,
+        period: int,
+        **kwargs: Any,
+    ) -> tuple[RollingQuantileState, Decimal]:
+        return super().step(state, x_t, period, q=0.5)
 
 
 __all__ = [
@@ -158,4 +182,6 @@ __all__ = [
     "RollingMedianKernel",
     "RollingMedianState",
     "RollingMinKernel",
+    "RollingQuantileKernel",
+    "RollingQuantileState",
 ]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import math
+from array import array
+from typing import Any
 
 import ta_py
 
 from ..core import Series
+from ..core.columnar import AvailabilityMask
 from ..core.series import Series as CoreSeries
 from ..core.types import Price
 from ..registry.models import SeriesContext
@@ -21,22 +23,16 @@ from .kernel import run_kernel
 from .kernels.rolling import (
     RollingArgmaxKernel,
     RollingArgminKernel,
-    RollingMedianKernel,
 )
 from .select import _select, _select_field
 
 
-def _series_to_f64(src: Series[Price]) -> list[float]:
-    return [float(v) for v in src.values]
+def _series_to_f64(src: Series[Price]) -> array[float]:
+    return src.to_f64_array()
 
 
-def _f64_to_series(src: Series[Price], values: list[float]) -> Series[Price]:
-    return CoreSeries[Price](
-        timestamps=src.timestamps,
-        values=tuple(Price("NaN") if math.isnan(v) else Price(str(v)) for v in values),
-        symbol=src.symbol,
-        timeframe=src.timeframe,
-    )
+def _f64_to_series(src: Series[Price], values: Any) -> Series[Price]:
+    return CoreSeries.from_f64(values, timestamps=src.timestamps, symbol=src.symbol, timeframe=src.timeframe)
 
 
 def _with_window_mask(res: Series[Price], period: int, src: Series | None = None) -> Series[Price]:
@@ -61,7 +57,7 @@ def _with_window_mask(res: Series[Price], period: int, src: Series | None = None
         values=res.values,
         symbol=res.symbol,
         timeframe=res.timeframe,
-        availability_mask=tuple(window_mask),
+        availability_mask=AvailabilityMask(window_mask),
     )
 
 
@@ -143,10 +139,43 @@ def rolling_argmin(ctx: SeriesContext, period: int = 20, field: str | None = Non
     return _with_window_mask(res, period, src=source)
 
 
-@register(spec=_rolling_spec("rolling_median", ("median", "med"), "Median over window (O(n*w))"))
+@register(spec=_rolling_spec("rolling_median", ("median", "med"), "Median over window (O(n*log w))"))
 def rolling_median(ctx: SeriesContext, period: int = 20, field: str | None = None) -> Series[Price]:
     src = _select_field(ctx, field) if field else _select(ctx)
-    return run_kernel(src, RollingMedianKernel(), min_periods=period, period=period)
+    if period <= 0:
+        raise ValueError("Period must be positive")
+    res = _f64_to_series(src, ta_py.rolling_median(_series_to_f64(src), period))
+    return _with_window_mask(res, period, src=src)
+
+
+_ROLLING_QUANTILE_SPEC = IndicatorSpec(
+    name="rolling_quantile",
+    description="Quantile over window (O(n*log w)); the element at floor(q * period) of the sorted window",
+    aliases=("quantile",),
+    inputs=(InputSlotSpec(name="field", required=False, default_source="ohlcv", default_field="close"),),
+    params={
+        "period": ParamSpec(name="period", type=int, default=20, required=False),
+        "q": ParamSpec(name="q", type=float, default=0.5, required=False),
+        "field": ParamSpec(name="field", type=str, default=None, required=False),
+    },
+    outputs={"result": OutputSpec(name="result", type=Series, description="Rolling quantile", role="line")},
+    semantics=SemanticsSpec(
+        required_fields=("close",), lookback_params=("period",), input_field="close", input_series_param="field"
+    ),
+    runtime_binding=RuntimeBindingSpec(kernel_id="rolling_quantile"),
+    param_aliases={"lookback": "period"},
+)
+
+
+@register(spec=_ROLLING_QUANTILE_SPEC)
+def rolling_quantile(ctx: SeriesContext, period: int = 20, q: float = 0.5, field: str | None = None) -> Series[Price]:
+    src = _select_field(ctx, field) if field else _select(ctx)
+    if period <= 0:
+        raise ValueError("Period must be positive")
+    if not 0.0 <= q <= 1.0:
+        raise ValueError("Quantile must be between 0 and 1")
+    res = _f64_to_series(src, ta_py.rolling_quantile(_series_to_f64(src), period, q))
+    return _with_window_mask(res, period, src=src)
 
 
 @register(spec=_rolling_spec("rolling_ema", (), "Exponential Moving Average over a window"))
@@ -229,6 +258,7 @@ __all__ = [
     "rolling_mean",
     "rolling_median",
     "rolling_min",
+    "rolling_quantile",
     "rolling_rma",
     "rolling_std",
     "rolling_sum",
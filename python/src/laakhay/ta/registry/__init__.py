@@ -10,6 +10,7 @@ from .registry import (
     indicator_info,
     list_all_names,
     list_indicators,
+    on_registry_change,
     register,
 )
 from .schemas import (
@@ -51,4 +52,5 @@ __all__ = [
     "list_indicators",
     "list_all_names",
     "get_global_registry",
+    "on_registry_change",
 ]
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import importlib
 import inspect
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any, Union
 
 from ..core.series import Series
@@ -26,6 +27,9 @@ class Registry:
         """Initialize empty registry."""
         self._indicators: dict[str, IndicatorHandle] = {}
         self._aliases: dict[str, str] = {}  # alias -> name mapping
+        # Declared but not yet imported: name/alias -> defining module
+        self._lazy_names: dict[str, str] = {}
+        self._lazy_aliases: dict[str, str] = {}
         self._lock = threading.RLock()  # Reentrant lock for thread safety
 
     def register(
@@ -87,7 +91,22 @@ class Registry:
                     raise ValueError(f"Alias '{alias}' conflicts with existing indicator '{alias}'")
                 self._aliases[alias] = name
 
-            return func
+        _notify_change()
+        return func
+
+    def declare_lazy(self, module: str, names: Iterable[str], aliases: Iterable[str] = ()) -> None:
+        """Record indicators that ``module`` registers without importing it.
+
+        The module is imported on the first lookup of one of its names or
+        aliases, or when every indicator is listed.
+        """
+        with self._lock:
+            for name in names:
+                if name not in self._indicators:
+                    self._lazy_names[name] = module
+            for alias in aliases:
+                if alias not in self._aliases:
+                    self._lazy_aliases[alias] = module
 
     def get(self, name: str) -> IndicatorHandle | None:
         """Get indicator by name or alias."""
@@ -96,30 +115,64 @@ class Registry:
             if name in self._indicators:
                 return self._indicators[name]
 
-            # Check aliases
-            if name in self._aliases:
+            # A declared name takes precedence over a registered alias, as it
+            # would had its module been imported already
+            module = self._lazy_names.get(name)
+            if module is None and name in self._aliases:
                 actual_name = self._aliases[name]
                 return self._indicators[actual_name]
 
+            if module is None:
+                module = self._lazy_aliases.get(name)
+            if module is None:
+                return None
+
+        self._load_module(module)
+        with self._lock:
+            if name in self._indicators:
+                return self._indicators[name]
+            if name in self._aliases:
+                return self._indicators[self._aliases[name]]
             return None
 
+    def load_all(self) -> None:
+        """Import every module with declared but not yet registered indicators."""
+        with self._lock:
+            modules = set(self._lazy_names.values()) | set(self._lazy_aliases.values())
+        for module in sorted(modules):
+            self._load_module(module)
+
+    def _load_module(self, module: str) -> None:
+        # Imported outside the registry lock: the module's decorators take it,
+        # and another thread may already be importing the same module.
+        importlib.import_module(module)
+        with self._lock:
+            for pending in (self._lazy_names, self._lazy_aliases):
+                for key in [key for key, owner in pending.items() if owner == module]:
+                    del pending[key]
+
     def list_indicators(self) -> list[str]:
         """List all registered indicator names."""
+        self.load_all()
         with self._lock:
             return list(self._indicators.keys())
 
     def list_all_names(self) -> list[str]:
         """List all registered indicator names and aliases."""
+        self.load_all()
         with self._lock:
             names = list(self._indicators.keys())
             aliases = list(self._aliases.keys())
             return sorted(names + aliases)
 
     def clear(self) -> None:
-        """Clear all registered indicators. Useful for testing."""
+        """Clear all registered and declared indicators. Useful for testing."""
         with self._lock:
             self._indicators.clear()
             self._aliases.clear()
+            self._lazy_names.clear()
+            self._lazy_aliases.clear()
+        _notify_change()
 
     def _validate_function(self, func: Callable[..., Any]) -> None:
         """Validate that a function is suitable for registration as an indicator."""
@@ -372,6 +425,23 @@ class Registry:
 # Global registry instance
 _global_registry = None
 
+# Callbacks run after any indicator is registered or a registry is cleared/reset
+_change_listeners: list[Callable[[], None]] = []
+
+
+def on_registry_change(callback: Callable[[], None]) -> None:
+    """Call ``callback`` whenever registered indicators change.
+
+    Caches derived from registry lookups (compiled plans, for example) use this
+    to drop entries that may no longer match the registered specs.
+    """
+    _change_listeners.append(callback)
+
+
+def _notify_change() -> None:
+    for callback in tuple(_change_listeners):
+        callback()
+
 
 def get_global_registry() -> Registry:
     """Get the global registry instance. Useful for testing and advanced usage."""
@@ -385,6 +455,7 @@ def reset_global_registry() -> None:
     """Reset the global registry. Useful for testing."""
     global _global_registry
     _global_registry = None
+    _notify_change()
 
 
 def register(
@@ -442,6 +513,7 @@ def list_all_names() -> list[str]:
 def describe_all() -> dict[str, IndicatorSchema]:
     """Return schema for all registered indicators keyed by name."""
     reg = get_global_registry()
+    reg.load_all()
     return {name: handle.schema for name, handle in reg._indicators.items()}
 
 
@@ -68,3 +68,28 @@ def test_rust_rolling_sum_smoke():
     out = ta_py.rolling_sum([1.0, 2.0, 3.0, 4.0], 3)
     assert out[2] == 6.0
     assert out[3] == 9.0
+
+
+def test_kernels_accept_float64_buffers(mock_series: Series[Price]):
+    expected = ta_py.rolling_mean([float(v) for v in mock_series.values], 3)
+    buf = mock_series.to_f64_array()
+
+    for arg in (buf, memoryview(buf)):
+        res = ta_py.rolling_mean(arg, 3)
+        assert isinstance(res, ta_py.BufferArray)
+        assert res.typecode == "d"
+        assert memoryview(res).format == "d"
+        assert len(res) == 20
+        assert res.tolist()[2:] == expected[2:]
+        assert res[-1] == expected[-1]
+
+
+def test_multi_output_and_event_kernels_return_buffers(mock_series: Series[Price]):
+    buf = mock_series.to_f64_array()
+    upper, middle, lower = ta_py.bbands(buf, 5, 2.0)
+    assert all(isinstance(out, ta_py.BufferArray) for out in (upper, middle, lower))
+    assert middle[4:6] == [3.0, 4.0]
+
+    rising = ta_py.rising(buf)
+    assert rising.typecode == "?"
+    assert memoryview(rising).tolist()[1:] == [True] * 19
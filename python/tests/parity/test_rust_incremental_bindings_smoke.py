@@ -1,7 +1,26 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+import pytest
 import ta_py
 
+from laakhay.ta.expr.execution.backends.incremental_rust import (
+    export_snapshot,
+    import_snapshot,
+    load_snapshot,
+    save_snapshot,
+)
+
+_RSI = [
+    {
+        "node_id": 1,
+        "kernel_id": "rsi",
+        "input_field": "close",
+        "kwargs": {"period": 2.0},
+    }
+]
+
 
 def test_incremental_lifecycle_smoke() -> None:
     backend = ta_py.incremental_initialize()
@@ -27,3 +46,71 @@ def test_incremental_lifecycle_smoke() -> None:
     assert isinstance(replay, list)
     assert len(replay) == 1
     assert replay[0] == out3
+
+
+def _warmed_snapshot() -> int:
+    backend = ta_py.incremental_initialize()
+    for index, close in enumerate([10.0, 11.0, 12.0, 11.0], start=1):
+        ta_py.incremental_step(backend, _RSI, {"close": close}, index)
+    return ta_py.incremental_snapshot(backend)
+
+
+def _continue(snapshot: int) -> dict:
+    backend = ta_py.incremental_initialize()
+    assert ta_py.incremental_restore(backend, snapshot) == 4
+    return ta_py.incremental_step(backend, _RSI, {"close": 13.0}, 5)
+
+
+def test_snapshot_bytes_roundtrip() -> None:
+    snap = _warmed_snapshot()
+    data = export_snapshot(snap)
+
+    assert isinstance(data, bytes)
+    imported = import_snapshot(data)
+    assert _continue(imported.id) == _continue(snap)
+
+    corrupt = bytearray(data)
+    corrupt[len(corrupt) // 2] ^= 0x01
+    with pytest.raises(ValueError):
+        import_snapshot(bytes(corrupt))
+
+
+def test_snapshot_save_load(tmp_path: Path) -> None:
+    snap = _warmed_snapshot()
+    path = tmp_path / "rsi.snap"
+
+    save_snapshot(snap, path)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["rsi.snap"]
+    loaded = load_snapshot(path)
+    assert _continue(loaded.id) == _continue(snap)
+    with pytest.raises(FileNotFoundError):
+        load_snapshot(tmp_path / "missing.snap")
+
+
+def test_dropped_handles_release_rust_state() -> None:
+    backend = ta_py.incremental_initialize()
+    snap = ta_py.incremental_snapshot(backend)
+
+    assert ta_py.snapshot_drop(snap) is True
+    assert ta_py.snapshot_drop(snap) is False
+    assert ta_py.incremental_drop(backend) is True
+    with pytest.raises(KeyError):
+        ta_py.incremental_step(backend, _RSI, {"close": 1.0}, 1)
+
+
+def test_step_batch_matches_single_steps() -> None:
+    closes = [10.0, 11.0, 12.0, 11.0, 13.0, 12.5]
+    single = ta_py.incremental_initialize()
+    expected = [
+        ta_py.incremental_step(single, _RSI, {"close": close}, index) for index, close in enumerate(closes, start=1)
+    ]
+
+    batched = ta_py.incremental_initialize()
+    out = ta_py.incremental_step_batch(batched, {"close": closes[:4]}, 1, _RSI)
+    last = ta_py.incremental_step_batch(batched, {"close": closes[4:]}, 5, _RSI, last_only=True)
+
+    assert out[1] == [row[1] for row in expected[:4]]
+    assert last == expected[-1]
+    with pytest.raises(ValueError):
+        ta_py.incremental_step_batch(batched, {"close": [1.0], "high": []}, 7, _RSI)
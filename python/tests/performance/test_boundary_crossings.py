@@ -3,7 +3,7 @@ from __future__ import annotations
 from laakhay.ta.core.dataset import Dataset
 from laakhay.ta.core.ohlcv import OHLCV
 from laakhay.ta.expr.dsl import compile_expression
-from laakhay.ta.expr.execution.backends.incremental_rust import IncrementalRustBackend
+from laakhay.ta.expr.execution.backends.incremental_rust import IncrementalRustBackend, ohlcv_tick
 
 
 def _build_dataset(sample_ohlcv_data) -> Dataset:
@@ -28,18 +28,59 @@ def test_single_boundary_crossing_for_supported_plan(sample_ohlcv_data, monkeypa
     plan = compile_expression("rsi(close, 14)")._ensure_plan()
     backend = IncrementalRustBackend()
 
-    call_count = {"execute_plan_payload": 0}
+    call_count = {"plan_execute": 0}
 
     import laakhay.ta.expr.execution.backends.incremental_rust as backend_module
 
-    original = backend_module.ta_py.execute_plan_payload
+    original = backend_module.ta_py.plan_execute
 
-    def wrapped_execute_plan_payload(*args, **kwargs):  # noqa: ANN002, ANN003
-        call_count["execute_plan_payload"] += 1
+    def wrapped_plan_execute(*args, **kwargs):  # noqa: ANN002, ANN003
+        call_count["plan_execute"] += 1
         return original(*args, **kwargs)
 
-    monkeypatch.setattr(backend_module.ta_py, "execute_plan_payload", wrapped_execute_plan_payload)
+    monkeypatch.setattr(backend_module.ta_py, "plan_execute", wrapped_plan_execute)
     out = backend.evaluate(plan, ds)
 
     assert out
-    assert call_count["execute_plan_payload"] == 1
+    assert call_count["plan_execute"] == 1
+
+
+def test_warmup_steps_history_in_one_crossing(sample_ohlcv_data, monkeypatch) -> None:
+    ds = _build_dataset(sample_ohlcv_data)
+    symbol, timeframe = sample_ohlcv_data["symbol"], sample_ohlcv_data["timeframe"]
+    plan = compile_expression("sma(close, 3) > ema(close, 5)")._ensure_plan()
+
+    import laakhay.ta.expr.execution.backends.incremental_rust as backend_module
+
+    calls = {"batch": 0, "single": 0}
+    original_batch = backend_module.ta_py.incremental_step_batch
+    original_single = backend_module.ta_py.incremental_step_graph
+
+    def wrapped_batch(*args, **kwargs):  # noqa: ANN002, ANN003
+        calls["batch"] += 1
+        return original_batch(*args, **kwargs)
+
+    def wrapped_single(*args, **kwargs):  # noqa: ANN002, ANN003
+        calls["single"] += 1
+        return original_single(*args, **kwargs)
+
+    monkeypatch.setattr(backend_module.ta_py, "incremental_step_batch", wrapped_batch)
+    monkeypatch.setattr(backend_module.ta_py, "incremental_step_graph", wrapped_single)
+    warmed = IncrementalRustBackend()
+    warmed.initialize(plan, ds, symbol=symbol, timeframe=timeframe)
+    assert calls == {"batch": 1, "single": 0}
+
+    stepped = IncrementalRustBackend()
+    stepped.initialize(plan, ds)
+    ohlcv = ds.series(symbol, timeframe, "ohlcv")
+    for index in range(len(ohlcv)):
+        stepped.step(
+            plan,
+            ohlcv_tick(
+                ohlcv.opens[index], ohlcv.highs[index], ohlcv.lows[index], ohlcv.closes[index], ohlcv.volumes[index]
+            ),
+        )
+
+    tick = ohlcv_tick(1.0, 2.0, 0.5, 1.5, 10.0)
+    assert warmed.event_index == stepped.event_index == len(ohlcv)
+    assert warmed.step(plan, tick) == stepped.step(plan, tick)
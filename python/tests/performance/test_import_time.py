@@ -0,0 +1,57 @@
+"""Guards on what ``import laakhay.ta`` pulls in and how long it takes."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+
+_IMPORT_BUDGET_SECONDS = 2.0
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_indicator_categories_are_imported_on_first_use() -> None:
+    output = _run(
+        """
+        import sys
+
+        import laakhay.ta as ta
+        from laakhay.ta.indicators import INDICATOR_CATEGORIES
+
+        def loaded():
+            return sorted(c for c in INDICATOR_CATEGORIES if f"laakhay.ta.indicators.{c}" in sys.modules)
+
+        print(loaded())
+        assert ta.indicator("wma").name == "wma"
+        ta.indicator("rsi")
+        print(loaded())
+        """
+    )
+    assert output.splitlines() == ["[]", "['momentum', 'trend']"]
+
+
+def test_import_time_stays_within_budget() -> None:
+    timings = [
+        float(
+            _run(
+                """
+                import time
+
+                start = time.perf_counter()
+                import laakhay.ta
+                print(time.perf_counter() - start)
+                """
+            )
+        )
+        for _ in range(3)
+    ]
+    assert min(timings) < _IMPORT_BUDGET_SECONDS
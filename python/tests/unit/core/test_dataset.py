@@ -143,6 +143,24 @@ class TestDatasetCore:
         assert info["series_count"] == 1
         assert info["series_row_count"] == len(s)
 
+    def test_rust_partition_appends_tail_and_replaces_in_place(self, sample_series_data):
+        ds = Dataset()
+        s = mk_series_from_fixture(sample_series_data, "BTCUSDT", "1h")
+        head = s[: len(s) - 1]
+        ds.add_series("BTCUSDT", "1h", head, source="close")
+        dataset_id = ds.rust_dataset_id
+        v1 = ds.partition_version("BTCUSDT", "1h", "close")
+
+        ds.add_series("BTCUSDT", "1h", s, source="close")
+        v2 = ds.partition_version("BTCUSDT", "1h", "close")
+        assert ds.rust_dataset_id == dataset_id
+        assert v2 > v1
+        assert ds.rust_info()["series_row_count"] == len(s)
+
+        ds.add_series("BTCUSDT", "1h", head, source="close")
+        assert ds.partition_version("BTCUSDT", "1h", "close") > v2
+        assert ds.rust_info()["series_row_count"] == len(head)
+
     def test_series_retrieval_found_and_not_found(self, sample_series_data):
         ds = Dataset()
         s = mk_series_from_fixture(sample_series_data, "BTCUSDT", "1h")
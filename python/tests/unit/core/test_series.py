@@ -582,3 +582,88 @@ def test_change_pct_zero_previous():
     assert len(result) == 2
     assert result.values[0] != result.values[0]  # NaN
     assert result.values[1] != result.values[1]  # NaN (division by zero)
+
+
+# ---------------------------------------------------------------------
+# Compact float64 storage
+# ---------------------------------------------------------------------
+
+
+def test_compact_series_reads_back_as_decimal_and_datetime(multi_series):
+    compact = multi_series.compact()
+    assert compact.is_compact
+    assert not multi_series.is_compact
+    assert compact.values == multi_series.values
+    assert compact.timestamps == multi_series.timestamps
+    assert isinstance(compact.values[0], Decimal)
+    assert compact.timestamps[1] == datetime(2024, 1, 1, 11, tzinfo=UTC)
+    assert compact.timestamps.millis.tolist() == [1704103200000, 1704106800000]
+    assert compact.to_f64_array() is compact.values.buffer
+
+
+def test_compact_series_arithmetic_matches_tuple_storage(multi_series, other_series_same_t):
+    compact = multi_series.compact() + other_series_same_t
+    expected = multi_series + other_series_same_t
+    assert compact.values == expected.values
+
+
+def test_from_f64_masks_nan_rows():
+    stamps = ts((2024, 1, 1, 10), (2024, 1, 1, 11), (2024, 1, 1, 12))
+    series = Series.from_f64([1.0, float("nan"), 3.0], timestamps=stamps, symbol="BTC", timeframe="1h", mask_nan=True)
+    assert list(series.availability_mask) == [True, False, True]
+    assert series.values[1].is_nan()
+    assert series.values[2] == Decimal("3")
+
+
+# ---------------------------------------------------------------------
+# Float64 kernels & precision modes
+# ---------------------------------------------------------------------
+
+
+def test_compact_operators_return_compact_series_with_joined_masks():
+    stamps = ts((2024, 1, 1, 10), (2024, 1, 1, 11), (2024, 1, 1, 12))
+    left = Series.from_f64([1.0, float("nan"), 3.0], timestamps=stamps, symbol="BTC", timeframe="1h", mask_nan=True)
+    right = Series.from_f64(
+        [4.0, 5.0, 6.0], timestamps=stamps, symbol="BTC", timeframe="1h", availability_mask=[1, 1, 0]
+    )
+
+    result = left * right
+    assert result.is_compact
+    assert result.to_f64_array()[0] == 4.0 and result.to_f64_array()[2] == 18.0
+    assert list(result.availability_mask) == [True, False, False]
+    assert list((-left).to_f64_array())[::2] == [-1.0, -3.0]
+    with pytest.raises(ValueError):
+        _ = left / 0
+
+
+def test_precision_modes_select_decimal_or_float64_arithmetic(multi_series, other_series_same_t):
+    from laakhay.ta.core import precision
+
+    compact = multi_series.compact()
+    with precision("decimal"):
+        exact = compact / other_series_same_t
+    assert not exact.is_compact
+    assert exact.values[1] == Decimal("2.666666666666666666666666667")
+
+    with precision("float64"):
+        fast = multi_series / other_series_same_t
+    assert fast.is_compact
+    assert fast.to_f64_array().tolist() == [2.0, 200 / 75]
+
+    with pytest.raises(ValueError, match="precision mode"):
+        with precision("fixed"):  # type: ignore[arg-type]
+            pass
+
+
+def test_compact_shift_filter_and_extremes():
+    stamps = ts((2024, 1, 1, 10), (2024, 1, 1, 11), (2024, 1, 1, 12), (2024, 1, 1, 13))
+    series = Series.from_f64([float("nan"), 7.0, 2.0, 5.0], timestamps=stamps, symbol="BTC", timeframe="1h")
+
+    assert series.shift(-1).to_f64_array().tolist() == [7.0, 2.0, 5.0, 5.0]
+    assert series.max().values[0] == Decimal("7") and series.min().values[0] == Decimal("2")
+
+    condition = Series[bool](timestamps=stamps, values=(False, True, False, True), symbol="BTC", timeframe="1h")
+    kept = series.filter(condition)
+    assert kept.is_compact
+    assert kept.timestamps == (stamps[1], stamps[3])
+    assert kept.to_f64_array().tolist() == [7.0, 5.0]
@@ -5,6 +5,7 @@ from typing import Any
 from laakhay.ta.core.dataset import Dataset
 from laakhay.ta.core.ohlcv import OHLCV
 from laakhay.ta.expr.dsl import compile_expression
+from laakhay.ta.expr.execution.backends import incremental_rust
 from laakhay.ta.expr.execution.backends.incremental_rust import IncrementalRustBackend
 
 
@@ -25,6 +26,25 @@ def _build_dataset(sample_ohlcv_data: dict[str, Any]) -> Dataset:
     return ds
 
 
+def _fake_plan_calls(monkeypatch, execute) -> dict[str, int]:  # noqa: ANN001
+    """Route plan registration and execution to fakes with a fresh handle table."""
+    counts = {"register": 0, "execute": 0}
+
+    def fake_register(graph):  # noqa: ANN001
+        counts["register"] += 1
+        return 7
+
+    def fake_execute(plan_id, dataset_id, partition, root_only=False, threads=1):  # noqa: ANN001
+        counts["execute"] += 1
+        assert plan_id == 7
+        return execute(dataset_id, partition)
+
+    monkeypatch.setattr(incremental_rust, "_PLAN_HANDLES", {})
+    monkeypatch.setattr(incremental_rust.ta_py, "plan_register", fake_register, raising=False)
+    monkeypatch.setattr(incremental_rust.ta_py, "plan_execute", fake_execute, raising=False)
+    return counts
+
+
 def test_evaluate_uses_execute_plan_for_supported_root(sample_ohlcv_data, monkeypatch) -> None:
     ds = _build_dataset(sample_ohlcv_data)
     expr = compile_expression("rsi(close, 2)")
@@ -33,18 +53,12 @@ def test_evaluate_uses_execute_plan_for_supported_root(sample_ohlcv_data, monkey
 
     called: dict[str, Any] = {}
 
-    def fake_execute_plan_payload(payload):  # noqa: ANN001
-        called["dataset_id"] = payload["dataset_id"]
-        called["symbol"] = payload["partition"]["symbol"]
-        called["timeframe"] = payload["partition"]["timeframe"]
-        called["source"] = payload["partition"]["source"]
-        called["requests"] = payload["requests"]
+    def fake_execute(dataset_id, partition):  # noqa: ANN001
+        called["dataset_id"] = dataset_id
+        called["symbol"], called["timeframe"], called["source"] = partition
         return {int(plan.graph.root_id): [42.0] * len(sample_ohlcv_data["timestamps"])}
 
-    monkeypatch.setattr(
-        "laakhay.ta.expr.execution.backends.incremental_rust.ta_py.execute_plan_payload",
-        fake_execute_plan_payload,
-    )
+    _fake_plan_calls(monkeypatch, fake_execute)
 
     out = backend.evaluate(plan, ds)
     assert isinstance(out, dict)
@@ -60,20 +74,14 @@ def test_evaluate_uses_execute_plan_for_expanded_supported_root(sample_ohlcv_dat
     plan = expr._ensure_plan()
     backend = IncrementalRustBackend()
 
-    called = {"count": 0}
-
-    def fake_execute_plan_payload(payload):  # noqa: ANN001
-        called["count"] += 1
-        return {int(plan.graph.root_id): [0.0] * len(sample_ohlcv_data["timestamps"])}
-
-    monkeypatch.setattr(
-        "laakhay.ta.expr.execution.backends.incremental_rust.ta_py.execute_plan_payload",
-        fake_execute_plan_payload,
+    counts = _fake_plan_calls(
+        monkeypatch,
+        lambda dataset_id, partition: {int(plan.graph.root_id): [0.0] * len(sample_ohlcv_data["timestamps"])},
     )
 
     out = backend.evaluate(plan, ds)
     assert isinstance(out, dict)
-    assert called["count"] == 1
+    assert counts["execute"] == 1
 
 
 def test_evaluate_uses_execute_plan_for_boolean_graph(sample_ohlcv_data, monkeypatch) -> None:
@@ -82,17 +90,96 @@ def test_evaluate_uses_execute_plan_for_boolean_graph(sample_ohlcv_data, monkeyp
     plan = expr._ensure_plan()
     backend = IncrementalRustBackend()
 
-    called = {"count": 0}
+    counts = _fake_plan_calls(
+        monkeypatch,
+        lambda dataset_id, partition: {int(plan.graph.root_id): [False] * len(sample_ohlcv_data["timestamps"])},
+    )
+
+    out = backend.evaluate(plan, ds)
+    assert isinstance(out, dict)
+    assert counts["execute"] == 1
+
+
+def test_plan_is_registered_once_across_evaluations(sample_ohlcv_data, monkeypatch) -> None:
+    ds = _build_dataset(sample_ohlcv_data)
+    plan = compile_expression("sma(close, 5) - ema(close, 3)")._ensure_plan()
+    backend = IncrementalRustBackend()
+
+    counts = _fake_plan_calls(
+        monkeypatch,
+        lambda dataset_id, partition: {int(plan.graph.root_id): [0.0] * len(sample_ohlcv_data["timestamps"])},
+    )
+
+    for _ in range(3):
+        backend.evaluate(plan, ds)
+    assert counts == {"register": 1, "execute": 3}
+
+
+def test_evaluate_many_runs_all_partitions_in_one_call(sample_ohlcv_data, monkeypatch) -> None:
+    ds = _build_dataset(sample_ohlcv_data)
+    plan = compile_expression("rsi(close, 2)")._ensure_plan()
+    backend = IncrementalRustBackend()
+    symbol, timeframe = sample_ohlcv_data["symbol"], sample_ohlcv_data["timeframe"]
+
+    calls: list[tuple[dict[str, Any], Any]] = []
 
-    def fake_execute_plan_payload(payload):  # noqa: ANN001
-        called["count"] += 1
-        return {int(plan.graph.root_id): [False] * len(sample_ohlcv_data["timestamps"])}
+    def fake_execute_plan_batch(payload, partitions):  # noqa: ANN001
+        calls.append((payload, partitions))
+        rows = [1.0] * len(sample_ohlcv_data["timestamps"])
+        return {(symbol, timeframe, "ohlcv"): {int(plan.graph.root_id): rows}}
 
     monkeypatch.setattr(
-        "laakhay.ta.expr.execution.backends.incremental_rust.ta_py.execute_plan_payload",
-        fake_execute_plan_payload,
+        "laakhay.ta.expr.execution.backends.incremental_rust.ta_py.execute_plan_batch",
+        fake_execute_plan_batch,
+        raising=False,
     )
 
-    out = backend.evaluate(plan, ds)
-    assert isinstance(out, dict)
-    assert called["count"] == 1
+    out = backend.evaluate_many(plan, ds)
+    assert len(calls) == 1
+    payload, partitions = calls[0]
+    assert partitions is None
+    assert payload["partition"] == {"symbol": "*", "timeframe": "*", "source": "ohlcv"}
+    assert payload["options"] == {"outputs": "root"}
+    assert list(out) == [(symbol, timeframe, "default")]
+    assert len(out[(symbol, timeframe, "default")].values) == len(sample_ohlcv_data["timestamps"])
+
+    backend.evaluate_many(plan, ds, [(symbol, timeframe)])
+    assert calls[1][1] == [(symbol, timeframe, "ohlcv")]
+
+
+def test_step_walks_compiled_graph_for_composed_plans(monkeypatch) -> None:
+    expr = compile_expression("sma(close, 5) > ema(close, 9) and rsi(close, 14) > 50")
+    plan = expr._ensure_plan()
+    assert IncrementalRustBackend.can_step(plan)
+
+    called: dict[str, Any] = {}
+
+    def fake_load_graph(backend_id, graph):  # noqa: ANN001
+        called["graph"] = graph
+
+    def fake_step_graph(backend_id, tick, event_index):  # noqa: ANN001
+        called["event_index"] = event_index
+        return {int(plan.graph.root_id): True}
+
+    monkeypatch.setattr(
+        "laakhay.ta.expr.execution.backends.incremental_rust.ta_py.incremental_load_graph",
+        fake_load_graph,
+    )
+    monkeypatch.setattr(
+        "laakhay.ta.expr.execution.backends.incremental_rust.ta_py.incremental_step_graph",
+        fake_step_graph,
+    )
+
+    backend = IncrementalRustBackend()
+    backend.initialize(plan, Dataset())
+    assert called["graph"]["root_id"] == int(plan.graph.root_id)
+    assert called["graph"]["node_order"] == [int(n) for n in plan.node_order]
+
+    tick = {"open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0}
+    assert backend.step(plan, tick) is True
+    assert called["event_index"] == 1
+
+
+def test_can_step_rejects_non_tick_sources() -> None:
+    plan = compile_expression("trades.volume > 5")._ensure_plan()
+    assert not IncrementalRustBackend.can_step(plan)
@@ -37,3 +37,26 @@ def test_build_rust_execution_payload_serializes_node_kinds() -> None:
     kinds = {node["kind"] for node in payload["graph"]["nodes"].values()}
     assert "call" in kinds
     assert "binary_op" in kinds
+
+
+def test_build_rust_execution_payload_groups_sibling_kernel_outputs() -> None:
+    plan = compile_expression("bb_upper(20) - bb_lower(20) > sma(20)")._ensure_plan()
+    payload = build_rust_execution_payload(
+        plan,
+        dataset_id=1,
+        symbol="BTCUSDT",
+        timeframe="1h",
+        source="ohlcv",
+        requests=[],
+    )
+    calls = {node["name"]: node for node in payload["graph"]["nodes"].values() if node["kind"] == "call"}
+    assert calls["bb_upper"]["kernel_group"] == calls["bb_lower"]["kernel_group"]
+    assert "kernel_group" not in calls["sma"]
+
+
+def test_build_rust_execution_payload_carries_thread_count() -> None:
+    plan = compile_expression("sma(20) > sma(50)")._ensure_plan()
+    kwargs = {"dataset_id": 1, "symbol": "BTCUSDT", "timeframe": "1h", "source": "ohlcv", "requests": []}
+    assert build_rust_execution_payload(plan, **kwargs)["options"] == {}
+    payload = build_rust_execution_payload(plan, root_only=True, threads=4, **kwargs)
+    assert payload["options"] == {"outputs": "root", "threads": 4}
@@ -0,0 +1,59 @@
+"""Tests for the process-wide compiled-plan cache."""
+
+from laakhay.ta.expr.planner import alignment
+from laakhay.ta.expr.runtime import clear_plan_cache, compile_plan, plan_cache_info
+from laakhay.ta.expr.runtime.plan_cache import PlanCache, normalize_expression_text
+from laakhay.ta.registry import get_global_registry
+
+
+def test_repeated_text_reuses_compiled_plan():
+    clear_plan_cache()
+    before = plan_cache_info()
+
+    first = compile_plan("sma(20) > sma(50)")
+    second = compile_plan("  sma(20)   >  sma(50) ")
+
+    after = plan_cache_info()
+    assert second is first
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + 1
+    assert first.rust_graph is first.plan.rust_graph
+    assert first.expression._ensure_plan() is first.plan
+    assert first.trim > 0
+
+
+def test_alignment_policy_is_part_of_the_key():
+    clear_plan_cache()
+    inner = compile_plan("close > sma(20)")
+    with alignment(how="outer", fill="ffill"):
+        outer = compile_plan("close > sma(20)")
+
+    assert outer is not inner
+    assert outer.plan.alignment.how == "outer"
+
+
+def test_registry_changes_invalidate_the_cache():
+    compile_plan("rsi(14) < 30")
+    assert plan_cache_info().size > 0
+
+    registry = get_global_registry()
+    handle = registry.get("sma")
+    registry.register(handle.func, spec=handle.indicator_spec)
+
+    assert plan_cache_info().size == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PlanCache(maxsize=2)
+    cache.get_or_compile("sma(5)")
+    cache.get_or_compile("sma(10)")
+    cache.get_or_compile("sma(5)")
+    cache.get_or_compile("sma(20)")
+
+    assert cache.info().size == 2
+    cache.get_or_compile("sma(5)")
+    assert cache.info().hits == 2
+
+
+def test_whitespace_inside_quotes_is_preserved():
+    assert normalize_expression_text("select( 'a  b' )\n") == "select( 'a  b' )"
@@ -0,0 +1,63 @@
+"""Tests for the Rust-side node result cache."""
+
+import pytest
+
+from laakhay.ta.core.dataset import Dataset
+from laakhay.ta.core.ohlcv import OHLCV
+from laakhay.ta.expr.dsl import compile_expression
+from laakhay.ta.expr.execution.backends.incremental_rust import IncrementalRustBackend
+from laakhay.ta.expr.runtime import (
+    clear_result_cache,
+    result_cache_info,
+    set_result_cache_budget,
+)
+from laakhay.ta.expr.runtime.result_cache import DEFAULT_BUDGET_BYTES
+
+
+def _build_dataset(sample_ohlcv_data) -> Dataset:
+    ohlcv = OHLCV(
+        timestamps=sample_ohlcv_data["timestamps"],
+        opens=sample_ohlcv_data["opens"],
+        highs=sample_ohlcv_data["highs"],
+        lows=sample_ohlcv_data["lows"],
+        closes=sample_ohlcv_data["closes"],
+        volumes=sample_ohlcv_data["volumes"],
+        is_closed=sample_ohlcv_data["is_closed"],
+        symbol=sample_ohlcv_data["symbol"],
+        timeframe=sample_ohlcv_data["timeframe"],
+    )
+    ds = Dataset()
+    ds.add_series(ohlcv.symbol, ohlcv.timeframe, ohlcv, "ohlcv")
+    return ds
+
+
+def test_shared_indicator_is_reused_across_strategies(sample_ohlcv_data):
+    ds = _build_dataset(sample_ohlcv_data)
+    backend = IncrementalRustBackend()
+    first = backend.evaluate(compile_expression("sma(close, 5) > close")._ensure_plan(), ds)
+    before = result_cache_info()
+
+    second = backend.evaluate(compile_expression("sma(close, 5) < ema(close, 3)")._ensure_plan(), ds)
+
+    assert first and second
+    assert result_cache_info().hits > before.hits
+
+
+def test_budget_controls_cache_occupancy(sample_ohlcv_data):
+    ds = _build_dataset(sample_ohlcv_data)
+    backend = IncrementalRustBackend()
+    try:
+        set_result_cache_budget(0)
+        backend.evaluate(compile_expression("rsi(close, 3)")._ensure_plan(), ds)
+        info = result_cache_info()
+        assert info.budget_bytes == 0
+        assert info.entries == 0
+    finally:
+        set_result_cache_budget(DEFAULT_BUDGET_BYTES)
+    clear_result_cache()
+    assert result_cache_info().bytes == 0
+
+
+def test_negative_budget_is_rejected():
+    with pytest.raises(ValueError):
+        set_result_cache_budget(-1)
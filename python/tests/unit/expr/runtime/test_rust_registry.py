@@ -0,0 +1,65 @@
+"""Tests for Rust registry lifecycle and accounting."""
+
+import gc
+
+import pytest
+
+from laakhay.ta.core.dataset import Dataset
+from laakhay.ta.expr.dsl import compile_expression
+from laakhay.ta.expr.execution.backends.incremental_rust import IncrementalRustBackend, ohlcv_tick
+from laakhay.ta.expr.runtime import registry_stats, set_snapshot_capacity
+
+
+def _stepped_backend(plan, ticks: int) -> IncrementalRustBackend:
+    backend = IncrementalRustBackend()
+    backend.initialize(plan, Dataset())
+    for index in range(ticks):
+        close = 100.0 + index
+        backend.step(plan, ohlcv_tick(close, close + 1, close - 1, close, 1_000.0))
+    return backend
+
+
+def test_backends_and_snapshots_are_released_with_their_handles():
+    plan = compile_expression("sma(close, 20)")._ensure_plan()
+    gc.collect()
+    before = registry_stats()
+
+    backend = _stepped_backend(plan, 50)
+    snapshot = backend.snapshot(plan)
+    held = registry_stats()
+    assert held.backends == before.backends + 1
+    assert held.snapshots == before.snapshots + 1
+    assert held.backend_bytes > before.backend_bytes
+    assert held.snapshot_bytes > before.snapshot_bytes
+
+    backend.clear_cache()
+    assert registry_stats().backends == held.backends
+
+    del backend, snapshot
+    gc.collect()
+    after = registry_stats()
+    assert (after.backends, after.snapshots) == (before.backends, before.snapshots)
+    assert after.snapshot_bytes == before.snapshot_bytes
+
+
+def test_snapshot_capacity_evicts_least_recently_used():
+    plan = compile_expression("sma(close, 5)")._ensure_plan()
+    backend = _stepped_backend(plan, 10)
+    try:
+        set_snapshot_capacity(2)
+        oldest = backend.snapshot(plan)
+        kept = [backend.snapshot(plan), backend.snapshot(plan)]
+
+        stats = registry_stats()
+        assert stats.snapshots == 2
+        assert stats.snapshot_evictions >= 1
+        with pytest.raises(KeyError):
+            backend.restore(plan, oldest)
+        backend.restore(plan, kept[-1])
+        assert backend.event_index == 10
+    finally:
+        set_snapshot_capacity(None)
+    assert registry_stats().snapshot_capacity is None
+
+    with pytest.raises(ValueError):
+        set_snapshot_capacity(0)
@@ -5,6 +5,7 @@ from decimal import Decimal
 
 from laakhay.ta import ta
 from laakhay.ta.core.bar import Bar
+from laakhay.ta.expr.dsl import compile_expression
 from laakhay.ta.expr.runtime.stream import Stream
 
 
@@ -53,3 +54,69 @@ def test_stream_transition_callback_invoked():
     stream.update_ohlcv("BTCUSDT", "1h", _bar(base + timedelta(hours=1), 110))
 
     assert events == [Decimal("105")]
+
+
+def test_incremental_stream_steps_and_buffers_bars():
+    stream = Stream(incremental=True)
+    rsi = ta.indicator("rsi", period=2)
+    stream.register("rsi2", rsi._to_expression())
+
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    transitions = []
+    for i, price in enumerate([100, 110, 105, 115, 108]):
+        update = stream.update_ohlcv("BTCUSDT", "1h", _bar(base + timedelta(hours=i), price))
+        series = update.outputs["rsi2"][("BTCUSDT", "1h", "default")]
+        assert len(series) == 1
+        assert series.timestamps[0] == base + timedelta(hours=i)
+        transitions.extend(update.transitions)
+
+    assert len(transitions) == 1
+    assert transitions[0].expression == "rsi2"
+    assert len(stream.dataset.series("BTCUSDT", "1h", source="ohlcv")) == 5
+
+
+def test_incremental_stream_steps_parameterised_indicators():
+    stream = Stream(incremental=True)
+    sma = ta.indicator("sma", period=2)
+    stream.register("sma2", sma._to_expression())
+
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    stream.update_ohlcv("BTCUSDT", "1h", _bar(base, 100))
+    update = stream.update_ohlcv("BTCUSDT", "1h", _bar(base + timedelta(hours=1), 110))
+
+    series = next(iter(update.outputs["sma2"].values()))
+    assert len(series.timestamps) == 1
+    assert len(update.transitions) == 1
+    assert update.transitions[0].value == Decimal("105")
+    assert isinstance(series.values[0], Decimal)
+
+
+def test_incremental_stream_steps_composed_expressions():
+    stream = Stream(incremental=True)
+    shifted = ta.indicator("sma", period=2) + 1
+    stream.register("sma2", shifted)
+
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    stream.update_ohlcv("BTCUSDT", "1h", _bar(base, 100))
+    update = stream.update_ohlcv("BTCUSDT", "1h", _bar(base + timedelta(hours=1), 110))
+
+    series = next(iter(update.outputs["sma2"].values()))
+    assert len(series.timestamps) == 1
+    assert len(update.transitions) == 1
+    assert update.transitions[0].value == 106
+
+
+def test_incremental_stream_steps_signal_graphs():
+    stream = Stream(incremental=True)
+    signal = compile_expression("crossup(close, sma(close, 2)) or close > 112")
+    stream.register("signal", signal)
+
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    values = []
+    for i, price in enumerate([100, 98, 104, 101, 115]):
+        update = stream.update_ohlcv("BTCUSDT", "1h", _bar(base + timedelta(hours=i), price))
+        series = next(iter(update.outputs["signal"].values()))
+        assert len(series.timestamps) == 1
+        values.append(series.values[0])
+
+    assert values == [False, False, True, False, True]
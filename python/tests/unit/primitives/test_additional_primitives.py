@@ -9,6 +9,8 @@ from laakhay.ta.primitives import (
     cumulative_sum,
     negative_values,
     positive_values,
+    rolling_median,
+    rolling_quantile,
     rolling_rma,
     true_range,
 )
@@ -123,3 +125,19 @@ def test_true_range_calculation():
         Decimal("1"),
     ]
     assert tuple(result.values) == tuple(expected)
+
+
+def test_rolling_quantile_matches_sorted_window():
+    values = [5, 1, 4, 2, 8, 7, 3, 6]
+    ctx = SeriesContext(close=_make_series(values))
+
+    period = 4
+    for q in (0.0, 0.25, 0.5, 0.9, 1.0):
+        result = rolling_quantile(ctx, period=period, q=q)
+        assert not any(result.availability_mask[: period - 1])
+        for i in range(period - 1, len(values)):
+            window = sorted(values[i + 1 - period : i + 1])
+            assert result.values[i] == Decimal(window[min(int(q * period), period - 1)])
+
+    median = rolling_median(ctx, period=period)
+    assert median.values[period - 1 :] == rolling_quantile(ctx, period=period, q=0.5).values[period - 1 :]
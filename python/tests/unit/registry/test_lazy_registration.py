@@ -0,0 +1,65 @@
+"""Lazy indicator declarations."""
+
+import sys
+import types
+
+from laakhay.ta.indicators import INDICATOR_CATEGORIES
+from laakhay.ta.registry.registry import Registry, get_global_registry
+
+_INDICATORS_PACKAGE = "laakhay.ta.indicators"
+
+
+def test_declared_categories_match_registered_indicators():
+    registry = get_global_registry()
+    registry.load_all()
+
+    declared: dict[str, str] = {}
+    for category, (names, aliases) in INDICATOR_CATEGORIES.items():
+        module = f"{_INDICATORS_PACKAGE}.{category}"
+        for name in names:
+            handle = registry.get(name)
+            assert handle is not None, name
+            assert handle.name == name
+            assert handle.func.__module__.startswith(module), name
+            declared[name] = category
+        for alias in aliases:
+            handle = registry.get(alias)
+            assert handle is not None, alias
+            assert handle.name in names, alias
+
+    for name, handle in registry._indicators.items():
+        module = handle.func.__module__
+        if not module.startswith(_INDICATORS_PACKAGE) or module.startswith(f"{_INDICATORS_PACKAGE}.primitives"):
+            continue
+        category = module.split(".")[3]
+        assert declared.get(name) == category, f"{name} is registered by {module} but not declared"
+
+
+def test_lookup_imports_declared_module(tmp_path, monkeypatch):
+    registry = Registry()
+    host = types.ModuleType("lazy_demo_host")
+    host.registry = registry  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "lazy_demo_host", host)
+    (tmp_path / "lazy_demo_indicators.py").write_text(
+        "from lazy_demo_host import registry\n"
+        "from laakhay.ta.core.series import Series\n"
+        "from laakhay.ta.registry.models import SeriesContext\n"
+        "\n"
+        "def lazy_demo(ctx: SeriesContext) -> Series[float]:\n"
+        "    return ctx.close\n"
+        "\n"
+        "registry.register(lazy_demo, aliases=['lazy_demo_alias'])\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_demo_indicators", raising=False)
+
+    registry.declare_lazy("lazy_demo_indicators", ["lazy_demo"], ["lazy_demo_alias"])
+    assert "lazy_demo_indicators" not in sys.modules
+    assert registry.get("unknown") is None
+    assert "lazy_demo_indicators" not in sys.modules
+
+    handle = registry.get("lazy_demo_alias")
+    assert handle is not None and handle.name == "lazy_demo"
+    assert "lazy_demo_indicators" in sys.modules
+    assert registry.get("lazy_demo") is handle
+    assert registry.list_indicators() == ["lazy_demo"]